@@ -2675,6 +2675,7 @@ async def generate_holidays(
     Uses holiday patterns to create specific holiday dates.
     """
     from app.models.court_holiday import CourtHoliday, HolidayPattern
+    from app.utils.holiday_provider import get_holiday_provider
     from datetime import date
     from calendar import monthrange
 
@@ -2753,6 +2754,7 @@ async def generate_holidays(
             logger.warning(f"Failed to generate holiday {pattern.name}: {e}")
 
     db.commit()
+    get_holiday_provider().load_overrides(db)
 
     return {
         "jurisdiction_id": jurisdiction_id,
@@ -2774,6 +2776,7 @@ async def create_holiday(
 ):
     """Create a custom court holiday."""
     from app.models.court_holiday import CourtHoliday
+    from app.utils.holiday_provider import get_holiday_provider
     from datetime import date as date_type
 
     holiday = CourtHoliday(
@@ -2787,6 +2790,7 @@ async def create_holiday(
     db.add(holiday)
     db.commit()
     db.refresh(holiday)
+    get_holiday_provider().load_overrides(db)
 
     return {
         "id": holiday.id,
@@ -2805,6 +2809,7 @@ async def delete_holiday(
 ):
     """Delete a court holiday."""
     from app.models.court_holiday import CourtHoliday
+    from app.utils.holiday_provider import get_holiday_provider
 
     holiday = db.query(CourtHoliday).filter(CourtHoliday.id == holiday_id).first()
     if not holiday:
@@ -2812,6 +2817,7 @@ async def delete_holiday(
 
     db.delete(holiday)
     db.commit()
+    get_holiday_provider().load_overrides(db)
 
     return {"deleted": True, "id": holiday_id}
 
@@ -1,20 +1,26 @@
 """
 Dashboard API endpoints
 """
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import User
 from app.utils.auth import get_current_user
 from app.services.dashboard_service import dashboard_service
-from app.services.morning_report_service import MorningReportService
+from app.services.morning_report_snapshot import get_morning_report as get_morning_report_snapshot
 
 router = APIRouter()
 
 
 @router.get("")
 async def get_dashboard(
+    sections: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to compute (default: all), e.g. deadline_alerts,critical_cases"
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> dict:
@@ -27,11 +33,20 @@ async def get_dashboard(
         - Recent activity feed
         - Critical cases needing attention
         - Upcoming deadlines (next 30 days)
+
+    Pass ``sections`` to get a partial response: request the alerts first
+    for a fast first paint, then lazy-load analytics (judge_analytics,
+    heat_map_flat, ...) in a second call.
     """
-    dashboard_data = await dashboard_service.get_dashboard_data(
-        user_id=current_user.id,
-        db=db
-    )
+    requested = [name.strip() for name in sections.split(",") if name.strip()] if sections else None
+    try:
+        dashboard_data = await dashboard_service.get_dashboard_data(
+            user_id=current_user.id,
+            db=db,
+            sections=requested
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return dashboard_data
 
@@ -50,12 +65,13 @@ def get_morning_report(
     - Actionable insights and next steps
     - Case overview
 
-    This is the "War Room" Intelligence Briefing that appears upon login
+    This is the "War Room" Intelligence Briefing that appears upon login.
+    Served from the snapshot pre-generated off-peak (one read); generated
+    live only when the user's data changed since.
     """
 
-    morning_service = MorningReportService(db)
-
-    report = morning_service.generate_morning_report(
+    report = get_morning_report_snapshot(
+        db=db,
         user_id=str(current_user.id),
         last_login=current_user.last_login
     )
@@ -437,14 +453,19 @@ async def get_dashboard_health(
     Get matter health cards (lazy loaded).
 
     Returns health status for each active case with progress and next deadline.
+    A section that failed is returned empty and listed in "section_errors".
     """
     data = await dashboard_service.get_dashboard_data(
         user_id=current_user.id,
-        db=db
+        db=db,
+        sections=["matter_health_cards", "critical_cases", "zombie_cases"]
     )
 
-    return {
-        "health_cards": data.get("matter_health_cards", []),
-        "critical_cases": data.get("critical_cases", []),
-        "zombie_cases": data.get("zombie_cases", [])
+    response = {
+        "health_cards": data.get("matter_health_cards") or [],
+        "critical_cases": data.get("critical_cases") or [],
+        "zombie_cases": data.get("zombie_cases") or []
     }
+    if data.get("section_errors"):
+        response["section_errors"] = data["section_errors"]
+    return response
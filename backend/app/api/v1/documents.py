@@ -50,6 +50,7 @@ class BulkUploadResult(BaseModel):
     case_id: Optional[str] = None
     error: Optional[str] = None
     deadlines_extracted: int = 0
+    chunks_embedded: int = 0
 
 
 @router.post("/upload")
@@ -395,6 +396,7 @@ async def bulk_upload_documents(
             raise HTTPException(status_code=404, detail="Case not found or access denied")
 
     results = []
+    uploaded_documents = []
 
     for file in files:
         try:
@@ -479,6 +481,7 @@ async def bulk_upload_documents(
                 case_id=analysis_result['case_id'],
                 deadlines_extracted=extraction_result['count']
             ))
+            uploaded_documents.append((document, analysis_result['case_id']))
 
         except Exception as e:
             # Rollback failed transaction before continuing to next file
@@ -490,6 +493,18 @@ async def bulk_upload_documents(
                 error=str(e)
             ))
 
+    # Embed all uploaded documents together for RAG search: batched API calls
+    # off the event loop and one bulk insert (a failure never fails the upload)
+    if uploaded_documents:
+        try:
+            ingestion = await rag_service.embed_documents(uploaded_documents, db)
+            for r in results:
+                if r.document_id:
+                    r.chunks_embedded = ingestion.chunks.get(r.document_id, 0)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Bulk upload: embedding generation failed: {e}")
+
     # Summary stats
     successful = sum(1 for r in results if r.success)
     total_deadlines = sum(r.deadlines_extracted for r in results)
@@ -12,7 +12,12 @@ from app.models.user import User
 from app.models.case import Case
 from app.models.document import Document
 from app.utils.auth import get_current_user
+from app.utils.case_access_check import get_accessible_case_ids
 from app.services.rag_service import rag_service
+from app.services.chunk_keyword_index import get_chunk_keyword_index
+from app.services.embedding_cache import get_embedding_cache
+from app.services.firm_vector_index import IndexNotReadyError
+from app.services.retrieval_cache import get_query_embedding_cache, get_search_result_cache
 from app.services.ai_service import ai_service
 import logging
 
@@ -37,6 +42,20 @@ class SemanticSearchResponse(BaseModel):
     total_chunks_searched: int
 
 
+class FirmSearchRequest(BaseModel):
+    """Request model for firm-wide semantic search"""
+    query: str = Field(..., min_length=3, max_length=500, description="Natural language question")
+    top_k: int = Field(default=10, ge=1, le=50, description="Number of relevant chunks to return")
+    case_ids: Optional[List[str]] = Field(default=None, description="Only search these cases (must be accessible)")
+
+
+class FirmSearchResponse(BaseModel):
+    """Response model for firm-wide semantic search"""
+    query: str
+    sources: List[Dict[str, Any]]
+    cases_searched: int
+
+
 class RAGAnswerRequest(BaseModel):
     """Request model for RAG-powered Q&A"""
     question: str = Field(..., min_length=3, max_length=500, description="Question about the case documents")
@@ -70,14 +89,22 @@ async def semantic_search(
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    # Perform semantic search
+    # Perform semantic search (on SQLite, fused with FTS5 keyword matches)
     try:
-        results = await rag_service.semantic_search(
-            query=request.query,
-            case_id=request.case_id,
-            db=db,
-            top_k=request.top_k
-        )
+        if get_chunk_keyword_index().available(db):
+            results = await rag_service.hybrid_search(
+                query=request.query,
+                case_id=request.case_id,
+                db=db,
+                top_k=request.top_k
+            )
+        else:
+            results = await rag_service.semantic_search(
+                query=request.query,
+                case_id=request.case_id,
+                db=db,
+                top_k=request.top_k
+            )
 
         if not results:
             return SemanticSearchResponse(
@@ -96,7 +123,7 @@ async def semantic_search(
 
             enriched_sources.append({
                 "chunk_text": result['chunk_text'],
-                "similarity": result['similarity'],
+                "similarity": result.get('similarity', result.get('semantic_score', 0.0)),
                 "document_id": result['document_id'],
                 "document_name": doc.file_name if doc else "Unknown",
                 "document_type": doc.document_type if doc else None,
@@ -121,6 +148,76 @@ async def semantic_search(
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+@router.post("/semantic/firm", response_model=FirmSearchResponse)
+async def firm_semantic_search(
+    request: FirmSearchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Semantic search across every case the user can access
+
+    Covers owned cases and cases shared through active case_access grants.
+
+    Example queries:
+    - "Every motion where opposing counsel argued lack of personal jurisdiction"
+    - "Orders granting extensions of time to respond to discovery"
+    """
+    case_ids = get_accessible_case_ids(db, str(current_user.id))
+    if request.case_ids is not None:
+        requested = set(request.case_ids)
+        case_ids = [case_id for case_id in case_ids if case_id in requested]
+
+    try:
+        results = await rag_service.firm_search(
+            query=request.query,
+            case_ids=case_ids,
+            db=db,
+            top_k=request.top_k
+        )
+
+        document_ids = {result['document_id'] for result in results}
+        documents = {
+            str(doc.id): doc
+            for doc in db.query(Document).filter(Document.id.in_(document_ids)).all()
+        } if document_ids else {}
+        result_case_ids = {result['case_id'] for result in results}
+        case_numbers = dict(
+            db.query(Case.id, Case.case_number).filter(Case.id.in_(result_case_ids)).all()
+        ) if result_case_ids else {}
+
+        sources = []
+        for result in results:
+            doc = documents.get(result['document_id'])
+            sources.append({
+                "chunk_text": result['chunk_text'],
+                "similarity": result['similarity'],
+                "case_id": result['case_id'],
+                "case_number": case_numbers.get(result['case_id']),
+                "document_id": result['document_id'],
+                "document_name": doc.file_name if doc else "Unknown",
+                "document_type": doc.document_type if doc else None,
+                "chunk_index": result['chunk_index'],
+                "metadata": result.get('metadata') or {}
+            })
+
+        return FirmSearchResponse(
+            query=request.query,
+            sources=sources,
+            cases_searched=len(case_ids)
+        )
+
+    except IndexNotReadyError:
+        raise HTTPException(
+            status_code=503,
+            detail="Firm-wide search index is being built. Please try again shortly.",
+            headers={"Retry-After": "30"}
+        )
+    except Exception as e:
+        logger.error(f"Firm-wide semantic search error: {e}")
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+
 @router.post("/ask")
 async def ask_question(
     request: RAGAnswerRequest,
@@ -256,6 +353,7 @@ async def generate_embeddings(
 
     This endpoint manually triggers embedding generation for a document.
     Normally this happens automatically on upload, but this allows re-processing.
+    Re-processing is incremental: only chunks whose text changed are embedded.
     """
 
     # Verify document ownership
@@ -271,18 +369,20 @@ async def generate_embeddings(
         raise HTTPException(status_code=400, detail="Document has no extracted text")
 
     try:
-        # Generate embeddings
-        chunks_created = await rag_service.embed_document(
-            document=document,
-            case_id=document.case_id,
-            db=db
-        )
+        # Generate embeddings (unchanged chunks keep their stored rows)
+        result = await rag_service.embed_documents([(document, document.case_id)], db)
+        error = result.failed.get(str(document.id))
+        if error:
+            raise RuntimeError(error)
+        chunks_created = result.chunks.get(str(document.id), 0) - result.unchanged
 
         return {
             "success": True,
             "data": {
                 "document_id": document_id,
                 "chunks_created": chunks_created,
+                "chunks_unchanged": result.unchanged,
+                "chunks_removed": result.removed,
                 "document_name": document.file_name
             },
             "message": f"Generated {chunks_created} embeddings for document"
@@ -338,6 +438,9 @@ async def get_rag_stats(
             "documents_with_embeddings": documents_with_embeddings,
             "documents_pending_embedding": total_documents - documents_with_embeddings,
             "total_embedding_chunks": total_chunks,
-            "rag_enabled": documents_with_embeddings > 0
+            "rag_enabled": documents_with_embeddings > 0,
+            "embedding_cache": get_embedding_cache().get_stats(),
+            "query_embedding_cache": get_query_embedding_cache().get_stats(),
+            "search_result_cache": get_search_result_cache().get_stats()
         }
     }
@@ -5,10 +5,13 @@ This module handles trigger-based deadline generation with Authority Core integr
 The Authority Core rules database is queried first, with fallback to hardcoded rules.
 """
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import date as date_type, datetime, timedelta
 from pydantic import BaseModel
+import json
 import os
 
 from app.database import get_db
@@ -19,9 +22,11 @@ from app.models.jurisdiction import Jurisdiction
 from app.utils.auth import get_current_user
 from app.services.rules_engine import rules_engine, TriggerType
 from app.services.calendar_service import calendar_service
+from app.services.deadline_cascade import DeadlineCascadeEngine
 from app.services.case_summary_service import CaseSummaryService
 from app.services.authority_integrated_deadline_service import (
     AuthorityIntegratedDeadlineService,
+    BulkDeadlineRequest,
     USE_AUTHORITY_CORE
 )
 import logging
@@ -74,6 +79,15 @@ def get_jurisdiction_id(db: Session, jurisdiction_name: str) -> Optional[str]:
 router = APIRouter()
 
 
+def _party_names(case: Case, role: str) -> List[str]:
+    """Names of the case parties whose role mentions ``role`` (e.g. "plaintiff")"""
+    return [
+        party["name"]
+        for party in case.parties or []
+        if isinstance(party, dict) and party.get("name") and role in (party.get("role") or "").lower()
+    ]
+
+
 # ============================================================================
 # TRIGGER TYPE DEFINITIONS
 # Friendly names + metadata for the TriggerType enum
@@ -346,6 +360,72 @@ class SimulatedDeadline(BaseModel):
     short_explanation: str
 
 
+def _simulation_context(case: Case) -> tuple:
+    """
+    Jurisdiction, rules-engine court_type and CompuLaw case context for a case.
+
+    Returns:
+        (jurisdiction, court_type, case_context)
+    """
+    jurisdiction = case.jurisdiction or "florida_state"
+    court_type = case.case_type or "civil"
+
+    # Map common case_type values to rules engine court_type
+    court_type_map = {
+        "personal_injury": "civil",
+        "contract_dispute": "civil",
+        "real_estate": "civil",
+        "employment": "civil",
+        "criminal": "criminal",
+        "appellate": "appellate",
+    }
+    court_type = court_type_map.get(court_type.lower(), court_type.lower())
+
+    # Build case context for CompuLaw-style formatting
+    case_context = {
+        "case_number": case.case_number,
+        "plaintiffs": _party_names(case, "plaintiff"),
+        "defendants": _party_names(case, "defendant"),
+        "source_document": None,
+        "case_type": court_type,
+    }
+    return jurisdiction, court_type, case_context
+
+
+def _format_simulated_deadline(
+    deadline: Any,
+    trigger_date: date_type,
+    jurisdiction: str,
+    court_type: str
+) -> dict:
+    """Serialize an IntegratedDeadline for the simulate endpoints"""
+    return {
+        "title": deadline.title,
+        "description": deadline.description,
+        "deadline_date": deadline.deadline_date.isoformat() if deadline.deadline_date else None,
+        "priority": deadline.priority,
+        "party_role": deadline.party_role,
+        "action_required": deadline.action_required,
+        "rule_citation": deadline.rule_citation,
+        "calculation_basis": deadline.calculation_basis,
+        "trigger_formula": deadline.trigger_formula or "",
+        "days_count": deadline.days_count,
+        "calculation_type": deadline.calculation_type,
+        "short_explanation": deadline.short_explanation or "",
+        # Extra fields for UI
+        "trigger_event": deadline.trigger_event,
+        "trigger_date": deadline.trigger_date.isoformat() if deadline.trigger_date else trigger_date.isoformat(),
+        "jurisdiction": deadline.jurisdiction or jurisdiction,
+        "court_type": deadline.court_type or court_type,
+        "trigger_code": deadline.trigger_code or "",
+        "party_string": deadline.party_string or "",
+        # Authority Core tracking
+        "source_rule_id": deadline.source_rule_id,
+        "source_rule_name": deadline.source_rule_name,
+        "source": "authority_core" if deadline.source_rule_id else "system_rules",
+    }
+
+
 @router.post("/simulate")
 async def simulate_trigger_deadlines(
     request: SimulateTriggerRequest,
@@ -414,30 +494,9 @@ async def simulate_trigger_deadlines(
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    # Determine jurisdiction and court_type from case
-    jurisdiction = case.jurisdiction or "florida_state"
+    # Determine jurisdiction, court_type and CompuLaw case context from case
+    jurisdiction, court_type, case_context = _simulation_context(case)
     jurisdiction_id = get_jurisdiction_id(db, jurisdiction)  # Look up from jurisdiction name
-    court_type = case.case_type or "civil"
-
-    # Map common case_type values to rules engine court_type
-    court_type_map = {
-        "personal_injury": "civil",
-        "contract_dispute": "civil",
-        "real_estate": "civil",
-        "employment": "civil",
-        "criminal": "criminal",
-        "appellate": "appellate",
-    }
-    court_type = court_type_map.get(court_type.lower(), court_type.lower())
-
-    # Build case context for CompuLaw-style formatting
-    case_context = {
-        "case_number": case.case_number,
-        "plaintiffs": [case.plaintiff] if case.plaintiff else [],
-        "defendants": [case.defendant] if case.defendant else [],
-        "source_document": None,
-        "case_type": court_type,
-    }
 
     # Use Authority-Integrated Deadline Service
     integrated_service = AuthorityIntegratedDeadlineService(db)
@@ -475,33 +534,10 @@ async def simulate_trigger_deadlines(
     source = "authority_core" if has_authority_source else "system_rules"
 
     # Format response - convert to serializable format
-    formatted_deadlines = []
-    for deadline in integrated_deadlines:
-        formatted_deadlines.append({
-            "title": deadline.title,
-            "description": deadline.description,
-            "deadline_date": deadline.deadline_date.isoformat() if deadline.deadline_date else None,
-            "priority": deadline.priority,
-            "party_role": deadline.party_role,
-            "action_required": deadline.action_required,
-            "rule_citation": deadline.rule_citation,
-            "calculation_basis": deadline.calculation_basis,
-            "trigger_formula": deadline.trigger_formula or "",
-            "days_count": deadline.days_count,
-            "calculation_type": deadline.calculation_type,
-            "short_explanation": deadline.short_explanation or "",
-            # Extra fields for UI
-            "trigger_event": deadline.trigger_event,
-            "trigger_date": deadline.trigger_date.isoformat() if deadline.trigger_date else trigger_date.isoformat(),
-            "jurisdiction": deadline.jurisdiction or jurisdiction,
-            "court_type": deadline.court_type or court_type,
-            "trigger_code": deadline.trigger_code or "",
-            "party_string": deadline.party_string or "",
-            # Authority Core tracking
-            "source_rule_id": deadline.source_rule_id,
-            "source_rule_name": deadline.source_rule_name,
-            "source": "authority_core" if deadline.source_rule_id else "system_rules",
-        })
+    formatted_deadlines = [
+        _format_simulated_deadline(deadline, trigger_date, jurisdiction, court_type)
+        for deadline in integrated_deadlines
+    ]
 
     # Sort by deadline_date
     formatted_deadlines.sort(key=lambda d: d["deadline_date"] or "9999-12-31")
@@ -526,6 +562,164 @@ async def simulate_trigger_deadlines(
     }
 
 
+# ============================================================================
+# BULK SIMULATE ENDPOINT - Replay many historical triggers (firm onboarding)
+# Streams one NDJSON line per item, WITHOUT saving to database
+# ============================================================================
+
+MAX_BULK_SIMULATION_ITEMS = 5000
+BULK_SIMULATION_CHUNK = 250
+
+
+class BulkSimulateItem(BaseModel):
+    """One trigger in a bulk simulation"""
+    case_id: str
+    trigger_type: str
+    trigger_date: str  # ISO format YYYY-MM-DD
+    service_method: Optional[str] = "email"
+    context: Optional[Dict[str, Any]] = None  # Extra case context (e.g. motion_type)
+    ref: Optional[str] = None  # Client reference echoed back on the result line
+
+
+class BulkSimulateRequest(BaseModel):
+    """Request schema for bulk trigger simulation"""
+    items: List[BulkSimulateItem]
+
+
+@router.post("/simulate/bulk")
+def simulate_trigger_deadlines_bulk(
+    request: BulkSimulateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    POST /api/v1/triggers/simulate/bulk - Simulate many triggers at once
+
+    Used when onboarding a firm to replay historical trigger events. Each
+    item is (case_id, trigger_type, trigger_date, service_method, context).
+    Rule templates are resolved once per distinct jurisdiction/trigger pair
+    and each chunk of items is calculated in a single pass.
+
+    Streams application/x-ndjson: one line per item, in request order, with
+    the same fields as /simulate plus "index" and "ref" (failed items carry
+    "success": false and an "error"), then a final summary line
+    {"done": true, "items", "succeeded", "failed", "deadlines"}.
+
+    Constraint: Does NOT save to database - this is a preview/simulation only.
+    """
+    items = request.items
+    if not items:
+        raise HTTPException(status_code=400, detail="No items to simulate")
+    if len(items) > MAX_BULK_SIMULATION_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many items ({len(items)}); maximum is {MAX_BULK_SIMULATION_ITEMS} per request"
+        )
+
+    user_id = str(current_user.id)
+    integrated_service = AuthorityIntegratedDeadlineService(db)
+
+    def result_lines():
+        jurisdiction_ids: Dict[str, Optional[str]] = {}
+        totals = {"items": len(items), "succeeded": 0, "failed": 0, "deadlines": 0}
+
+        for start in range(0, len(items), BULK_SIMULATION_CHUNK):
+            chunk = items[start:start + BULK_SIMULATION_CHUNK]
+
+            # Ownership-checked case lookup, one query per chunk
+            cases = {
+                case.id: case
+                for case in db.query(Case).filter(
+                    Case.id.in_({item.case_id for item in chunk}),
+                    Case.user_id == user_id
+                )
+            }
+
+            lines: List[Optional[dict]] = [None] * len(chunk)
+            bulk_requests: List[BulkDeadlineRequest] = []
+            pending = []
+
+            for offset, item in enumerate(chunk):
+                line = {"index": start + offset, "ref": item.ref, "case_id": item.case_id}
+                error = None
+                try:
+                    TriggerType(item.trigger_type)
+                except ValueError:
+                    error = f"Invalid trigger_type: {item.trigger_type}"
+                try:
+                    trigger_date = datetime.strptime(item.trigger_date, "%Y-%m-%d").date()
+                except ValueError:
+                    error = error or "Invalid trigger_date format. Use YYYY-MM-DD"
+                case = cases.get(item.case_id)
+                if case is None:
+                    error = error or "Case not found"
+
+                if error:
+                    lines[offset] = {**line, "success": False, "error": error}
+                    continue
+
+                jurisdiction, court_type, case_context = _simulation_context(case)
+                if item.context:
+                    case_context = {**case_context, **item.context}
+                if jurisdiction not in jurisdiction_ids:
+                    jurisdiction_ids[jurisdiction] = get_jurisdiction_id(db, jurisdiction)
+
+                bulk_requests.append(BulkDeadlineRequest(
+                    jurisdiction_id=jurisdiction_ids[jurisdiction],
+                    trigger_type=item.trigger_type,
+                    trigger_date=trigger_date,
+                    jurisdiction_name=jurisdiction,
+                    court_type=court_type,
+                    service_method=item.service_method or "email",
+                    case_context=case_context
+                ))
+                pending.append((offset, line, item, case, jurisdiction, court_type, trigger_date))
+
+            results = integrated_service.calculate_deadlines_bulk(bulk_requests) if bulk_requests else []
+
+            for (offset, line, item, case, jurisdiction, court_type, trigger_date), deadlines in zip(pending, results):
+                formatted = [
+                    _format_simulated_deadline(deadline, trigger_date, jurisdiction, court_type)
+                    for deadline in deadlines
+                ]
+                formatted.sort(key=lambda d: d["deadline_date"] or "9999-12-31")
+                if not formatted:
+                    source = "none"
+                elif any(d.source_rule_id for d in deadlines):
+                    source = "authority_core"
+                else:
+                    source = "system_rules"
+
+                lines[offset] = {
+                    **line,
+                    "success": True,
+                    "trigger_type": item.trigger_type,
+                    "trigger_date": item.trigger_date,
+                    "case_number": case.case_number,
+                    "jurisdiction": jurisdiction,
+                    "court_type": court_type,
+                    "deadlines_count": len(formatted),
+                    "deadlines": formatted,
+                    "source": source,
+                }
+
+            for line in lines:
+                if line["success"]:
+                    totals["succeeded"] += 1
+                    totals["deadlines"] += line["deadlines_count"]
+                else:
+                    totals["failed"] += 1
+                yield json.dumps(line, default=str) + "\n"
+
+        logger.info(
+            f"Bulk simulated {totals['items']} triggers for user {user_id}: "
+            f"{totals['succeeded']} ok, {totals['failed']} failed, {totals['deadlines']} deadlines"
+        )
+        yield json.dumps({"done": True, **totals}) + "\n"
+
+    return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/event-types")
 def get_event_types(
     jurisdiction: Optional[str] = None,
@@ -1182,6 +1376,31 @@ class UpdateTriggerDateRequest(BaseModel):
     new_date: str  # ISO format YYYY-MM-DD
 
 
+def _trigger_cascade_engine(db: Session, trigger: Deadline) -> DeadlineCascadeEngine:
+    """Cascade engine for a trigger: pending deadlines, case-jurisdiction holidays"""
+    case = db.query(Case).filter(Case.id == trigger.case_id).first()
+    jurisdiction = case.jurisdiction if case and case.jurisdiction else "florida_state"
+
+    return DeadlineCascadeEngine(
+        db,
+        adjust=lambda d: calendar_service.adjust_for_holidays_and_weekends(d, jurisdiction=jurisdiction),
+        pending_only=True
+    )
+
+
+def _legacy_trigger_dependents(trigger: Deadline):
+    """
+    Rows created before parent_deadline_id was populated: same case and
+    trigger_event, no parent link. Treated as direct dependents of the trigger
+    (whatever their is_dependent flag, as the trigger_event match always was).
+    """
+    return and_(
+        Deadline.case_id == trigger.case_id,
+        Deadline.trigger_event == trigger.trigger_event,
+        Deadline.parent_deadline_id.is_(None)
+    )
+
+
 class CascadePreviewItem(BaseModel):
     deadline_id: str
     title: str
@@ -1223,45 +1442,29 @@ def preview_cascade_changes(
     if not old_trigger_date:
         raise HTTPException(status_code=400, detail="Trigger has no date set")
 
-    # Calculate days difference
-    days_diff = (new_trigger_date - old_trigger_date).days
-
-    # Get all dependent deadlines for this trigger
-    dependent_deadlines = db.query(Deadline).filter(
-        Deadline.trigger_event == trigger.trigger_event,
-        Deadline.case_id == trigger.case_id,
-        Deadline.id != trigger_id  # Exclude the trigger itself
-    ).all()
+    # Same plan update-date would apply
+    plan = _trigger_cascade_engine(db, trigger).plan(
+        trigger_id,
+        old_trigger_date,
+        new_trigger_date,
+        extra_children=_legacy_trigger_dependents(trigger)
+    )
+    changes = {change.node.id: change for change in plan.changes}
 
     preview = []
-    for deadline in dependent_deadlines:
-        current_date = deadline.deadline_date
-        new_deadline_date = None
-
-        if current_date:
-            new_deadline_date = current_date + timedelta(days=days_diff)
-
-        # Check if manually overridden
-        is_manually_overridden = (
-            deadline.is_manually_overridden == True or
-            deadline.auto_recalculate == False
-        )
-
-        # Will update if: has auto_recalculate=True, is pending, and not manually overridden
-        will_update = (
-            deadline.auto_recalculate == True and
-            deadline.status == 'pending' and
-            not is_manually_overridden
-        )
+    for node in plan.nodes.values():
+        change = changes.get(node.id)
+        current_date = node.deadline_date
+        new_deadline_date = change.new_date if change else current_date
 
         preview.append(CascadePreviewItem(
-            deadline_id=str(deadline.id),
-            title=deadline.title,
+            deadline_id=node.id,
+            title=node.title,
             current_date=current_date.isoformat() if current_date else None,
             new_date=new_deadline_date.isoformat() if new_deadline_date else None,
-            days_changed=days_diff,
-            is_manually_overridden=is_manually_overridden,
-            will_update=will_update
+            days_changed=(new_deadline_date - current_date).days if change else 0,
+            is_manually_overridden=bool(node.is_manually_overridden) or node.auto_recalculate == False,
+            will_update=change is not None
         ))
 
     return preview
@@ -1298,47 +1501,25 @@ async def update_trigger_date(
     if not old_trigger_date:
         raise HTTPException(status_code=400, detail="Trigger has no date set")
 
-    # Calculate days difference
-    days_diff = (new_trigger_date - old_trigger_date).days
-
     # Update trigger deadline
     trigger.deadline_date = new_trigger_date
     trigger.trigger_date = new_trigger_date
     trigger.modified_by = current_user.email
 
-    # Get all dependent deadlines that should be updated
-    dependent_deadlines = db.query(Deadline).filter(
-        Deadline.trigger_event == trigger.trigger_event,
-        Deadline.case_id == trigger.case_id,
-        Deadline.id != trigger_id,
-        Deadline.auto_recalculate == True,
-        Deadline.status == 'pending'
-    ).all()
-
-    # Update each dependent deadline
-    updated_count = 0
-    for deadline in dependent_deadlines:
-        # Skip if manually overridden
-        if deadline.is_manually_overridden:
-            continue
-
-        if deadline.deadline_date:
-            # Determine jurisdiction from case for holiday adjustment
-            case = db.query(Case).filter(Case.id == deadline.case_id).first()
-            jurisdiction = case.jurisdiction if case and case.jurisdiction else "florida_state"
-
-            new_deadline_date = deadline.deadline_date + timedelta(days=days_diff)
-
-            # Adjust for holidays/weekends
-            new_deadline_date = calendar_service.adjust_for_holidays_and_weekends(
-                new_deadline_date,
-                jurisdiction=jurisdiction
-            )
-
-            deadline.deadline_date = new_deadline_date
-            deadline.trigger_date = new_trigger_date
-            deadline.modified_by = current_user.email
-            updated_count += 1
+    # Recompute everything downstream of the trigger (pending, auto-recalculated,
+    # not manually overridden) and write it in one bulk UPDATE
+    engine = _trigger_cascade_engine(db, trigger)
+    plan = engine.plan(
+        trigger_id,
+        old_trigger_date,
+        new_trigger_date,
+        extra_children=_legacy_trigger_dependents(trigger)
+    )
+    updated_count = engine.apply(
+        plan,
+        modified_by=current_user.email,
+        always_set_trigger_date=True
+    )
 
     db.commit()
 
@@ -11,6 +11,7 @@ from app.database import get_db
 from app.models.user import User
 from app.utils.auth import get_current_user
 from app.services.workload_optimizer import workload_optimizer
+from app.utils.case_access_check import get_accessible_case_ids
 import logging
 
 logger = logging.getLogger(__name__)
@@ -152,3 +153,40 @@ async def get_rebalancing_suggestions(
     except Exception as e:
         logger.error(f"Suggestion generation error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate suggestions: {str(e)}")
+
+
+@router.get("/team")
+async def analyze_team_workload(
+    days_ahead: int = Query(default=365, ge=7, le=365, description="Days to analyze ahead"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Team-wide workload saturation across every case you can access
+
+    Scores each attorney with deadlines on your owned and shared cases:
+    - Team heatmap: daily deadline count, summed risk and saturated attorneys
+    - Per-attorney saturated days, peak day and burnout periods
+
+    Use this to:
+    - Spot attorneys heading into overloaded stretches months ahead
+    - Staff matters around team-wide crunch periods
+    """
+
+    try:
+        case_ids = get_accessible_case_ids(db, str(current_user.id))
+        analysis = workload_optimizer.analyze_team_saturation(
+            db=db,
+            case_ids=case_ids,
+            days_ahead=days_ahead
+        )
+
+        return {
+            "success": True,
+            "data": analysis,
+            "message": f"Analyzed team workload for next {days_ahead} days"
+        }
+
+    except Exception as e:
+        logger.error(f"Team workload analysis error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Team analysis failed: {str(e)}")
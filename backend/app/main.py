@@ -210,9 +210,27 @@ async def startup():
     if "sqlite" in settings.DATABASE_URL.lower():
         logger.info("Creating database tables (SQLite)...")
         Base.metadata.create_all(bind=engine)
+
+        # FTS5 keyword index over document chunks (trigger-maintained)
+        from app.services.chunk_keyword_index import get_chunk_keyword_index
+        get_chunk_keyword_index().ensure(engine)
     else:
         logger.info("Using PostgreSQL - schema managed by Supabase migrations")
 
+    # Load the precomputed court holiday table plus court_holidays overrides
+    try:
+        from app.database import SessionLocal
+        from app.utils.holiday_provider import get_holiday_provider
+        db = SessionLocal()
+        try:
+            override_count = get_holiday_provider().load_overrides(db)
+        finally:
+            db.close()
+        logger.info(f"✓ Court holiday table loaded ({override_count} overrides)")
+    except Exception as e:
+        logger.error(f"Failed to load court holiday overrides: {e}")
+        logger.warning("Using computed court holidays without database overrides")
+
     # Start background job scheduler for Authority Core automation
     try:
         from app.scheduler import start_scheduler
@@ -7,7 +7,7 @@ from app.models.chat_message import ChatMessage
 from app.models.calendar_event import CalendarEvent
 
 # V3.0 Enhancement Models - RAG, Dependencies, Audit Trail
-from app.models.document_embedding import DocumentEmbedding
+from app.models.document_embedding import DocumentEmbedding, EmbeddingCacheEntry
 from app.models.deadline_chain import DeadlineChain
 from app.models.deadline_dependency import DeadlineDependency
 from app.models.deadline_history import DeadlineHistory
@@ -113,6 +113,10 @@ from app.models.watchtower import WatchtowerHash
 # Phase 7 Step 11: Proposal System for AI Safety Rails
 from app.models.proposal import Proposal
 
+# War Room dashboard aggregates
+from app.models.dashboard_summary import DashboardCaseSummary
+from app.models.morning_report import MorningReportSnapshot
+
 __all__ = [
     "Base",
     "User",
@@ -123,6 +127,7 @@ __all__ = [
     "CalendarEvent",
     # V3.0 Models
     "DocumentEmbedding",
+    "EmbeddingCacheEntry",
     "DeadlineChain",
     "DeadlineDependency",
     "DeadlineHistory",
@@ -201,4 +206,7 @@ __all__ = [
     "WatchtowerHash",
     # Phase 7 Step 11: Proposal System
     "Proposal",
+    # War Room dashboard aggregates
+    "DashboardCaseSummary",
+    "MorningReportSnapshot",
 ]
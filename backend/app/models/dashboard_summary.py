@@ -0,0 +1,46 @@
+"""Materialized per-case dashboard aggregates (War Room)."""
+
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Integer, JSON, func
+
+from app.database import Base
+
+
+class DashboardCaseSummary(Base):
+    """
+    One row per case with everything the War Room dashboard needs.
+
+    Maintained incrementally by app.services.dashboard_summary: any committed
+    change to a case, its deadlines or its documents refreshes that case's row
+    in the same transaction. The dashboard reads all rows of a user with one
+    indexed query and buckets the stored dates against today on read, so the
+    rows never go stale as days pass.
+    """
+    __tablename__ = "dashboard_case_summaries"
+
+    case_id = Column(String(36), ForeignKey("cases.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Denormalized case fields
+    case_number = Column(String(100))
+    title = Column(String(500))
+    court = Column(String(255))
+    judge = Column(String(255))
+    status = Column(String(50))
+    case_type = Column(String(100))
+    jurisdiction = Column(String(100))
+    filing_date = Column(Date)
+
+    # Deadline aggregates
+    total_deadlines = Column(Integer, nullable=False, default=0)
+    completed_deadlines = Column(Integer, nullable=False, default=0)
+    pending_deadlines = Column(Integer, nullable=False, default=0)
+    last_deadline_date = Column(Date)
+    pending_dated = Column(JSON)  # Pending deadlines with a date, serialized, sorted by date
+    activity_by_day = Column(JSON)  # {"added": {date: n}, "completed": {date: n}} for the velocity window
+
+    # Document aggregates
+    document_count = Column(Integer, nullable=False, default=0)
+    last_document_at = Column(DateTime(timezone=True))
+    recent_documents = Column(JSON)  # Latest uploads, newest first
+
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -4,11 +4,12 @@ Stores vector embeddings of document chunks for semantic search
 
 Supports two modes:
 1. pgvector (PostgreSQL) - Uses native Vector type with HNSW index for fast similarity search
-2. JSON fallback (SQLite/PostgreSQL without pgvector) - Stores as JSON array with manual similarity
+2. Fallback (SQLite/PostgreSQL without pgvector) - Stores packed float32/int8 bytes
+   (see app.services.embedding_storage); older rows may still hold a JSON array
 
 Detection is automatic based on database configuration.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, JSON, Index, event
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, JSON, LargeBinary, DateTime, Index, event, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.engine import Engine
 import uuid
@@ -53,8 +54,8 @@ class DocumentEmbedding(Base):
     - Uses pgvector's <=> operator for cosine distance
 
     When using SQLite or PostgreSQL without pgvector:
-    - Stores embedding as JSON array
-    - Uses manual cosine similarity calculation in Python
+    - Stores embedding as packed bytes in embedding_bytes (legacy rows: JSON array)
+    - Uses an in-memory NumPy index for similarity (see case_vector_index)
     """
     __tablename__ = "document_embeddings"
 
@@ -74,11 +75,20 @@ class DocumentEmbedding(Base):
     if USE_PGVECTOR:
         embedding = Column(Vector(EMBEDDING_DIMENSIONS))
     else:
-        embedding = Column(JSON)  # Array of floats as JSON
+        embedding = Column(JSON(none_as_null=True))  # Legacy: array of floats as JSON
+
+    # Packed float32/int8 embedding (fallback mode) - see app.services.embedding_storage
+    embedding_bytes = Column(LargeBinary, nullable=True)
 
     # Metadata about the chunk
     chunk_metadata = Column(JSON)  # {document_type, section, keywords, etc.}
 
+    # sha256 of the normalized chunk text - lets re-embedding skip unchanged chunks
+    content_hash = Column(String(64), nullable=True)
+
+    # Embedding model that produced the vector (NULL: legacy row or fallback vector)
+    embedding_model = Column(String(100), nullable=True)
+
     # Relationships
     case = relationship("Case", back_populates="document_embeddings")
     document = relationship("Document", back_populates="embeddings")
@@ -96,6 +106,22 @@ class DocumentEmbedding(Base):
         return USE_PGVECTOR
 
 
+class EmbeddingCacheEntry(Base):
+    """
+    Content-addressed embedding cache - one vector per (model, chunk text)
+
+    Court filings repeat boilerplate (captions, certificates of service,
+    signature blocks); identical chunks reuse the stored vector instead of
+    calling the embedding API again. See app.services.embedding_cache.
+    """
+    __tablename__ = "embedding_cache"
+
+    model = Column(String(100), primary_key=True)
+    content_hash = Column(String(64), primary_key=True)  # sha256 of normalized chunk text
+    embedding_bytes = Column(LargeBinary, nullable=False)  # Packed float32
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 # SQL to create pgvector extension and HNSW index (run manually on PostgreSQL)
 PGVECTOR_SETUP_SQL = """
 -- Enable pgvector extension (requires superuser or extension granted)
@@ -0,0 +1,30 @@
+"""Precomputed Morning Report snapshots (Intelligence Briefing)."""
+
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Integer, JSON, Numeric, func
+
+from app.database import Base
+
+
+class MorningReportSnapshot(Base):
+    """
+    A user's Morning Report, generated ahead of time.
+
+    Maintained by app.services.morning_report_snapshot: an early-morning job
+    generates every user's report for the day, and later runs regenerate only
+    users whose deadlines, documents or cases changed since.
+    GET /dashboard/morning-report serves the row with one read.
+    """
+    __tablename__ = "morning_report_snapshots"
+
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    report_date = Column(Date, nullable=False)  # Day the date-relative sections were computed for
+    report = Column(JSON, nullable=False)  # Response of MorningReportService.generate_morning_report
+
+    # What the report was generated from
+    source_rows = Column(Integer, nullable=False, default=0)  # Deadline/document/case rows read
+    source_updated_at = Column(DateTime(timezone=True))  # Latest updated_at of those rows
+    source_updated_sum = Column(Numeric(28, 6))  # Sum of their updated_at epochs
+    last_login = Column(DateTime(timezone=True))  # "New since last login" threshold used
+
+    generated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,7 +1,7 @@
 """
 Notification Model - In-app notifications and alerts for users
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum, JSON, func
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum, JSON, Index, func
 from sqlalchemy.orm import relationship
 import uuid
 import enum
@@ -94,6 +94,11 @@ class Notification(Base):
     deadline = relationship("Deadline", backref="notifications")
     document = relationship("Document", backref="notifications")
 
+    __table_args__ = (
+        # "Already reminded today?" anti-join of the reminder engine
+        Index("idx_notifications_deadline_created", "deadline_id", "created_at"),
+    )
+
     def to_dict(self):
         """Convert notification to dictionary"""
         return {
@@ -6,6 +6,7 @@ This module provides APScheduler integration for:
 - Scraper health monitoring
 - Inbox cleanup
 - Automated rule harvesting workflows
+- Morning report pre-generation
 """
 
 import logging
@@ -56,7 +57,8 @@ def start_scheduler():
             run_scraper_health_check,
             cleanup_old_inbox_items,
             run_self_healing_check,  # Phase 6
-            run_conflict_detection_and_resolution  # Phase 6
+            run_conflict_detection_and_resolution,  # Phase 6
+            generate_morning_report_snapshots
         )
 
         # Schedule daily Watchtower - check DAILY sync jurisdictions at 6am UTC
@@ -126,8 +128,20 @@ def start_scheduler():
             name='AI Conflict Resolution'
         )
 
+        # Schedule morning report snapshots - pre-generate briefings before the login rush,
+        # then refresh users whose data changed, at 10:30 and 12:30 UTC
+        scheduler.add_job(
+            generate_morning_report_snapshots,
+            'cron',
+            hour='10,12',
+            minute=30,
+            id='morning_report_snapshots',
+            replace_existing=True,
+            name='Morning Report Snapshots'
+        )
+
         scheduler.start()
-        logger.info("APScheduler started successfully with 6 scheduled jobs")
+        logger.info("APScheduler started successfully with 7 scheduled jobs")
         logger.info(f"Jobs: {[job.id for job in scheduler.get_jobs()]}")
 
     except Exception as e:
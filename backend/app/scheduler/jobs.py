@@ -5,6 +5,7 @@ This module contains the actual job implementations that are
 scheduled by the APScheduler in __init__.py.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import List
@@ -228,6 +229,32 @@ async def cleanup_old_inbox_items():
         db.close()
 
 
+async def generate_morning_report_snapshots():
+    """
+    Pre-generate today's Morning Reports before the login rush.
+
+    Runs daily at 10:30 and 12:30 UTC. The first run generates every user's
+    snapshot for the day; the second only regenerates users whose cases,
+    deadlines or documents changed since (see morning_report_snapshot).
+    Reports are generated by a bounded thread pool off the event loop.
+    """
+    logger.info("Starting morning report snapshot generation")
+
+    try:
+        from app.services.morning_report_snapshot import refresh_morning_report_snapshots
+
+        counts = await asyncio.to_thread(refresh_morning_report_snapshots)
+
+        logger.info(
+            f"Morning report snapshots completed. Generated {counts['generated']}/{counts['users']} "
+            f"({counts['skipped']} current, {counts['failed']} failed)"
+        )
+
+    except Exception as e:
+        logger.error(f"Critical error in morning report snapshot job: {str(e)}")
+        raise
+
+
 # Helper functions for notifications and error handling
 
 async def _notify_jurisdiction_changes(db: Session, jurisdiction: Jurisdiction, changes: dict):
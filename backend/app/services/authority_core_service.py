@@ -45,6 +45,8 @@ from app.schemas.authority_core import (
     DeadlineSpec,
     CalculatedDeadline
 )
+from app.services.authority_rule_index import get_authority_rule_index
+from app.services.rule_condition_compiler import get_condition_cache
 from app.utils.deadline_calculator import AuthoritativeDeadlineCalculator, CalculationMethod
 
 logger = logging.getLogger(__name__)
@@ -570,24 +572,37 @@ class AuthorityCoreService:
         Returns:
             List of matching AuthorityRule objects, sorted by tier precedence
         """
-        query = self.db.query(AuthorityRule).filter(
-            AuthorityRule.trigger_type == trigger_type,
-            AuthorityRule.is_active == True,
-            AuthorityRule.is_verified == True
+        return self._indexed_rules_for_trigger(
+            jurisdiction_id=jurisdiction_id,
+            trigger_type=trigger_type,
+            include_higher_tiers=include_higher_tiers
         )
 
-        if include_higher_tiers:
-            # Get rules for this jurisdiction OR higher-tier (federal) rules
-            query = query.filter(
-                or_(
-                    AuthorityRule.jurisdiction_id == jurisdiction_id,
-                    AuthorityRule.authority_tier == AuthorityTier.FEDERAL
-                )
-            )
-        else:
-            query = query.filter(AuthorityRule.jurisdiction_id == jurisdiction_id)
+    def _indexed_rules_for_trigger(
+        self,
+        jurisdiction_id: str,
+        trigger_type: str,
+        include_higher_tiers: bool = True,
+        case_context: Optional[Dict[str, Any]] = None
+    ) -> List[AuthorityRule]:
+        """
+        Candidate rules from the in-memory rule index, sorted by tier precedence.
 
-        rules = query.all()
+        With a case_context, rules whose declared case_types / motion_types
+        exclude the case are dropped before any row is loaded.
+        """
+        case_context = case_context or {}
+        index = get_authority_rule_index()
+        rule_ids = index.candidate_ids(
+            self.db,
+            trigger_type=trigger_type,
+            jurisdiction_ids=[jurisdiction_id],
+            include_federal=include_higher_tiers,
+            verified_only=True,
+            case_type=case_context.get("case_type"),
+            motion_type=case_context.get("motion_type")
+        )
+        rules = index.load_rules(self.db, rule_ids)
 
         # Sort by tier precedence (lower = higher priority)
         rules.sort(key=lambda r: TIER_PRECEDENCE.get(r.authority_tier, 99))
@@ -616,18 +631,20 @@ class AuthorityCoreService:
         Returns:
             List of effective rules to apply
         """
-        rules = await self.get_rules_for_trigger(
+        rules = self._indexed_rules_for_trigger(
             jurisdiction_id=jurisdiction_id,
             trigger_type=trigger_type,
-            include_higher_tiers=True
+            include_higher_tiers=True,
+            case_context=case_context
         )
 
         if not rules:
             return []
 
-        # Filter by conditions if context provided
+        # Filter by conditions if context provided (compiled once per rule version)
         if case_context:
-            rules = [r for r in rules if self._conditions_match(r.conditions, case_context)]
+            conditions = get_condition_cache()
+            rules = [r for r in rules if conditions.for_rule(r)(case_context)]
 
         return rules
 
@@ -639,13 +656,9 @@ class AuthorityCoreService:
         """
         Check if rule conditions match the case context.
 
-        Supports:
-        - Simple value matching (case_types, motion_types)
-        - Exclusions (exclusions.field = [excluded_values])
-        - Date ranges (date_range.field = {after: date, before: date})
-        - Boolean logic (AND, OR, NOT)
-        - Regex patterns (regex.field = pattern)
-        - Numeric comparisons (numeric.field = {gt: N, lt: N, gte: N, lte: N, eq: N})
+        Conditions are compiled once (see rule_condition_compiler) and the
+        compiled predicate is cached by content, so repeated checks of the same
+        conditions document skip the JSON walk entirely.
 
         Args:
             rule_conditions: The conditions to check
@@ -654,273 +667,7 @@ class AuthorityCoreService:
         Returns:
             True if all conditions match, False otherwise
         """
-        if not rule_conditions:
-            return True
-
-        # Check for boolean logic wrappers
-        if "$and" in rule_conditions:
-            return all(
-                self._conditions_match(sub_cond, case_context)
-                for sub_cond in rule_conditions["$and"]
-            )
-
-        if "$or" in rule_conditions:
-            return any(
-                self._conditions_match(sub_cond, case_context)
-                for sub_cond in rule_conditions["$or"]
-            )
-
-        if "$not" in rule_conditions:
-            return not self._conditions_match(rule_conditions["$not"], case_context)
-
-        # Simple value matching: case_types
-        if "case_types" in rule_conditions:
-            case_type = case_context.get("case_type")
-            allowed_types = rule_conditions["case_types"]
-
-            if case_type:
-                # Support regex patterns in case_types
-                if any(self._match_with_regex(case_type, pattern) for pattern in allowed_types):
-                    pass  # Match found
-                elif case_type not in allowed_types:
-                    return False
-
-        # Simple value matching: motion_types
-        if "motion_types" in rule_conditions:
-            motion_type = case_context.get("motion_type")
-            if motion_type and motion_type not in rule_conditions["motion_types"]:
-                return False
-
-        # Exclusions
-        if "exclusions" in rule_conditions:
-            for key, excluded_values in rule_conditions["exclusions"].items():
-                context_value = case_context.get(key)
-                if context_value is not None and context_value in excluded_values:
-                    return False
-
-        # Date range conditions
-        if "date_range" in rule_conditions:
-            if not self._check_date_range_conditions(
-                rule_conditions["date_range"], case_context
-            ):
-                return False
-
-        # Regex conditions
-        if "regex" in rule_conditions:
-            if not self._check_regex_conditions(
-                rule_conditions["regex"], case_context
-            ):
-                return False
-
-        # Numeric conditions
-        if "numeric" in rule_conditions:
-            if not self._check_numeric_conditions(
-                rule_conditions["numeric"], case_context
-            ):
-                return False
-
-        # Field existence checks
-        if "required_fields" in rule_conditions:
-            for field in rule_conditions["required_fields"]:
-                if field not in case_context or case_context[field] is None:
-                    return False
-
-        # Boolean field checks
-        if "boolean" in rule_conditions:
-            for field, expected_value in rule_conditions["boolean"].items():
-                actual_value = case_context.get(field)
-                # Normalize boolean-like values
-                normalized = self._normalize_boolean(actual_value)
-                expected = self._normalize_boolean(expected_value)
-                if normalized != expected:
-                    return False
-
-        return True
-
-    def _match_with_regex(self, value: str, pattern: str) -> bool:
-        """
-        Check if a value matches a pattern.
-
-        Pattern can be:
-        - Plain string: exact match
-        - String starting with "regex:": regex pattern
-        - String with wildcards (*): glob-style matching
-        """
-        import re
-
-        if pattern.startswith("regex:"):
-            # Explicit regex pattern
-            regex_pattern = pattern[6:]  # Remove "regex:" prefix
-            try:
-                return bool(re.match(regex_pattern, value, re.IGNORECASE))
-            except re.error:
-                logger.warning(f"Invalid regex pattern: {regex_pattern}")
-                return False
-
-        elif "*" in pattern:
-            # Glob-style pattern - convert to regex
-            regex_pattern = pattern.replace("*", ".*")
-            try:
-                return bool(re.match(f"^{regex_pattern}$", value, re.IGNORECASE))
-            except re.error:
-                return False
-
-        else:
-            # Exact match (case-insensitive)
-            return value.lower() == pattern.lower()
-
-    def _check_date_range_conditions(
-        self,
-        date_conditions: Dict[str, Any],
-        case_context: Dict[str, Any]
-    ) -> bool:
-        """
-        Check date range conditions.
-
-        Supports:
-        - after: date must be after this date
-        - before: date must be before this date
-        - on_or_after: date must be on or after this date
-        - on_or_before: date must be on or before this date
-        """
-        from datetime import datetime as dt
-
-        for field, conditions in date_conditions.items():
-            context_value = case_context.get(field)
-            if not context_value:
-                continue
-
-            # Parse the context date
-            if isinstance(context_value, str):
-                try:
-                    context_date = dt.fromisoformat(context_value.replace('Z', '+00:00')).date()
-                except ValueError:
-                    logger.warning(f"Invalid date format in context: {context_value}")
-                    continue
-            elif isinstance(context_value, date):
-                context_date = context_value
-            else:
-                continue
-
-            # Check each condition
-            if "after" in conditions:
-                after_date = self._parse_date_condition(conditions["after"])
-                if after_date and context_date <= after_date:
-                    return False
-
-            if "before" in conditions:
-                before_date = self._parse_date_condition(conditions["before"])
-                if before_date and context_date >= before_date:
-                    return False
-
-            if "on_or_after" in conditions:
-                after_date = self._parse_date_condition(conditions["on_or_after"])
-                if after_date and context_date < after_date:
-                    return False
-
-            if "on_or_before" in conditions:
-                before_date = self._parse_date_condition(conditions["on_or_before"])
-                if before_date and context_date > before_date:
-                    return False
-
-        return True
-
-    def _parse_date_condition(self, value: Any) -> Optional[date]:
-        """Parse a date from a condition value"""
-        from datetime import datetime as dt
-
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            # Handle special values
-            if value == "today":
-                return date.today()
-            try:
-                return dt.fromisoformat(value.replace('Z', '+00:00')).date()
-            except ValueError:
-                return None
-        return None
-
-    def _check_regex_conditions(
-        self,
-        regex_conditions: Dict[str, str],
-        case_context: Dict[str, Any]
-    ) -> bool:
-        """
-        Check regex pattern conditions.
-
-        Format: {"field_name": "pattern"}
-        """
-        import re
-
-        for field, pattern in regex_conditions.items():
-            context_value = case_context.get(field)
-            if context_value is None:
-                continue
-
-            # Convert to string if necessary
-            value_str = str(context_value)
-
-            try:
-                if not re.search(pattern, value_str, re.IGNORECASE):
-                    return False
-            except re.error:
-                logger.warning(f"Invalid regex pattern for {field}: {pattern}")
-                continue
-
-        return True
-
-    def _check_numeric_conditions(
-        self,
-        numeric_conditions: Dict[str, Dict[str, Any]],
-        case_context: Dict[str, Any]
-    ) -> bool:
-        """
-        Check numeric comparison conditions.
-
-        Format: {"field_name": {"gt": N, "lt": N, "gte": N, "lte": N, "eq": N}}
-        """
-        for field, conditions in numeric_conditions.items():
-            context_value = case_context.get(field)
-            if context_value is None:
-                continue
-
-            try:
-                num_value = float(context_value)
-            except (ValueError, TypeError):
-                continue
-
-            # Check each comparison
-            if "gt" in conditions and not (num_value > conditions["gt"]):
-                return False
-            if "lt" in conditions and not (num_value < conditions["lt"]):
-                return False
-            if "gte" in conditions and not (num_value >= conditions["gte"]):
-                return False
-            if "lte" in conditions and not (num_value <= conditions["lte"]):
-                return False
-            if "eq" in conditions and not (num_value == conditions["eq"]):
-                return False
-            if "ne" in conditions and not (num_value != conditions["ne"]):
-                return False
-
-        return True
-
-    def _normalize_boolean(self, value: Any) -> Optional[bool]:
-        """Normalize various boolean-like values to actual booleans"""
-        if value is None:
-            return None
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            lower = value.lower().strip()
-            if lower in ("true", "yes", "1", "y", "on"):
-                return True
-            if lower in ("false", "no", "0", "n", "off"):
-                return False
-        if isinstance(value, (int, float)):
-            return bool(value)
-        return None
+        return get_condition_cache().for_conditions(rule_conditions)(case_context)
 
     async def search_rules(
         self,
@@ -953,16 +700,18 @@ class AuthorityCoreService:
             AuthorityRule.is_active == True
         )
 
-        if jurisdiction_id:
-            db_query = db_query.filter(
-                or_(
-                    AuthorityRule.jurisdiction_id == jurisdiction_id,
-                    AuthorityRule.authority_tier == AuthorityTier.FEDERAL
-                )
+        if jurisdiction_id or trigger_type:
+            # Narrow to indexed candidates so the text match only runs on those rows
+            rule_ids = get_authority_rule_index().candidate_ids(
+                self.db,
+                trigger_type=trigger_type or None,
+                jurisdiction_ids=[jurisdiction_id] if jurisdiction_id else None,
+                include_federal=True,
+                verified_only=False
             )
-
-        if trigger_type:
-            db_query = db_query.filter(AuthorityRule.trigger_type == trigger_type)
+            if not rule_ids:
+                return []
+            db_query = db_query.filter(AuthorityRule.id.in_(rule_ids))
 
         return db_query.limit(limit).all()
 
@@ -1034,15 +783,64 @@ class AuthorityCoreService:
 
         calculated = []
         calculator = AuthoritativeDeadlineCalculator()
+        jurisdiction_name = self._calculator_jurisdiction(jurisdiction_id)
+
+        for rule, deadline_spec, days, method_str, calc_method in self._applicable_deadline_specs(
+            rules, case_context, service_method
+        ):
+            # Calculate the date using AuthoritativeDeadlineCalculator
+            calculation = calculator.calculate_deadline(
+                trigger_date=trigger_date,
+                base_days=days,
+                service_method=service_method,
+                calculation_method=calc_method,
+                jurisdiction=jurisdiction_name
+            )
+
+            # Extract the deadline date from the DeadlineCalculation object
+            calculated.append(self._calculated_deadline(
+                rule, deadline_spec, method_str, calculation.final_deadline, case_context
+            ))
+
+        return calculated
+
+    def _calculator_jurisdiction(self, jurisdiction_id: str) -> str:
+        """Calculator jurisdiction ("state" for Florida, else "federal") of a jurisdiction id"""
+        code = self.db.query(Jurisdiction.code).filter(
+            Jurisdiction.id == jurisdiction_id
+        ).scalar()
+        return "state" if code == "FL" else "federal"
+
+    def _applicable_deadline_specs(
+        self,
+        rules: List[AuthorityRule],
+        case_context: Optional[Dict[str, Any]],
+        service_method: str
+    ):
+        """
+        Yield every deadline the effective rules produce for a case.
+
+        Yields:
+            (rule, deadline_spec, total_days, method_str, CalculationMethod)
+            where total_days includes the rule/deadline service extension
+        """
+        # Map to CalculationMethod enum
+        method_map = {
+            "calendar_days": CalculationMethod.CALENDAR_DAYS,
+            "business_days": CalculationMethod.BUSINESS_DAYS,
+            "court_days": CalculationMethod.COURT_DAYS
+        }
+
+        conditions = get_condition_cache()
 
         for rule in rules:
             # Get rule-level service extensions (defaults)
             rule_extensions = rule.service_extensions or {"mail": 3, "electronic": 0, "personal": 0}
 
-            for deadline_spec in rule.deadlines or []:
-                # Check deadline-specific conditions
+            for index, deadline_spec in enumerate(rule.deadlines or []):
+                # Check deadline-specific conditions (compiled once per rule version)
                 if deadline_spec.get("conditions") and case_context:
-                    if not self._conditions_match(deadline_spec["conditions"], case_context):
+                    if not conditions.for_deadline(rule, index)(case_context):
                         continue
 
                 # =====================================================================
@@ -1055,50 +853,32 @@ class AuthorityCoreService:
                     deadline_extensions=deadline_spec.get("service_extensions")
                 )
 
-                # Calculate the deadline date
                 days = deadline_spec.get("days_from_trigger", 0) + extension_days
                 method_str = deadline_spec.get("calculation_method", "calendar_days")
-
-                # Map to CalculationMethod enum
-                method_map = {
-                    "calendar_days": CalculationMethod.CALENDAR_DAYS,
-                    "business_days": CalculationMethod.BUSINESS_DAYS,
-                    "court_days": CalculationMethod.COURT_DAYS
-                }
                 calc_method = method_map.get(method_str, CalculationMethod.CALENDAR_DAYS)
 
-                # Calculate the date using AuthoritativeDeadlineCalculator
-                # Get jurisdiction name for the calculator
-                jurisdiction_obj = self.db.query(Jurisdiction).filter(
-                    Jurisdiction.id == jurisdiction_id
-                ).first()
-                jurisdiction_name = "state" if jurisdiction_obj and jurisdiction_obj.code == "FL" else "federal"
-
-                calculation = calculator.calculate_deadline(
-                    trigger_date=trigger_date,
-                    base_days=days,
-                    service_method=service_method,
-                    calculation_method=calc_method,
-                    jurisdiction=jurisdiction_name
-                )
-
-                # Extract the deadline date from the DeadlineCalculation object
-                deadline_date = calculation.final_deadline
-
-                calculated.append(CalculatedDeadline(
-                    title=deadline_spec.get("title", "Unknown"),
-                    deadline_date=deadline_date,
-                    days_from_trigger=deadline_spec.get("days_from_trigger", 0),
-                    calculation_method=method_str,
-                    priority=deadline_spec.get("priority", "standard"),
-                    party_responsible=deadline_spec.get("party_responsible"),
-                    source_rule_id=rule.id,
-                    citation=rule.citation,
-                    rule_name=rule.rule_name,
-                    conditions_met=case_context or {}
-                ))
-
-        return calculated
+                yield rule, deadline_spec, days, method_str, calc_method
+
+    @staticmethod
+    def _calculated_deadline(
+        rule: AuthorityRule,
+        deadline_spec: Dict[str, Any],
+        method_str: str,
+        deadline_date: date,
+        case_context: Optional[Dict[str, Any]]
+    ) -> CalculatedDeadline:
+        return CalculatedDeadline(
+            title=deadline_spec.get("title", "Unknown"),
+            deadline_date=deadline_date,
+            days_from_trigger=deadline_spec.get("days_from_trigger", 0),
+            calculation_method=method_str,
+            priority=deadline_spec.get("priority", "standard"),
+            party_responsible=deadline_spec.get("party_responsible"),
+            source_rule_id=rule.id,
+            citation=rule.citation,
+            rule_name=rule.rule_name,
+            conditions_met=case_context or {}
+        )
 
     def _get_service_extension_days(
         self,
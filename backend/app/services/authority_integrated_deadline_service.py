@@ -11,7 +11,7 @@ deadline calculation flow. It:
 This is the bridge between the Authority Core system and the trigger-based
 deadline generation in triggers.py.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from datetime import date
 from dataclasses import dataclass
 import logging
@@ -22,7 +22,9 @@ from sqlalchemy.orm import Session
 from app.models.authority_core import AuthorityRule
 from app.services.authority_core_service import AuthorityCoreService
 from app.services.rules_engine import rules_engine, RuleTemplate, TriggerType
+from app.services.rule_condition_compiler import get_condition_cache
 from app.schemas.authority_core import CalculatedDeadline
+from app.utils.deadline_calculator import AuthoritativeDeadlineCalculator
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,18 @@ class IntegratedDeadline:
     court_type: Optional[str] = None
 
 
+@dataclass
+class BulkDeadlineRequest:
+    """One trigger to calculate in AuthorityIntegratedDeadlineService.calculate_deadlines_bulk"""
+    jurisdiction_id: Optional[str]
+    trigger_type: str
+    trigger_date: date
+    jurisdiction_name: str = "florida_state"
+    court_type: str = "civil"
+    service_method: str = "electronic"
+    case_context: Optional[Dict[str, Any]] = None
+
+
 class AuthorityIntegratedDeadlineService:
     """
     Service that integrates Authority Core rules with deadline calculation.
@@ -87,6 +101,10 @@ class AuthorityIntegratedDeadlineService:
     def __init__(self, db: Session):
         self.db = db
         self.authority_service = AuthorityCoreService(db)
+        # Per-instance resolution caches used by calculate_deadlines_bulk
+        self._bulk_authority_rules: Dict[Tuple[str, str], List[AuthorityRule]] = {}
+        self._bulk_templates: Dict[Tuple[str, str, str], List[RuleTemplate]] = {}
+        self._bulk_calculator_jurisdictions: Dict[str, str] = {}
 
     async def calculate_deadlines(
         self,
@@ -214,27 +232,10 @@ class AuthorityIntegratedDeadlineService:
                 return []
 
             # Convert CalculatedDeadline to IntegratedDeadline
-            deadlines = []
-            for calc in calculated:
-                deadline = IntegratedDeadline(
-                    title=calc.title,
-                    description=f"Calculated from {calc.rule_name}: {calc.citation or ''}",
-                    deadline_date=calc.deadline_date,
-                    priority=calc.priority.upper() if calc.priority else "STANDARD",
-                    party_role=calc.party_responsible or "",
-                    action_required=calc.title,
-                    rule_citation=calc.citation or "",
-                    calculation_basis=f"{calc.days_from_trigger} {calc.calculation_method} from trigger",
-                    trigger_event=trigger_type,
-                    trigger_date=trigger_date,
-                    days_count=calc.days_from_trigger,
-                    calculation_type=calc.calculation_method,
-                    # Authority Core source tracking
-                    source_rule_id=calc.source_rule_id,
-                    source_rule_name=calc.rule_name,
-                    source_citation=calc.citation
-                )
-                deadlines.append(deadline)
+            deadlines = [
+                self._from_authority_calculation(calc, trigger_type, trigger_date)
+                for calc in calculated
+            ]
 
             return deadlines
 
@@ -285,33 +286,10 @@ class AuthorityIntegratedDeadlineService:
                     case_context=case_context or {}
                 )
 
-                for calc in calculated:
-                    deadline = IntegratedDeadline(
-                        title=calc.get("title", ""),
-                        description=calc.get("description", ""),
-                        deadline_date=calc.get("deadline_date"),
-                        priority=calc.get("priority", "STANDARD"),
-                        party_role=calc.get("party_role", ""),
-                        action_required=calc.get("action_required", ""),
-                        rule_citation=calc.get("rule_citation", ""),
-                        calculation_basis=calc.get("calculation_basis", ""),
-                        trigger_event=calc.get("trigger_event", trigger_type),
-                        trigger_date=calc.get("trigger_date", trigger_date),
-                        days_count=calc.get("days_count", 0),
-                        calculation_type=calc.get("calculation_type", "calendar_days"),
-                        # No Authority Core source for hardcoded rules
-                        source_rule_id=None,
-                        source_rule_name=None,
-                        source_citation=None,
-                        # CompuLaw-style fields
-                        trigger_formula=calc.get("trigger_formula"),
-                        short_explanation=calc.get("short_explanation"),
-                        trigger_code=calc.get("trigger_code"),
-                        party_string=calc.get("party_string"),
-                        jurisdiction=calc.get("jurisdiction", jurisdiction_name),
-                        court_type=calc.get("court_type", court_type)
-                    )
-                    deadlines.append(deadline)
+                deadlines.extend(
+                    self._from_rules_engine_calculation(calc, trigger_type, trigger_date, jurisdiction_name, court_type)
+                    for calc in calculated
+                )
 
             return deadlines
 
@@ -319,6 +297,186 @@ class AuthorityIntegratedDeadlineService:
             logger.error(f"Error getting hardcoded deadlines: {e}")
             return []
 
+    @staticmethod
+    def _from_authority_calculation(
+        calc: CalculatedDeadline,
+        trigger_type: str,
+        trigger_date: date
+    ) -> IntegratedDeadline:
+        """Convert an Authority Core CalculatedDeadline"""
+        return IntegratedDeadline(
+            title=calc.title,
+            description=f"Calculated from {calc.rule_name}: {calc.citation or ''}",
+            deadline_date=calc.deadline_date,
+            priority=calc.priority.upper() if calc.priority else "STANDARD",
+            party_role=calc.party_responsible or "",
+            action_required=calc.title,
+            rule_citation=calc.citation or "",
+            calculation_basis=f"{calc.days_from_trigger} {calc.calculation_method} from trigger",
+            trigger_event=trigger_type,
+            trigger_date=trigger_date,
+            days_count=calc.days_from_trigger,
+            calculation_type=calc.calculation_method,
+            # Authority Core source tracking
+            source_rule_id=calc.source_rule_id,
+            source_rule_name=calc.rule_name,
+            source_citation=calc.citation
+        )
+
+    @staticmethod
+    def _from_rules_engine_calculation(
+        calc: Dict[str, Any],
+        trigger_type: str,
+        trigger_date: date,
+        jurisdiction_name: str,
+        court_type: str
+    ) -> IntegratedDeadline:
+        """Convert a rules_engine.calculate_dependent_deadlines result"""
+        return IntegratedDeadline(
+            title=calc.get("title", ""),
+            description=calc.get("description", ""),
+            deadline_date=calc.get("deadline_date"),
+            priority=calc.get("priority", "STANDARD"),
+            party_role=calc.get("party_role", ""),
+            action_required=calc.get("action_required", ""),
+            rule_citation=calc.get("rule_citation", ""),
+            calculation_basis=calc.get("calculation_basis", ""),
+            trigger_event=calc.get("trigger_event", trigger_type),
+            trigger_date=calc.get("trigger_date", trigger_date),
+            days_count=calc.get("days_count", 0),
+            calculation_type=calc.get("calculation_type", "calendar_days"),
+            # No Authority Core source for hardcoded rules
+            source_rule_id=None,
+            source_rule_name=None,
+            source_citation=None,
+            # CompuLaw-style fields
+            trigger_formula=calc.get("trigger_formula"),
+            short_explanation=calc.get("short_explanation"),
+            trigger_code=calc.get("trigger_code"),
+            party_string=calc.get("party_string"),
+            jurisdiction=calc.get("jurisdiction", jurisdiction_name),
+            court_type=calc.get("court_type", court_type)
+        )
+
+    # =========================================================================
+    # BULK CALCULATION
+    # =========================================================================
+
+    def _authority_rules_for(self, jurisdiction_id: str, trigger_type: str) -> List[AuthorityRule]:
+        """Candidate Authority Core rules, resolved once per jurisdiction/trigger pair"""
+        key = (jurisdiction_id, trigger_type)
+        if key not in self._bulk_authority_rules:
+            try:
+                self._bulk_authority_rules[key] = self.authority_service._indexed_rules_for_trigger(
+                    jurisdiction_id=jurisdiction_id,
+                    trigger_type=trigger_type,
+                    include_higher_tiers=True
+                )
+            except Exception as e:
+                logger.error(f"Error getting Authority Core rules for {trigger_type} in {jurisdiction_id}: {e}")
+                self._bulk_authority_rules[key] = []
+        return self._bulk_authority_rules[key]
+
+    def _templates_for(self, jurisdiction_name: str, court_type: str, trigger_type: str) -> List[RuleTemplate]:
+        """Hardcoded rule templates, resolved once per jurisdiction/court/trigger"""
+        key = (jurisdiction_name, court_type, trigger_type)
+        if key not in self._bulk_templates:
+            try:
+                self._bulk_templates[key] = rules_engine.get_applicable_rules(
+                    jurisdiction=jurisdiction_name,
+                    court_type=court_type,
+                    trigger_type=TriggerType(trigger_type)
+                )
+            except ValueError:
+                logger.warning(f"Unknown trigger type: {trigger_type}")
+                self._bulk_templates[key] = []
+        return self._bulk_templates[key]
+
+    def calculate_deadlines_bulk(
+        self,
+        requests: Sequence[BulkDeadlineRequest]
+    ) -> List[List[IntegratedDeadline]]:
+        """
+        Calculate deadlines for many triggers at once (same sources and
+        precedence as calculate_deadlines, without usage recording).
+
+        Rules and templates are resolved once per distinct jurisdiction /
+        trigger pair for the lifetime of this service instance, so callers
+        can feed a large replay through in chunks. Every Authority Core
+        deadline in the chunk is dated in a single vectorized
+        calculate_deadlines_batch call per calculator jurisdiction.
+
+        Args:
+            requests: Triggers to calculate
+
+        Returns:
+            One list of IntegratedDeadline per request, in request order
+        """
+        results: List[List[IntegratedDeadline]] = [[] for _ in requests]
+        conditions = get_condition_cache()
+
+        # Pass 1: collect every Authority Core deadline across all requests
+        # calculator jurisdiction -> [(request index, rule, spec, method_str)], batch rows
+        pending: Dict[str, Tuple[List[tuple], List[tuple]]] = {}
+        for i, request in enumerate(requests):
+            if not USE_AUTHORITY_CORE:
+                continue
+
+            jurisdiction_id = request.jurisdiction_id or ""
+            rules = self._authority_rules_for(jurisdiction_id, request.trigger_type)
+            if rules and request.case_context:
+                rules = [r for r in rules if conditions.for_rule(r)(request.case_context)]
+            if not rules:
+                continue
+
+            calculator_jurisdiction = self._bulk_calculator_jurisdictions.get(jurisdiction_id)
+            if calculator_jurisdiction is None:
+                calculator_jurisdiction = self.authority_service._calculator_jurisdiction(jurisdiction_id)
+                self._bulk_calculator_jurisdictions[jurisdiction_id] = calculator_jurisdiction
+
+            specs, rows = pending.setdefault(calculator_jurisdiction, ([], []))
+            for rule, spec, days, method_str, calc_method in self.authority_service._applicable_deadline_specs(
+                rules, request.case_context, request.service_method
+            ):
+                specs.append((i, rule, spec, method_str))
+                rows.append((request.trigger_date, days, calc_method, request.service_method))
+
+        calculator = AuthoritativeDeadlineCalculator()
+        for calculator_jurisdiction, (specs, rows) in pending.items():
+            final_dates = calculator.calculate_deadlines_batch(rows, jurisdiction=calculator_jurisdiction).final_deadlines
+            for (i, rule, spec, method_str), deadline_date in zip(specs, final_dates):
+                request = requests[i]
+                calc = self.authority_service._calculated_deadline(
+                    rule, spec, method_str, deadline_date, request.case_context
+                )
+                results[i].append(self._from_authority_calculation(calc, request.trigger_type, request.trigger_date))
+
+        # Pass 2: hardcoded fallback for requests without Authority Core deadlines
+        for i, request in enumerate(requests):
+            if results[i]:
+                continue
+            templates = self._templates_for(request.jurisdiction_name, request.court_type, request.trigger_type)
+            for template in templates:
+                try:
+                    calculated = rules_engine.calculate_dependent_deadlines(
+                        trigger_date=request.trigger_date,
+                        rule_template=template,
+                        service_method=request.service_method,
+                        case_context=request.case_context or {}
+                    )
+                except Exception as e:
+                    logger.error(f"Error getting hardcoded deadlines: {e}")
+                    continue
+                results[i].extend(
+                    self._from_rules_engine_calculation(
+                        calc, request.trigger_type, request.trigger_date,
+                        request.jurisdiction_name, request.court_type
+                    )
+                    for calc in calculated
+                )
+
+        return results
+
     def has_authority_core_rules(
         self,
         jurisdiction_id: str,
@@ -0,0 +1,415 @@
+"""
+Authority Rule Index - In-memory inverted index over active Authority Core rules
+
+Candidate-rule lookups (trigger + jurisdiction, with or without federal rules,
+verified only, narrowed by case/motion type) used to filter authority_rules
+and then evaluate every returned row in Python. This index keeps postings
+lists of rule ids keyed by:
+
+- jurisdiction_id
+- trigger_type
+- authority tier
+- declared condition values (case_types / motion_types exact values)
+
+so a lookup is a handful of set intersections; only the matching rows are
+then loaded by primary key.
+
+The index holds metadata only (never ORM instances) and covers active rules.
+It is built with a single column query on first use and then maintained
+incrementally: every committed session that inserts, updates (approve,
+deactivate, new version) or deletes an AuthorityRule re-indexes just those
+rules. Writes made by other processes (scheduler harvest, scripts) are
+detected on read with a cheap stamp query - number of active rules and
+latest updated_at - as case_vector_index does; a periodic full rebuild
+(MAX_AGE) remains as a backstop.
+
+Usage:
+    index = get_authority_rule_index()
+    ids = index.candidate_ids(db, trigger_type="complaint_served",
+                              jurisdiction_ids=[jurisdiction_id])
+    rules = index.load_rules(db, ids)
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set
+
+from sqlalchemy import case, event, func
+from sqlalchemy.orm import Session
+
+from app.models.authority_core import AuthorityRule
+from app.models.enums import AuthorityTier
+
+logger = logging.getLogger(__name__)
+
+
+def _key(value: Any) -> Optional[str]:
+    """Normalize enum / str values to the stored string form"""
+    if value is None:
+        return None
+    return getattr(value, "value", value)
+
+
+@dataclass(frozen=True)
+class IndexedRule:
+    """Metadata of one active rule as stored in the index"""
+    id: str
+    jurisdiction_id: Optional[str]
+    trigger_type: Optional[str]
+    authority_tier: Optional[str]
+    is_verified: bool
+    # Exact (lowercased) case types the rule is restricted to; None = unrestricted
+    case_types: Optional[FrozenSet[str]]
+    # Exact motion types the rule is restricted to; None = unrestricted
+    motion_types: Optional[FrozenSet[Any]]
+
+
+def _case_type_postings(conditions: Any) -> Optional[FrozenSet[str]]:
+    """
+    Exact case types a rule's top-level conditions restrict it to.
+
+    Rules whose case_types use regex/glob patterns, or whose conditions are
+    wrapped in $and/$or/$not, are treated as unrestricted - the compiled
+    predicate still has the final say.
+    """
+    if not isinstance(conditions, Mapping) or not conditions:
+        return None
+    if "$and" in conditions or "$or" in conditions or "$not" in conditions:
+        return None
+    allowed = conditions.get("case_types")
+    if not isinstance(allowed, (list, tuple)):
+        return None
+    values = set()
+    for pattern in allowed:
+        if not isinstance(pattern, str) or pattern.startswith("regex:") or "*" in pattern:
+            return None
+        values.add(pattern.lower())
+    return frozenset(values)
+
+
+def _motion_type_postings(conditions: Any) -> Optional[FrozenSet[Any]]:
+    """Exact motion types a rule's top-level conditions restrict it to."""
+    if not isinstance(conditions, Mapping) or not conditions:
+        return None
+    if "$and" in conditions or "$or" in conditions or "$not" in conditions:
+        return None
+    allowed = conditions.get("motion_types")
+    if not isinstance(allowed, (list, tuple)):
+        return None
+    try:
+        return frozenset(allowed)
+    except TypeError:
+        return None
+
+
+def indexed_rule_from(rule: Any) -> IndexedRule:
+    """Build an index entry from an AuthorityRule (or a row with the same fields)."""
+    conditions = rule.conditions
+    return IndexedRule(
+        id=str(rule.id),
+        jurisdiction_id=rule.jurisdiction_id,
+        trigger_type=_key(rule.trigger_type),
+        authority_tier=_key(rule.authority_tier),
+        is_verified=bool(rule.is_verified),
+        case_types=_case_type_postings(conditions),
+        motion_types=_motion_type_postings(conditions),
+    )
+
+
+class AuthorityRuleIndex:
+    """
+    Inverted index of active Authority Core rules.
+
+    Thread-safe: mutations and lookups take a lock; lookups return new sets.
+    """
+
+    # Full rebuild interval (seconds), backstop for writes the stamp misses
+    MAX_AGE = 15 * 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        # Latest authority_rules.updated_at the index reflects (None: adopt on next check)
+        self._stamp: Optional[Any] = None
+        self._rules: Dict[str, IndexedRule] = {}
+        self._by_jurisdiction: Dict[Optional[str], Set[str]] = {}
+        self._by_trigger: Dict[Optional[str], Set[str]] = {}
+        self._by_tier: Dict[Optional[str], Set[str]] = {}
+        self._verified: Set[str] = set()
+        # (condition key, value) -> ids restricted to that value
+        self._by_condition: Dict[tuple, Set[str]] = {}
+        # condition key -> ids with no restriction on that key
+        self._unrestricted: Dict[str, Set[str]] = {"case_types": set(), "motion_types": set()}
+        self._stats = {
+            "lookups": 0,
+            "full_builds": 0,
+            "stale": 0,
+            "incremental_updates": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _add(self, entry: IndexedRule) -> None:
+        self._rules[entry.id] = entry
+        self._by_jurisdiction.setdefault(entry.jurisdiction_id, set()).add(entry.id)
+        self._by_trigger.setdefault(entry.trigger_type, set()).add(entry.id)
+        self._by_tier.setdefault(entry.authority_tier, set()).add(entry.id)
+        if entry.is_verified:
+            self._verified.add(entry.id)
+        for condition_key, values in (("case_types", entry.case_types), ("motion_types", entry.motion_types)):
+            if values is None:
+                self._unrestricted[condition_key].add(entry.id)
+            else:
+                for value in values:
+                    self._by_condition.setdefault((condition_key, value), set()).add(entry.id)
+
+    def _discard(self, rule_id: str) -> None:
+        entry = self._rules.pop(rule_id, None)
+        if entry is None:
+            return
+        self._by_jurisdiction.get(entry.jurisdiction_id, set()).discard(rule_id)
+        self._by_trigger.get(entry.trigger_type, set()).discard(rule_id)
+        self._by_tier.get(entry.authority_tier, set()).discard(rule_id)
+        self._verified.discard(rule_id)
+        for condition_key, values in (("case_types", entry.case_types), ("motion_types", entry.motion_types)):
+            if values is None:
+                self._unrestricted[condition_key].discard(rule_id)
+            else:
+                for value in values:
+                    self._by_condition.get((condition_key, value), set()).discard(rule_id)
+
+    def build(self, entries: Iterable[IndexedRule], stamp: Optional[Any] = None) -> int:
+        """Replace the whole index. Returns number of rules indexed."""
+        with self._lock:
+            self._stamp = stamp
+            self._rules = {}
+            self._by_jurisdiction = {}
+            self._by_trigger = {}
+            self._by_tier = {}
+            self._verified = set()
+            self._by_condition = {}
+            self._unrestricted = {"case_types": set(), "motion_types": set()}
+            for entry in entries:
+                self._add(entry)
+            self._loaded_at = time.monotonic()
+            self._stats["full_builds"] += 1
+            count = len(self._rules)
+        logger.info(f"Authority rule index built: {count} active rules")
+        return count
+
+    def apply(self, changes: Mapping[str, Optional[IndexedRule]]) -> None:
+        """
+        Apply incremental changes: rule id -> new entry, or None to remove.
+
+        Ignored until the index has been built (the build will see them).
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            for rule_id, entry in changes.items():
+                self._discard(rule_id)
+                if entry is not None:
+                    self._add(entry)
+            self._stamp = None  # This commit's updated_at is adopted on the next check
+            self._stats["incremental_updates"] += len(changes)
+
+    def _is_current(self, active: int, updated_at: Optional[Any]) -> bool:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.MAX_AGE:
+            return False
+        if len(self._rules) != active:
+            return False
+        if self._stamp is None:
+            self._stamp = updated_at
+        return self._stamp == updated_at
+
+    def ensure_loaded(self, db: Session) -> None:
+        """
+        Build from the database on first use, when the table stamp (active
+        rules, latest updated_at) no longer matches, or when older than MAX_AGE.
+        """
+        active, updated_at = db.query(
+            func.sum(case((AuthorityRule.is_active == True, 1), else_=0)),
+            func.max(AuthorityRule.updated_at)
+        ).one()
+        with self._lock:
+            if self._is_current(int(active or 0), updated_at):
+                return
+            if self._loaded_at is not None:
+                self._stats["stale"] += 1
+        rows = db.query(
+            AuthorityRule.id,
+            AuthorityRule.jurisdiction_id,
+            AuthorityRule.trigger_type,
+            AuthorityRule.authority_tier,
+            AuthorityRule.is_verified,
+            AuthorityRule.conditions,
+        ).filter(AuthorityRule.is_active == True).all()
+        self.build((indexed_rule_from(row) for row in rows), stamp=updated_at)
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on next use."""
+        with self._lock:
+            self._loaded_at = None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def candidate_ids(
+        self,
+        db: Optional[Session],
+        trigger_type: Optional[Any] = None,
+        jurisdiction_ids: Optional[Iterable[str]] = None,
+        include_federal: bool = False,
+        verified_only: bool = True,
+        case_type: Optional[str] = None,
+        motion_type: Optional[Any] = None
+    ) -> Set[str]:
+        """
+        Ids of active rules matching every given filter.
+
+        Args:
+            db: Session used to build the index if needed (None = use as-is)
+            trigger_type: Restrict to this trigger type
+            jurisdiction_ids: Restrict to these jurisdictions
+            include_federal: Also include federal-tier rules from any jurisdiction
+            verified_only: Only verified rules
+            case_type: Drop rules whose case_types exclude this case type
+            motion_type: Drop rules whose motion_types exclude this motion type
+
+        Returns:
+            Set of candidate rule ids (conditions still need evaluating)
+        """
+        if db is not None:
+            self.ensure_loaded(db)
+
+        with self._lock:
+            self._stats["lookups"] += 1
+            postings: List[Set[str]] = []
+
+            if trigger_type is not None:
+                postings.append(self._by_trigger.get(_key(trigger_type), set()))
+
+            if jurisdiction_ids is not None:
+                scope: Set[str] = set()
+                for jurisdiction_id in jurisdiction_ids:
+                    scope |= self._by_jurisdiction.get(jurisdiction_id, set())
+                if include_federal:
+                    scope |= self._by_tier.get(AuthorityTier.FEDERAL.value, set())
+                postings.append(scope)
+
+            if verified_only:
+                postings.append(self._verified)
+
+            if case_type and isinstance(case_type, str):
+                postings.append(
+                    self._unrestricted["case_types"]
+                    | self._by_condition.get(("case_types", case_type.lower()), set())
+                )
+
+            if motion_type:
+                try:
+                    restricted = self._by_condition.get(("motion_types", motion_type), set())
+                except TypeError:
+                    restricted = set()
+                postings.append(self._unrestricted["motion_types"] | restricted)
+
+            if not postings:
+                return set(self._rules)
+
+            postings.sort(key=len)
+            result = set(postings[0])
+            for posting in postings[1:]:
+                result &= posting
+                if not result:
+                    break
+            return result
+
+    def load_rules(
+        self,
+        db: Session,
+        rule_ids: Iterable[str],
+        verified_only: bool = True
+    ) -> List[AuthorityRule]:
+        """
+        Load the given rules by primary key (one query, unordered).
+
+        The active/verified filters are re-applied here so the index only ever
+        narrows candidates: a rule deactivated since the index was built (by
+        another process or a write that skipped the ORM) is never returned.
+        """
+        rule_ids = list(rule_ids)
+        if not rule_ids:
+            return []
+        query = db.query(AuthorityRule).filter(
+            AuthorityRule.id.in_(rule_ids),
+            AuthorityRule.is_active == True
+        )
+        if verified_only:
+            query = query.filter(AuthorityRule.is_verified == True)
+        return query.all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index statistics for diagnostics."""
+        with self._lock:
+            return {
+                "loaded": self._loaded_at is not None,
+                "rules": len(self._rules),
+                "jurisdictions": len(self._by_jurisdiction),
+                "trigger_types": len(self._by_trigger),
+                **self._stats,
+            }
+
+
+# Global singleton instance
+authority_rule_index = AuthorityRuleIndex()
+
+
+def get_authority_rule_index() -> AuthorityRuleIndex:
+    """Get the global authority rule index instance."""
+    return authority_rule_index
+
+
+# =============================================================================
+# INCREMENTAL MAINTENANCE ON COMMIT
+# =============================================================================
+
+_PENDING_KEY = "authority_rule_index_changes"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_rule_changes(session, flush_context):
+    """Capture index entries for flushed AuthorityRule rows (final state)."""
+    changes = None
+    for obj, deleted in (
+        *((obj, False) for obj in session.new),
+        *((obj, False) for obj in session.dirty),
+        *((obj, True) for obj in session.deleted),
+    ):
+        if not isinstance(obj, AuthorityRule) or obj.id is None:
+            continue
+        if changes is None:
+            changes = session.info.setdefault(_PENDING_KEY, {})
+        if deleted or obj.is_active is False:
+            changes[str(obj.id)] = None
+        else:
+            changes[str(obj.id)] = indexed_rule_from(obj)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_rule_changes(session):
+    if session.in_nested_transaction():
+        return  # Savepoint released (e.g. the summary refresh): the outer transaction is still open
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        authority_rule_index.apply(changes)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rule_changes(session, previous_transaction):
+    # A rolled-back savepoint leaves the outer transaction's changes pending
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
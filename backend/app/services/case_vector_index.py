@@ -0,0 +1,325 @@
+"""
+Case Vector Index - In-process similarity search over a case's chunk embeddings
+
+Without pgvector, semantic search used to load every DocumentEmbedding row
+of the case as ORM objects and run a pure-Python cosine similarity per row.
+This module keeps, per case, a contiguous float32 matrix of pre-normalized
+embedding rows so that a top-k query is one matrix-vector product plus
+``numpy.argpartition``:
+
+- built once per case with a single column query (no ORM objects); packed
+  embeddings are decoded with ``numpy.frombuffer`` (see embedding_storage)
+- kept in a process-wide cache bounded by total vector memory (LRU)
+- extended in place when new chunks are embedded (amortized O(1) append)
+- checked against the case's row count and max(id) on use, so deletions or
+  rows written by another process trigger a rebuild (the id stamp catches
+  chunks deleted and re-inserted in equal number, as re-embedding does)
+
+Only ids and ranking data live in memory; chunk text and metadata of the
+top-k rows are loaded by primary key afterwards.
+
+Usage:
+    index = get_case_vector_index_cache().get(db, case_id)
+    hits = index.search(query_embedding, top_k=5)   # [(embedding_id, similarity)]
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.document_embedding import DocumentEmbedding
+from app.services.embedding_storage import row_vector
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length in place (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class _VectorBlock:
+    """Unit-length float32 rows of one embedding dimension, with spare capacity"""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.matrix = np.empty((0, dimension), dtype=np.float32)
+        self.size = 0
+        self.ids: List[str] = []
+
+    def append(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        needed = self.size + len(ids)
+        if needed > self.matrix.shape[0]:
+            capacity = max(needed, 2 * self.matrix.shape[0], 64)
+            grown = np.empty((capacity, self.dimension), dtype=np.float32)
+            grown[:self.size] = self.matrix[:self.size]
+            self.matrix = grown
+        self.matrix[self.size:needed] = _normalize_rows(vectors)
+        self.ids.extend(ids)
+        self.size = needed
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes
+
+
+class CaseVectorIndex:
+    """
+    Pre-normalized embedding matrix of one case.
+
+    Rows are grouped by dimension (fallback and OpenAI embeddings can coexist
+    in a case); a query only scores rows of its own dimension, and other rows
+    count as similarity 0.0, as the old per-row cosine did.
+    """
+
+    def __init__(self, case_id: str):
+        self.case_id = case_id
+        self._blocks: Dict[int, _VectorBlock] = {}
+        self._other_ids: List[str] = []  # Rows without a usable embedding
+        self._lock = threading.Lock()
+        # max(id) of the case's rows when last checked against the database;
+        # None after an incremental add (adopted from the next check)
+        self.stamp: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        """Number of rows (with and without embeddings) the index accounts for"""
+        return sum(block.size for block in self._blocks.values()) + len(self._other_ids)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(block.nbytes for block in self._blocks.values())
+
+    def add(self, rows: Iterable[Tuple[str, Optional[Sequence[float]]]]) -> int:
+        """
+        Append (embedding_id, vector) rows.
+
+        Returns:
+            Number of rows added
+        """
+        by_dimension: Dict[int, Tuple[List[str], List[Sequence[float]]]] = {}
+        empty: List[str] = []
+        for row_id, vector in rows:
+            if vector is None or len(vector) == 0:
+                empty.append(str(row_id))
+                continue
+            ids, vectors = by_dimension.setdefault(len(vector), ([], []))
+            ids.append(str(row_id))
+            vectors.append(vector)
+
+        with self._lock:
+            for dimension, (ids, vectors) in by_dimension.items():
+                block = self._blocks.get(dimension)
+                if block is None:
+                    block = self._blocks[dimension] = _VectorBlock(dimension)
+                block.append(ids, np.asarray(vectors, dtype=np.float32))
+            self._other_ids.extend(empty)
+
+        return sum(len(ids) for ids, _ in by_dimension.values()) + len(empty)
+
+    def search(self, query_embedding: Sequence[float], top_k: int) -> List[Tuple[str, float]]:
+        """
+        Top-k rows by cosine similarity.
+
+        Returns:
+            [(embedding_id, similarity)] best first
+        """
+        if top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+
+        with self._lock:
+            block = self._blocks.get(query.shape[0])
+            results: List[Tuple[str, float]] = []
+
+            if block is not None and block.size and norm > 0:
+                scores = block.matrix[:block.size] @ (query / norm)
+                k = min(top_k, block.size)
+                if k < block.size:
+                    top = np.argpartition(-scores, k - 1)[:k]
+                else:
+                    top = np.arange(block.size)
+                # Stable sort keeps insertion order among equal scores
+                top = top[np.argsort(-scores[top], kind="stable")]
+                results = [(block.ids[i], float(scores[i])) for i in top]
+
+            # Rows that cannot be compared score 0.0, so they still outrank
+            # negative similarities and fill up small cases
+            unscored: List[str] = []
+            for other in self._blocks.values():
+                if other is not block or norm == 0:
+                    unscored.extend(other.ids[:top_k - len(unscored)])
+            unscored.extend(self._other_ids[:top_k - len(unscored)])
+
+        if unscored:
+            results.extend((row_id, 0.0) for row_id in unscored)
+            results.sort(key=lambda r: r[1], reverse=True)
+        return results[:top_k]
+
+
+class CaseVectorIndexCache:
+    """
+    LRU cache of CaseVectorIndex objects bounded by total matrix memory.
+
+    Thread-safe. An index larger than the whole budget is still returned to
+    the caller, just not kept.
+    """
+
+    DEFAULT_MAX_BYTES = int(os.getenv("VECTOR_INDEX_CACHE_MB", "512")) * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._entries: "OrderedDict[str, CaseVectorIndex]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "builds": 0,
+            "incremental_adds": 0,
+            "evictions": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lookup / build
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_current(index: Optional[CaseVectorIndex], row_count: int, max_id: Optional[str]) -> bool:
+        if index is None or index.size != row_count:
+            return False
+        if index.stamp is None:
+            index.stamp = max_id
+        return index.stamp == max_id
+
+    def get(self, db: Session, case_id: str) -> CaseVectorIndex:
+        """Index for a case, built (or rebuilt when out of date) as needed."""
+        case_id = str(case_id)
+        row_count, max_id = db.query(
+            func.count(DocumentEmbedding.id), func.max(DocumentEmbedding.id)
+        ).filter(
+            DocumentEmbedding.case_id == case_id
+        ).one()
+        row_count = row_count or 0
+
+        with self._lock:
+            index = self._entries.get(case_id)
+            if self._is_current(index, row_count, max_id):
+                self._entries.move_to_end(case_id)
+                self._stats["hits"] += 1
+                return index
+            if index is not None:
+                self._stats["stale"] += 1
+            self._stats["misses"] += 1
+            build_lock = self._build_locks.setdefault(case_id, threading.Lock())
+
+        with build_lock:
+            # Another request may have just built it
+            with self._lock:
+                index = self._entries.get(case_id)
+            if self._is_current(index, row_count, max_id):
+                return index
+
+            index = self.build(db, case_id)
+            index.stamp = max_id
+            self._store(index)
+            return index
+
+    def build(self, db: Session, case_id: str) -> CaseVectorIndex:
+        """Build an index from the database (one column query)."""
+        index = CaseVectorIndex(case_id)
+        rows = db.query(
+            DocumentEmbedding.id, DocumentEmbedding.embedding_bytes, DocumentEmbedding.embedding
+        ).filter(
+            DocumentEmbedding.case_id == case_id
+        ).order_by(DocumentEmbedding.document_id, DocumentEmbedding.chunk_index).all()
+        index.add((row.id, row_vector(row.embedding_bytes, row.embedding)) for row in rows)
+        with self._lock:
+            self._stats["builds"] += 1
+        logger.debug(f"Vector index for case {case_id}: {index.size} rows, {index.nbytes / 1e6:.1f} MB")
+        return index
+
+    def _store(self, index: CaseVectorIndex) -> None:
+        with self._lock:
+            self._entries[index.case_id] = index
+            self._entries.move_to_end(index.case_id)
+            self._evict()
+
+    def _evict(self) -> None:
+        total = sum(index.nbytes for index in self._entries.values())
+        while total > self._max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.nbytes
+            self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add_chunks(self, case_id: str, rows: Iterable[Tuple[str, Optional[Sequence[float]]]]) -> bool:
+        """
+        Append newly committed (embedding_id, vector) rows to a cached index.
+
+        Returns:
+            True if the case was cached and updated (otherwise it is built
+            from the database on next use)
+        """
+        with self._lock:
+            index = self._entries.get(str(case_id))
+        if index is None:
+            return False
+        index.add(rows)
+        index.stamp = None
+        with self._lock:
+            self._stats["incremental_adds"] += 1
+            self._evict()
+        return True
+
+    def invalidate(self, case_id: str) -> None:
+        """Drop a case's index (e.g. after embeddings were deleted)."""
+        with self._lock:
+            self._entries.pop(str(case_id), None)
+
+    def clear(self) -> int:
+        """Drop all indexes. Returns number of cases removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics including hit rate and memory use."""
+        with self._lock:
+            total_requests = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (
+                self._stats["hits"] / total_requests * 100
+                if total_requests > 0
+                else 0.0
+            )
+            return {
+                "cases": len(self._entries),
+                "rows": sum(index.size for index in self._entries.values()),
+                "memory_mb": round(sum(index.nbytes for index in self._entries.values()) / 1e6, 1),
+                "max_memory_mb": round(self._max_bytes / 1e6, 1),
+                "hit_rate": f"{hit_rate:.1f}%",
+                **self._stats,
+            }
+
+
+# Global singleton instance
+case_vector_index_cache = CaseVectorIndexCache()
+
+
+def get_case_vector_index_cache() -> CaseVectorIndexCache:
+    """Get the global case vector index cache instance."""
+    return case_vector_index_cache
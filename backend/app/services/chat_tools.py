@@ -2881,6 +2881,7 @@ class ChatToolExecutor:
         try:
             from app.models.authority_core import AuthorityRule
             from app.models.jurisdiction import Jurisdiction
+            from app.services.authority_rule_index import get_authority_rule_index
 
             trigger_type = input_data.get('trigger_type')
             jurisdiction_id = input_data.get('jurisdiction_id')
@@ -2888,16 +2889,19 @@ class ChatToolExecutor:
             if not trigger_type or not jurisdiction_id:
                 return {"success": False, "error": "trigger_type and jurisdiction_id are required"}
 
-            # Query applicable rules
+            # Candidate rules from the in-memory rule index, loaded by id
+            rule_ids = get_authority_rule_index().candidate_ids(
+                self.db,
+                trigger_type=trigger_type,
+                jurisdiction_ids=[jurisdiction_id],
+                verified_only=True
+            )
             rules = self.db.query(AuthorityRule).filter(
-                AuthorityRule.jurisdiction_id == jurisdiction_id,
-                AuthorityRule.trigger_type == trigger_type,
-                AuthorityRule.is_active == True,
-                AuthorityRule.is_verified == True
+                AuthorityRule.id.in_(rule_ids)
             ).order_by(
                 AuthorityRule.confidence_score.desc(),
                 AuthorityRule.authority_tier
-            ).all()
+            ).all() if rule_ids else []
 
             if not rules:
                 # Get jurisdiction name for better error message
@@ -2949,8 +2953,8 @@ class ChatToolExecutor:
     def _compare_rules_across_jurisdictions(self, input_data: Dict) -> Dict:
         """Compare rules across multiple jurisdictions"""
         try:
-            from app.models.authority_core import AuthorityRule
             from app.models.jurisdiction import Jurisdiction
+            from app.services.authority_rule_index import get_authority_rule_index
 
             trigger_type = input_data.get('trigger_type')
             jurisdiction_ids = input_data.get('jurisdiction_ids', [])
@@ -2964,20 +2968,29 @@ class ChatToolExecutor:
             if len(jurisdiction_ids) > 5:
                 return {"success": False, "error": "Maximum 5 jurisdictions for comparison"}
 
-            # Fetch rules for each jurisdiction
+            # Fetch rules for all jurisdictions in one pass via the rule index
+            index = get_authority_rule_index()
+            rule_ids = index.candidate_ids(
+                self.db,
+                trigger_type=trigger_type,
+                jurisdiction_ids=jurisdiction_ids,
+                verified_only=True
+            )
+            rules_by_jurisdiction: Dict[str, List] = {}
+            for rule in index.load_rules(self.db, rule_ids):
+                rules_by_jurisdiction.setdefault(rule.jurisdiction_id, []).append(rule)
+
+            jurisdictions = {
+                j.id: j for j in self.db.query(Jurisdiction).filter(
+                    Jurisdiction.id.in_(jurisdiction_ids)
+                ).all()
+            }
+
             comparison = []
 
             for jurisdiction_id in jurisdiction_ids:
-                jurisdiction = self.db.query(Jurisdiction).filter(
-                    Jurisdiction.id == jurisdiction_id
-                ).first()
-
-                rules = self.db.query(AuthorityRule).filter(
-                    AuthorityRule.jurisdiction_id == jurisdiction_id,
-                    AuthorityRule.trigger_type == trigger_type,
-                    AuthorityRule.is_active == True,
-                    AuthorityRule.is_verified == True
-                ).all()
+                jurisdiction = jurisdictions.get(jurisdiction_id)
+                rules = rules_by_jurisdiction.get(jurisdiction_id, [])
 
                 comparison.append({
                     "jurisdiction_id": jurisdiction_id,
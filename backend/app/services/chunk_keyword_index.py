@@ -0,0 +1,197 @@
+"""
+Chunk Keyword Index - SQLite FTS5 full-text index over document chunks
+
+PostgreSQL keyword search uses the chunk_text_search tsvector (migration
+018). SQLite deployments (local development, offline laptops) had no
+keyword index at all. This module maintains an FTS5 virtual table over
+``document_embeddings.chunk_text``:
+
+- external-content table (no second copy of the text), porter stemming
+- kept in sync by AFTER INSERT/UPDATE/DELETE triggers, so every writer
+  (embedding pipeline bulk inserts, raw-SQL deletes) is covered
+- created and backfilled on first use (or at startup), once per engine
+- ranked with FTS5's built-in BM25
+
+Query text is reduced to word terms OR-ed together (BM25 rewards chunks
+matching more and rarer terms), so user input never reaches the FTS5
+query syntax.
+
+Usage:
+    index = get_chunk_keyword_index()
+    if index.available(db):
+        hits = index.search(db, case_id, "motion to compel", top_k=15)  # [(id, score)]
+"""
+import logging
+import re
+import threading
+import weakref
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "document_embeddings_fts"
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+# Longer queries add little ranking signal but cost a posting-list scan each
+MAX_QUERY_TERMS = 32
+
+_SETUP_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        chunk_text,
+        case_id,
+        content='document_embeddings',
+        content_rowid='rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON document_embeddings BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, chunk_text, case_id) VALUES (new.rowid, new.chunk_text, new.case_id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON document_embeddings BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, chunk_text, case_id)
+            VALUES ('delete', old.rowid, old.chunk_text, old.case_id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF chunk_text, case_id ON document_embeddings BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, chunk_text, case_id)
+            VALUES ('delete', old.rowid, old.chunk_text, old.case_id);
+        INSERT INTO {FTS_TABLE}(rowid, chunk_text, case_id) VALUES (new.rowid, new.chunk_text, new.case_id);
+    END
+    """,
+]
+
+
+def fts_query(query: str, case_id: str) -> str:
+    """
+    FTS5 MATCH expression: the case id phrase AND any of the query terms.
+
+    Matching the case inside FTS5 (rather than filtering joined rows) keeps
+    common terms from scoring every chunk in the database.
+    """
+    terms = list(dict.fromkeys(term.lower() for term in _TERM.findall(query)))[:MAX_QUERY_TERMS]
+    if not terms:
+        return ""
+    case_phrase = " ".join(_TERM.findall(str(case_id)))
+    any_term = " OR ".join(f'"{term}"' for term in terms)
+    return f'case_id : "{case_phrase}" AND chunk_text : ({any_term})'
+
+
+class ChunkKeywordIndex:
+    """
+    FTS5 keyword search over document chunks (SQLite only).
+
+    Thread-safe; remembers per engine whether the index has been set up.
+    """
+
+    def __init__(self):
+        self._ready: "weakref.WeakKeyDictionary[Engine, bool]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = {
+            "searches": 0,
+            "setups": 0,
+        }
+
+    def available(self, db: Session) -> bool:
+        """True if the session's database is SQLite with FTS5 (index ensured)."""
+        bind = db.get_bind()
+        if bind.dialect.name != "sqlite":
+            return False
+        engine = getattr(bind, "engine", bind)
+        with self._lock:
+            ready = self._ready.get(engine)
+        if ready is None:
+            ready = self.ensure(engine)
+        return ready
+
+    def ensure(self, engine: Engine) -> bool:
+        """
+        Create the FTS table and triggers if missing, backfilling existing rows.
+
+        Returns:
+            True if the index is usable
+        """
+        try:
+            with engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": FTS_TABLE}
+                ).first() is not None
+                for statement in _SETUP_STATEMENTS:
+                    conn.execute(text(statement))
+                if not exists:
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                    logger.info(f"Built SQLite FTS5 chunk index ({FTS_TABLE})")
+            ready = True
+        except Exception as e:
+            # e.g. SQLite compiled without FTS5, or document_embeddings missing
+            logger.warning(f"SQLite FTS5 chunk index unavailable: {e}")
+            ready = False
+
+        with self._lock:
+            self._ready[engine] = ready
+            self._stats["setups"] += 1
+        return ready
+
+    def search(self, db: Session, case_id: str, query: str, top_k: int) -> List[Tuple[str, float]]:
+        """
+        BM25-ranked chunks of a case.
+
+        Returns:
+            [(embedding_id, score)] best first; score is -bm25 (higher is better)
+        """
+        match = fts_query(query, case_id)
+        if not match or top_k <= 0:
+            return []
+
+        # bm25 column weights: chunk_text only; the case_id column is a filter.
+        # The join re-checks case_id exactly (the phrase match is token-based).
+        rows = db.execute(text(f"""
+            WITH ranked AS (
+                SELECT rowid, -bm25({FTS_TABLE}, 1.0, 0.0) AS score
+                FROM {FTS_TABLE}
+                WHERE {FTS_TABLE} MATCH :match
+                ORDER BY bm25({FTS_TABLE}, 1.0, 0.0)
+                LIMIT :fetch_k
+            )
+            SELECT e.id, ranked.score
+            FROM ranked
+            JOIN document_embeddings e ON e.rowid = ranked.rowid
+            WHERE e.case_id = :case_id
+            ORDER BY ranked.score DESC
+            LIMIT :top_k
+        """), {"match": match, "case_id": str(case_id), "fetch_k": top_k * 2, "top_k": top_k}).all()
+
+        with self._lock:
+            self._stats["searches"] += 1
+        return [(str(row.id), float(row.score)) for row in rows]
+
+    def rebuild(self, db: Session) -> None:
+        """Rebuild the index from document_embeddings (e.g. after a bulk restore)."""
+        db.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "engines": len(self._ready),
+                **self._stats,
+            }
+
+
+# Global singleton instance
+chunk_keyword_index = ChunkKeywordIndex()
+
+
+def get_chunk_keyword_index() -> ChunkKeywordIndex:
+    """Get the global chunk keyword index instance."""
+    return chunk_keyword_index
@@ -2,36 +2,92 @@
 Dashboard Service - War Room Intelligence for Legal Practice
 
 Provides intelligent overview of all cases and deadlines with:
-- Database-optimized queries (SQL-side filtering)
+- Materialized per-case aggregates (one indexed read per page load)
 - Zombie case detection (malpractice risk)
 - Workload saturation index (calendar hotspots)
 - Recent velocity metrics (productivity trends)
 - Judge-specific analytics
+
+Every section is computed from the user's DashboardCaseSummary rows (see
+dashboard_summary). The rows store dates rather than urgency buckets, so
+bucketing against today happens here, in memory.
+
+Sections are independent: callers may request a subset (the frontend asks
+for the alerts first and lazy-loads analytics). Requested sections are
+computed concurrently off the event loop, each with its own timeout and an
+entry in the per-user section cache; a failed or slow section comes back as
+None (listed in "section_errors") instead of failing the whole response.
 """
-from typing import Dict, List, Any, Optional
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_, case
 from collections import defaultdict
 import logging
 
-from app.models.case import Case
-from app.models.document import Document
-from app.models.deadline import Deadline
+from app.models.dashboard_summary import DashboardCaseSummary
+from app.services.dashboard_summary import (
+    get_dashboard_section_cache,
+    get_user_dashboard_generation,
+    load_user_summaries,
+)
 
 logger = logging.getLogger(__name__)
 
+# (deadline_date, serialized pending deadline)
+PendingDeadline = Tuple[date, Dict[str, Any]]
+
+# Seconds a single section may take before it is returned as None
+SECTION_TIMEOUT_SECONDS = float(os.getenv("DASHBOARD_SECTION_TIMEOUT", "5"))
+
+DASHBOARD_SECTIONS = (
+    "case_statistics",
+    "deadline_alerts",
+    "recent_activity",
+    "critical_cases",
+    "upcoming_deadlines",
+    "total_cases",
+    "zombie_cases",
+    "calendar_hotspots",
+    "velocity_metrics",
+    "heat_map_flat",
+    "judge_analytics",
+    "matter_health_cards",
+)
+
+
+@dataclass
+class _DashboardContext:
+    """Inputs shared by all sections of one request"""
+    user_id: str
+    today: date
+    summaries: List[DashboardCaseSummary]
+    cases: List[DashboardCaseSummary]  # Excluding deleted cases
+    pending: List[PendingDeadline]
+
 
 class DashboardService:
     """Service for generating dashboard data and analytics"""
 
-    async def get_dashboard_data(self, user_id: str, db: Session) -> Dict[str, Any]:
+    async def get_dashboard_data(
+        self,
+        user_id: str,
+        db: Session,
+        sections: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
         """
-        Generate comprehensive War Room dashboard data for a user
+        Generate War Room dashboard data for a user
+
+        Args:
+            user_id: User whose cases are summarized
+            db: Database session
+            sections: Section names to compute (default: all, see DASHBOARD_SECTIONS)
 
-        Returns:
+        Returns (requested sections only):
             - case_statistics: Total cases, active cases, etc.
-            - deadline_alerts: Overdue, urgent, upcoming deadlines (DB-optimized)
+            - deadline_alerts: Overdue, urgent, upcoming deadlines
             - recent_activity: Latest documents and case updates
             - critical_cases: Cases needing attention
             - zombie_cases: Active cases with ZERO future deadlines (RISK!)
@@ -39,159 +95,153 @@ class DashboardService:
             - velocity_metrics: Productivity trend (completed vs added)
             - heat_map_flat: Flattened heat map for frontend
             - judge_analytics: Judge-specific case statistics
-        """
-        today = date.today()
+            - section_errors: {section: reason}, only if a section failed
 
-        # Get all user's cases (needed for several calculations)
-        cases = db.query(Case).filter(
-            Case.user_id == user_id,
-            Case.status != 'deleted'
-        ).all()
-        total_cases = len(cases)
-
-        # ═══════════════════════════════════════════════════════════════════════
-        # DATABASE-OPTIMIZED DEADLINE ALERTS (Improvement #7)
-        # Move filtering to SQL instead of Python loops
-        # ═══════════════════════════════════════════════════════════════════════
-        deadline_alerts = self._calculate_deadline_alerts_optimized(user_id, db, today)
-
-        # Get case statistics
-        case_stats = self._calculate_case_statistics(cases, user_id, db)
-
-        # Get recent activity
-        recent_activity = await self._get_recent_activity(user_id, db)
-
-        # Get critical cases (cases with urgent deadlines)
-        critical_cases = self._identify_critical_cases_optimized(user_id, db, today)
-
-        # Get upcoming deadlines (next 30 days) - DB optimized
-        upcoming_deadlines = self._get_upcoming_deadlines_optimized(user_id, db, today, days=30)
-
-        # ═══════════════════════════════════════════════════════════════════════
-        # ZOMBIE CASE DETECTION (Improvement #2)
-        # Active cases with ZERO future deadlines = malpractice risk
-        # ═══════════════════════════════════════════════════════════════════════
-        zombie_cases = self._detect_zombie_cases(cases, user_id, db, today)
-
-        # ═══════════════════════════════════════════════════════════════════════
-        # WORKLOAD SATURATION INDEX (Improvement #4)
-        # Calendar hotspots for next 7 days
-        # ═══════════════════════════════════════════════════════════════════════
-        calendar_hotspots = self._calculate_calendar_hotspots(user_id, db, today)
-
-        # ═══════════════════════════════════════════════════════════════════════
-        # VELOCITY METRICS (Improvement #6)
-        # Productivity trend: completed vs added this week
-        # ═══════════════════════════════════════════════════════════════════════
-        velocity_metrics = self._calculate_velocity_metrics(user_id, db, today)
-
-        # ═══════════════════════════════════════════════════════════════════════
-        # FLATTENED HEAT MAP (Improvement #9)
-        # Frontend-friendly flat structure instead of nested dict
-        # ═══════════════════════════════════════════════════════════════════════
-        heat_map_flat = self._generate_heat_map_flat(user_id, db, today)
-
-        # ═══════════════════════════════════════════════════════════════════════
-        # JUDGE-SPECIFIC ANALYTICS (Improvement #10)
-        # Strategic view of judge workload
-        # ═══════════════════════════════════════════════════════════════════════
-        judge_analytics = self._calculate_judge_analytics(cases, user_id, db, today)
-
-        # Matter health cards (enhanced with judge stats)
-        matter_health_cards = self._generate_matter_health_cards_enhanced(cases, user_id, db, today)
+        Raises:
+            ValueError: If an unknown section is requested
+        """
+        requested = list(dict.fromkeys(sections)) if sections else list(DASHBOARD_SECTIONS)
+        unknown = [name for name in requested if name not in DASHBOARD_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown dashboard section(s): {', '.join(unknown)}")
 
-        return {
-            "case_statistics": case_stats,
-            "deadline_alerts": deadline_alerts,
-            "recent_activity": recent_activity,
-            "critical_cases": critical_cases,
-            "upcoming_deadlines": upcoming_deadlines,
-            "total_cases": total_cases,
-            # War Room Intelligence enhancements
-            "zombie_cases": zombie_cases,
-            "calendar_hotspots": calendar_hotspots,
-            "velocity_metrics": velocity_metrics,
-            "heat_map_flat": heat_map_flat,
-            "judge_analytics": judge_analytics,
-            "matter_health_cards": matter_health_cards,
-            "generated_at": datetime.now().isoformat()
-        }
+        today = date.today()
+        cache = get_dashboard_section_cache()
+        results = {name: cache.get(user_id, name, today) for name in requested}
+        missing = [name for name, value in results.items() if value is None]
+        errors = {}
+
+        if missing:
+            # ═══════════════════════════════════════════════════════════════════
+            # MATERIALIZED AGGREGATES
+            # One indexed read of the user's per-case summary rows
+            # ═══════════════════════════════════════════════════════════════════
+            generation = get_user_dashboard_generation(user_id)
+            summaries = load_user_summaries(db, user_id)
+            context = _DashboardContext(
+                user_id=user_id,
+                today=today,
+                summaries=summaries,
+                cases=[s for s in summaries if s.status != 'deleted'],
+                pending=self._pending_deadlines(summaries)
+            )
+
+            computed = await asyncio.gather(*(self._compute_section(name, context) for name in missing))
+            for name, (value, error) in zip(missing, computed):
+                results[name] = value
+                if error:
+                    errors[name] = error
+                else:
+                    cache.set(user_id, name, today, value, generation)
+
+        data = dict(results)
+        data["generated_at"] = datetime.now().isoformat()
+        if errors:
+            data["section_errors"] = errors
+        return data
+
+    async def _compute_section(self, name: str, context: _DashboardContext) -> Tuple[Any, Optional[str]]:
+        """Compute one section in a worker thread. Returns (value, error)."""
+        try:
+            value = await asyncio.wait_for(
+                asyncio.to_thread(self._build_section, name, context),
+                timeout=SECTION_TIMEOUT_SECONDS
+            )
+            return value, None
+        except asyncio.TimeoutError:
+            logger.warning(f"Dashboard section {name} timed out for user {context.user_id}")
+            return None, "timeout"
+        except Exception as e:
+            logger.error(f"Dashboard section {name} failed for user {context.user_id}: {e}")
+            return None, "error"
+
+    def _build_section(self, name: str, context: _DashboardContext) -> Any:
+        today, pending = context.today, context.pending
+        if name == "case_statistics":
+            return self._calculate_case_statistics(context.cases, context.summaries)
+        if name == "deadline_alerts":
+            return self._calculate_deadline_alerts(pending, today)
+        if name == "recent_activity":
+            return self._get_recent_activity(context.summaries)
+        if name == "critical_cases":
+            # Cases with deadlines in the next 7 days
+            return self._identify_critical_cases(pending, context.summaries, today)
+        if name == "upcoming_deadlines":
+            return self._get_upcoming_deadlines(pending, today, days=30)
+        if name == "total_cases":
+            return len(context.cases)
+        if name == "zombie_cases":
+            # Improvement #2: active cases with ZERO future deadlines = malpractice risk
+            return self._detect_zombie_cases(context.cases, context.user_id, today)
+        if name == "calendar_hotspots":
+            # Improvement #4: workload saturation for the next 7 days
+            return self._calculate_calendar_hotspots(pending, today)
+        if name == "velocity_metrics":
+            # Improvement #6: completed vs added this week
+            return self._calculate_velocity_metrics(context.summaries, today)
+        if name == "heat_map_flat":
+            # Improvement #9: frontend-friendly flat structure instead of nested dict
+            return self._generate_heat_map_flat(pending, today)
+        if name == "judge_analytics":
+            # Improvement #10: strategic view of judge workload
+            return self._calculate_judge_analytics(context.cases, today)
+        if name == "matter_health_cards":
+            return self._generate_matter_health_cards_enhanced(context.cases, today)
+        raise ValueError(f"Unknown dashboard section: {name}")
+
+    def _pending_deadlines(self, summaries: List[DashboardCaseSummary]) -> List[PendingDeadline]:
+        """All pending, dated deadlines of the summaries, sorted by date"""
+        pending = [
+            (date.fromisoformat(d['deadline_date']), d)
+            for s in summaries
+            for d in (s.pending_dated or [])
+        ]
+        pending.sort(key=lambda p: p[0])
+        return pending
 
     # ═══════════════════════════════════════════════════════════════════════════
-    # IMPROVEMENT #7: DATABASE-SIDE FILTERING FOR ALERTS
+    # IMPROVEMENT #7: DEADLINE ALERTS
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def _calculate_deadline_alerts_optimized(
+    def _calculate_deadline_alerts(
         self,
-        user_id: str,
-        db: Session,
+        pending: List[PendingDeadline],
         today: date
     ) -> Dict[str, Any]:
         """
-        Calculate deadline alerts using SQL-side filtering.
-        Much faster than fetching all deadlines and filtering in Python.
+        Bucket pending deadlines into overdue, urgent (0-3 days),
+        upcoming week (4-7 days) and upcoming month (8-30 days).
         """
-        three_days = today + timedelta(days=3)
-        seven_days = today + timedelta(days=7)
-        thirty_days = today + timedelta(days=30)
-
-        # Base query for pending deadlines with dates
-        base_query = db.query(Deadline).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending',
-            Deadline.deadline_date.isnot(None)
-        )
-
-        # Overdue: deadline_date < today
-        overdue = base_query.filter(Deadline.deadline_date < today).all()
-
-        # Urgent: today <= deadline_date <= 3 days
-        urgent = base_query.filter(
-            Deadline.deadline_date >= today,
-            Deadline.deadline_date <= three_days
-        ).all()
-
-        # Upcoming week: 4-7 days
-        upcoming_week = base_query.filter(
-            Deadline.deadline_date > three_days,
-            Deadline.deadline_date <= seven_days
-        ).all()
-
-        # Upcoming month: 8-30 days
-        upcoming_month = base_query.filter(
-            Deadline.deadline_date > seven_days,
-            Deadline.deadline_date <= thirty_days
-        ).all()
+        buckets = {
+            "overdue": [],
+            "urgent": [],
+            "upcoming_week": [],
+            "upcoming_month": []
+        }
+        urgency_levels = {
+            "overdue": "overdue",
+            "urgent": "urgent",
+            "upcoming_week": "upcoming-week",
+            "upcoming_month": "upcoming-month"
+        }
+
+        for deadline_date, deadline in pending:
+            days_until = (deadline_date - today).days
+            if days_until < 0:
+                bucket = "overdue"
+            elif days_until <= 3:
+                bucket = "urgent"
+            elif days_until <= 7:
+                bucket = "upcoming_week"
+            elif days_until <= 30:
+                bucket = "upcoming_month"
+            else:
+                break  # Sorted by date: everything after is further out
+            buckets[bucket].append(self._serialize_deadline(deadline, urgency_levels[bucket], days_until))
 
         return {
-            "overdue": {
-                "count": len(overdue),
-                "deadlines": sorted(
-                    [self._serialize_deadline(d, "overdue", today) for d in overdue],
-                    key=lambda x: x['deadline_date']
-                )
-            },
-            "urgent": {
-                "count": len(urgent),
-                "deadlines": sorted(
-                    [self._serialize_deadline(d, "urgent", today) for d in urgent],
-                    key=lambda x: x['deadline_date']
-                )
-            },
-            "upcoming_week": {
-                "count": len(upcoming_week),
-                "deadlines": sorted(
-                    [self._serialize_deadline(d, "upcoming-week", today) for d in upcoming_week],
-                    key=lambda x: x['deadline_date']
-                )
-            },
-            "upcoming_month": {
-                "count": len(upcoming_month),
-                "deadlines": sorted(
-                    [self._serialize_deadline(d, "upcoming-month", today) for d in upcoming_month],
-                    key=lambda x: x['deadline_date']
-                )
-            }
+            bucket: {"count": len(deadlines), "deadlines": deadlines}
+            for bucket, deadlines in buckets.items()
         }
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -200,60 +250,34 @@ class DashboardService:
 
     def _detect_zombie_cases(
         self,
-        cases: List[Case],
+        cases: List[DashboardCaseSummary],
         user_id: str,
-        db: Session,
         today: date
     ) -> List[Dict]:
         """
         Detect active cases with ZERO future deadlines.
         MALPRACTICE RISK - cases falling through the cracks.
-        OPTIMIZED: Uses SQL subquery instead of N+1 pattern.
         """
-        # OPTIMIZATION: Use SQL to find zombie cases directly
-        # Active cases WITHOUT any future pending deadlines
-        from sqlalchemy import text
-
-        zombie_query = text("""
-            SELECT
-                c.id as case_id,
-                c.case_number,
-                c.title,
-                c.court,
-                c.judge,
-                c.status,
-                MAX(d.deadline_date) as last_deadline,
-                MAX(doc.created_at) as last_document
-            FROM cases c
-            LEFT JOIN deadlines d ON d.case_id = c.id
-            LEFT JOIN documents doc ON doc.case_id = c.id
-            WHERE c.user_id = :user_id
-              AND c.status = 'active'
-              AND NOT EXISTS (
-                  SELECT 1 FROM deadlines d2
-                  WHERE d2.case_id = c.id
-                    AND d2.status = 'pending'
-                    AND d2.deadline_date >= :today
-              )
-            GROUP BY c.id, c.case_number, c.title, c.court, c.judge, c.status
-        """)
-
-        zombie_results = db.execute(zombie_query, {'user_id': user_id, 'today': today}).fetchall()
-
         zombie_cases = []
-        for row in zombie_results:
+        for summary in cases:
+            if summary.status != 'active':
+                continue
+            # pending_dated is sorted by date: the last one is the latest
+            if summary.pending_dated and summary.pending_dated[-1]['deadline_date'] >= today.isoformat():
+                continue
+
             last_activity = None
-            if row.last_deadline:
-                last_activity = row.last_deadline.isoformat()
-            elif row.last_document:
-                last_activity = row.last_document.isoformat()
+            if summary.last_deadline_date:
+                last_activity = summary.last_deadline_date.isoformat()
+            elif summary.last_document_at:
+                last_activity = summary.last_document_at.isoformat()
 
             zombie_cases.append({
-                'case_id': str(row.case_id),
-                'case_number': row.case_number,
-                'title': row.title,
-                'court': row.court,
-                'judge': row.judge,
+                'case_id': str(summary.case_id),
+                'case_number': summary.case_number,
+                'title': summary.title,
+                'court': summary.court,
+                'judge': summary.judge,
                 'last_activity': last_activity,
                 'risk_level': 'high',
                 'recommended_action': 'Add deadlines or close case'
@@ -268,8 +292,7 @@ class DashboardService:
 
     def _calculate_calendar_hotspots(
         self,
-        user_id: str,
-        db: Session,
+        pending: List[PendingDeadline],
         today: date
     ) -> Dict[str, Any]:
         """
@@ -281,23 +304,15 @@ class DashboardService:
         hotspots = {}
         seven_days = today + timedelta(days=7)
 
-        # Query deadlines for next 7 days with counts per day
-        deadlines = db.query(Deadline).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending',
-            Deadline.deadline_date >= today,
-            Deadline.deadline_date <= seven_days
-        ).all()
-
         # Group by date
         deadlines_by_date = defaultdict(list)
-        for d in deadlines:
-            if d.deadline_date:
-                deadlines_by_date[d.deadline_date.isoformat()].append({
-                    'id': str(d.id),
-                    'title': d.title,
-                    'priority': d.priority,
-                    'case_id': str(d.case_id)
+        for deadline_date, d in pending:
+            if today <= deadline_date <= seven_days:
+                deadlines_by_date[d['deadline_date']].append({
+                    'id': d['id'],
+                    'title': d['title'],
+                    'priority': d['priority'],
+                    'case_id': d['case_id']
                 })
 
         # Calculate saturation levels
@@ -359,8 +374,7 @@ class DashboardService:
 
     def _calculate_velocity_metrics(
         self,
-        user_id: str,
-        db: Session,
+        summaries: List[DashboardCaseSummary],
         today: date
     ) -> Dict[str, Any]:
         """
@@ -369,20 +383,18 @@ class DashboardService:
         If Completed > Added: "On Track" (green)
         If Added > Completed: "Falling Behind" (red)
         """
-        week_ago = today - timedelta(days=7)
-
-        # Deadlines completed this week
-        completed_this_week = db.query(func.count(Deadline.id)).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'completed',
-            Deadline.updated_at >= week_ago
-        ).scalar() or 0
-
-        # Deadlines added this week
-        added_this_week = db.query(func.count(Deadline.id)).filter(
-            Deadline.user_id == user_id,
-            Deadline.created_at >= week_ago
-        ).scalar() or 0
+        week_ago = (today - timedelta(days=7)).isoformat()
+
+        completed_this_week = 0
+        added_this_week = 0
+        total_pending = 0
+        total_completed = 0
+        for summary in summaries:
+            activity = summary.activity_by_day or {}
+            completed_this_week += sum(n for day, n in activity.get('completed', {}).items() if day >= week_ago)
+            added_this_week += sum(n for day, n in activity.get('added', {}).items() if day >= week_ago)
+            total_pending += summary.pending_deadlines or 0
+            total_completed += summary.completed_deadlines or 0
 
         # Calculate net velocity
         net_velocity = completed_this_week - added_this_week
@@ -398,17 +410,6 @@ class DashboardService:
             trend = 'even'
             trend_message = "Balanced: same number completed as added"
 
-        # Calculate completion rate
-        total_pending = db.query(func.count(Deadline.id)).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending'
-        ).scalar() or 0
-
-        total_completed = db.query(func.count(Deadline.id)).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'completed'
-        ).scalar() or 0
-
         overall_completion_rate = int(
             (total_completed / (total_completed + total_pending) * 100)
         ) if (total_completed + total_pending) > 0 else 0
@@ -434,8 +435,7 @@ class DashboardService:
 
     def _generate_heat_map_flat(
         self,
-        user_id: str,
-        db: Session,
+        pending: List[PendingDeadline],
         today: date
     ) -> List[Dict]:
         """
@@ -444,21 +444,11 @@ class DashboardService:
         Returns list of objects instead of nested dict:
         [{"severity": "fatal", "urgency": "today", "count": 2, "case_ids": [...]}]
         """
-        thirty_days = today + timedelta(days=30)
-
-        # Query all pending deadlines in range
-        deadlines = db.query(Deadline).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending',
-            Deadline.deadline_date.isnot(None),
-            Deadline.deadline_date <= thirty_days
-        ).all()
-
         # Build flat matrix
         matrix_data = defaultdict(lambda: {'count': 0, 'deadlines': []})
 
-        for deadline in deadlines:
-            days_until = (deadline.deadline_date - today).days
+        for deadline_date, deadline in pending:
+            days_until = (deadline_date - today).days
 
             # Determine urgency bucket
             if days_until < 0 or days_until == 0:
@@ -470,20 +460,20 @@ class DashboardService:
             elif days_until <= 30:
                 urgency = '30_day'
             else:
-                continue
+                break
 
             # Determine severity
-            severity = deadline.priority or 'standard'
+            severity = deadline['priority'] or 'standard'
             if severity not in ['fatal', 'critical', 'important', 'standard', 'informational']:
                 severity = 'standard'
 
             key = f"{severity}_{urgency}"
             matrix_data[key]['count'] += 1
             matrix_data[key]['deadlines'].append({
-                'id': str(deadline.id),
-                'case_id': str(deadline.case_id),
-                'title': deadline.title,
-                'deadline_date': deadline.deadline_date.isoformat(),
+                'id': deadline['id'],
+                'case_id': deadline['case_id'],
+                'title': deadline['title'],
+                'deadline_date': deadline['deadline_date'],
                 'days_until': days_until
             })
 
@@ -512,9 +502,7 @@ class DashboardService:
 
     def _calculate_judge_analytics(
         self,
-        cases: List[Case],
-        user_id: str,
-        db: Session,
+        cases: List[DashboardCaseSummary],
         today: date
     ) -> List[Dict]:
         """
@@ -524,46 +512,27 @@ class DashboardService:
         and identify if they're overloaded before a specific judge.
         """
         judge_stats = defaultdict(lambda: {
-            'judge': None,
             'active_cases': 0,
             'total_pending_deadlines': 0,
             'urgent_deadlines': 0,
-            'case_ids': [],
             'courts': set()
         })
 
-        three_days = today + timedelta(days=3)
+        three_days = (today + timedelta(days=3)).isoformat()
+        today_str = today.isoformat()
 
-        for case in cases:
-            if case.status != 'active':
+        for summary in cases:
+            if summary.status != 'active':
                 continue
 
-            judge = case.judge or 'Unassigned'
-            judge_stats[judge]['judge'] = judge
-            judge_stats[judge]['active_cases'] += 1
-            judge_stats[judge]['case_ids'].append(str(case.id))
-            if case.court:
-                judge_stats[judge]['courts'].add(case.court)
-
-        # Get deadline counts per judge's cases
-        for judge, stats in judge_stats.items():
-            if stats['case_ids']:
-                # Total pending
-                pending_count = db.query(func.count(Deadline.id)).filter(
-                    Deadline.case_id.in_(stats['case_ids']),
-                    Deadline.status == 'pending'
-                ).scalar() or 0
-
-                # Urgent (next 3 days)
-                urgent_count = db.query(func.count(Deadline.id)).filter(
-                    Deadline.case_id.in_(stats['case_ids']),
-                    Deadline.status == 'pending',
-                    Deadline.deadline_date >= today,
-                    Deadline.deadline_date <= three_days
-                ).scalar() or 0
-
-                stats['total_pending_deadlines'] = pending_count
-                stats['urgent_deadlines'] = urgent_count
+            stats = judge_stats[summary.judge or 'Unassigned']
+            stats['active_cases'] += 1
+            stats['total_pending_deadlines'] += summary.pending_deadlines or 0
+            stats['urgent_deadlines'] += sum(
+                1 for d in (summary.pending_dated or []) if today_str <= d['deadline_date'] <= three_days
+            )
+            if summary.court:
+                stats['courts'].add(summary.court)
 
         # Convert to list and sort by active cases
         result = []
@@ -586,115 +555,52 @@ class DashboardService:
 
     def _generate_matter_health_cards_enhanced(
         self,
-        cases: List[Case],
-        user_id: str,
-        db: Session,
+        cases: List[DashboardCaseSummary],
         today: date
     ) -> List[Dict]:
         """
         Generate Matter Health Cards with enhanced judge information.
-        OPTIMIZED: Uses bulk queries instead of N+1 pattern.
         """
         # Filter active/pending cases upfront
         active_cases = [c for c in cases if c.status in ['active', 'pending']]
         if not active_cases:
             return []
 
-        case_ids = [c.id for c in active_cases]
-
-        # OPTIMIZATION 1: Get ALL deadline counts in ONE query using aggregation
-        deadline_stats = db.query(
-            Deadline.case_id,
-            func.count(Deadline.id).label('total_count'),
-            func.sum(case((Deadline.status == 'completed', 1), else_=0)).label('completed_count')
-        ).filter(
-            Deadline.case_id.in_(case_ids)
-        ).group_by(Deadline.case_id).all()
-
-        # Build lookup dict
-        deadline_counts = {
-            str(stat.case_id): {
-                'total': int(stat.total_count),
-                'completed': int(stat.completed_count or 0),
-                'pending': int(stat.total_count - (stat.completed_count or 0))
-            }
-            for stat in deadline_stats
-        }
-
-        # OPTIMIZATION 2: Get ALL next deadlines in ONE query using window functions
-        # For each case, get the earliest pending deadline
-        from sqlalchemy import literal
-        next_deadlines_query = db.query(
-            Deadline.case_id,
-            Deadline.title,
-            Deadline.deadline_date,
-            Deadline.priority
-        ).filter(
-            Deadline.case_id.in_(case_ids),
-            Deadline.status == 'pending',
-            Deadline.deadline_date >= today
-        ).order_by(
-            Deadline.case_id,
-            Deadline.deadline_date
-        ).distinct(Deadline.case_id).all()
-
-        # Build next deadline lookup
-        next_deadlines_map = {
-            str(nd.case_id): nd for nd in next_deadlines_query
-        }
+        # Active cases per judge
+        judge_count_map = defaultdict(int)
+        for c in cases:
+            if c.status == 'active' and c.judge is not None:
+                judge_count_map[c.judge] += 1
 
-        # OPTIMIZATION 3: Get ALL document counts in ONE query
-        doc_counts = db.query(
-            Document.case_id,
-            func.count(Document.id).label('doc_count')
-        ).filter(
-            Document.case_id.in_(case_ids)
-        ).group_by(Document.case_id).all()
-
-        doc_count_map = {str(dc.case_id): int(dc.doc_count) for dc in doc_counts}
-
-        # OPTIMIZATION 4: Pre-compute ALL judge case counts in ONE query
-        # This eliminates the N+1 query pattern for judge stats
-        judge_counts = db.query(
-            Case.judge,
-            func.count(Case.id).label('count')
-        ).filter(
-            Case.user_id == user_id,
-            Case.status == 'active',
-            Case.judge.isnot(None)
-        ).group_by(Case.judge).all()
-        judge_count_map = {jc.judge: int(jc.count) for jc in judge_counts}
-
-        # Now build health cards using pre-fetched data (NO MORE QUERIES IN LOOP!)
+        today_str = today.isoformat()
         health_cards = []
         for case_obj in active_cases:
-            case_id_str = str(case_obj.id)
-
-            # Get counts from pre-fetched data
-            counts = deadline_counts.get(case_id_str, {'total': 0, 'completed': 0, 'pending': 0})
-            total_deadlines = counts['total']
-            completed_deadlines = counts['completed']
-            pending_deadlines = counts['pending']
+            total_deadlines = case_obj.total_deadlines or 0
+            completed_deadlines = case_obj.completed_deadlines or 0
+            pending_deadlines = total_deadlines - completed_deadlines
 
             progress_percentage = int((completed_deadlines / total_deadlines * 100)) if total_deadlines > 0 else 0
 
-            # Get next deadline from pre-fetched data
+            # Earliest pending deadline from today on
             next_deadline = None
             next_deadline_urgency = 'normal'
-            next_deadline_obj = next_deadlines_map.get(case_id_str)
+            next_deadline_obj = next(
+                (d for d in (case_obj.pending_dated or []) if d['deadline_date'] >= today_str),
+                None
+            )
 
-            if next_deadline_obj and next_deadline_obj.deadline_date:
-                days_until = (next_deadline_obj.deadline_date - today).days
+            if next_deadline_obj:
+                days_until = (date.fromisoformat(next_deadline_obj['deadline_date']) - today).days
                 next_deadline = {
-                    'title': next_deadline_obj.title,
-                    'date': next_deadline_obj.deadline_date.isoformat(),
+                    'title': next_deadline_obj['title'],
+                    'date': next_deadline_obj['deadline_date'],
                     'days_until': days_until,
-                    'priority': next_deadline_obj.priority
+                    'priority': next_deadline_obj['priority']
                 }
 
-                if days_until <= 1 or next_deadline_obj.priority == 'fatal':
+                if days_until <= 1 or next_deadline_obj['priority'] == 'fatal':
                     next_deadline_urgency = 'critical'
-                elif days_until <= 3 or next_deadline_obj.priority == 'critical':
+                elif days_until <= 3 or next_deadline_obj['priority'] == 'critical':
                     next_deadline_urgency = 'urgent'
                 elif days_until <= 7:
                     next_deadline_urgency = 'attention'
@@ -708,14 +614,10 @@ class DashboardService:
             elif pending_deadlines > completed_deadlines:
                 health_status = 'busy'
 
-            # Document count from pre-fetched data
-            doc_count = doc_count_map.get(case_id_str, 0)
-
-            # Judge stats from pre-fetched data (no more N+1 query!)
             judge_case_count = judge_count_map.get(case_obj.judge, 0) if case_obj.judge else 0
 
             health_cards.append({
-                'case_id': str(case_obj.id),
+                'case_id': str(case_obj.case_id),
                 'case_number': case_obj.case_number,
                 'title': case_obj.title,
                 'court': case_obj.court or 'Unknown Court',
@@ -734,7 +636,7 @@ class DashboardService:
                 'next_deadline': next_deadline,
                 'next_deadline_urgency': next_deadline_urgency,
                 'health_status': health_status,
-                'document_count': doc_count,
+                'document_count': case_obj.document_count or 0,
                 'filing_date': case_obj.filing_date.isoformat() if case_obj.filing_date else None
             })
 
@@ -748,14 +650,13 @@ class DashboardService:
         return health_cards
 
     # ═══════════════════════════════════════════════════════════════════════════
-    # OPTIMIZED HELPER METHODS
+    # HELPER METHODS
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _calculate_case_statistics(
         self,
-        cases: List[Case],
-        user_id: str,
-        db: Session
+        cases: List[DashboardCaseSummary],
+        summaries: List[DashboardCaseSummary]
     ) -> Dict[str, Any]:
         """Calculate case statistics"""
         if not cases:
@@ -767,16 +668,8 @@ class DashboardService:
                 "by_case_type": {"civil": 0, "criminal": 0, "appellate": 0, "other": 0}
             }
 
-        # Count documents
-        total_documents = db.query(func.count(Document.id)).filter(
-            Document.user_id == user_id
-        ).scalar() or 0
-
-        # Count pending deadlines
-        total_pending_deadlines = db.query(func.count(Deadline.id)).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending'
-        ).scalar() or 0
+        total_documents = sum(s.document_count or 0 for s in summaries)
+        total_pending_deadlines = sum(s.pending_deadlines or 0 for s in summaries)
 
         # Count by jurisdiction
         state_cases = len([c for c in cases if c.jurisdiction in ['state', 'florida_state']])
@@ -804,119 +697,103 @@ class DashboardService:
             }
         }
 
-    async def _get_recent_activity(
+    def _get_recent_activity(
         self,
-        user_id: str,
-        db: Session,
+        summaries: List[DashboardCaseSummary],
         limit: int = 10
     ) -> List[Dict]:
         """Get recent activity across all cases"""
-        recent_documents = db.query(Document).filter(
-            Document.user_id == user_id
-        ).order_by(desc(Document.created_at)).limit(limit).all()
-
-        activities = []
-        for doc in recent_documents:
-            case = db.query(Case).filter(Case.id == doc.case_id).first()
-            activities.append({
+        recent_documents = sorted(
+            ((s, doc) for s in summaries for doc in (s.recent_documents or []) if doc.get('created_at')),
+            key=lambda item: item[1]['created_at'],
+            reverse=True
+        )[:limit]
+
+        return [
+            {
                 "type": "document_uploaded",
-                "timestamp": doc.created_at.isoformat(),
-                "case_id": str(doc.case_id),
-                "case_number": case.case_number if case else "Unknown",
-                "description": f"Uploaded: {doc.file_name}",
-                "document_type": doc.document_type,
+                "timestamp": doc['created_at'],
+                "case_id": str(summary.case_id),
+                "case_number": summary.case_number or "Unknown",
+                "description": f"Uploaded: {doc['file_name']}",
+                "document_type": doc['document_type'],
                 "icon": "file-text"
-            })
-
-        return activities
+            }
+            for summary, doc in recent_documents
+        ]
 
-    def _identify_critical_cases_optimized(
+    def _identify_critical_cases(
         self,
-        user_id: str,
-        db: Session,
+        pending: List[PendingDeadline],
+        summaries: List[DashboardCaseSummary],
         today: date
     ) -> List[Dict]:
         """Identify cases with deadlines in next 7 days"""
         seven_days = today + timedelta(days=7)
+        summaries_by_id = {str(s.case_id): s for s in summaries}
 
-        # Get deadlines in next 7 days with case info
-        critical_deadlines = db.query(Deadline).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending',
-            Deadline.deadline_date >= today,
-            Deadline.deadline_date <= seven_days
-        ).order_by(Deadline.deadline_date).all()
-
-        # Group by case
+        # First deadline per case, in date order
         cases_seen = {}
-        for deadline in critical_deadlines:
-            case_id = str(deadline.case_id)
-            if case_id not in cases_seen:
-                case = db.query(Case).filter(Case.id == deadline.case_id).first()
-                if case:
-                    days_until = (deadline.deadline_date - today).days
-                    pending_count = db.query(func.count(Deadline.id)).filter(
-                        Deadline.case_id == case.id,
-                        Deadline.status == 'pending'
-                    ).scalar() or 0
-
-                    cases_seen[case_id] = {
-                        "case_id": case_id,
-                        "case_number": case.case_number,
-                        "title": case.title,
-                        "court": case.court,
-                        "next_deadline_date": deadline.deadline_date.isoformat(),
-                        "next_deadline_title": deadline.title,
-                        "days_until_deadline": days_until,
-                        "urgency_level": "critical" if days_until <= 3 else "high",
-                        "total_pending_deadlines": pending_count
-                    }
+        for deadline_date, deadline in pending:
+            if deadline_date < today:
+                continue
+            if deadline_date > seven_days:
+                break
+            case_id = deadline['case_id']
+            summary = summaries_by_id.get(case_id)
+            if case_id not in cases_seen and summary is not None:
+                days_until = (deadline_date - today).days
+                cases_seen[case_id] = {
+                    "case_id": case_id,
+                    "case_number": summary.case_number,
+                    "title": summary.title,
+                    "court": summary.court,
+                    "next_deadline_date": deadline['deadline_date'],
+                    "next_deadline_title": deadline['title'],
+                    "days_until_deadline": days_until,
+                    "urgency_level": "critical" if days_until <= 3 else "high",
+                    "total_pending_deadlines": summary.pending_deadlines or 0
+                }
 
         return list(cases_seen.values())
 
-    def _get_upcoming_deadlines_optimized(
+    def _get_upcoming_deadlines(
         self,
-        user_id: str,
-        db: Session,
+        pending: List[PendingDeadline],
         today: date,
         days: int = 30
     ) -> List[Dict]:
-        """Get upcoming deadlines using DB query"""
+        """Get pending deadlines due in the next `days` days"""
         end_date = today + timedelta(days=days)
 
-        deadlines = db.query(Deadline).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending',
-            Deadline.deadline_date >= today,
-            Deadline.deadline_date <= end_date
-        ).order_by(Deadline.deadline_date).all()
-
-        return [self._serialize_deadline(d, self._calculate_urgency_level(d, today), today) for d in deadlines]
-
-    def _serialize_deadline(self, deadline: Deadline, urgency_level: str, today: date) -> Dict:
-        """Serialize deadline to dict with urgency info"""
-        days_until = (deadline.deadline_date - today).days if deadline.deadline_date else None
+        return [
+            self._serialize_deadline(d, self._calculate_urgency_level(deadline_date, today), (deadline_date - today).days)
+            for deadline_date, d in pending
+            if today <= deadline_date <= end_date
+        ]
 
+    def _serialize_deadline(self, deadline: Dict[str, Any], urgency_level: str, days_until: int) -> Dict:
+        """Serialize a stored pending deadline with urgency info"""
         return {
-            "id": str(deadline.id),
-            "case_id": str(deadline.case_id),
-            "title": deadline.title,
-            "deadline_date": deadline.deadline_date.isoformat() if deadline.deadline_date else None,
-            "deadline_time": deadline.deadline_time.isoformat() if deadline.deadline_time else None,
-            "priority": deadline.priority,
-            "party_role": deadline.party_role,
-            "action_required": deadline.action_required,
+            "id": deadline['id'],
+            "case_id": deadline['case_id'],
+            "title": deadline['title'],
+            "deadline_date": deadline['deadline_date'],
+            "deadline_time": deadline['deadline_time'],
+            "priority": deadline['priority'],
+            "party_role": deadline['party_role'],
+            "action_required": deadline['action_required'],
             "urgency_level": urgency_level,
             "days_until": days_until,
-            "rule_citation": deadline.rule_citation
+            "rule_citation": deadline['rule_citation']
         }
 
-    def _calculate_urgency_level(self, deadline: Deadline, today: date) -> str:
-        """Calculate urgency level for a deadline"""
-        if not deadline.deadline_date:
+    def _calculate_urgency_level(self, deadline_date: date, today: date) -> str:
+        """Calculate urgency level for a deadline date"""
+        if not deadline_date:
             return "unknown"
 
-        days_until = (deadline.deadline_date - today).days
+        days_until = (deadline_date - today).days
 
         if days_until < 0:
             return "overdue"
@@ -0,0 +1,393 @@
+"""
+Dashboard Summary - Incrementally maintained War Room aggregates
+
+The War Room dashboard used to run about ten independent queries per page
+load (alert buckets, zombie-case joins, hotspots, velocity, heat map, judge
+analytics, health cards) and load every Case of the user as an ORM object.
+Partners with hundreds of active matters waited seconds for it.
+
+Instead, every case has a DashboardCaseSummary row holding its deadline and
+document aggregates. Rows store dates, not date-relative buckets, so the
+dashboard can bucket against today on read and a row only needs refreshing
+when its case, deadlines or documents change:
+
+- Any committed session that inserted, updated or deleted a Case, Deadline or
+  Document through the ORM refreshes the touched cases' rows in the same
+  transaction (before_commit), so the dashboard never lags a write.
+- Writes that bypass the ORM unit of work (raw SQL, bulk UPDATE/DELETE) call
+  mark_dashboard_cases_changed(db, case_ids) before committing.
+- A user without any rows (e.g. right after the migration) is backfilled on
+  their first dashboard load; scripts/rebuild_dashboard_summaries.py
+  rebuilds everything.
+
+Refreshing a case costs a handful of queries filtered on case_id, whatever
+the size of the user's docket. If the table does not exist in the bound
+database, maintenance is skipped (checked once per engine).
+
+Computed dashboard sections are cached per user in DashboardSectionCache,
+stamped with the user's *dashboard generation*: a process-wide counter bumped
+after every commit that refreshed one of the user's rows. Like the embedding
+generation (retrieval_cache), it is per process; the TTL bounds staleness
+from writes made by other processes.
+
+Usage:
+    summaries = load_user_summaries(db, user_id)   # one indexed read
+
+    cache = get_dashboard_section_cache()
+    value = cache.get(user_id, "judge_analytics", today)
+    if value is None:
+        generation = get_user_dashboard_generation(user_id)
+        value = compute(...)
+        cache.set(user_id, "judge_analytics", today, value, generation)
+"""
+import logging
+import os
+import threading
+import weakref
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import case, desc, event, func, inspect, or_
+from sqlalchemy.orm import Session
+
+from app.models.case import Case
+from app.models.dashboard_summary import DashboardCaseSummary
+from app.models.deadline import Deadline
+from app.models.document import Document
+from app.services.retrieval_cache import _TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Days of added/completed counts kept for velocity metrics. Counts older than
+# this are never needed: a newer addition or completion refreshes the row.
+VELOCITY_WINDOW_DAYS = 7
+
+# Latest uploads kept per case for the activity feed
+RECENT_DOCUMENTS_PER_CASE = 10
+
+# Cases refreshed per round of queries (IN-list size)
+REFRESH_BATCH_SIZE = 500
+
+
+# =============================================================================
+# USER DASHBOARD GENERATION
+# =============================================================================
+
+_generations: Dict[str, int] = {}
+_generation_lock = threading.Lock()
+
+
+def get_user_dashboard_generation(user_id: str) -> int:
+    """Current dashboard generation of a user. Capture it *before* reading summaries."""
+    return _generations.get(str(user_id), 0)
+
+
+def bump_user_dashboard_generation(user_id: str) -> int:
+    """Invalidate every cached dashboard section of a user. Returns the new generation."""
+    user_id = str(user_id)
+    with _generation_lock:
+        new_generation = _generations.get(user_id, 0) + 1
+        _generations[user_id] = new_generation
+    return new_generation
+
+
+class DashboardSectionCache(_TTLCache):
+    """
+    Computed dashboard sections per (user, section, day).
+
+    Entries are only served while the user's dashboard generation holds.
+    Section values are shared between callers and must not be mutated.
+    """
+
+    DEFAULT_MAX_ENTRIES = int(os.getenv("DASHBOARD_SECTION_CACHE_ENTRIES", "4096"))
+    DEFAULT_TTL_SECONDS = float(os.getenv("DASHBOARD_SECTION_CACHE_TTL", "300"))
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        super().__init__(max_entries, ttl_seconds)
+
+    def get(self, user_id: str, section: str, today: date) -> Optional[Any]:
+        """Cached section value, or None if missing, expired or from an older generation."""
+        return self._get((str(user_id), section, today), get_user_dashboard_generation(user_id))
+
+    def set(self, user_id: str, section: str, today: date, value: Any, generation: int) -> None:
+        """Store a section computed at ``generation``; dropped if the user's rows changed meanwhile."""
+        if generation != get_user_dashboard_generation(user_id):
+            return
+        self._set((str(user_id), section, today), value, generation)
+
+
+# Global singleton instance
+dashboard_section_cache = DashboardSectionCache()
+
+
+def get_dashboard_section_cache() -> DashboardSectionCache:
+    """Get the global dashboard section cache instance."""
+    return dashboard_section_cache
+
+
+def _iso(value) -> Any:
+    return value.isoformat() if value is not None else None
+
+
+def _serialize_pending(row) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "case_id": str(row.case_id),
+        "title": row.title,
+        "deadline_date": row.deadline_date.isoformat(),
+        "deadline_time": _iso(row.deadline_time),
+        "priority": row.priority,
+        "party_role": row.party_role,
+        "action_required": row.action_required,
+        "rule_citation": row.rule_citation,
+    }
+
+
+# =============================================================================
+# REFRESH
+# =============================================================================
+
+def refresh_case_summaries(db: Session, case_ids: Iterable[str]) -> int:
+    """
+    Recompute the summary rows of the given cases (rows of deleted cases are removed).
+
+    Changes are added to the session; the caller commits.
+
+    Returns:
+        Number of summary rows written
+    """
+    case_ids = sorted({str(case_id) for case_id in case_ids if case_id})
+    refreshed = 0
+    for start in range(0, len(case_ids), REFRESH_BATCH_SIZE):
+        refreshed += _refresh_batch(db, case_ids[start:start + REFRESH_BATCH_SIZE])
+    return refreshed
+
+
+def _refresh_batch(db: Session, case_ids: List[str]) -> int:
+    window_start = datetime.combine(date.today() - timedelta(days=VELOCITY_WINDOW_DAYS), time.min)
+
+    cases = {
+        str(row.id): row
+        for row in db.query(
+            Case.id, Case.user_id, Case.case_number, Case.title, Case.court, Case.judge,
+            Case.status, Case.case_type, Case.jurisdiction, Case.filing_date
+        ).filter(Case.id.in_(case_ids))
+    }
+
+    deadline_counts = {
+        str(row.case_id): row
+        for row in db.query(
+            Deadline.case_id,
+            func.count(Deadline.id).label("total"),
+            func.sum(case((Deadline.status == "completed", 1), else_=0)).label("completed"),
+            func.sum(case((Deadline.status == "pending", 1), else_=0)).label("pending"),
+            func.max(Deadline.deadline_date).label("last_deadline_date"),
+        ).filter(Deadline.case_id.in_(case_ids)).group_by(Deadline.case_id)
+    }
+
+    pending_dated = defaultdict(list)
+    for row in db.query(
+        Deadline.id, Deadline.case_id, Deadline.title, Deadline.deadline_date, Deadline.deadline_time,
+        Deadline.priority, Deadline.party_role, Deadline.action_required, Deadline.rule_citation
+    ).filter(
+        Deadline.case_id.in_(case_ids),
+        Deadline.status == "pending",
+        Deadline.deadline_date.isnot(None)
+    ).order_by(Deadline.deadline_date, Deadline.id):
+        pending_dated[str(row.case_id)].append(_serialize_pending(row))
+
+    activity = defaultdict(lambda: {"added": defaultdict(int), "completed": defaultdict(int)})
+    for row in db.query(Deadline.case_id, Deadline.status, Deadline.created_at, Deadline.updated_at).filter(
+        Deadline.case_id.in_(case_ids),
+        or_(
+            Deadline.created_at >= window_start,
+            (Deadline.status == "completed") & (Deadline.updated_at >= window_start)
+        )
+    ):
+        days = activity[str(row.case_id)]
+        if row.created_at is not None and row.created_at.date() >= window_start.date():
+            days["added"][row.created_at.date().isoformat()] += 1
+        if row.status == "completed" and row.updated_at is not None and row.updated_at.date() >= window_start.date():
+            days["completed"][row.updated_at.date().isoformat()] += 1
+
+    document_counts = {
+        str(row.case_id): row
+        for row in db.query(
+            Document.case_id,
+            func.count(Document.id).label("count"),
+            func.max(Document.created_at).label("last_created_at"),
+        ).filter(Document.case_id.in_(case_ids)).group_by(Document.case_id)
+    }
+
+    ranked = db.query(
+        Document.case_id, Document.id, Document.file_name, Document.document_type, Document.created_at,
+        func.row_number().over(
+            partition_by=Document.case_id,
+            order_by=(desc(Document.created_at), Document.id)
+        ).label("rank")
+    ).filter(Document.case_id.in_(case_ids)).subquery()
+    recent_documents = defaultdict(list)
+    for row in db.query(ranked).filter(ranked.c.rank <= RECENT_DOCUMENTS_PER_CASE).order_by(
+        ranked.c.case_id, ranked.c.rank
+    ):
+        recent_documents[str(row.case_id)].append({
+            "id": str(row.id),
+            "file_name": row.file_name,
+            "document_type": row.document_type,
+            "created_at": _iso(row.created_at),
+        })
+
+    existing = {
+        summary.case_id: summary
+        for summary in db.query(DashboardCaseSummary).filter(DashboardCaseSummary.case_id.in_(case_ids))
+    }
+
+    # Owners whose cached sections this refresh invalidates (on commit)
+    users = db.info.setdefault(_USERS_KEY, set())
+    users.update(summary.user_id for summary in existing.values())
+    users.update(str(row.user_id) for row in cases.values())
+
+    refreshed = 0
+    for case_id in case_ids:
+        row = cases.get(case_id)
+        if row is None:
+            if case_id in existing:
+                db.delete(existing[case_id])
+            continue
+
+        summary = existing.get(case_id)
+        if summary is None:
+            summary = DashboardCaseSummary(case_id=case_id)
+            db.add(summary)
+
+        counts = deadline_counts.get(case_id)
+        documents = document_counts.get(case_id)
+        days = activity.get(case_id)
+
+        summary.user_id = str(row.user_id)
+        summary.case_number = row.case_number
+        summary.title = row.title
+        summary.court = row.court
+        summary.judge = row.judge
+        summary.status = row.status
+        summary.case_type = row.case_type
+        summary.jurisdiction = row.jurisdiction
+        summary.filing_date = row.filing_date
+        summary.total_deadlines = int(counts.total) if counts else 0
+        summary.completed_deadlines = int(counts.completed or 0) if counts else 0
+        summary.pending_deadlines = int(counts.pending or 0) if counts else 0
+        summary.last_deadline_date = counts.last_deadline_date if counts else None
+        summary.pending_dated = pending_dated.get(case_id, [])
+        summary.activity_by_day = (
+            {"added": dict(days["added"]), "completed": dict(days["completed"])}
+            if days else {"added": {}, "completed": {}}
+        )
+        summary.document_count = int(documents.count) if documents else 0
+        summary.last_document_at = documents.last_created_at if documents else None
+        summary.recent_documents = recent_documents.get(case_id, [])
+        refreshed += 1
+
+    return refreshed
+
+
+def rebuild_user_summaries(db: Session, user_id: str = None) -> int:
+    """
+    Recompute the summary rows of all cases of a user (or of every case).
+
+    Changes are added to the session; the caller commits.
+    """
+    query = db.query(Case.id)
+    if user_id is not None:
+        query = query.filter(Case.user_id == user_id)
+    return refresh_case_summaries(db, [row.id for row in query])
+
+
+def load_user_summaries(db: Session, user_id: str) -> List[DashboardCaseSummary]:
+    """
+    All summary rows of a user's cases (one indexed read).
+
+    A user with cases but no rows yet is backfilled first.
+    """
+    summaries = db.query(DashboardCaseSummary).filter(DashboardCaseSummary.user_id == user_id).all()
+    if summaries or db.query(Case.id).filter(Case.user_id == user_id).first() is None:
+        return summaries
+
+    logger.info(f"Backfilling dashboard summaries for user {user_id}")
+    rebuild_user_summaries(db, user_id)
+    db.commit()
+    return db.query(DashboardCaseSummary).filter(DashboardCaseSummary.user_id == user_id).all()
+
+
+# =============================================================================
+# AUTOMATIC MAINTENANCE ON COMMIT
+# =============================================================================
+
+_SESSION_KEY = "dashboard_cases_changed"
+_USERS_KEY = "dashboard_users_changed"
+_TRACKED_TABLES = {"cases": "id", "deadlines": "case_id", "documents": "case_id"}
+_table_available: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def mark_dashboard_cases_changed(db: Session, case_ids: Iterable[str]) -> None:
+    """Refresh these cases' summaries when the session commits (for raw SQL writes)."""
+    db.info.setdefault(_SESSION_KEY, set()).update(str(case_id) for case_id in case_ids if case_id)
+
+
+def _summaries_enabled(session: Session) -> bool:
+    engine = session.get_bind().engine
+    available = _table_available.get(engine)
+    if available is None:
+        available = inspect(session.connection()).has_table(DashboardCaseSummary.__tablename__)
+        _table_available[engine] = available
+    return available
+
+
+@event.listens_for(Session, "after_flush")
+def _track_dashboard_changes(session, flush_context):
+    """Remember which cases this transaction touched (ids are assigned by now)."""
+    changed = set()
+    for obj in list(session.new) + list(session.deleted):
+        column = _TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+        if column:
+            changed.add(getattr(obj, column))
+    for obj in session.dirty:
+        column = _TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+        if column and session.is_modified(obj, include_collections=False):
+            changed.add(getattr(obj, column))
+            # A deadline or document moved to another case changes both cases
+            changed.update(inspect(obj).attrs[column].history.deleted or ())
+    changed.discard(None)
+    if changed:
+        mark_dashboard_cases_changed(session, changed)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_on_commit(session):
+    session.flush()
+    case_ids = session.info.pop(_SESSION_KEY, None)
+    if not case_ids or not _summaries_enabled(session):
+        return
+    try:
+        with session.begin_nested():
+            refresh_case_summaries(session, case_ids)
+    except Exception as e:
+        # Never fail the user's write over a dashboard aggregate
+        logger.warning(f"Dashboard summary refresh failed for {len(case_ids)} case(s): {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    if session.in_nested_transaction():
+        return  # Savepoint released (e.g. the summary refresh): the outer transaction is still open
+    for user_id in session.info.pop(_USERS_KEY, ()):
+        bump_user_dashboard_generation(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _reset_on_rollback(session, previous_transaction):
+    # The refresh savepoint failing must not drop the other listeners' pending
+    # invalidations (they skip nested rollbacks too)
+    if not previous_transaction.nested:
+        session.info.pop(_SESSION_KEY, None)
+        session.info.pop(_USERS_KEY, None)
@@ -0,0 +1,297 @@
+"""
+Deadline Cascade Engine - Incremental recomputation of dependent deadlines
+
+Deadlines form a DAG through ``parent_deadline_id`` (trigger -> dependents ->
+their dependents ...). When a node moves, only its downstream nodes can
+change. The engine:
+
+1. Loads the downstream subgraph of the changed node with one recursive CTE.
+   Recursion stops at nodes that will not move (manually overridden,
+   auto_recalculate off, no date, or - optionally - not pending), so rows
+   below them are never loaded.
+2. Walks the subgraph in topological order, shifting each recalculable node
+   by the *actual* shift of its parent (after weekend/holiday adjustment) and
+   pruning branches whose shift comes out to zero.
+3. Applies every date change in a single bulk UPDATE.
+
+Usage:
+    engine = DeadlineCascadeEngine(db)
+    plan = engine.plan(trigger.id, old_date, new_date)
+    engine.apply(plan, modified_by=user_id)
+    db.commit()
+"""
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import String, and_, case, literal, or_, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.models.deadline import Deadline
+from app.utils.florida_holidays import adjust_to_business_day
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CascadeNode:
+    """Lightweight view of one dependent deadline (no ORM instance)"""
+    id: str
+    parent_id: str
+    title: str
+    priority: Optional[str]
+    status: Optional[str]
+    deadline_date: Optional[date]
+    trigger_date: Optional[date]
+    is_manually_overridden: Optional[bool]
+    auto_recalculate: Optional[bool]
+    override_timestamp: Optional[datetime]
+    override_reason: Optional[str]
+
+
+@dataclass
+class CascadeChange:
+    """A planned date change for one node"""
+    node: CascadeNode
+    new_date: date
+    new_trigger_date: date
+    days_shifted: int  # Shift inherited from the parent, before adjustment
+    depth: int
+
+
+@dataclass
+class CascadePlan:
+    """Result of planning a cascade: what moves, what is protected"""
+    root_id: str
+    old_date: date
+    new_date: date
+    nodes: Dict[str, CascadeNode] = field(default_factory=dict)
+    changes: List[CascadeChange] = field(default_factory=list)
+    skipped: List[CascadeNode] = field(default_factory=list)
+
+    @property
+    def days_shift(self) -> int:
+        return (self.new_date - self.old_date).days
+
+
+class DeadlineCascadeEngine:
+    """
+    Plans and applies trigger-date cascades over the deadline DAG.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        adjust: Callable[[date], date] = adjust_to_business_day,
+        pending_only: bool = False
+    ):
+        """
+        Args:
+            db: Database session
+            adjust: Rolls a shifted date onto a business day
+            pending_only: Only move deadlines whose status is 'pending'
+        """
+        self.db = db
+        self.adjust = adjust
+        self.pending_only = pending_only
+
+    # =========================================================================
+    # RECALCULABILITY
+    # =========================================================================
+
+    def _recalculable_clause(self, model: Any):
+        """SQL version of is_recalculable() for recursion pruning"""
+        clauses = [
+            model.auto_recalculate == True,
+            or_(model.is_manually_overridden == False, model.is_manually_overridden.is_(None)),
+            model.deadline_date.isnot(None),
+        ]
+        if self.pending_only:
+            clauses.append(model.status == 'pending')
+        return and_(*clauses)
+
+    def is_recalculable(self, node: CascadeNode) -> bool:
+        """Whether a node follows its parent (manual overrides are protected)"""
+        if node.is_manually_overridden or not node.auto_recalculate:
+            return False
+        if self.pending_only and node.status != 'pending':
+            return False
+        return node.deadline_date is not None
+
+    # =========================================================================
+    # SUBGRAPH LOADING
+    # =========================================================================
+
+    def load_subgraph(self, root_id: str, extra_children: Optional[Any] = None) -> Dict[str, CascadeNode]:
+        """
+        Load the downstream nodes of ``root_id`` in one query.
+
+        Args:
+            root_id: The changed deadline
+            extra_children: Optional SQL filter selecting additional rows to
+                treat as direct children of the root (legacy rows without a
+                parent link)
+
+        Returns:
+            Dict of node id -> CascadeNode (root excluded)
+        """
+        seed_filter = Deadline.parent_deadline_id == root_id
+        if extra_children is not None:
+            seed_filter = or_(seed_filter, extra_children)
+
+        seed = select(
+            Deadline.id,
+            literal(root_id, String(36)).label("graph_parent_id")
+        ).where(seed_filter, Deadline.id != root_id)
+        tree = seed.cte("cascade_tree", recursive=True)
+
+        parent = aliased(Deadline)
+        tree = tree.union(
+            select(Deadline.id, Deadline.parent_deadline_id)
+            .join(parent, Deadline.parent_deadline_id == parent.id)
+            .join(tree, parent.id == tree.c.id)
+            .where(self._recalculable_clause(parent), Deadline.id != root_id)
+        )
+
+        rows = self.db.execute(
+            select(
+                Deadline.id,
+                tree.c.graph_parent_id,
+                Deadline.title,
+                Deadline.priority,
+                Deadline.status,
+                Deadline.deadline_date,
+                Deadline.trigger_date,
+                Deadline.is_manually_overridden,
+                Deadline.auto_recalculate,
+                Deadline.override_timestamp,
+                Deadline.override_reason,
+            ).join(tree, Deadline.id == tree.c.id)
+        ).all()
+
+        return {str(row[0]): CascadeNode(str(row[0]), str(row[1]), *row[2:]) for row in rows}
+
+    # =========================================================================
+    # PLANNING
+    # =========================================================================
+
+    def plan(
+        self,
+        root_id: str,
+        old_date: date,
+        new_date: date,
+        extra_children: Optional[Any] = None
+    ) -> CascadePlan:
+        """
+        Compute the new dates of every node downstream of ``root_id``.
+
+        Args:
+            root_id: The deadline whose date changes
+            old_date: Its current date
+            new_date: Its new date
+            extra_children: See load_subgraph
+
+        Returns:
+            CascadePlan with changes in topological order and protected nodes
+        """
+        root_id = str(root_id)
+        plan = CascadePlan(root_id=root_id, old_date=old_date, new_date=new_date)
+        plan.nodes = self.load_subgraph(root_id, extra_children)
+
+        children: Dict[str, List[CascadeNode]] = {}
+        for node in plan.nodes.values():
+            children.setdefault(node.parent_id, []).append(node)
+
+        # Breadth-first from the root is a topological order of the DAG:
+        # a node is visited only after the parent whose shift it inherits.
+        queue = deque([(root_id, plan.days_shift, new_date, 0)])
+        visited = {root_id}
+        while queue:
+            parent_id, shift, parent_new_date, depth = queue.popleft()
+            for node in children.get(parent_id, ()):
+                if node.id in visited:
+                    continue
+                visited.add(node.id)
+
+                if node.is_manually_overridden or not node.auto_recalculate:
+                    plan.skipped.append(node)
+                    continue
+                if not self.is_recalculable(node):
+                    continue
+                if shift == 0:
+                    continue
+
+                moved = self.adjust(node.deadline_date + timedelta(days=shift))
+                plan.changes.append(CascadeChange(
+                    node=node,
+                    new_date=moved,
+                    new_trigger_date=parent_new_date,
+                    days_shifted=shift,
+                    depth=depth + 1
+                ))
+                queue.append((node.id, (moved - node.deadline_date).days, moved, depth + 1))
+
+        return plan
+
+    # =========================================================================
+    # APPLYING
+    # =========================================================================
+
+    def apply(
+        self,
+        plan: CascadePlan,
+        modified_by: Optional[str],
+        reason: Optional[Callable[[CascadeChange], str]] = None,
+        always_set_trigger_date: bool = False
+    ) -> int:
+        """
+        Write all planned date changes with one bulk UPDATE (not committed).
+
+        Args:
+            plan: Plan from plan()
+            modified_by: Stored in modified_by on every updated row
+            reason: Optional per-change modification_reason
+            always_set_trigger_date: Set trigger_date to the parent's new date
+                even on rows that had none
+
+        Returns:
+            Number of deadlines updated
+        """
+        if not plan.changes:
+            return 0
+
+        ids = [change.node.id for change in plan.changes]
+        new_dates = {change.node.id: change.new_date for change in plan.changes}
+        trigger_dates = {
+            change.node.id: change.new_trigger_date
+            for change in plan.changes
+            if always_set_trigger_date or change.node.trigger_date is not None
+        }
+
+        values: Dict[str, Any] = {
+            "deadline_date": case(new_dates, value=Deadline.id),
+            "modified_by": modified_by,
+        }
+        if trigger_dates:
+            values["trigger_date"] = case(trigger_dates, value=Deadline.id, else_=Deadline.trigger_date)
+        if reason is not None:
+            values["modification_reason"] = case(
+                {change.node.id: reason(change) for change in plan.changes},
+                value=Deadline.id
+            )
+
+        self.db.execute(
+            update(Deadline).where(Deadline.id.in_(ids)).values(**values),
+            execution_options={"synchronize_session": False}
+        )
+
+        # Refresh any copies of the updated rows already in the session
+        updated = set(ids)
+        for obj in list(self.db.identity_map.values()):
+            if isinstance(obj, Deadline) and str(obj.id) in updated:
+                self.db.expire(obj)
+
+        logger.info(f"Cascade from {plan.root_id}: updated {len(ids)} deadline(s), {len(plan.skipped)} protected")
+        return len(ids)
@@ -2,8 +2,10 @@
 Dependency Listener - Advanced Dependency Tracking
 Detects when parent (trigger) deadlines change and cascades updates to dependent deadlines
 
-When a trigger changes, all dependent deadlines automatically update
-EXCEPT those that were manually overridden by the user.
+When a trigger changes, all dependent deadlines (at every level of the
+parent_deadline_id chain) automatically update EXCEPT those that were manually
+overridden by the user - and anything that depends on them. The graph work is
+done by DeadlineCascadeEngine.
 """
 from typing import Dict, List, Optional
 from datetime import date, timedelta, datetime
@@ -11,7 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.models.deadline import Deadline
 from app.models.user import User
-from app.utils.florida_holidays import adjust_to_business_day
+from app.services.deadline_cascade import DeadlineCascadeEngine
 
 
 class DependencyListener:
@@ -48,12 +50,9 @@ class DependencyListener:
             }
         """
 
-        # Find all child deadlines
-        dependents = self.db.query(Deadline).filter(
-            Deadline.parent_deadline_id == parent_deadline_id
-        ).all()
+        plan = DeadlineCascadeEngine(self.db).plan(parent_deadline_id, old_date, new_date)
 
-        if not dependents:
+        if not plan.nodes:
             return {
                 'is_parent': False,
                 'has_dependents': False,
@@ -63,49 +62,39 @@ class DependencyListener:
                 'skipped_deadlines': []
             }
 
-        # Calculate date shift
-        days_shift = (new_date - old_date).days
-
-        affected = []
-        skipped = []
-
-        for child in dependents:
-            # PHASE 1 INTEGRATION: Skip manually overridden deadlines!
-            if child.is_manually_overridden or not child.auto_recalculate:
-                skipped.append({
-                    'id': str(child.id),
-                    'title': child.title,
-                    'current_date': child.deadline_date.isoformat() if child.deadline_date else None,
-                    'reason': 'manually_overridden',
-                    'override_date': child.override_timestamp.isoformat() if child.override_timestamp else None,
-                    'override_reason': child.override_reason
-                })
-                continue
-
-            # Calculate new date for this child
-            if child.deadline_date:
-                new_child_date = child.deadline_date + timedelta(days=days_shift)
-
-                # Adjust for business days (weekends/holidays)
-                new_child_date = adjust_to_business_day(new_child_date)
-
-                affected.append({
-                    'id': str(child.id),
-                    'title': child.title,
-                    'old_date': child.deadline_date.isoformat(),
-                    'new_date': new_child_date.isoformat(),
-                    'days_shifted': days_shift,
-                    'priority': child.priority,
-                    'status': child.status
-                })
+        # PHASE 1 INTEGRATION: manually overridden deadlines are skipped, and
+        # so is everything below them
+        affected = [
+            {
+                'id': change.node.id,
+                'title': change.node.title,
+                'old_date': change.node.deadline_date.isoformat(),
+                'new_date': change.new_date.isoformat(),
+                'days_shifted': change.days_shifted,
+                'priority': change.node.priority,
+                'status': change.node.status
+            }
+            for change in plan.changes
+        ]
+        skipped = [
+            {
+                'id': node.id,
+                'title': node.title,
+                'current_date': node.deadline_date.isoformat() if node.deadline_date else None,
+                'reason': 'manually_overridden',
+                'override_date': node.override_timestamp.isoformat() if node.override_timestamp else None,
+                'override_reason': node.override_reason
+            }
+            for node in plan.skipped
+        ]
 
         return {
             'is_parent': True,
             'has_dependents': True,
-            'total_dependents': len(dependents),
+            'total_dependents': len(plan.nodes),
             'affected_count': len(affected),
             'overridden_count': len(skipped),
-            'days_shift': days_shift,
+            'days_shift': plan.days_shift,
             'parent_old_date': old_date.isoformat(),
             'parent_new_date': new_date.isoformat(),
             'changes_preview': affected,
@@ -122,7 +111,9 @@ class DependencyListener:
         """
         Apply cascade updates to all dependent deadlines
 
-        This is the actual execution - call this after user approves the preview
+        This is the actual execution - call this after user approves the preview.
+        Dependents of dependents follow too; all of them are written with a
+        single bulk UPDATE.
 
         Args:
             parent_deadline_id: ID of parent deadline
@@ -148,50 +139,41 @@ class DependencyListener:
             }
 
         old_date = parent.deadline_date
-        days_shift = (new_date - old_date).days
+        if not old_date:
+            return {
+                'success': False,
+                'error': 'Parent deadline has no date to shift from'
+            }
+
+        # Plan against the current dates before touching the parent
+        engine = DeadlineCascadeEngine(self.db)
+        plan = engine.plan(parent_deadline_id, old_date, new_date)
 
         # Update parent first
         parent.deadline_date = new_date
         parent.modified_by = user_id
         parent.modification_reason = reason
 
-        # Find all dependents
-        dependents = self.db.query(Deadline).filter(
-            Deadline.parent_deadline_id == parent_deadline_id
-        ).all()
-
-        updated_deadlines = []
-        skipped_count = 0
-
-        for child in dependents:
-            # PHASE 1 PROTECTION: Skip overridden deadlines
-            if child.is_manually_overridden or not child.auto_recalculate:
-                skipped_count += 1
-                continue
-
-            # Calculate new date
-            if child.deadline_date:
-                new_child_date = child.deadline_date + timedelta(days=days_shift)
-                new_child_date = adjust_to_business_day(new_child_date)
-
-                # Update the child
-                child.deadline_date = new_child_date
-                child.modified_by = user_id
-                child.modification_reason = f"Auto-updated: parent trigger moved by {days_shift} days"
-
-                # Update trigger_date as well since it's dependent
-                if child.trigger_date:
-                    child.trigger_date = new_date
-
-                updated_deadlines.append({
-                    'id': str(child.id),
-                    'title': child.title,
-                    'new_date': new_child_date.isoformat()
-                })
+        # PHASE 1 PROTECTION: overridden deadlines are not part of the plan
+        engine.apply(
+            plan,
+            modified_by=user_id,
+            reason=lambda change: f"Auto-updated: parent trigger moved by {change.days_shifted} days"
+        )
 
         # Commit all changes
         self.db.commit()
 
+        updated_deadlines = [
+            {
+                'id': change.node.id,
+                'title': change.node.title,
+                'new_date': change.new_date.isoformat()
+            }
+            for change in plan.changes
+        ]
+        skipped_count = len(plan.skipped)
+
         return {
             'success': True,
             'updated_count': len(updated_deadlines),
@@ -200,6 +182,31 @@ class DependencyListener:
             'message': f"✓ Updated parent and {len(updated_deadlines)} dependent deadline(s). {skipped_count} manually overridden deadline(s) were protected and not changed."
         }
 
+    async def handle_trigger_change(
+        self,
+        trigger_id: str,
+        old_date: date,
+        new_date: date,
+        user_id: Optional[str] = None
+    ) -> int:
+        """
+        Cascade a trigger move that the caller has already applied to the
+        trigger itself. Does not commit.
+
+        Returns:
+            Number of dependent deadlines updated
+        """
+        if not old_date or old_date == new_date:
+            return 0
+
+        engine = DeadlineCascadeEngine(self.db)
+        plan = engine.plan(trigger_id, old_date, new_date)
+        return engine.apply(
+            plan,
+            modified_by=user_id,
+            reason=lambda change: f"Auto-updated: parent trigger moved by {change.days_shifted} days"
+        )
+
     def get_dependency_tree(self, case_id: str) -> Dict:
         """
         Get the full dependency tree for a case
@@ -13,6 +13,9 @@ from app.services.firebase_service import firebase_service
 from app.services.deadline_service import DeadlineService
 from app.services.confidence_scoring import confidence_scorer
 from app.services.jurisdiction_detector import JurisdictionDetector
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.retrieval_cache import bump_case_embedding_generation
+from app.services.dashboard_summary import mark_dashboard_cases_changed
 from app.utils.pdf_parser import extract_text_from_pdf, get_pdf_metadata
 from app.models.document import Document
 from app.models.case import Case
@@ -1116,7 +1119,11 @@ class DocumentService:
                 text("DELETE FROM documents WHERE id = :doc_id"),
                 {"doc_id": document_id}
             )
+            mark_dashboard_cases_changed(self.db, [document.case_id])
             self.db.commit()
+            if document.case_id:
+                get_case_vector_index_cache().invalidate(document.case_id)
+                bump_case_embedding_generation(document.case_id, "document deleted")
             logger.info(f"✓ Document {document_id} successfully deleted")
             return True
 
@@ -0,0 +1,240 @@
+"""
+Embedding Cache - Content-addressed reuse of chunk embeddings
+
+Court filings repeat large amounts of boilerplate (captions, certificates of
+service, signature blocks), and the same text is re-embedded for every
+document and case it appears in. This cache keys vectors by
+(model, sha256(normalized chunk text)):
+
+- in-memory LRU front (EMBEDDING_CACHE_ENTRIES, default 10000 vectors)
+- backed by the ``embedding_cache`` table, so hits survive restarts and
+  are shared between workers
+- duplicate texts within one request are embedded once
+
+Normalization only collapses whitespace (and applies Unicode NFC): text that
+differs in wording or case is embedded separately.
+
+Only deterministic embedding models may be cached; the hash-based fallback
+embedder uses Python's per-process salted ``hash()`` and is never cached.
+
+Usage:
+    cache = get_embedding_cache()
+    vectors = cache.embed(db, "text-embedding-3-small", texts, embed_fn)
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.document_embedding import EmbeddingCacheEntry
+from app.services.embedding_storage import FORMAT_FLOAT32, decode_embedding, encode_embedding
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# SQLite limits bound parameters per statement; stay well below it
+_LOOKUP_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of chunk text for hashing."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def content_hash(text: str) -> str:
+    """sha256 hex digest of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-level (memory LRU + database table) embedding cache.
+
+    Thread-safe for the in-memory level; database access uses the caller's
+    session.
+    """
+
+    DEFAULT_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_ENTRIES", "10000"))
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._memory: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "request_duplicates": 0,
+            "misses": 0,
+            "stored": 0,
+            "store_errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def lookup(self, db: Session, model: str, hashes: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Cached vectors for the given content hashes.
+
+        Returns:
+            {content_hash: vector} for the hashes that were found
+        """
+        found: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+
+        with self._lock:
+            for digest in dict.fromkeys(hashes):
+                vector = self._memory.get((model, digest))
+                if vector is not None:
+                    self._memory.move_to_end((model, digest))
+                    found[digest] = vector
+                else:
+                    missing.append(digest)
+            self._stats["memory_hits"] += len(found)
+
+        loaded: Dict[str, np.ndarray] = {}
+        for i in range(0, len(missing), _LOOKUP_CHUNK):
+            rows = db.query(EmbeddingCacheEntry.content_hash, EmbeddingCacheEntry.embedding_bytes).filter(
+                EmbeddingCacheEntry.model == model,
+                EmbeddingCacheEntry.content_hash.in_(missing[i:i + _LOOKUP_CHUNK])
+            ).all()
+            for row in rows:
+                loaded[row.content_hash] = decode_embedding(row.embedding_bytes)
+
+        with self._lock:
+            self._stats["db_hits"] += len(loaded)
+            self._stats["misses"] += len(missing) - len(loaded)
+            for digest, vector in loaded.items():
+                self._remember(model, digest, vector)
+
+        found.update(loaded)
+        return found
+
+    def store(self, db: Session, model: str, entries: Dict[str, Sequence[float]]) -> int:
+        """
+        Persist newly embedded vectors ({content_hash: vector}) and commit.
+
+        Write failures (e.g. another worker stored the same hash first) are
+        logged and rolled back; they never fail the caller.
+
+        Returns:
+            Number of entries written
+        """
+        if not entries:
+            return 0
+
+        packed = {digest: encode_embedding(vector, FORMAT_FLOAT32) for digest, vector in entries.items()}
+        with self._lock:
+            for digest, blob in packed.items():
+                self._remember(model, digest, decode_embedding(blob))
+
+        try:
+            db.bulk_insert_mappings(EmbeddingCacheEntry, [
+                {"model": model, "content_hash": digest, "embedding_bytes": blob}
+                for digest, blob in packed.items()
+            ])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Embedding cache write failed (ignoring): {e}")
+            with self._lock:
+                self._stats["store_errors"] += 1
+            return 0
+
+        with self._lock:
+            self._stats["stored"] += len(packed)
+        return len(packed)
+
+    def embed(
+        self,
+        db: Session,
+        model: str,
+        texts: Sequence[str],
+        embed_fn: Callable[[List[str]], List[List[float]]],
+    ) -> List[Sequence[float]]:
+        """
+        Vectors for ``texts``, calling ``embed_fn`` only for unseen content.
+
+        Returns:
+            One vector per input text, in order
+        """
+        hashes = [content_hash(text) for text in texts]
+        self.record_duplicates(len(hashes) - len(set(hashes)))
+        vectors = self.lookup(db, model, hashes)
+
+        to_embed: Dict[str, str] = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in vectors:
+                to_embed.setdefault(digest, text)
+
+        if to_embed:
+            new_vectors = embed_fn(list(to_embed.values()))
+            fresh = dict(zip(to_embed.keys(), new_vectors))
+            self.store(db, model, fresh)
+            vectors.update(fresh)
+
+        return [vectors[digest] for digest in hashes]
+
+    def record_duplicates(self, count: int) -> None:
+        """Count repeated texts within one request (embedded once, so hits)."""
+        if count:
+            with self._lock:
+                self._stats["request_duplicates"] += count
+
+    def _remember(self, model: str, digest: str, vector: np.ndarray) -> None:
+        """Add to the memory LRU (caller holds the lock)."""
+        self._memory[(model, digest)] = vector
+        self._memory.move_to_end((model, digest))
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def clear(self) -> int:
+        """Drop the in-memory level. Returns number of entries removed."""
+        with self._lock:
+            count = len(self._memory)
+            self._memory.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics including hit rate."""
+        with self._lock:
+            hits = (
+                self._stats["memory_hits"]
+                + self._stats["db_hits"]
+                + self._stats["request_duplicates"]
+            )
+            total_requests = hits + self._stats["misses"]
+            hit_rate = (
+                hits / total_requests * 100
+                if total_requests > 0
+                else 0.0
+            )
+            return {
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self._max_entries,
+                "hits": hits,
+                "hit_rate": f"{hit_rate:.1f}%",
+                **self._stats,
+            }
+
+
+# Global singleton instance
+embedding_cache = EmbeddingCache()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the global embedding cache instance."""
+    return embedding_cache
@@ -0,0 +1,449 @@
+"""
+Embedding Pipeline - Batched, concurrent chunk embedding for document ingestion
+
+RAGService.embed_document used to embed one document at a time, calling the
+synchronous OpenAI client on the event loop and adding every chunk row to
+the session individually. For bulk uploads this stalled the whole worker.
+
+The pipeline:
+1. pulls chunks lazily from the chunker, in waves of at most
+   ``max_wave_chunks`` (memory stays flat on very long records)
+2. packs a wave's chunks, across documents, into batches bounded by an
+   estimated token budget and an item limit (one embedding API call per batch)
+3. runs batches concurrently in worker threads (asyncio.to_thread), at most
+   ``max_concurrency`` at a time, so the event loop keeps serving requests
+4. writes the wave's rows with one bulk insert and commit
+
+Chunks are keyed by content hash: identical text within a request is
+embedded once, and with an EmbeddingCache previously embedded text is not
+sent to the embedding API at all.
+
+Re-embedding a document that already has rows is incremental: every row
+stores its chunk's content hash, new chunks matching a stored row keep it
+(only its position is updated), only new text is embedded, and rows whose
+text is gone are deleted in bulk.
+
+A failing batch only fails the documents that have chunks in it; their new
+rows are not written (rows from earlier waves are deleted, previously
+stored rows are left alone) and the error is reported per document.
+
+Usage:
+    pipeline = EmbeddingPipeline(embed_fn=rag_service.generate_embeddings,
+                                 chunker=rag_service.iter_chunks)
+    result = await pipeline.embed_documents([(document, case_id), ...], db)
+    result.chunks   # {document_id: chunks_created}
+    result.failed   # {document_id: error}
+"""
+import asyncio
+import itertools
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.embedding_cache import EmbeddingCache, content_hash
+from app.services.embedding_storage import embedding_columns, stored_dimension
+from app.services.firm_vector_index import get_firm_vector_index
+from app.services.retrieval_cache import bump_case_embedding_generation
+
+logger = logging.getLogger(__name__)
+
+# Row ids per DELETE ... WHERE id IN (...) statement
+DELETE_BATCH_SIZE = 500
+
+EmbedFn = Callable[[List[str]], List[List[float]]]
+Chunker = Callable[..., Iterable[Dict[str, Any]]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for batching (~4 characters per token for English)."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class IngestionResult:
+    """Outcome of embedding a set of documents"""
+    chunks: Dict[str, int] = field(default_factory=dict)   # document_id -> chunks stored (new + unchanged)
+    failed: Dict[str, str] = field(default_factory=dict)   # document_id -> error
+    batches: int = 0
+    embedded: int = 0        # Texts sent to the embedder
+    reused: int = 0          # Chunks served from the cache or an identical chunk
+    unchanged: int = 0       # Existing rows kept as-is on re-embedding
+    removed: int = 0         # Existing rows deleted because their text is gone
+    elapsed_ms: float = 0.0
+
+    @property
+    def total_chunks(self) -> int:
+        return sum(self.chunks.values())
+
+
+@dataclass
+class _PendingChunk:
+    document_id: str
+    case_id: str
+    chunk: Dict[str, Any]
+    tokens: int
+    content_hash: str = ""
+
+
+@dataclass
+class _DocumentDiff:
+    """A document's stored rows, matched against its new chunks by content hash"""
+    case_id: str
+    # content_hash -> [(row id, chunk_index, chunk_metadata, hash and model stored)] not matched yet
+    # (rows embedded by another model are filed under None and never matched)
+    unmatched: Dict[Optional[str], List[Tuple[str, int, Any, bool]]] = field(default_factory=dict)
+    updates: List[Dict[str, Any]] = field(default_factory=list)  # Kept rows that moved
+    kept: int = 0
+    inserted: List[str] = field(default_factory=list)  # Row ids written by this run
+
+
+class EmbeddingPipeline:
+    """
+    Token-budgeted, bounded-concurrency embedding of many documents' chunks.
+
+    ``embed_fn`` is any blocking callable mapping a list of texts to a list of
+    vectors (RAGService.generate_embeddings in production, a stub in tests).
+    With ``cache`` and ``model`` set, vectors are looked up in / stored to the
+    embedding cache; only vectors of ``dimensions`` (when given) are stored,
+    so fallback vectors returned after an API error never poison it.
+
+    Stored rows record the model that produced them (``embedding_model``,
+    NULL for fallback vectors). Re-embedding only keeps an unchanged chunk's
+    row when it was embedded by the current model, so fallback vectors and
+    vectors of a previous model are replaced.
+    """
+
+    DEFAULT_MAX_BATCH_TOKENS = int(os.getenv("EMBEDDING_BATCH_TOKENS", "20000"))
+    DEFAULT_MAX_BATCH_ITEMS = 100
+    DEFAULT_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_CONCURRENCY", "4"))
+    DEFAULT_MAX_WAVE_CHUNKS = int(os.getenv("EMBEDDING_WAVE_CHUNKS", "2000"))
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        chunker: Chunker,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+        max_batch_items: int = DEFAULT_MAX_BATCH_ITEMS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_wave_chunks: int = DEFAULT_MAX_WAVE_CHUNKS,
+        cache: Optional[EmbeddingCache] = None,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+    ):
+        self.embed_fn = embed_fn
+        self.chunker = chunker
+        self.cache = cache if model else None
+        self.model = model
+        self.dimensions = dimensions
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_items = max_batch_items
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_wave_chunks = max(1, max_wave_chunks)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def embed_documents(
+        self,
+        documents: Sequence[Tuple[Document, str]],
+        db: Session,
+    ) -> IngestionResult:
+        """
+        Chunk, embed and store a set of documents.
+
+        Args:
+            documents: (document, case_id) pairs; documents without extracted
+                text are skipped (0 chunks)
+            db: Database session (committed once per wave)
+
+        Returns:
+            IngestionResult with per-document chunk counts and failures
+        """
+        started = time.perf_counter()
+        result = IngestionResult()
+        diffs: Dict[str, _DocumentDiff] = {}
+
+        pending = self._iter_chunks(documents, db, result, diffs)
+        while True:
+            wave = list(itertools.islice(pending, self.max_wave_chunks))
+            if not wave:
+                break
+            await self._embed_wave(wave, db, result, diffs)
+
+        self._apply_diffs(db, result, diffs)
+
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Embedded {result.total_chunks} chunks from {len(result.chunks)} documents "
+            f"in {result.batches} batches ({result.reused} reused, {result.unchanged} unchanged, "
+            f"{result.removed} removed, {result.elapsed_ms:.0f}ms, {len(result.failed)} failed)"
+        )
+        return result
+
+    def build_batches(self, pending: Sequence[_PendingChunk]) -> List[List[_PendingChunk]]:
+        """Pack chunks in order into batches within the token and item limits."""
+        batches: List[List[_PendingChunk]] = []
+        current: List[_PendingChunk] = []
+        current_tokens = 0
+
+        for item in pending:
+            if current and (
+                current_tokens + item.tokens > self.max_batch_tokens
+                or len(current) >= self.max_batch_items
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += item.tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _iter_chunks(
+        self,
+        documents: Sequence[Tuple[Document, str]],
+        db: Session,
+        result: IngestionResult,
+        diffs: Dict[str, _DocumentDiff],
+    ) -> Iterator[_PendingChunk]:
+        """
+        Chunks of all documents that still need embedding, produced lazily.
+
+        A chunk whose text matches a row the document already has keeps that
+        row (re-embedding after an OCR re-run only embeds what changed),
+        provided that row was embedded by the current model.
+        """
+        for document, case_id in documents:
+            document_id = str(document.id)
+            result.chunks[document_id] = 0
+            if not document.extracted_text:
+                continue
+            diff = diffs[document_id] = self._load_diff(db, document_id, str(case_id))
+            try:
+                for chunk in self.chunker(
+                    text=document.extracted_text,
+                    document_id=document_id,
+                    document_type=document.document_type
+                ):
+                    digest = content_hash(chunk["chunk_text"])
+                    rows = diff.unmatched.get(digest)
+                    if rows:
+                        row_id, chunk_index, metadata, stamped = rows.pop(0)
+                        diff.kept += 1
+                        if not stamped or chunk_index != chunk["chunk_index"] or metadata != chunk["chunk_metadata"]:
+                            diff.updates.append({
+                                "id": row_id,
+                                "chunk_index": chunk["chunk_index"],
+                                "chunk_metadata": chunk["chunk_metadata"],
+                                "content_hash": digest,
+                                "embedding_model": self.model,
+                            })
+                        continue
+                    yield _PendingChunk(
+                        document_id, str(case_id), chunk, estimate_tokens(chunk["chunk_text"]), digest
+                    )
+            except Exception as e:
+                logger.error(f"Chunking failed for document {document_id}: {e}")
+                result.failed[document_id] = str(e)
+
+    def _load_diff(self, db: Session, document_id: str, case_id: str) -> _DocumentDiff:
+        """
+        Index a document's stored rows by content hash (legacy rows are hashed
+        from their text).
+
+        Rows stamped with another model are not reusable. Unstamped rows
+        (written before the model was recorded, or fallback vectors) are
+        reusable only when their dimension matches ``dimensions``; their
+        vector is read just for those rows.
+        """
+        unstamped = DocumentEmbedding.embedding_model.is_(None)
+        rows = db.query(
+            DocumentEmbedding.id,
+            DocumentEmbedding.chunk_index,
+            DocumentEmbedding.chunk_metadata,
+            DocumentEmbedding.content_hash,
+            case((DocumentEmbedding.content_hash.is_(None), DocumentEmbedding.chunk_text), else_=None),
+            DocumentEmbedding.embedding_model,
+            case((unstamped, DocumentEmbedding.embedding_bytes), else_=None),
+            case((unstamped, DocumentEmbedding.embedding), else_=None),
+        ).filter(
+            DocumentEmbedding.document_id == document_id
+        ).order_by(DocumentEmbedding.chunk_index).all()
+
+        diff = _DocumentDiff(case_id)
+        for row_id, chunk_index, metadata, stored_hash, legacy_text, model, vector_bytes, vector in rows:
+            if model is not None:
+                reusable = model == self.model
+            elif self.model is None or self.dimensions is None:
+                reusable = True
+            else:
+                reusable = stored_dimension(vector_bytes, vector) == self.dimensions
+            digest = (stored_hash or content_hash(legacy_text or "")) if reusable else None
+            stamped = stored_hash is not None and model == self.model
+            diff.unmatched.setdefault(digest, []).append((row_id, chunk_index, metadata, stamped))
+        return diff
+
+    def _apply_diffs(self, db: Session, result: IngestionResult, diffs: Dict[str, _DocumentDiff]) -> None:
+        """
+        Finish every document: renumber kept rows and delete rows whose text is
+        gone, or - for a failed document - delete the rows this run inserted
+        (a document is re-embedded completely or not at all).
+        """
+        changed_cases: Dict[str, bool] = {}  # case_id -> rows deleted
+        for document_id, diff in diffs.items():
+            if document_id in result.failed:
+                delete_ids = diff.inserted
+            else:
+                delete_ids = [row[0] for rows in diff.unmatched.values() for row in rows]
+                if diff.updates:
+                    db.bulk_update_mappings(DocumentEmbedding, diff.updates)
+                result.chunks[document_id] += diff.kept
+                result.unchanged += diff.kept
+                result.removed += len(delete_ids)
+
+            for start in range(0, len(delete_ids), DELETE_BATCH_SIZE):
+                db.query(DocumentEmbedding).filter(
+                    DocumentEmbedding.id.in_(delete_ids[start:start + DELETE_BATCH_SIZE])
+                ).delete(synchronize_session=False)
+            if delete_ids or (diff.updates and document_id not in result.failed):
+                changed_cases[diff.case_id] = changed_cases.get(diff.case_id, False) or bool(delete_ids)
+
+        for document_id in result.failed:
+            result.chunks[document_id] = 0
+
+        if changed_cases:
+            db.commit()
+            cache = get_case_vector_index_cache()
+            for case_id, deleted in changed_cases.items():
+                if deleted:
+                    cache.invalidate(case_id)
+                bump_case_embedding_generation(case_id, "document re-embedded")
+
+    async def _embed_wave(
+        self,
+        pending: List[_PendingChunk],
+        db: Session,
+        result: IngestionResult,
+        diffs: Dict[str, _DocumentDiff],
+    ) -> None:
+        """Embed and store one wave of chunks (one bulk insert and commit)."""
+        # One embedding per distinct text; reuse cached vectors
+        unique: Dict[str, _PendingChunk] = {}
+        for item in pending:
+            unique.setdefault(item.content_hash, item)
+        vectors: Dict[str, Sequence[float]] = {}
+        if self.cache is not None:
+            self.cache.record_duplicates(len(pending) - len(unique))
+            vectors = self.cache.lookup(db, self.model, list(unique))
+        to_embed = [item for digest, item in unique.items() if digest not in vectors]
+
+        batches = self.build_batches(to_embed)
+        result.batches += len(batches)
+        result.embedded += len(to_embed)
+        result.reused += len(pending) - len(to_embed)
+
+        fresh = await self._embed_batches(batches, result)
+        vectors.update(fresh)
+
+        # A document whose chunk (or an identical chunk) failed is not stored
+        for item in pending:
+            if item.content_hash not in vectors:
+                result.failed.setdefault(item.document_id, "Embedding failed")
+
+        rows_by_case: Dict[str, List[Tuple[str, Sequence[float]]]] = {}
+        mappings = []
+        for item in pending:
+            if item.document_id in result.failed:
+                continue
+            vector = vectors[item.content_hash]
+            row_id = str(uuid.uuid4())
+            mappings.append({
+                "id": row_id,
+                "case_id": item.case_id,
+                "document_id": item.chunk["document_id"],
+                "chunk_text": item.chunk["chunk_text"],
+                "chunk_index": item.chunk["chunk_index"],
+                "chunk_metadata": item.chunk["chunk_metadata"],
+                "content_hash": item.content_hash,
+                "embedding_model": self._model_of(vector),
+                **embedding_columns(vector),
+            })
+            rows_by_case.setdefault(item.case_id, []).append((row_id, vector))
+            result.chunks[item.document_id] += 1
+            diffs[item.document_id].inserted.append(row_id)
+
+        if mappings:
+            db.bulk_insert_mappings(DocumentEmbedding, mappings)
+            db.commit()
+            for case_id in rows_by_case:
+                bump_case_embedding_generation(case_id, "chunks embedded")
+
+            # Keep already-loaded vector indexes current without a rebuild
+            if not DocumentEmbedding.using_pgvector():
+                cache = get_case_vector_index_cache()
+                for case_id, rows in rows_by_case.items():
+                    cache.add_chunks(case_id, rows)
+                get_firm_vector_index().add_rows(
+                    (row_id, case_id, vector)
+                    for case_id, rows in rows_by_case.items()
+                    for row_id, vector in rows
+                )
+
+        if self.cache is not None and fresh:
+            self.cache.store(db, self.model, {
+                digest: vector for digest, vector in fresh.items()
+                if self._model_of(vector) is not None
+            })
+
+    def _model_of(self, vector: Sequence[float]) -> Optional[str]:
+        """The model that produced ``vector``: None for fallback vectors of another dimension."""
+        if self.model and (self.dimensions is None or len(vector) == self.dimensions):
+            return self.model
+        return None
+
+    async def _embed_batches(
+        self,
+        batches: List[List[_PendingChunk]],
+        result: IngestionResult,
+    ) -> Dict[str, Sequence[float]]:
+        """Embed batches concurrently; returns {content_hash: vector} of the successful ones."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_with_semaphore(batch: List[_PendingChunk]) -> List[List[float]]:
+            async with semaphore:
+                texts = [item.chunk["chunk_text"] for item in batch]
+                vectors = await asyncio.to_thread(self.embed_fn, texts)
+                if len(vectors) != len(texts):
+                    raise ValueError(f"Embedder returned {len(vectors)} vectors for {len(texts)} texts")
+                return vectors
+
+        outcomes = await asyncio.gather(
+            *(embed_with_semaphore(batch) for batch in batches),
+            return_exceptions=True
+        )
+
+        vectors: Dict[str, Sequence[float]] = {}
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Embedding batch of {len(batch)} chunks failed: {outcome}")
+                for item in batch:
+                    result.failed.setdefault(item.document_id, str(outcome))
+                continue
+            for item, vector in zip(batch, outcome):
+                vectors[item.content_hash] = vector
+        return vectors
@@ -0,0 +1,173 @@
+"""
+Embedding Storage - Compact binary encoding for document embeddings
+
+Without pgvector, embeddings used to be stored as JSON arrays of floats:
+~20 bytes per dimension on disk and a full JSON parse on every read. They
+are now stored in ``document_embeddings.embedding_bytes`` in one of two
+binary formats, selected by ``EMBEDDING_STORAGE_FORMAT``:
+
+- ``float32`` (default): raw little-endian float32, 4 bytes per dimension,
+  decoded zero-copy with ``numpy.frombuffer``
+- ``int8``: scalar-quantized, 1 byte per dimension plus a per-vector
+  float32 scale (cosine rankings are practically unchanged)
+- ``json``: legacy behaviour, keep writing the JSON column
+
+Layout (little-endian):
+
+    byte 0      format code (1 = float32, 2 = int8)
+    bytes 1-3   reserved (keeps the float32 payload 4-byte aligned)
+    int8 only:  float32 scale
+    payload     float32[n] | int8[n]
+
+Rows written before this change keep their JSON embedding until
+``migrate_json_embeddings`` (scripts/migrate_embeddings_to_binary.py)
+converts them; ``row_vector`` reads either representation.
+"""
+import logging
+import os
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.document_embedding import DocumentEmbedding
+
+logger = logging.getLogger(__name__)
+
+FORMAT_FLOAT32 = "float32"
+FORMAT_INT8 = "int8"
+FORMAT_JSON = "json"
+
+_FORMAT_CODES = {FORMAT_FLOAT32: 1, FORMAT_INT8: 2}
+_HEADER_SIZE = 4
+_SCALE_SIZE = 4
+
+EMBEDDING_STORAGE_FORMAT = os.getenv("EMBEDDING_STORAGE_FORMAT", FORMAT_FLOAT32).lower()
+if EMBEDDING_STORAGE_FORMAT not in (FORMAT_FLOAT32, FORMAT_INT8, FORMAT_JSON):
+    logger.warning(f"Unknown EMBEDDING_STORAGE_FORMAT '{EMBEDDING_STORAGE_FORMAT}', using float32")
+    EMBEDDING_STORAGE_FORMAT = FORMAT_FLOAT32
+
+
+def encode_embedding(vector: Sequence[float], fmt: str = FORMAT_FLOAT32) -> bytes:
+    """Encode a vector as float32 or int8 bytes (see module docstring for layout)."""
+    values = np.asarray(vector, dtype="<f4")
+    header = bytes((_FORMAT_CODES[fmt], 0, 0, 0))
+
+    if fmt == FORMAT_FLOAT32:
+        return header + values.tobytes()
+
+    peak = float(np.max(np.abs(values))) if values.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    quantized = np.clip(np.rint(values / scale), -127, 127).astype(np.int8)
+    return header + np.float32(scale).astype("<f4").tobytes() + quantized.tobytes()
+
+
+def decode_embedding(blob: Any) -> np.ndarray:
+    """
+    Decode bytes from ``encode_embedding`` into a float32 vector.
+
+    float32 payloads are returned as a read-only view of ``blob`` (no copy).
+    """
+    buffer = memoryview(blob)
+    code = buffer[0]
+
+    if code == _FORMAT_CODES[FORMAT_FLOAT32]:
+        return np.frombuffer(buffer, dtype="<f4", offset=_HEADER_SIZE)
+    if code == _FORMAT_CODES[FORMAT_INT8]:
+        scale = np.frombuffer(buffer, dtype="<f4", count=1, offset=_HEADER_SIZE)[0]
+        quantized = np.frombuffer(buffer, dtype=np.int8, offset=_HEADER_SIZE + _SCALE_SIZE)
+        return quantized.astype(np.float32) * scale
+
+    raise ValueError(f"Unknown embedding storage format code {code}")
+
+
+def embedding_columns(vector: Sequence[float], fmt: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Column values for storing ``vector`` on a DocumentEmbedding.
+
+    pgvector deployments always use the native vector column.
+    """
+    fmt = fmt or EMBEDDING_STORAGE_FORMAT
+    if DocumentEmbedding.using_pgvector() or fmt == FORMAT_JSON:
+        return {"embedding": vector}
+    return {"embedding_bytes": encode_embedding(vector, fmt)}
+
+
+def stored_dimension(embedding_bytes: Any, embedding: Optional[Sequence[float]]) -> Optional[int]:
+    """Dimension of a stored row's vector, read from the header/length (no decode)."""
+    if embedding_bytes is not None:
+        size = len(embedding_bytes)
+        code = memoryview(embedding_bytes)[0] if size else None
+        if code == _FORMAT_CODES[FORMAT_FLOAT32]:
+            return (size - _HEADER_SIZE) // 4
+        if code == _FORMAT_CODES[FORMAT_INT8]:
+            return size - _HEADER_SIZE - _SCALE_SIZE
+        return None
+    if embedding is None:
+        return None
+    return len(embedding)
+
+
+def row_vector(embedding_bytes: Any, embedding: Optional[Sequence[float]]) -> Optional[Sequence[float]]:
+    """Vector of a stored row, whichever column holds it (None if neither)."""
+    if embedding_bytes is not None:
+        return decode_embedding(embedding_bytes)
+    return embedding
+
+
+def migrate_json_embeddings(
+    db: Session,
+    fmt: str = FORMAT_FLOAT32,
+    batch_size: int = 500,
+    keep_json: bool = False,
+) -> int:
+    """
+    Convert rows that only have a JSON embedding to the binary format.
+
+    Walks the table in primary-key order and commits after every batch, so
+    it can be interrupted and re-run.
+
+    Args:
+        db: Database session
+        fmt: "float32" or "int8"
+        batch_size: Rows per transaction
+        keep_json: Leave the JSON column populated (e.g. to roll back)
+
+    Returns:
+        Number of rows converted
+    """
+    if fmt not in _FORMAT_CODES:
+        raise ValueError(f"Cannot migrate embeddings to format '{fmt}'")
+    if DocumentEmbedding.using_pgvector():
+        logger.info("pgvector in use - embeddings are stored natively, nothing to migrate")
+        return 0
+
+    converted = 0
+    last_id = ""
+    while True:
+        rows = db.query(DocumentEmbedding.id, DocumentEmbedding.embedding).filter(
+            DocumentEmbedding.id > last_id,
+            DocumentEmbedding.embedding_bytes.is_(None),
+            DocumentEmbedding.embedding.isnot(None),
+        ).order_by(DocumentEmbedding.id).limit(batch_size).all()
+        if not rows:
+            break
+
+        updates = [
+            {
+                "id": row.id,
+                "embedding_bytes": encode_embedding(row.embedding, fmt),
+                **({} if keep_json else {"embedding": None}),
+            }
+            for row in rows
+            if row.embedding
+        ]
+        if updates:
+            db.bulk_update_mappings(DocumentEmbedding, updates)
+        db.commit()
+
+        converted += len(updates)
+        last_id = rows[-1].id
+        logger.info(f"Converted {converted} embeddings to {fmt}")
+
+    return converted
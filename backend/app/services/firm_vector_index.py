@@ -0,0 +1,578 @@
+"""
+Firm Vector Index - Approximate nearest-neighbour search across all cases
+
+All other retrieval is scoped to one case. Firm-wide questions ("every
+motion where opposing counsel argued X") need to search every chunk the
+user can see. Without pgvector, this module provides an IVF (inverted file)
+index built with NumPy:
+
+- spherical k-means partitions the unit-length vectors into ``nlist``
+  lists; a query scores the centroids and scans only the ``nprobe``
+  closest lists
+- vectors are stored grouped by list in ``.npy`` files and memory-mapped
+  on load, so the index costs page cache rather than process memory and
+  survives restarts without a rebuild
+- rows are also ordered by case: when the user can only see a small part
+  of the firm (``exact_max_rows`` rows or fewer), those rows are scored
+  exactly instead of probing lists
+- the embedding pipeline appends new rows to a delta segment (in memory
+  and appended to ``delta_*`` files); rebuild periodically to fold it in
+- deleted rows are not removed from the files; search results are
+  hydrated from document_embeddings, which drops them
+
+Filtering by case access happens inside the scan (case code mask), never
+after the top-k, so other cases' chunks cannot crowd out allowed ones.
+
+The index covers one embedding dimension (the active embedding model).
+Like the other in-process caches, deltas assume a single writer process;
+rebuild with scripts/build_firm_vector_index.py.
+
+A request never builds the index: when none is persisted for the dimension,
+``ensure`` starts the build in a background thread and returns False, and
+the endpoint answers 503 until the build has been swapped in.
+
+Usage:
+    index = get_firm_vector_index()
+    if index.ensure(db, dimension=len(query_embedding)):
+        hits = index.search(query_embedding, allowed_case_ids, top_k=10)  # [(id, case_id, score)]
+"""
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.document_embedding import DocumentEmbedding
+from app.services.embedding_storage import row_vector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = os.getenv(
+    "FIRM_VECTOR_INDEX_DIR",
+    str(Path(__file__).resolve().parents[2] / "data" / "firm_vector_index")
+)
+DEFAULT_NPROBE = int(os.getenv("FIRM_VECTOR_INDEX_NPROBE", "16"))
+DEFAULT_EXACT_MAX_ROWS = int(os.getenv("FIRM_VECTOR_INDEX_EXACT_ROWS", "50000"))
+
+MAX_LISTS = 4096
+KMEANS_SAMPLE_SIZE = 65536
+KMEANS_ITERATIONS = 12
+BUILD_BATCH_SIZE = 2000
+SCORE_BATCH_ROWS = 32768
+
+ID_DTYPE = "S36"  # document_embeddings.id is String(36)
+
+_META = "meta.json"
+_CENTROIDS = "centroids.npy"
+_VECTORS = "vectors.npy"
+_OFFSETS = "offsets.npy"
+_IDS = "ids.npy"
+_CASES = "cases.npy"
+_CASE_ORDER = "case_order.npy"
+_CASE_OFFSETS = "case_offsets.npy"
+_DELTA_VECTORS = "delta_vectors.f32"
+_DELTA_ROWS = "delta_rows.jsonl"
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def suggested_nlist(count: int) -> int:
+    """Number of IVF lists for ``count`` vectors (~4 * sqrt(n), capped)."""
+    return int(min(MAX_LISTS, max(1, round(4 * np.sqrt(count)))))
+
+
+def spherical_kmeans(sample: np.ndarray, nlist: int, iterations: int = KMEANS_ITERATIONS,
+                     seed: int = 0) -> np.ndarray:
+    """Unit-length centroids of unit-length rows (cosine k-means)."""
+    rng = np.random.default_rng(seed)
+    nlist = min(nlist, len(sample))
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assign = _nearest(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        counts = np.bincount(assign, minlength=nlist)
+        empty = counts == 0
+        if empty.any():
+            # Re-seed empty lists with random rows
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+def _nearest(rows: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid per row (in bounded batches)."""
+    assign = np.empty(len(rows), dtype=np.int32)
+    for start in range(0, len(rows), SCORE_BATCH_ROWS):
+        assign[start:start + SCORE_BATCH_ROWS] = np.argmax(
+            np.asarray(rows[start:start + SCORE_BATCH_ROWS]) @ centroids.T, axis=1
+        )
+    return assign
+
+
+class _Delta:
+    """Rows added since the last build (in memory; mirrored to append-only files)"""
+
+    def __init__(self, dimension: int):
+        self.matrix = np.empty((0, dimension), dtype=np.float32)
+        self.cases = np.empty(0, dtype=np.int32)
+        self.ids: List[str] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def append(self, ids: List[str], cases: np.ndarray, vectors: np.ndarray) -> None:
+        needed = self.size + len(ids)
+        if needed > len(self.matrix):
+            capacity = max(needed, 2 * len(self.matrix), 256)
+            grown = np.empty((capacity, self.matrix.shape[1]), dtype=np.float32)
+            grown[:self.size] = self.matrix[:self.size]
+            self.matrix = grown
+            grown_cases = np.empty(capacity, dtype=np.int32)
+            grown_cases[:self.size] = self.cases[:self.size]
+            self.cases = grown_cases
+        self.matrix[self.size:needed] = vectors
+        self.cases[self.size:needed] = cases
+        self.ids.extend(ids)
+
+
+class IndexNotReadyError(RuntimeError):
+    """The firm index is being built in the background; retry shortly."""
+
+
+class FirmVectorIndex:
+    """
+    Persistent, memory-mapped IVF index over every chunk embedding.
+
+    Thread-safe. ``search`` only ever returns rows of the given case ids.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_DIR, nprobe: int = DEFAULT_NPROBE,
+                 exact_max_rows: int = DEFAULT_EXACT_MAX_ROWS):
+        self.path = Path(path)
+        self.nprobe = max(1, nprobe)
+        self.exact_max_rows = exact_max_rows
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._builder: Optional[threading.Thread] = None
+        self._reset()
+        self._stats = {
+            "searches": 0,
+            "exact_searches": 0,
+            "builds": 0,
+            "rows_added": 0,
+        }
+
+    def _reset(self) -> None:
+        self.dimension: Optional[int] = None
+        self.count = 0
+        self.built_at: Optional[float] = None
+        self._case_ids: List[str] = []
+        self._case_codes: Dict[str, int] = {}
+        self._centroids = None
+        self._vectors = None
+        self._offsets = None
+        self._ids = None
+        self._cases = None
+        self._case_order = None
+        self._case_offsets = None
+        self._delta: Optional[_Delta] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def building(self) -> bool:
+        builder = self._builder
+        return builder is not None and builder.is_alive()
+
+    def ensure(self, db: Session, dimension: int) -> bool:
+        """
+        Make the index usable for ``dimension``: load it from disk, or start
+        building it in a background thread (with its own session on ``db``'s
+        engine) and return False.
+
+        Returns:
+            True if the index is ready
+        """
+        with self._lock:
+            if self._loaded and self.dimension == dimension:
+                return True
+            if not self.building and self.load() and self.dimension == dimension:
+                return True
+            if not self.building:
+                logger.warning(
+                    f"Firm vector index missing or not {dimension}-dimensional; building it in the "
+                    f"background (run scripts/build_firm_vector_index.py ahead of time)"
+                )
+                self._builder = threading.Thread(
+                    target=self._build_in_background,
+                    args=(sessionmaker(bind=db.get_bind()), dimension),
+                    name="firm-vector-index-build",
+                    daemon=True
+                )
+                self._builder.start()
+            return False
+
+    def _build_in_background(self, session_factory: Callable[[], Session], dimension: int) -> None:
+        db = session_factory()
+        try:
+            self.build(db, dimension)
+        except Exception as e:
+            logger.error(f"Background firm vector index build failed: {e}")
+        finally:
+            db.close()
+
+    def load(self) -> bool:
+        """Memory-map a persisted index. Returns False if none exists."""
+        with self._lock:
+            meta_path = self.path / _META
+            if not meta_path.exists():
+                return False
+            meta = json.loads(meta_path.read_text())
+
+            self._reset()
+            self.dimension = meta["dimension"]
+            self.count = meta["count"]
+            self.built_at = meta.get("built_at")
+            self._case_ids = list(meta["case_ids"])
+            self._case_codes = {case_id: code for code, case_id in enumerate(self._case_ids)}
+
+            def mapped(name):
+                return np.load(self.path / name, mmap_mode="r")
+
+            self._centroids = np.load(self.path / _CENTROIDS)
+            self._vectors = mapped(_VECTORS)
+            self._offsets = np.load(self.path / _OFFSETS)
+            self._ids = mapped(_IDS)
+            self._cases = mapped(_CASES)
+            self._case_order = mapped(_CASE_ORDER)
+            self._case_offsets = np.load(self.path / _CASE_OFFSETS)
+            self._delta = _Delta(self.dimension)
+            self._load_delta()
+            self._loaded = True
+            logger.info(f"Loaded firm vector index: {self.count} rows, {len(self._offsets) - 1} lists, "
+                        f"{self._delta.size} delta rows")
+            return True
+
+    def _load_delta(self) -> None:
+        rows_path = self.path / _DELTA_ROWS
+        vectors_path = self.path / _DELTA_VECTORS
+        if not rows_path.exists() or not vectors_path.exists():
+            return
+        rows = [json.loads(line) for line in rows_path.read_text().splitlines() if line.strip()]
+        vectors = np.fromfile(vectors_path, dtype=np.float32)
+        complete = min(len(rows), len(vectors) // self.dimension)  # Ignore a torn last append
+        if not complete:
+            return
+        rows = rows[:complete]
+        vectors = vectors[:complete * self.dimension].reshape(complete, self.dimension)
+        cases = np.array([self._case_code(case_id) for _, case_id in rows], dtype=np.int32)
+        self._delta.append([row_id for row_id, _ in rows], cases, vectors)
+
+    def _case_code(self, case_id: str) -> int:
+        code = self._case_codes.get(case_id)
+        if code is None:
+            code = self._case_codes[case_id] = len(self._case_ids)
+            self._case_ids.append(case_id)
+        return code
+
+    def build(self, db: Session, dimension: int, nlist: Optional[int] = None) -> int:
+        """
+        Rebuild the index from document_embeddings and swap it in.
+
+        Rows are streamed in keyset batches into a memory-mapped scratch
+        file; k-means runs on a sample. Rows of another dimension are skipped.
+
+        Returns:
+            Number of rows indexed
+        """
+        started = time.perf_counter()
+        building = self.path.with_name(self.path.name + ".building")
+        shutil.rmtree(building, ignore_errors=True)
+        building.mkdir(parents=True)
+
+        capacity = max(1, db.query(DocumentEmbedding).count())
+        scratch = np.lib.format.open_memmap(building / "scratch.npy", mode="w+", dtype=np.float32,
+                                            shape=(capacity, dimension))
+        ids = np.empty(capacity, dtype=ID_DTYPE)
+        case_ids: List[str] = []
+        case_codes: Dict[str, int] = {}
+        cases = np.empty(capacity, dtype=np.int32)
+
+        count = 0
+        last_id = ""
+        while count < capacity:
+            rows = db.query(
+                DocumentEmbedding.id,
+                DocumentEmbedding.case_id,
+                DocumentEmbedding.embedding_bytes,
+                DocumentEmbedding.embedding,
+            ).filter(
+                DocumentEmbedding.id > last_id
+            ).order_by(DocumentEmbedding.id).limit(BUILD_BATCH_SIZE).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            for row in rows:
+                vector = row_vector(row.embedding_bytes, row.embedding)
+                if vector is None or len(vector) != dimension or count >= capacity:
+                    continue
+                scratch[count] = vector
+                ids[count] = str(row.id).encode()
+                code = case_codes.get(str(row.case_id))
+                if code is None:
+                    code = case_codes[str(row.case_id)] = len(case_ids)
+                    case_ids.append(str(row.case_id))
+                cases[count] = code
+                count += 1
+
+        # Normalize in place, batch by batch
+        for start in range(0, count, SCORE_BATCH_ROWS):
+            _normalize(scratch[start:min(count, start + SCORE_BATCH_ROWS)])
+
+        nlist = min(nlist or suggested_nlist(count), max(1, count))
+        if count:
+            rng = np.random.default_rng(0)
+            sample_rows = np.sort(rng.choice(count, min(count, KMEANS_SAMPLE_SIZE), replace=False))
+            centroids = spherical_kmeans(np.asarray(scratch[sample_rows]), nlist)
+            assign = _nearest(scratch[:count], centroids)
+        else:
+            centroids = np.zeros((1, dimension), dtype=np.float32)
+            assign = np.empty(0, dtype=np.int32)
+
+        # Group rows by list
+        order = np.argsort(assign, kind="stable")
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=len(centroids)), out=offsets[1:])
+        vectors = np.lib.format.open_memmap(building / _VECTORS, mode="w+", dtype=np.float32,
+                                            shape=(count, dimension))
+        for start in range(0, count, SCORE_BATCH_ROWS):
+            positions = order[start:start + SCORE_BATCH_ROWS]
+            vectors[start:start + len(positions)] = scratch[np.sort(positions)][np.argsort(np.argsort(positions))]
+        vectors.flush()
+        del vectors, scratch
+        (building / "scratch.npy").unlink()
+
+        sorted_cases = cases[:count][order]
+        case_order = np.argsort(sorted_cases, kind="stable").astype(np.int64)
+        case_offsets = np.zeros(len(case_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sorted_cases, minlength=len(case_ids)), out=case_offsets[1:])
+
+        np.save(building / _CENTROIDS, centroids.astype(np.float32))
+        np.save(building / _OFFSETS, offsets)
+        np.save(building / _IDS, ids[:count][order])
+        np.save(building / _CASES, sorted_cases)
+        np.save(building / _CASE_ORDER, case_order)
+        np.save(building / _CASE_OFFSETS, case_offsets)
+        (building / _META).write_text(json.dumps({
+            "dimension": dimension,
+            "count": count,
+            "nlist": len(centroids),
+            "built_at": time.time(),
+            "case_ids": case_ids,
+        }))
+
+        with self._lock:
+            # Swap directories; rows the pipeline added meanwhile are re-appended as delta
+            pending = self._delta_rows() if self._loaded else []
+            self._release()
+            retired = self.path.with_name(self.path.name + ".old")
+            shutil.rmtree(retired, ignore_errors=True)
+            if self.path.exists():
+                self.path.rename(retired)
+            building.rename(self.path)
+            shutil.rmtree(retired, ignore_errors=True)
+            self.load()
+            indexed = set(np.char.decode(np.asarray(self._ids), "ascii")) if pending else set()
+            self.add_rows([row for row in pending if row[0] not in indexed])
+            self._stats["builds"] += 1
+
+        logger.info(f"Built firm vector index: {count} rows, {len(centroids)} lists "
+                    f"in {time.perf_counter() - started:.1f}s")
+        return count
+
+    def _delta_rows(self) -> List[Tuple[str, str, np.ndarray]]:
+        delta = self._delta
+        return [
+            (delta.ids[i], self._case_ids[delta.cases[i]], delta.matrix[i].copy())
+            for i in range(delta.size)
+        ] if delta else []
+
+    def _release(self) -> None:
+        """Drop memory maps (required before replacing the files)."""
+        self._reset()
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def add_rows(self, rows: Iterable[Tuple[str, str, Optional[Sequence[float]]]]) -> int:
+        """
+        Append (embedding_id, case_id, vector) rows to the delta segment.
+
+        A persisted index that is not loaded yet is loaded first; without a
+        persisted index this is a no-op (the first build reads the table).
+
+        Returns:
+            Number of rows added
+        """
+        with self._lock:
+            if not self._loaded and not self.load():
+                return 0
+            accepted = [
+                (str(row_id), str(case_id), vector) for row_id, case_id, vector in rows
+                if vector is not None and len(vector) == self.dimension
+            ]
+            if not accepted:
+                return 0
+
+            vectors = _normalize(np.asarray([vector for _, _, vector in accepted], dtype=np.float32))
+            cases = np.array([self._case_code(case_id) for _, case_id, _ in accepted], dtype=np.int32)
+            self._delta.append([row_id for row_id, _, _ in accepted], cases, vectors)
+
+            with open(self.path / _DELTA_VECTORS, "ab") as f:
+                f.write(vectors.tobytes())
+            with open(self.path / _DELTA_ROWS, "a") as f:
+                f.writelines(json.dumps([row_id, case_id]) + "\n" for row_id, case_id, _ in accepted)
+
+            self._stats["rows_added"] += len(accepted)
+            return len(accepted)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        case_ids: Iterable[str],
+        top_k: int,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Top-k rows of the given cases by cosine similarity.
+
+        Returns:
+            [(embedding_id, case_id, similarity)] best first
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+
+        with self._lock:
+            if not self._loaded or top_k <= 0 or norm == 0 or query.shape[0] != self.dimension:
+                return []
+            query = query / norm
+            codes = np.array(sorted({self._case_codes[c] for c in map(str, case_ids) if c in self._case_codes}),
+                             dtype=np.int32)
+            if not len(codes):
+                return []
+
+            positions, scores = self._search_base(query, codes, top_k, nprobe or self.nprobe)
+            base_ids = [self._ids[p].decode() for p in positions]
+            base_cases = [self._case_ids[self._cases[p]] for p in positions]
+
+            delta = self._delta
+            delta_ids: List[str] = []
+            delta_cases: List[str] = []
+            delta_scores = np.empty(0, dtype=np.float32)
+            if delta.size:
+                rows = np.flatnonzero(np.isin(delta.cases[:delta.size], codes))
+                if len(rows):
+                    row_scores = delta.matrix[rows] @ query
+                    best = _top(row_scores, top_k)
+                    keep, delta_scores = rows[best], row_scores[best]
+                    delta_ids = [delta.ids[i] for i in keep]
+                    delta_cases = [self._case_ids[delta.cases[i]] for i in keep]
+            self._stats["searches"] += 1
+
+        merged: Dict[str, Tuple[str, float]] = {}
+        for row_id, case_id, score in zip(base_ids + delta_ids, base_cases + delta_cases,
+                                          list(scores) + list(delta_scores)):
+            if row_id not in merged or score > merged[row_id][1]:
+                merged[row_id] = (case_id, float(score))
+        ranked = sorted(merged.items(), key=lambda item: item[1][1], reverse=True)[:top_k]
+        return [(row_id, case_id, score) for row_id, (case_id, score) in ranked]
+
+    def _search_base(self, query: np.ndarray, codes: np.ndarray, top_k: int,
+                     nprobe: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Best (positions, scores) in the built segment, restricted to case codes."""
+        base_codes = codes[codes < len(self._case_offsets) - 1]
+        if not self.count or not len(base_codes):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        allowed_rows = int(np.sum(self._case_offsets[base_codes + 1] - self._case_offsets[base_codes]))
+        if allowed_rows <= self.exact_max_rows:
+            # Few visible rows: score exactly those (sorted for mmap locality)
+            self._stats["exact_searches"] += 1
+            positions = np.sort(np.concatenate([
+                self._case_order[self._case_offsets[c]:self._case_offsets[c + 1]] for c in base_codes
+            ]))
+        else:
+            lists = _top(self._centroids @ query, min(nprobe, len(self._centroids)))
+            chunks = []
+            for list_no in lists:
+                start, end = int(self._offsets[list_no]), int(self._offsets[list_no + 1])
+                if end > start:
+                    mask = np.isin(self._cases[start:end], base_codes)
+                    chunks.append(start + np.flatnonzero(mask))
+            positions = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+        if not len(positions):
+            return positions, np.empty(0, dtype=np.float32)
+        scores = np.concatenate([
+            np.asarray(self._vectors[positions[i:i + SCORE_BATCH_ROWS]]) @ query
+            for i in range(0, len(positions), SCORE_BATCH_ROWS)
+        ])
+        best = _top(scores, top_k)
+        return positions[best], scores[best]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "path": str(self.path),
+                "dimension": self.dimension,
+                "rows": self.count,
+                "delta_rows": self._delta.size if self._delta else 0,
+                "lists": len(self._offsets) - 1 if self._offsets is not None else 0,
+                "cases": len(self._case_ids),
+                "nprobe": self.nprobe,
+                "building": self.building,
+                **self._stats,
+            }
+
+
+def _top(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+# Global singleton instance
+firm_vector_index = FirmVectorIndex()
+
+
+def get_firm_vector_index() -> FirmVectorIndex:
+    """Get the global firm vector index instance."""
+    return firm_vector_index
@@ -0,0 +1,272 @@
+"""
+Legal Chunker - Structure-aware, streaming chunking of legal documents
+
+RAGService.chunk_document used to slice fixed 1,000-character windows,
+backing up to the last period. That cut numbered paragraphs, case captions
+and rule citations ("Fla. R. Civ. P. 1.140(b)") across chunks, and built
+every chunk of a document in one list.
+
+This chunker walks the extracted text line by line (generators throughout)
+and groups it into structural blocks:
+
+- headings (short all-caps lines: captions, "MOTION TO DISMISS", "ARGUMENT")
+- numbered paragraphs ("1.", "(a)", "IV.", "B.")
+- WHEREFORE clauses and certificate blocks ("I HEREBY CERTIFY ...")
+- plain paragraphs (separated by blank lines)
+
+Blocks are packed into chunks under a token budget. Headings, WHEREFORE
+clauses and certificates always start a new chunk (consecutive headings,
+such as a caption, stay together); other blocks are only split when a
+single block exceeds the budget, at sentence boundaries that skip legal
+abbreviations, with a small overlap between the pieces.
+
+Chunks are yielded one at a time, so memory stays flat regardless of
+document length.
+
+Usage:
+    chunker = LegalChunker(max_tokens=300)
+    for chunk in chunker.iter_chunks(text, document_id, "motion"):
+        ...  # {'document_id', 'chunk_index', 'chunk_text', 'chunk_metadata'}
+"""
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.services.embedding_pipeline import estimate_tokens
+
+# Block kinds
+TEXT = "text"
+HEADING = "heading"
+NUMBERED = "numbered"
+WHEREFORE = "wherefore"
+CERTIFICATE = "certificate"
+
+# Kinds that always begin a new chunk
+SECTION_STARTS = (HEADING, WHEREFORE, CERTIFICATE)
+
+DEFAULT_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", "300"))
+DEFAULT_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "50"))
+
+MAX_HEADING_LENGTH = 100
+
+_LINE = re.compile(r"[^\n]*\n|[^\n]+\Z")
+_WHEREFORE = re.compile(r"\s*WHEREFORE\b")
+_CERTIFICATE = re.compile(r"\s*I\s+HEREBY\s+CERTIFY\b", re.IGNORECASE)
+_NUMBERED = re.compile(r"\s*(?:\(?\d{1,3}[.)]|\([a-zA-Z0-9]{1,4}\)|[IVXLC]{1,7}\.|[A-Z]\.)\s+\S")
+
+# Candidate sentence end: punctuation (plus closing quotes/brackets), whitespace,
+# then something that can start a sentence
+_SENTENCE_END = re.compile(r"[.?!][\"')\]]*\s+(?=[\"'(\[]?[A-Z0-9§])")
+
+# Words whose trailing period does not end a sentence (compared lower-cased,
+# without the period). Single letters ("R.", "P.", "v.") are always skipped.
+_ABBREVIATIONS = frozenset({
+    "fla", "stat", "app", "civ", "crim", "jud", "admin", "proc", "evid", "fam",
+    "ct", "cir", "dist", "supp", "fed", "reg", "const", "amend", "ann", "rev",
+    "no", "nos", "art", "sec", "ch", "para", "pg", "pp", "id", "ibid", "cf",
+    "inc", "corp", "co", "ltd", "llc", "bros", "assn", "dept", "div", "gen",
+    "mr", "mrs", "ms", "dr", "jr", "sr", "st", "hon", "esq", "atty",
+    "vs", "so", "2d", "3d", "4th", "al", "seq", "etc", "jan", "feb", "mar",
+    "apr", "jun", "jul", "aug", "sept", "sep", "oct", "nov", "dec",
+})
+
+
+@dataclass
+class _Unit:
+    """A span of the text that is never split further"""
+    start: int
+    end: int
+    tokens: int
+    kind: str
+    first: bool  # First unit of its block
+
+
+def _classify(line: str) -> str:
+    if _WHEREFORE.match(line):
+        return WHEREFORE
+    if _CERTIFICATE.match(line):
+        return CERTIFICATE
+    stripped = line.strip()
+    if (
+        len(stripped) <= MAX_HEADING_LENGTH
+        and stripped == stripped.upper()
+        and sum(c.isalpha() for c in stripped) >= 3
+        and not stripped.endswith((",", ";"))
+    ):
+        return HEADING
+    if _NUMBERED.match(line):
+        return NUMBERED
+    return TEXT
+
+
+def iter_blocks(text: str) -> Iterator[Tuple[int, int, str]]:
+    """
+    Structural blocks of the text, in order.
+
+    Yields:
+        (start, end, kind) character spans; blank lines are not part of any block
+    """
+    block_start: Optional[int] = None
+    block_end = 0
+    kind = TEXT
+
+    for match in _LINE.finditer(text):
+        line = match.group()
+        if not line.strip():
+            if block_start is not None:
+                yield block_start, block_end, kind
+                block_start = None
+            continue
+
+        line_kind = _classify(line)
+        if block_start is not None and (line_kind != TEXT or kind == HEADING):
+            yield block_start, block_end, kind
+            block_start = None
+        if block_start is None:
+            block_start, kind = match.start(), line_kind
+        block_end = match.end()
+
+    if block_start is not None:
+        yield block_start, block_end, kind
+
+
+def iter_sentences(text: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """Sentence spans of text[start:end]; periods after abbreviations and initials don't split."""
+    sentence_start = start
+    for match in _SENTENCE_END.finditer(text, start, end):
+        if text[match.start()] == ".":
+            word_start = max(text.rfind(" ", sentence_start, match.start()),
+                             text.rfind("\n", sentence_start, match.start())) + 1
+            word = text[max(word_start, sentence_start):match.start()].lstrip("(\"'[").lower()
+            if (len(word) <= 1 and not word.isdigit()) or "." in word or word in _ABBREVIATIONS:
+                continue
+        yield sentence_start, match.end()
+        sentence_start = match.end()
+    if sentence_start < end:
+        yield sentence_start, end
+
+
+def _split_at_whitespace(text: str, start: int, end: int, max_chars: int) -> Iterator[Tuple[int, int]]:
+    """Last resort for a single over-long sentence: cut near max_chars at whitespace."""
+    while end - start > max_chars:
+        cut = text.rfind(" ", start + max_chars // 2, start + max_chars)
+        cut = cut + 1 if cut > start else start + max_chars
+        yield start, cut
+        start = cut
+    yield start, end
+
+
+class LegalChunker:
+    """
+    Streams token-budgeted chunks that follow legal document structure.
+
+    ``max_tokens`` bounds every chunk (estimated with estimate_tokens);
+    ``overlap_tokens`` is carried over only when a single block had to be
+    split across chunks.
+    """
+
+    def __init__(self, max_tokens: int = DEFAULT_MAX_TOKENS, overlap_tokens: int = DEFAULT_OVERLAP_TOKENS):
+        self.max_tokens = max(16, max_tokens)
+        self.overlap_tokens = max(0, min(overlap_tokens, self.max_tokens // 2))
+
+    def iter_chunks(
+        self,
+        text: str,
+        document_id: str,
+        document_type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield chunks of a document lazily.
+
+        Returns:
+            Iterator of {'document_id', 'chunk_index', 'chunk_text', 'chunk_metadata'};
+            chunk_metadata has document_type, start_char, end_char, length,
+            section (the heading in effect) and tokens
+        """
+        units: List[_Unit] = []
+        tokens = 0
+        only_headings = True
+        section: Optional[str] = None
+        chunk_section: Optional[str] = None
+        chunk_index = 0
+
+        for unit in self._iter_units(text):
+            starts_section = unit.first and unit.kind in SECTION_STARTS
+            if units and (
+                tokens + unit.tokens > self.max_tokens
+                or (starts_section and not only_headings)
+            ):
+                chunk = self._make_chunk(text, units, document_id, document_type, chunk_index, chunk_section)
+                if chunk:
+                    yield chunk
+                    chunk_index += 1
+                units = [] if unit.first else self._overlap(units, self.max_tokens - unit.tokens)
+                tokens = sum(u.tokens for u in units)
+                only_headings = not units
+
+            if unit.first and unit.kind == HEADING:
+                section = " ".join(text[unit.start:unit.end].split())
+            if not units:
+                chunk_section = section
+            units.append(unit)
+            tokens += unit.tokens
+            only_headings = only_headings and unit.kind == HEADING
+
+        if units:
+            chunk = self._make_chunk(text, units, document_id, document_type, chunk_index, chunk_section)
+            if chunk:
+                yield chunk
+
+    def _iter_units(self, text: str) -> Iterator[_Unit]:
+        """Blocks within the budget as one unit; larger blocks as sentence units."""
+        max_chars = (self.max_tokens - 1) * 4  # estimate_tokens(max_chars chars) == max_tokens
+        for start, end, kind in iter_blocks(text):
+            tokens = estimate_tokens(text[start:end])
+            if tokens <= self.max_tokens:
+                yield _Unit(start, end, tokens, kind, True)
+                continue
+            first = True
+            for sentence_start, sentence_end in iter_sentences(text, start, end):
+                for piece_start, piece_end in _split_at_whitespace(text, sentence_start, sentence_end, max_chars):
+                    yield _Unit(piece_start, piece_end, estimate_tokens(text[piece_start:piece_end]), kind, first)
+                    first = False
+
+    def _overlap(self, units: List[_Unit], room: int) -> List[_Unit]:
+        """Trailing units of the previous chunk, within the overlap budget and the room left."""
+        budget = min(self.overlap_tokens, room)
+        carried: List[_Unit] = []
+        for unit in reversed(units):
+            if unit.tokens > budget:
+                break
+            carried.append(unit)
+            budget -= unit.tokens
+        carried.reverse()
+        return carried
+
+    @staticmethod
+    def _make_chunk(
+        text: str,
+        units: List[_Unit],
+        document_id: str,
+        document_type: Optional[str],
+        chunk_index: int,
+        section: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        start, end = units[0].start, units[-1].end
+        chunk_text = text[start:end].strip()
+        if not chunk_text:
+            return None
+        return {
+            'document_id': document_id,
+            'chunk_index': chunk_index,
+            'chunk_text': chunk_text,
+            'chunk_metadata': {
+                'document_type': document_type,
+                'start_char': start,
+                'end_char': end,
+                'length': end - start,
+                'section': section,
+                'tokens': sum(unit.tokens for unit in units),
+            }
+        }
@@ -213,6 +213,15 @@ class MorningReportService:
 
         return milestones
 
+    @staticmethod
+    def time_greeting(now: datetime) -> str:
+        """Time-of-day prefix every greeting starts with"""
+        if now.hour < 12:
+            return "Good morning"
+        if now.hour < 17:
+            return "Good afternoon"
+        return "Good evening"
+
     def _generate_smart_greeting(
         self,
         user_name: str,
@@ -222,16 +231,10 @@ class MorningReportService:
     ) -> str:
         """Generate an intelligent, contextual greeting"""
 
-        hour = now.hour
         day_name = week_stats['day_of_week']
 
         # Time-based prefix
-        if hour < 12:
-            time_greeting = "Good morning"
-        elif hour < 17:
-            time_greeting = "Good afternoon"
-        else:
-            time_greeting = "Good evening"
+        time_greeting = self.time_greeting(now)
 
         # Build contextual greeting based on day and workload
         if week_stats['is_monday']:
@@ -0,0 +1,242 @@
+"""
+Morning Report Snapshots - Intelligence Briefings generated off-peak
+
+MorningReportService.generate_morning_report runs a dozen queries (alerts,
+new filings, upcoming deadlines, case overview, week statistics, milestones)
+and used to run them when the user opened the app, i.e. for every attorney
+within the same few minutes before 9am.
+
+Instead, refresh_morning_report_snapshots() (scheduled early in the morning)
+generates each user's report for the day with bounded parallelism and
+stores it as a MorningReportSnapshot. A snapshot is current while:
+
+- it was generated for today (the report is date-relative),
+- the rows the report is built from are unchanged: same number of rows,
+  same latest updated_at and same sum of updated_at epochs (on PostgreSQL
+  now() is the transaction start, so a late-committing write can stamp a
+  row earlier than the latest one; the sum still changes) across the
+  user's deadlines and documents (the
+  report selects by Deadline.user_id / Document.user_id, including those on
+  cases shared with the user), the user's own cases and the cases those
+  deadlines and documents belong to (case status and title),
+- it was generated with the same last_login ("new since last login").
+
+Later runs of the job therefore regenerate only users whose data changed
+since generation. The endpoint reads the snapshot and its freshness
+fingerprint with one query and falls back to live generation (storing the
+result) when the snapshot is missing or stale. Profile changes such as the
+display name are picked up by the next day's generation.
+
+Usage:
+    report = get_morning_report(db, user_id, last_login)   # one read when current
+
+    counts = refresh_morning_report_snapshots()             # scheduler / script
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import Numeric, extract, func, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.case import Case
+from app.models.deadline import Deadline
+from app.models.document import Document
+from app.models.morning_report import MorningReportSnapshot
+from app.models.user import User
+from app.services.morning_report_service import MorningReportService
+
+logger = logging.getLogger(__name__)
+
+# Reports generated concurrently by the job (one session per worker)
+MORNING_REPORT_WORKERS = int(os.getenv("MORNING_REPORT_WORKERS", "4"))
+
+
+def _sources(db: Session, user_id: Optional[str] = None):
+    """
+    Per-user fingerprint of the report's inputs: (rows, updated_at, updated_sum).
+
+    One (user_id, updated_at) row per deadline and document of the user,
+    per case they own, and per deadline/document joined to its case.
+    """
+    selects = [
+        select(Deadline.user_id.label("user_id"), Deadline.updated_at.label("updated_at")),
+        select(Document.user_id, Document.updated_at),
+        select(Case.user_id, Case.updated_at),
+        select(Deadline.user_id, Case.updated_at).join(Case, Case.id == Deadline.case_id),
+        select(Document.user_id, Case.updated_at).join(Case, Case.id == Document.case_id),
+    ]
+    if user_id is not None:
+        selects = [query.where(query.selected_columns[0] == user_id) for query in selects]
+    rows = union_all(*selects).subquery()
+    return db.query(
+        rows.c.user_id.label("user_id"),
+        func.count().label("rows"),
+        func.max(rows.c.updated_at).label("updated_at"),
+        func.sum(extract("epoch", rows.c.updated_at), type_=Numeric(28, 6)).label("updated_sum")
+    ).group_by(rows.c.user_id).subquery()
+
+
+def _is_current(snapshot_fields, source, last_login, today: date) -> bool:
+    report_date, source_rows, source_updated_at, source_updated_sum, snapshot_login = snapshot_fields
+    rows, updated_at, updated_sum = source
+    return (
+        report_date == today
+        and source_rows == (rows or 0)
+        and source_updated_at == updated_at
+        and source_updated_sum == updated_sum
+        and snapshot_login == last_login
+    )
+
+
+def _with_current_greeting(report: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """Swap the time-of-day prefix of a report generated earlier in the day."""
+    generated = MorningReportService.time_greeting(datetime.fromisoformat(report['generated_at']))
+    current = MorningReportService.time_greeting(now)
+    greeting = report.get('greeting') or ""
+    if generated == current or not greeting.startswith(generated):
+        return report
+    return {**report, 'greeting': current + greeting[len(generated):]}
+
+
+def generate_snapshot(
+    db: Session,
+    user_id: str,
+    last_login: Optional[datetime] = None,
+    today: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    Generate a user's report live and store it as their snapshot.
+
+    The fingerprint is read before generating, so a write racing with the
+    generation makes the snapshot stale rather than silently missing.
+
+    Returns:
+        The report (also returned when storing the snapshot fails)
+    """
+    today = today or date.today()
+    sources = _sources(db, user_id)
+    source = db.query(sources.c.rows, sources.c.updated_at, sources.c.updated_sum).first()
+
+    report = MorningReportService(db).generate_morning_report(user_id=user_id, last_login=last_login)
+    if "error" in report:
+        return report
+
+    try:
+        snapshot = db.get(MorningReportSnapshot, user_id)
+        if snapshot is None:
+            snapshot = MorningReportSnapshot(user_id=user_id)
+            db.add(snapshot)
+        snapshot.report_date = today
+        snapshot.report = report
+        snapshot.source_rows = source.rows if source else 0
+        snapshot.source_updated_at = source.updated_at if source else None
+        snapshot.source_updated_sum = source.updated_sum if source else None
+        snapshot.last_login = last_login
+        db.commit()
+    except SQLAlchemyError as e:
+        # Concurrent generation for the same user, or table not migrated yet
+        db.rollback()
+        logger.warning(f"Could not store morning report snapshot for user {user_id}: {e}")
+
+    return report
+
+
+def get_morning_report(db: Session, user_id: str, last_login: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    The user's Morning Report: the stored snapshot when current (one query),
+    otherwise generated live and stored.
+    """
+    today = date.today()
+    sources = _sources(db, user_id)
+    row = db.query(
+        MorningReportSnapshot.report,
+        MorningReportSnapshot.report_date,
+        MorningReportSnapshot.source_rows,
+        MorningReportSnapshot.source_updated_at,
+        MorningReportSnapshot.source_updated_sum,
+        MorningReportSnapshot.last_login,
+        sources.c.rows,
+        sources.c.updated_at,
+        sources.c.updated_sum
+    ).outerjoin(
+        sources, sources.c.user_id == MorningReportSnapshot.user_id
+    ).filter(MorningReportSnapshot.user_id == user_id).first()
+
+    if row is not None and _is_current(row[1:6], row[6:], last_login, today):
+        return _with_current_greeting(row.report, datetime.now())
+
+    return generate_snapshot(db, user_id, last_login, today)
+
+
+def refresh_morning_report_snapshots(
+    session_factory: Callable[[], Session] = SessionLocal,
+    max_workers: int = MORNING_REPORT_WORKERS,
+    user_id: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Generate today's snapshot of every user whose snapshot is missing or stale.
+
+    Stale users are found with one set-based query; reports are generated by
+    at most max_workers threads, each with its own session.
+
+    Returns:
+        Counts of users checked, reports generated, skipped (current) and failed
+    """
+    today = date.today()
+    db = session_factory()
+    try:
+        sources = _sources(db, user_id)
+        query = db.query(
+            User.id,
+            User.last_login,
+            MorningReportSnapshot.report_date,
+            MorningReportSnapshot.source_rows,
+            MorningReportSnapshot.source_updated_at,
+            MorningReportSnapshot.source_updated_sum,
+            MorningReportSnapshot.last_login.label("snapshot_login"),
+            sources.c.rows,
+            sources.c.updated_at,
+            sources.c.updated_sum
+        ).outerjoin(
+            MorningReportSnapshot, MorningReportSnapshot.user_id == User.id
+        ).outerjoin(
+            sources, sources.c.user_id == User.id
+        )
+        if user_id is not None:
+            query = query.filter(User.id == user_id)
+        rows = query.all()
+    finally:
+        db.close()
+
+    stale = [
+        (str(row.id), row.last_login)
+        for row in rows
+        if not _is_current(row[2:7], row[7:], row.last_login, today)
+    ]
+
+    def generate(user):
+        session = session_factory()
+        try:
+            generate_snapshot(session, user[0], user[1], today)
+            return True
+        except Exception as e:
+            logger.error(f"Morning report generation failed for user {user[0]}: {e}")
+            return False
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(generate, stale))
+
+    generated = sum(results)
+    return {
+        "users": len(rows),
+        "generated": generated,
+        "skipped": len(rows) - len(stale),
+        "failed": len(stale) - generated,
+    }
@@ -2,10 +2,10 @@
 Notification Service - Handles creation, delivery, and management of notifications
 Supports in-app notifications, email alerts, and deadline reminders
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Any, Tuple
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, exists
 import logging
 import asyncio
 
@@ -23,6 +23,39 @@ from app.services.email_service import email_service
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REMIND_DAYS_FATAL = (7, 3, 1, 0)
+DEFAULT_REMIND_DAYS_STANDARD = (3, 1)
+
+# Candidate deadlines fetched (and notifications inserted) per round trip
+REMINDER_BATCH_SIZE = 1000
+
+
+class ReminderPreferences(NamedTuple):
+    """The notification preferences the reminder engine needs (defaults = no preferences row)"""
+    in_app_enabled: bool = True
+    in_app_deadline_reminders: bool = True
+    email_enabled: bool = True
+    email_fatal_deadlines: bool = True
+    email_deadline_reminders: bool = True
+    remind_days_before_fatal: FrozenSet[int] = frozenset(DEFAULT_REMIND_DAYS_FATAL)
+    remind_days_before_standard: FrozenSet[int] = frozenset(DEFAULT_REMIND_DAYS_STANDARD)
+
+
+def reminder_shard_range(shard: int, shards: int) -> Tuple[Optional[str], Optional[str]]:
+    """
+    User id range [start, end) of one of ``shards`` equal slices of the UUID space.
+
+    The slices are fixed, so workers started independently (e.g. one cron
+    entry per shard) cover every user exactly once. None means unbounded.
+    """
+    if shards < 1 or not 0 <= shard < shards:
+        raise ValueError(f"Invalid shard {shard} of {shards}")
+
+    def bound(i: int) -> Optional[str]:
+        return None if i in (0, shards) else format(i * 16 ** 8 // shards, "08x")
+
+    return bound(shard), bound(shard + 1)
+
 
 class NotificationService:
     """
@@ -112,17 +145,7 @@ class NotificationService:
 
         # Send email if requested and enabled (fire-and-forget background task)
         if send_email and prefs.email_enabled:
-            try:
-                # Get or create event loop for background task
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.create_task(self._queue_email_notification(notification, prefs))
-                else:
-                    # If no running loop, run synchronously
-                    loop.run_until_complete(self._queue_email_notification(notification, prefs))
-            except RuntimeError:
-                # No event loop - skip email for now (will be handled by scheduled job)
-                logger.debug("No event loop available - email will be sent by scheduled job")
+            self._dispatch_email(notification, prefs)
 
         return notification
 
@@ -143,6 +166,28 @@ class NotificationService:
         Returns:
             Created Notification or None
         """
+        content = self._deadline_notification_content(deadline, notification_type, days_until)
+
+        return self.create_notification(
+            user_id=deadline.user_id,
+            notification_type=notification_type,
+            case_id=deadline.case_id,
+            deadline_id=str(deadline.id),
+            **content
+        )
+
+    def _deadline_notification_content(
+        self,
+        deadline: Any,
+        notification_type: NotificationType,
+        days_until: int = None
+    ) -> Dict[str, Any]:
+        """
+        Title, message, priority, metadata, action and email flag of a deadline notification
+
+        ``deadline`` only needs id, case_id, title, deadline_date, priority and
+        calculation_basis, so a Deadline or a column row both work.
+        """
         # Build notification content based on type
         if notification_type == NotificationType.DEADLINE_FATAL:
             if days_until is not None and days_until <= 0:
@@ -200,19 +245,15 @@ class NotificationService:
             NotificationType.DEADLINE_OVERDUE
         ]
 
-        return self.create_notification(
-            user_id=deadline.user_id,
-            notification_type=notification_type,
-            title=title,
-            message=message,
-            priority=priority,
-            case_id=deadline.case_id,
-            deadline_id=str(deadline.id),
-            metadata=metadata,
-            action_url=action_url,
-            action_label=action_label,
-            send_email=send_email
-        )
+        return {
+            "title": title,
+            "message": message,
+            "priority": priority,
+            "metadata": metadata,
+            "action_url": action_url,
+            "action_label": action_label,
+            "send_email": send_email
+        }
 
     def create_document_notification(
         self,
@@ -274,15 +315,26 @@ class NotificationService:
     # DEADLINE REMINDER ENGINE
     # ==========================================
 
-    def process_deadline_reminders(self, user_id: Optional[str] = None) -> Dict[str, int]:
+    def process_deadline_reminders(
+        self,
+        user_id: Optional[str] = None,
+        user_range: Optional[Tuple[Optional[str], Optional[str]]] = None
+    ) -> Dict[str, int]:
         """
-        Process deadline reminders for all users (or specific user)
+        Process deadline reminders for all users (or specific user / user range)
         Creates notifications for approaching and overdue deadlines
 
-        Should be called by a scheduled job (cron/celery)
+        Should be called by a scheduled job (cron/celery). Set-based: the
+        preferences of the users in scope are loaded once, candidate
+        (deadline, reminder day) pairs are selected in SQL - anti-joined
+        against notifications already sent today - in keyset batches, and each
+        batch is inserted with a single flush. Round trips grow with
+        deadlines / REMINDER_BATCH_SIZE, not with deadlines.
 
         Args:
             user_id: Optional - process only for this user
+            user_range: Optional - (start, end) user id range, end exclusive, None = unbounded.
+                Several workers can split the run with reminder_shard_range(shard, shards).
 
         Returns:
             Dict with counts: {"fatal": X, "overdue": Y, "approaching": Z}
@@ -290,70 +342,166 @@ class NotificationService:
         today = date.today()
         counts = {"fatal": 0, "overdue": 0, "approaching": 0}
 
-        # Build base query
-        query = self.db.query(Deadline).join(Case).filter(
-            Deadline.status == "pending",
-            Case.status == "active"
-        )
-
-        if user_id:
-            query = query.filter(Deadline.user_id == user_id)
-
-        deadlines = query.all()
-
-        for deadline in deadlines:
-            if not deadline.deadline_date:
-                continue
-
-            days_until = (deadline.deadline_date - today).days
-            prefs = self._get_user_preferences(deadline.user_id)
+        prefs_map = self._load_reminder_preferences(user_id, user_range)
+        default_prefs = ReminderPreferences()
+        fatal_days = set(default_prefs.remind_days_before_fatal).union(
+            *(p.remind_days_before_fatal for p in prefs_map.values()))
+        standard_days = set(default_prefs.remind_days_before_standard).union(
+            *(p.remind_days_before_standard for p in prefs_map.values()))
+
+        query = self._reminder_candidates_query(today, fatal_days, standard_days, user_id, user_range)
+
+        last_id = None
+        while True:
+            batch_query = query.filter(Deadline.id > last_id) if last_id is not None else query
+            rows = batch_query.order_by(Deadline.id).limit(REMINDER_BATCH_SIZE).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            notifications = []
+            emails = []
+            for row in rows:
+                prefs = prefs_map.get(row.user_id, default_prefs)
+                days_until = (row.deadline_date - today).days
+
+                # The SQL prefilter used the union of everyone's reminder days
+                if row.priority == "fatal":
+                    remind_days = prefs.remind_days_before_fatal
+                else:
+                    remind_days = prefs.remind_days_before_standard
+                if days_until >= 0 and days_until not in remind_days:
+                    continue
+
+                if row.priority == "fatal":
+                    notification_type, kind = NotificationType.DEADLINE_FATAL, "fatal"
+                elif days_until < 0:
+                    notification_type, kind = NotificationType.DEADLINE_OVERDUE, "overdue"
+                else:
+                    notification_type, kind = NotificationType.DEADLINE_APPROACHING, "approaching"
+
+                content = self._deadline_notification_content(row, notification_type, days_until)
+                priority = content["priority"]
+                if not prefs.in_app_enabled and priority != NotificationPriority.FATAL:
+                    continue
+                if not self._should_send_notification(prefs, notification_type, priority):
+                    continue
+
+                notification = Notification(
+                    user_id=row.user_id,
+                    type=notification_type,
+                    priority=priority,
+                    title=content["title"],
+                    message=content["message"],
+                    case_id=row.case_id,
+                    deadline_id=str(row.id),
+                    extra_data=content["metadata"],
+                    action_url=content["action_url"],
+                    action_label=content["action_label"]
+                )
+                notifications.append(notification)
+                counts[kind] += 1
+                if content["send_email"] and prefs.email_enabled:
+                    emails.append((notification, prefs))
 
-            # Check if we should create a reminder based on preferences
-            if deadline.priority == "fatal":
-                remind_days = prefs.remind_days_before_fatal or [7, 3, 1, 0]
-            else:
-                remind_days = prefs.remind_days_before_standard or [3, 1]
+            if notifications:
+                self.db.add_all(notifications)
+                self.db.commit()
+            for notification, prefs in emails:
+                self._dispatch_email(notification, prefs)
 
-            # Skip if not a reminder day (unless overdue)
-            if days_until >= 0 and days_until not in remind_days:
-                continue
+        logger.info(f"Processed deadline reminders: {counts}")
+        return counts
 
-            # Check if we already sent this notification today
-            existing = self._check_existing_notification(
-                user_id=deadline.user_id,
-                deadline_id=str(deadline.id),
-                today=today
+    def _load_reminder_preferences(
+        self,
+        user_id: Optional[str],
+        user_range: Optional[Tuple[Optional[str], Optional[str]]]
+    ) -> Dict[str, ReminderPreferences]:
+        """Preferences of all users in scope, one query. Users without a row get the defaults."""
+        query = self.db.query(
+            NotificationPreferences.user_id,
+            NotificationPreferences.in_app_enabled,
+            NotificationPreferences.in_app_deadline_reminders,
+            NotificationPreferences.email_enabled,
+            NotificationPreferences.email_fatal_deadlines,
+            NotificationPreferences.email_deadline_reminders,
+            NotificationPreferences.remind_days_before_fatal,
+            NotificationPreferences.remind_days_before_standard
+        )
+        query = self._filter_reminder_users(query, NotificationPreferences.user_id, user_id, user_range)
+
+        return {
+            row.user_id: ReminderPreferences(
+                in_app_enabled=row.in_app_enabled,
+                in_app_deadline_reminders=row.in_app_deadline_reminders,
+                email_enabled=row.email_enabled,
+                email_fatal_deadlines=row.email_fatal_deadlines,
+                email_deadline_reminders=row.email_deadline_reminders,
+                remind_days_before_fatal=frozenset(
+                    int(d) for d in (row.remind_days_before_fatal or DEFAULT_REMIND_DAYS_FATAL)),
+                remind_days_before_standard=frozenset(
+                    int(d) for d in (row.remind_days_before_standard or DEFAULT_REMIND_DAYS_STANDARD))
             )
-            if existing:
-                continue
-
-            # Create appropriate notification
-            if deadline.priority == "fatal":
-                self.create_deadline_notification(
-                    deadline,
-                    NotificationType.DEADLINE_FATAL,
-                    days_until
-                )
-                counts["fatal"] += 1
+            for row in query
+        }
 
-            elif days_until < 0:
-                self.create_deadline_notification(
-                    deadline,
-                    NotificationType.DEADLINE_OVERDUE,
-                    days_until
-                )
-                counts["overdue"] += 1
+    def _reminder_candidates_query(
+        self,
+        today: date,
+        fatal_days: set,
+        standard_days: set,
+        user_id: Optional[str],
+        user_range: Optional[Tuple[Optional[str], Optional[str]]]
+    ):
+        """
+        Pending deadlines on active cases that are overdue or fall on a reminder
+        day, with no notification sent for them today
+        """
+        start_of_day = datetime.combine(today, datetime.min.time())
+        end_of_day = datetime.combine(today, datetime.max.time())
+        fatal_dates = [today + timedelta(days=d) for d in sorted(fatal_days) if d >= 0]
+        standard_dates = [today + timedelta(days=d) for d in sorted(standard_days) if d >= 0]
+        is_fatal = Deadline.priority == "fatal"
 
-            else:
-                self.create_deadline_notification(
-                    deadline,
-                    NotificationType.DEADLINE_APPROACHING,
-                    days_until
-                )
-                counts["approaching"] += 1
+        already_sent = exists().where(
+            Notification.deadline_id == Deadline.id,
+            Notification.user_id == Deadline.user_id,
+            Notification.created_at.between(start_of_day, end_of_day)
+        )
 
-        logger.info(f"Processed deadline reminders: {counts}")
-        return counts
+        query = self.db.query(
+            Deadline.id,
+            Deadline.user_id,
+            Deadline.case_id,
+            Deadline.title,
+            Deadline.deadline_date,
+            Deadline.priority,
+            Deadline.calculation_basis
+        ).join(Case, Case.id == Deadline.case_id).filter(
+            Deadline.status == "pending",
+            Case.status == "active",
+            Deadline.deadline_date.isnot(None),
+            or_(
+                Deadline.deadline_date < today,
+                and_(is_fatal, Deadline.deadline_date.in_(fatal_dates)),
+                and_(or_(Deadline.priority.is_(None), ~is_fatal), Deadline.deadline_date.in_(standard_dates))
+            ),
+            ~already_sent
+        )
+        return self._filter_reminder_users(query, Deadline.user_id, user_id, user_range)
+
+    @staticmethod
+    def _filter_reminder_users(query, column, user_id, user_range):
+        if user_id:
+            query = query.filter(column == user_id)
+        if user_range:
+            start, end = user_range
+            if start is not None:
+                query = query.filter(column >= start)
+            if end is not None:
+                query = query.filter(column < end)
+        return query
 
     # ==========================================
     # NOTIFICATION RETRIEVAL
@@ -571,10 +719,24 @@ class NotificationService:
 
         return existing is not None
 
+    def _dispatch_email(self, notification: Notification, prefs: Any) -> None:
+        """Send the notification's email in the background (or inline if no loop is running)"""
+        try:
+            # Get or create event loop for background task
+            loop = asyncio.get_event_loop()
+            if loop.is_running():
+                asyncio.create_task(self._queue_email_notification(notification, prefs))
+            else:
+                # If no running loop, run synchronously
+                loop.run_until_complete(self._queue_email_notification(notification, prefs))
+        except RuntimeError:
+            # No event loop - skip email for now (will be handled by scheduled job)
+            logger.debug("No event loop available - email will be sent by scheduled job")
+
     async def _queue_email_notification(
         self,
         notification: Notification,
-        prefs: NotificationPreferences
+        prefs: Any
     ) -> None:
         """
         Send email notification via email service (SendGrid).
@@ -2,7 +2,7 @@
 RAG Service - Retrieval Augmented Generation
 Handles document embeddings, semantic search, and context retrieval for chat
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any, Tuple
 from sqlalchemy.orm import Session
 import json
 import numpy as np
@@ -10,9 +10,21 @@ from anthropic import Anthropic
 import logging
 
 from app.models.document import Document
-from app.models.document_embedding import DocumentEmbedding
+from app.models.document_embedding import DocumentEmbedding, EMBEDDING_DIMENSIONS
 from app.models.deadline import Deadline
 from app.models.case import Case
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.chunk_keyword_index import get_chunk_keyword_index
+from app.services.embedding_cache import get_embedding_cache
+from app.services.embedding_pipeline import EmbeddingPipeline, IngestionResult
+from app.services.firm_vector_index import IndexNotReadyError, get_firm_vector_index
+from app.services.legal_chunker import LegalChunker
+from app.services.retrieval_cache import (
+    get_case_embedding_generation,
+    get_query_embedding_cache,
+    get_search_result_cache,
+    make_search_key,
+)
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -25,6 +37,33 @@ except ImportError:
     OPENAI_AVAILABLE = False
     logger.warning("OpenAI not installed. Using fallback embeddings.")
 
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+FALLBACK_EMBEDDING_DIMENSIONS = 768
+
+# Reciprocal rank fusion: score = sum(weight / (RRF_K + rank)); 60 is the usual constant
+RRF_K = 60
+# Candidates fetched per ranking for fusion
+HYBRID_FETCH_MULTIPLIER = 3
+
+
+def reciprocal_rank_fusion(
+    rankings: List[List[str]],
+    weights: Optional[List[float]] = None,
+    k: int = RRF_K
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked id lists: score(id) = sum of weight / (k + rank), rank from 1.
+
+    Returns:
+        [(id, score)] best first (ties keep first-seen order)
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
 
 class RAGService:
     """
@@ -41,8 +80,7 @@ class RAGService:
         self.anthropic_client = Anthropic(
             api_key=settings.ANTHROPIC_API_KEY.strip() if settings.ANTHROPIC_API_KEY else None
         )
-        self.chunk_size = 1000  # Characters per chunk
-        self.chunk_overlap = 200  # Overlap between chunks
+        self.chunker = LegalChunker()  # Token-budgeted, follows legal document structure
 
         # Initialize OpenAI client if available and configured
         self.openai_client = None
@@ -60,9 +98,19 @@ class RAGService:
         else:
             logger.info("Using fallback embeddings (OpenAI not configured)")
 
-    def chunk_document(self, text: str, document_id: str, document_type: str = None) -> List[Dict]:
+        # Only OpenAI embeddings are cached: the fallback embedder hashes words
+        # with Python's per-process salted hash(), so its vectors are not stable
+        self.embedding_pipeline = EmbeddingPipeline(
+            embed_fn=self.generate_embeddings,
+            chunker=self.iter_chunks,
+            cache=get_embedding_cache(),
+            model=OPENAI_EMBEDDING_MODEL if self.use_openai_embeddings else None,
+            dimensions=EMBEDDING_DIMENSIONS
+        )
+
+    def iter_chunks(self, text: str, document_id: str, document_type: str = None) -> Iterator[Dict]:
         """
-        Split document into overlapping chunks for embedding
+        Lazily split a document into structure-aware chunks for embedding
 
         Args:
             text: Full document text
@@ -70,47 +118,23 @@ class RAGService:
             document_type: Type of document (motion, order, etc.)
 
         Returns:
-            List of chunks with metadata
+            Iterator of chunks with metadata (see LegalChunker)
         """
-        chunks = []
-        text_length = len(text)
-
-        # Simple chunking by character count with overlap
-        start = 0
-        chunk_index = 0
+        return self.chunker.iter_chunks(text, document_id, document_type)
 
-        while start < text_length:
-            end = min(start + self.chunk_size, text_length)
-            chunk_text = text[start:end]
-
-            # Try to break at sentence boundary if possible
-            if end < text_length:
-                # Look for last period, question mark, or exclamation mark
-                last_period = max(
-                    chunk_text.rfind('.'),
-                    chunk_text.rfind('?'),
-                    chunk_text.rfind('!')
-                )
-                if last_period > self.chunk_size * 0.7:  # Only if reasonably close to end
-                    end = start + last_period + 1
-                    chunk_text = text[start:end]
-
-            chunks.append({
-                'document_id': document_id,
-                'chunk_index': chunk_index,
-                'chunk_text': chunk_text.strip(),
-                'chunk_metadata': {
-                    'document_type': document_type,
-                    'start_char': start,
-                    'end_char': end,
-                    'length': len(chunk_text)
-                }
-            })
+    def chunk_document(self, text: str, document_id: str, document_type: str = None) -> List[Dict]:
+        """
+        Split document into chunks for embedding
 
-            chunk_index += 1
-            start = end - self.chunk_overlap  # Overlap for context
+        Returns:
+            List of chunks with metadata
+        """
+        return list(self.iter_chunks(text, document_id, document_type))
 
-        return chunks
+    @property
+    def embedding_dimensions(self) -> int:
+        """Dimension of the vectors generate_embeddings produces."""
+        return EMBEDDING_DIMENSIONS if self.use_openai_embeddings else FALLBACK_EMBEDDING_DIMENSIONS
 
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
@@ -146,7 +170,7 @@ class RAGService:
 
             try:
                 response = self.openai_client.embeddings.create(
-                    model="text-embedding-3-small",
+                    model=OPENAI_EMBEDDING_MODEL,
                     input=batch,
                     encoding_format="float"
                 )
@@ -176,11 +200,11 @@ class RAGService:
             words = text.lower().split()
 
             # Create a simple 768-dimensional embedding based on text features
-            embedding = [0.0] * 768
+            embedding = [0.0] * FALLBACK_EMBEDDING_DIMENSIONS
 
             # Hash words into embedding dimensions
             for word in words:
-                idx = hash(word) % 768
+                idx = hash(word) % FALLBACK_EMBEDDING_DIMENSIONS
                 embedding[idx] += 1.0
 
             # Normalize
@@ -192,6 +216,23 @@ class RAGService:
 
         return embeddings
 
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query, reusing the embedding of a recent identical query.
+
+        Returns:
+            Embedding vector
+        """
+        cache = get_query_embedding_cache()
+        model = OPENAI_EMBEDDING_MODEL if self.use_openai_embeddings else "fallback"
+        vector = cache.get(model, query)
+        if vector is None:
+            vector = self.generate_embeddings([query])[0]
+            # An OpenAI error yields a fallback vector of another size; don't keep it
+            if not self.use_openai_embeddings or len(vector) == EMBEDDING_DIMENSIONS:
+                cache.set(model, query, vector)
+        return vector
+
     async def embed_document(
         self,
         document: Document,
@@ -201,6 +242,9 @@ class RAGService:
         """
         Chunk and embed a document, store in database
 
+        Runs through the same pipeline as embed_documents, so the embedding
+        calls never block the event loop.
+
         Args:
             document: Document object
             case_id: Case ID
@@ -209,35 +253,32 @@ class RAGService:
         Returns:
             Number of chunks created
         """
-        # Skip if no text
-        if not document.extracted_text:
-            return 0
+        result = await self.embed_documents([(document, case_id)], db)
+        error = result.failed.get(str(document.id))
+        if error:
+            raise RuntimeError(f"Embedding failed for document {document.id}: {error}")
+        return result.chunks.get(str(document.id), 0)
 
-        # Chunk the document
-        chunks = self.chunk_document(
-            text=document.extracted_text,
-            document_id=str(document.id),
-            document_type=document.document_type
-        )
+    async def embed_documents(
+        self,
+        documents: List[Tuple[Document, str]],
+        db: Session
+    ) -> IngestionResult:
+        """
+        Chunk and embed many documents at once (e.g. bulk upload)
 
-        # Generate embeddings for all chunks
-        chunk_texts = [chunk['chunk_text'] for chunk in chunks]
-        embeddings = self.generate_embeddings(chunk_texts)
+        Chunks of all documents are embedded in token-budgeted batches,
+        concurrently and off the event loop, then stored with one bulk
+        insert (see embedding_pipeline).
 
-        # Store in database
-        for chunk, embedding in zip(chunks, embeddings):
-            doc_embedding = DocumentEmbedding(
-                case_id=case_id,
-                document_id=chunk['document_id'],
-                chunk_text=chunk['chunk_text'],
-                chunk_index=chunk['chunk_index'],
-                embedding=embedding,  # Stored as JSON array
-                chunk_metadata=chunk['chunk_metadata']
-            )
-            db.add(doc_embedding)
+        Args:
+            documents: (document, case_id) pairs
+            db: Database session
 
-        db.commit()
-        return len(chunks)
+        Returns:
+            IngestionResult with chunk counts and failures per document
+        """
+        return await self.embedding_pipeline.embed_documents(documents, db)
 
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
@@ -275,15 +316,24 @@ class RAGService:
         Returns:
             List of relevant document chunks with similarity scores
         """
-        # Generate query embedding
-        query_embeddings = self.generate_embeddings([query])
-        query_embedding = query_embeddings[0]
+        # Repeated questions (multi-turn chat) are served until the case's chunks change
+        result_cache = get_search_result_cache()
+        cache_key = make_search_key(case_id, "semantic", query, top_k)
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = get_case_embedding_generation(case_id)
+
+        query_embedding = self.embed_query(query)
 
         # Check if pgvector is available for optimized search
         if DocumentEmbedding.using_pgvector():
-            return await self._pgvector_semantic_search(query_embedding, case_id, db, top_k)
+            results = await self._pgvector_semantic_search(query_embedding, case_id, db, top_k)
         else:
-            return await self._fallback_semantic_search(query_embedding, case_id, db, top_k)
+            results = await self._fallback_semantic_search(query_embedding, case_id, db, top_k)
+
+        result_cache.set(cache_key, results, generation)
+        return results
 
     async def _pgvector_semantic_search(
         self,
@@ -343,38 +393,151 @@ class RAGService:
         top_k: int
     ) -> List[Dict[str, Any]]:
         """
-        Fallback semantic search using manual cosine similarity.
+        Fallback semantic search over the case's in-memory vector index.
 
         Used when pgvector is not available (SQLite, PostgreSQL without pgvector).
-        O(n) complexity - fine for < 100k embeddings per case.
+        The index holds the case's embeddings as one normalized float32 matrix
+        (see case_vector_index), so ranking is a single matrix-vector product;
+        only the top_k rows are then loaded from the database.
         """
-        # Get all embeddings for this case
-        embeddings = db.query(DocumentEmbedding).filter(
-            DocumentEmbedding.case_id == case_id
-        ).all()
-
-        if not embeddings:
+        index = get_case_vector_index_cache().get(db, case_id)
+        hits = index.search(query_embedding, top_k)
+        if not hits:
             return []
 
-        # Calculate similarities manually
+        rows = {
+            str(row.id): row
+            for row in db.query(
+                DocumentEmbedding.id,
+                DocumentEmbedding.chunk_text,
+                DocumentEmbedding.chunk_index,
+                DocumentEmbedding.document_id,
+                DocumentEmbedding.chunk_metadata
+            ).filter(DocumentEmbedding.id.in_([row_id for row_id, _ in hits]))
+        }
+
         results = []
-        for emb in embeddings:
-            if not emb.embedding:
+        for row_id, similarity in hits:
+            row = rows.get(row_id)
+            if row is None:  # Deleted since the index was loaded
                 continue
+            results.append({
+                'chunk_text': row.chunk_text,
+                'chunk_index': row.chunk_index,
+                'document_id': row.document_id,
+                'similarity': similarity,
+                'metadata': row.chunk_metadata
+            })
+
+        return results
+
+    async def firm_search(
+        self,
+        query: str,
+        case_ids: List[str],
+        db: Session,
+        top_k: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Semantic search across many cases at once (firm-wide retrieval)
+
+        Only chunks of ``case_ids`` (the user's accessible cases) are ever
+        considered. Uses pgvector when available, otherwise the memory-mapped
+        IVF index (see firm_vector_index).
+
+        Args:
+            query: Search query
+            case_ids: Cases the user may search
+            db: Database session
+            top_k: Number of results to return
+
+        Returns:
+            List of document chunks with similarity scores and case_id
 
-            similarity = self.cosine_similarity(query_embedding, emb.embedding)
+        Raises:
+            IndexNotReadyError: The firm index is still being built (never built inline)
+        """
+        if not case_ids or top_k <= 0:
+            return []
+
+        query_embedding = self.embed_query(query)
 
+        if DocumentEmbedding.using_pgvector():
+            return self._pgvector_firm_search(query_embedding, case_ids, db, top_k)
+
+        index = get_firm_vector_index()
+        if not index.ensure(db, len(query_embedding)):
+            raise IndexNotReadyError("Firm vector index is being built")
+
+        # Over-fetch: rows deleted since the index was built drop out below
+        allowed = {str(case_id) for case_id in case_ids}
+        hits = index.search(query_embedding, allowed, top_k * 2)
+        rows = {
+            str(row.id): row
+            for row in db.query(
+                DocumentEmbedding.id,
+                DocumentEmbedding.chunk_text,
+                DocumentEmbedding.chunk_index,
+                DocumentEmbedding.document_id,
+                DocumentEmbedding.case_id,
+                DocumentEmbedding.chunk_metadata
+            ).filter(DocumentEmbedding.id.in_([row_id for row_id, _, _ in hits])).all()
+        } if hits else {}
+
+        results = []
+        for row_id, _, similarity in hits:
+            row = rows.get(row_id)
+            if row is None or str(row.case_id) not in allowed:
+                continue
             results.append({
-                'chunk_text': emb.chunk_text,
-                'chunk_index': emb.chunk_index,
-                'document_id': emb.document_id,
+                'chunk_text': row.chunk_text,
+                'chunk_index': row.chunk_index,
+                'document_id': str(row.document_id),
+                'case_id': str(row.case_id),
                 'similarity': similarity,
-                'metadata': emb.chunk_metadata
+                'metadata': row.chunk_metadata
             })
+            if len(results) == top_k:
+                break
+
+        logger.debug(f"Firm search over {len(allowed)} cases returned {len(results)} results")
+        return results
+
+    def _pgvector_firm_search(
+        self,
+        query_embedding: List[float],
+        case_ids: List[str],
+        db: Session,
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Firm-wide nearest neighbours with pgvector, filtered to the given cases."""
+        from sqlalchemy import bindparam, text
 
-        # Sort by similarity and return top_k
-        results.sort(key=lambda x: x['similarity'], reverse=True)
-        return results[:top_k]
+        query = text("""
+            SELECT id, chunk_text, chunk_index, document_id, case_id, chunk_metadata,
+                   1 - (embedding <=> CAST(:query_embedding AS vector)) AS similarity
+            FROM document_embeddings
+            WHERE case_id IN :case_ids
+            ORDER BY embedding <=> CAST(:query_embedding AS vector)
+            LIMIT :top_k
+        """).bindparams(bindparam("case_ids", expanding=True))
+
+        rows = db.execute(query, {
+            "query_embedding": str(query_embedding),
+            "case_ids": [str(case_id) for case_id in case_ids],
+            "top_k": top_k
+        })
+        return [
+            {
+                'chunk_text': row.chunk_text,
+                'chunk_index': row.chunk_index,
+                'document_id': str(row.document_id),
+                'case_id': str(row.case_id),
+                'similarity': float(row.similarity),
+                'metadata': row.chunk_metadata
+            }
+            for row in rows
+        ]
 
     async def _bm25_search(
         self,
@@ -443,6 +606,7 @@ class RAGService:
         results = []
         for row in result:
             results.append({
+                'id': str(row.id),
                 'chunk_text': row.chunk_text,
                 'chunk_index': row.chunk_index,
                 'document_id': row.document_id,
@@ -459,12 +623,17 @@ class RAGService:
         case_id: str,
         db: Session,
         top_k: int = 5,
-        alpha: float = 0.5
+        alpha: float = 0.5,
+        fusion: str = "rrf"
     ) -> List[Dict[str, Any]]:
         """
         Hybrid search combining semantic and BM25 keyword search.
 
-        Formula: hybrid_score = alpha * semantic_score + (1 - alpha) * bm25_score
+        fusion="rrf" (default): reciprocal rank fusion,
+            hybrid_score = alpha / (k + semantic_rank) + (1 - alpha) / (k + keyword_rank)
+            With pgvector this is a single SQL statement (one round trip).
+        fusion="linear": the original blend of max-normalized scores,
+            hybrid_score = alpha * semantic_score + (1 - alpha) * bm25_score
 
         Args:
             query: Search query text
@@ -472,10 +641,234 @@ class RAGService:
             db: Database session
             top_k: Number of final results to return
             alpha: Weight for semantic search (0.0 = BM25 only, 1.0 = semantic only)
+            fusion: "rrf" or "linear"
 
         Returns:
             List of document chunks with hybrid scores, semantic scores, and BM25 scores
         """
+        result_cache = get_search_result_cache()
+        cache_key = make_search_key(case_id, "hybrid", query, top_k, alpha, fusion)
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = get_case_embedding_generation(case_id)
+
+        if fusion == "linear":
+            results = await self._linear_hybrid_search(query, case_id, db, top_k, alpha)
+            result_cache.set(cache_key, results, generation)
+            return results
+
+        query_embedding = self.embed_query(query)
+        fetch_k = top_k * HYBRID_FETCH_MULTIPLIER
+
+        if DocumentEmbedding.using_pgvector():
+            try:
+                results = self._pgvector_rrf_search(query, query_embedding, case_id, db, top_k, fetch_k, alpha)
+                result_cache.set(cache_key, results, generation)
+            except Exception as e:
+                # e.g. chunk_text_search missing (migration 018 not applied); not cached
+                logger.warning(f"Hybrid SQL search failed, using semantic search only: {e}")
+                db.rollback()
+                results = [
+                    {**r, 'hybrid_score': r['similarity'], 'semantic_score': r['similarity'], 'bm25_score': 0.0}
+                    for r in await self._pgvector_semantic_search(query_embedding, case_id, db, top_k)
+                ]
+        else:
+            results = await self._fallback_rrf_search(query, query_embedding, case_id, db, top_k, fetch_k, alpha)
+            result_cache.set(cache_key, results, generation)
+
+        logger.debug(f"Hybrid RRF search (alpha={alpha}) returned {len(results)} results for case {case_id}")
+        return results
+
+    def _pgvector_rrf_search(
+        self,
+        query: str,
+        query_embedding: List[float],
+        case_id: str,
+        db: Session,
+        top_k: int,
+        fetch_k: int,
+        alpha: float
+    ) -> List[Dict[str, Any]]:
+        """
+        RRF hybrid search in one statement: the pgvector (HNSW) and ts_rank_cd
+        (GIN) candidate lists are limited first, ranked in CTEs, fused with a
+        FULL OUTER JOIN, and only the top_k rows are joined back for their text.
+        """
+        from sqlalchemy import text
+
+        search_query = text("""
+            WITH nearest AS (
+                SELECT
+                    id,
+                    1 - (embedding <=> CAST(:query_embedding AS vector)) AS similarity
+                FROM document_embeddings
+                WHERE case_id = :case_id
+                ORDER BY embedding <=> CAST(:query_embedding AS vector)
+                LIMIT :fetch_k
+            ),
+            semantic AS (
+                SELECT id, similarity, ROW_NUMBER() OVER (ORDER BY similarity DESC) AS rank
+                FROM nearest
+            ),
+            matches AS (
+                SELECT
+                    id,
+                    ts_rank_cd(chunk_text_search, q) AS raw_score
+                FROM document_embeddings, plainto_tsquery('english', :query) AS q
+                WHERE case_id = :case_id
+                    AND chunk_text_search @@ q
+                ORDER BY raw_score DESC
+                LIMIT :fetch_k
+            ),
+            keyword AS (
+                SELECT id, raw_score, ROW_NUMBER() OVER (ORDER BY raw_score DESC) AS rank
+                FROM matches
+            ),
+            fused AS (
+                SELECT
+                    COALESCE(s.id, k.id) AS id,
+                    COALESCE(:alpha / (:rrf_k + s.rank), 0)
+                        + COALESCE((1 - :alpha) / (:rrf_k + k.rank), 0) AS hybrid_score,
+                    COALESCE(s.similarity, 0) AS semantic_score,
+                    COALESCE(k.raw_score / NULLIF(MAX(k.raw_score) OVER (), 0), 0) AS bm25_score
+                FROM semantic s
+                FULL OUTER JOIN keyword k ON k.id = s.id
+            )
+            SELECT
+                e.id,
+                e.chunk_text,
+                e.chunk_index,
+                e.document_id,
+                e.chunk_metadata,
+                f.hybrid_score,
+                f.semantic_score,
+                f.bm25_score
+            FROM fused f
+            JOIN document_embeddings e ON e.id = f.id
+            ORDER BY f.hybrid_score DESC
+            LIMIT :top_k
+        """)
+
+        result = db.execute(search_query, {
+            "query": query,
+            "query_embedding": str(query_embedding),
+            "case_id": case_id,
+            "alpha": alpha,
+            "rrf_k": RRF_K,
+            "fetch_k": fetch_k,
+            "top_k": top_k
+        })
+
+        return [
+            {
+                'chunk_text': row.chunk_text,
+                'chunk_index': row.chunk_index,
+                'document_id': row.document_id,
+                'hybrid_score': float(row.hybrid_score),
+                'semantic_score': float(row.semantic_score),
+                'bm25_score': float(row.bm25_score),
+                'metadata': row.chunk_metadata
+            }
+            for row in result
+        ]
+
+    async def _fallback_rrf_search(
+        self,
+        query: str,
+        query_embedding: List[float],
+        case_id: str,
+        db: Session,
+        top_k: int,
+        fetch_k: int,
+        alpha: float
+    ) -> List[Dict[str, Any]]:
+        """
+        RRF hybrid search without pgvector: the semantic ranking comes from the
+        in-process vector index, the keyword ranking from _keyword_search
+        (FTS5 on SQLite).
+        Text is loaded for the fused top_k only.
+        """
+        semantic_hits = get_case_vector_index_cache().get(db, case_id).search(query_embedding, fetch_k)
+        keyword_hits = await self._keyword_search(query, case_id, db, fetch_k)
+
+        similarity = dict(semantic_hits)
+        keyword_scores = dict(keyword_hits)
+        max_keyword = max(keyword_scores.values(), default=0.0)
+
+        fused = reciprocal_rank_fusion(
+            [[row_id for row_id, _ in semantic_hits], [row_id for row_id, _ in keyword_hits]],
+            weights=[alpha, 1 - alpha]
+        )[:top_k]
+        if not fused:
+            return []
+
+        rows = {
+            str(row.id): row
+            for row in db.query(
+                DocumentEmbedding.id,
+                DocumentEmbedding.chunk_text,
+                DocumentEmbedding.chunk_index,
+                DocumentEmbedding.document_id,
+                DocumentEmbedding.chunk_metadata
+            ).filter(DocumentEmbedding.id.in_([row_id for row_id, _ in fused]))
+        }
+
+        results = []
+        for row_id, score in fused:
+            row = rows.get(row_id)
+            if row is None:  # Deleted since the index was loaded
+                continue
+            results.append({
+                'chunk_text': row.chunk_text,
+                'chunk_index': row.chunk_index,
+                'document_id': row.document_id,
+                'hybrid_score': score,
+                'semantic_score': similarity.get(row_id, 0.0),
+                'bm25_score': keyword_scores.get(row_id, 0.0) / max_keyword if max_keyword > 0 else 0.0,
+                'metadata': row.chunk_metadata
+            })
+        return results
+
+    async def _keyword_search(
+        self,
+        query: str,
+        case_id: str,
+        db: Session,
+        top_k: int
+    ) -> List[Tuple[str, float]]:
+        """
+        Keyword ranking as [(embedding_id, score)], best first.
+
+        PostgreSQL uses the chunk_text_search tsvector, SQLite the FTS5 chunk
+        index (BM25). Without either, hybrid search degrades to semantic
+        ranking only.
+        """
+        keyword_index = get_chunk_keyword_index()
+        if keyword_index.available(db):
+            return keyword_index.search(db, case_id, query, top_k)
+        if db.get_bind().dialect.name != "postgresql":
+            return []
+        try:
+            return [(r['id'], r['bm25_score']) for r in await self._bm25_search(query, case_id, db, top_k)]
+        except Exception as e:
+            logger.warning(f"Keyword search failed, using semantic ranking only: {e}")
+            db.rollback()
+            return []
+
+    async def _linear_hybrid_search(
+        self,
+        query: str,
+        case_id: str,
+        db: Session,
+        top_k: int,
+        alpha: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Two-query hybrid search with a linear blend of max-normalized scores.
+
+        Formula: hybrid_score = alpha * semantic_score + (1 - alpha) * bm25_score
+        """
         # Fetch 3x top_k from each method to ensure good coverage
         fetch_k = top_k * 3
 
@@ -581,10 +974,10 @@ class RAGService:
             Deadline.status.in_(['pending', 'in_progress'])
         ).order_by(Deadline.deadline_date.asc().nullslast()).limit(50).all()
 
-        # Perform semantic search if query provided
+        # Hybrid (semantic + keyword) search if query provided - one round trip with pgvector
         relevant_chunks = []
         if user_query:
-            relevant_chunks = await self.semantic_search(
+            relevant_chunks = await self.hybrid_search(
                 query=user_query,
                 case_id=case_id,
                 db=db,
@@ -647,7 +1040,7 @@ class RAGService:
                 {
                     'text': chunk['chunk_text'][:500],  # Truncate for context
                     'document_id': chunk['document_id'],
-                    'similarity': round(chunk['similarity'], 3)
+                    'similarity': round(chunk['semantic_score'], 3)
                 }
                 for chunk in relevant_chunks
             ]
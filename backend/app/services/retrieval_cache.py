@@ -0,0 +1,277 @@
+"""
+Retrieval Cache - Query embeddings and per-case search results for RAG
+
+A multi-turn chat asks the same retrieval question over and over: once per
+message, again after each tool call, and across the turns of a session.
+Every call used to embed the query (an OpenAI round trip) and rerun the
+search. This module caches both:
+
+- QueryEmbeddingCache: LRU + TTL, keyed by (model, normalized query text)
+- SearchResultCache: LRU + TTL, keyed by (case_id, search kind, normalized
+  query, parameters) and stamped with the case's *embedding generation*
+
+The embedding generation is a per-case, process-wide counter bumped
+whenever the case's chunks change. A result is only served while its
+generation is still current, so a newly embedded or deleted document is
+visible on the very next search. The generation is bumped by:
+
+- EmbeddingPipeline after every committed wave (embed_document,
+  embed_documents) and when it removes a failed document's rows
+- DocumentService.delete_document (raw SQL delete of the chunks)
+- any committed session that inserted, updated or deleted DocumentEmbedding
+  rows, or deleted a Document or Case, through the ORM
+
+Like the rules generation (rule_resolution_cache), the counter is per
+process; the TTL bounds staleness from writes made by other processes.
+
+Usage:
+    cache = get_search_result_cache()
+    key = make_search_key(case_id, "semantic", query, top_k)
+    results = cache.get(key)
+    if results is None:
+        generation = get_case_embedding_generation(case_id)
+        results = search(...)
+        cache.set(key, results, generation)
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.services.embedding_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CASE EMBEDDING GENERATION
+# =============================================================================
+
+_generations: Dict[str, int] = {}
+_generation_lock = threading.Lock()
+
+
+def get_case_embedding_generation(case_id: str) -> int:
+    """Current embedding generation of a case. Capture it *before* searching."""
+    return _generations.get(str(case_id), 0)
+
+
+def bump_case_embedding_generation(case_id: str, reason: str = "") -> int:
+    """
+    Invalidate every cached search result of a case.
+
+    Args:
+        case_id: Case whose chunks changed
+        reason: Short description for the log (e.g. "document deleted")
+
+    Returns:
+        The new generation number
+    """
+    case_id = str(case_id)
+    with _generation_lock:
+        new_generation = _generations.get(case_id, 0) + 1
+        _generations[case_id] = new_generation
+    logger.debug(f"Embedding generation of case {case_id} bumped to {new_generation}"
+                 + (f" ({reason})" if reason else ""))
+    return new_generation
+
+
+# =============================================================================
+# CACHES
+# =============================================================================
+
+class _TTLCache:
+    """Thread-safe LRU of (expires_at, generation, value) entries"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, int, Any]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "stale": 0,
+            "sets": 0,
+            "evictions": 0,
+        }
+
+    def _get(self, key: Tuple[Hashable, ...], generation: int = 0) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            expires_at, entry_generation, value = entry
+            if expires_at <= now or entry_generation != generation:
+                del self._entries[key]
+                self._stats["expired" if expires_at <= now else "stale"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def _set(self, key: Tuple[Hashable, ...], value: Any, generation: int = 0) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, generation, value)
+            self._entries.move_to_end(key)
+            self._stats["sets"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> int:
+        """Drop all entries. Returns number of entries removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics including hit rate."""
+        with self._lock:
+            total_requests = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (
+                self._stats["hits"] / total_requests * 100
+                if total_requests > 0
+                else 0.0
+            )
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl,
+                "hit_rate": f"{hit_rate:.1f}%",
+                **self._stats,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class QueryEmbeddingCache(_TTLCache):
+    """
+    Embeddings of search queries, keyed by model and normalized text.
+
+    Vectors are stored as immutable tuples; callers get a new list.
+    """
+
+    DEFAULT_MAX_ENTRIES = int(os.getenv("QUERY_EMBEDDING_CACHE_ENTRIES", "2048"))
+    DEFAULT_TTL_SECONDS = float(os.getenv("QUERY_EMBEDDING_CACHE_TTL", "3600"))
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        super().__init__(max_entries, ttl_seconds)
+
+    def get(self, model: str, query: str) -> Optional[List[float]]:
+        """Cached embedding of the query, or None."""
+        vector = self._get((model, normalize_text(query)))
+        return list(vector) if vector is not None else None
+
+    def set(self, model: str, query: str, vector: Sequence[float]) -> None:
+        self._set((model, normalize_text(query)), tuple(vector))
+
+
+def make_search_key(case_id: str, kind: str, query: str, *params: Hashable) -> Tuple[Hashable, ...]:
+    """Build a search result cache key (params: top_k, alpha, ...)."""
+    return (str(case_id), kind, normalize_text(query), *params)
+
+
+class SearchResultCache(_TTLCache):
+    """
+    Search results per case, valid while the case's embedding generation holds.
+
+    Keys start with the case id (see make_search_key). Results are stored as
+    tuples; callers get shallow copies of the result dicts.
+    """
+
+    DEFAULT_MAX_ENTRIES = int(os.getenv("SEARCH_RESULT_CACHE_ENTRIES", "1024"))
+    DEFAULT_TTL_SECONDS = float(os.getenv("SEARCH_RESULT_CACHE_TTL", "600"))
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        super().__init__(max_entries, ttl_seconds)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Cached results for key, or None if missing, expired or from an older generation."""
+        results = self._get(key, get_case_embedding_generation(key[0]))
+        return [dict(result) for result in results] if results is not None else None
+
+    def set(self, key: Tuple[Hashable, ...], results: List[Dict[str, Any]], generation: int) -> None:
+        """
+        Store results computed at ``generation``.
+
+        If the case's chunks changed while searching, the results are dropped.
+        """
+        if generation != get_case_embedding_generation(key[0]):
+            return
+        self._set(key, tuple(dict(result) for result in results), generation)
+
+
+# Global singleton instances
+query_embedding_cache = QueryEmbeddingCache()
+search_result_cache = SearchResultCache()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Get the global query embedding cache instance."""
+    return query_embedding_cache
+
+
+def get_search_result_cache() -> SearchResultCache:
+    """Get the global search result cache instance."""
+    return search_result_cache
+
+
+# =============================================================================
+# AUTOMATIC INVALIDATION ON COMMIT
+# =============================================================================
+
+_SESSION_KEY = "embedding_cases_changed"
+
+
+@event.listens_for(Session, "before_flush")
+def _track_embedding_changes(session, flush_context, instances):
+    """Remember which cases' chunks this transaction touched."""
+    changed = set()
+    for obj in session.new:
+        if getattr(obj, "__tablename__", None) == "document_embeddings":
+            changed.add(obj.case_id)
+    for obj in session.deleted:
+        table = getattr(obj, "__tablename__", None)
+        if table in ("document_embeddings", "documents"):
+            changed.add(obj.case_id)
+        elif table == "cases":
+            changed.add(obj.id)
+    for obj in session.dirty:
+        if (
+            getattr(obj, "__tablename__", None) == "document_embeddings"
+            and session.is_modified(obj, include_collections=False)
+        ):
+            changed.add(obj.case_id)
+    changed.discard(None)
+    if changed:
+        session.info.setdefault(_SESSION_KEY, set()).update(str(case_id) for case_id in changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    if session.in_nested_transaction():
+        return  # Savepoint released (e.g. the summary refresh): the outer transaction is still open
+    for case_id in session.info.pop(_SESSION_KEY, ()):
+        bump_case_embedding_generation(case_id, "chunks committed")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _reset_on_rollback(session, previous_transaction):
+    # A rolled-back savepoint leaves the outer transaction's changes pending
+    if not previous_transaction.nested:
+        session.info.pop(_SESSION_KEY, None)
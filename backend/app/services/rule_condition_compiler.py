@@ -0,0 +1,509 @@
+"""
+Rule Condition Compiler - Compile Authority Core condition JSON into predicates
+
+Authority Core rules carry a ``conditions`` document (nested ``$and`` / ``$or`` /
+``$not``, case_types with regex/glob patterns, date ranges, numeric comparisons,
+...). Interpreting that document for every rule on every request means walking
+dicts, re-parsing dates and re-resolving regexes over and over. Instead each
+document is compiled once into a tree of closures:
+
+- regex and glob patterns are compiled up front (invalid ones are logged once)
+- fixed condition dates are parsed once; "today" is still evaluated per call
+- exact case_type patterns become a lowercase set lookup
+- expected boolean values are normalized once
+
+A rule's predicate and the predicates of all its deadline specs are compiled
+together the first time the rule version (rule id + version) is seen, and
+looked up by that key alone afterwards. Entries are also stamped with the rules
+generation (rule_resolution_cache), so rules edited in place and committed
+without a version bump are recompiled. Conditions without a rule id are cached
+per content fingerprint.
+
+Usage:
+    cache = get_condition_cache()
+    matching = [r for r in rules if cache.for_rule(r)(case_context)]
+    for index, spec in enumerate(rule.deadlines):
+        if cache.for_deadline(rule, index)(case_context): ...
+"""
+import copy
+import logging
+import operator
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Mapping, NamedTuple, Optional, Tuple
+
+from app.services.rule_resolution_cache import case_context_fingerprint
+
+logger = logging.getLogger(__name__)
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+
+def _always_true(case_context: Mapping[str, Any]) -> bool:
+    return True
+
+
+# =============================================================================
+# VALUE HELPERS
+# =============================================================================
+
+def normalize_boolean(value: Any) -> Optional[bool]:
+    """Normalize various boolean-like values to actual booleans"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lower = value.lower().strip()
+        if lower in ("true", "yes", "1", "y", "on"):
+            return True
+        if lower in ("false", "no", "0", "n", "off"):
+            return False
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return None
+
+
+def _parse_iso_date(value: str) -> Optional[date]:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_context_date(value: str) -> Optional[date]:
+    """Parse (and memoize) an ISO date string coming from a case context"""
+    parsed = _parse_iso_date(value)
+    if parsed is None:
+        logger.warning(f"Invalid date format in context: {value}")
+    return parsed
+
+
+def _context_date(value: Any) -> Optional[date]:
+    if isinstance(value, str):
+        return _parse_context_date(value)
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _compile_date_bound(value: Any) -> Optional[Callable[[], date]]:
+    """Pre-parse a condition date; returns a getter, or None if unparseable"""
+    if isinstance(value, date):
+        return lambda: value
+    if isinstance(value, str):
+        if value == "today":
+            return date.today
+        parsed = _parse_iso_date(value)
+        if parsed is not None:
+            return lambda: parsed
+    return None
+
+
+# =============================================================================
+# SECTION COMPILERS
+# =============================================================================
+
+def _compile_case_types(allowed_types: Any) -> Predicate:
+    """
+    case_types: the context case_type must match one entry.
+
+    Entries may be exact (case-insensitive), "regex:<pattern>" or globs with *.
+    """
+    exact = set()
+    patterns: List["re.Pattern[str]"] = []
+    for pattern in allowed_types:
+        if not isinstance(pattern, str):
+            continue
+        if pattern.startswith("regex:"):
+            try:
+                patterns.append(re.compile(pattern[6:], re.IGNORECASE))
+            except re.error:
+                logger.warning(f"Invalid regex pattern: {pattern[6:]}")
+        elif "*" in pattern:
+            try:
+                patterns.append(re.compile(f"^{pattern.replace('*', '.*')}$", re.IGNORECASE))
+            except re.error:
+                pass
+        else:
+            exact.add(pattern.lower())
+
+    exact_patterns = frozenset(exact)
+    regex_patterns = tuple(patterns)
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        case_type = case_context.get("case_type")
+        if not case_type:
+            return True
+        if isinstance(case_type, str):
+            if case_type.lower() in exact_patterns:
+                return True
+            for regex in regex_patterns:
+                if regex.match(case_type):
+                    return True
+        return case_type in allowed_types
+
+    return check
+
+
+def _compile_motion_types(allowed_types: Any) -> Predicate:
+    def check(case_context: Mapping[str, Any]) -> bool:
+        motion_type = case_context.get("motion_type")
+        return not motion_type or motion_type in allowed_types
+
+    return check
+
+
+def _compile_exclusions(exclusions: Mapping[str, Any]) -> Predicate:
+    items = tuple(exclusions.items())
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        for key, excluded_values in items:
+            context_value = case_context.get(key)
+            if context_value is not None and context_value in excluded_values:
+                return False
+        return True
+
+    return check
+
+
+# (condition key, comparison that must hold between context date and bound)
+_DATE_COMPARISONS = (
+    ("after", operator.gt),
+    ("before", operator.lt),
+    ("on_or_after", operator.ge),
+    ("on_or_before", operator.le),
+)
+
+
+def _compile_date_range(date_conditions: Mapping[str, Any]) -> Predicate:
+    """date_range: {field: {after|before|on_or_after|on_or_before: date}}"""
+    fields = []
+    for field, conditions in date_conditions.items():
+        bounds = []
+        for key, compare in _DATE_COMPARISONS:
+            if key in conditions:
+                bound = _compile_date_bound(conditions[key])
+                if bound is not None:
+                    bounds.append((compare, bound))
+        if bounds:
+            fields.append((field, tuple(bounds)))
+    fields = tuple(fields)
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        for field, bounds in fields:
+            context_value = case_context.get(field)
+            if not context_value:
+                continue
+            context_date = _context_date(context_value)
+            if context_date is None:
+                continue
+            for compare, bound in bounds:
+                if not compare(context_date, bound()):
+                    return False
+        return True
+
+    return check
+
+
+def _compile_regex(regex_conditions: Mapping[str, str]) -> Predicate:
+    """regex: {field: pattern} searched case-insensitively in str(value)"""
+    compiled = []
+    for field, pattern in regex_conditions.items():
+        try:
+            compiled.append((field, re.compile(pattern, re.IGNORECASE)))
+        except (re.error, TypeError):
+            logger.warning(f"Invalid regex pattern for {field}: {pattern}")
+    compiled = tuple(compiled)
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        for field, regex in compiled:
+            context_value = case_context.get(field)
+            if context_value is not None and not regex.search(str(context_value)):
+                return False
+        return True
+
+    return check
+
+
+_NUMERIC_COMPARISONS = (
+    ("gt", operator.gt),
+    ("lt", operator.lt),
+    ("gte", operator.ge),
+    ("lte", operator.le),
+    ("eq", operator.eq),
+    ("ne", operator.ne),
+)
+
+
+def _compile_numeric(numeric_conditions: Mapping[str, Mapping[str, Any]]) -> Predicate:
+    """numeric: {field: {gt|lt|gte|lte|eq|ne: N}}"""
+    fields = tuple(
+        (field, tuple(
+            (compare, conditions[key])
+            for key, compare in _NUMERIC_COMPARISONS
+            if key in conditions
+        ))
+        for field, conditions in numeric_conditions.items()
+    )
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        for field, comparisons in fields:
+            context_value = case_context.get(field)
+            if context_value is None:
+                continue
+            try:
+                num_value = float(context_value)
+            except (ValueError, TypeError):
+                continue
+            for compare, limit in comparisons:
+                if not compare(num_value, limit):
+                    return False
+        return True
+
+    return check
+
+
+def _compile_required_fields(required_fields: Any) -> Predicate:
+    fields = tuple(required_fields)
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        for field in fields:
+            if case_context.get(field) is None:
+                return False
+        return True
+
+    return check
+
+
+def _compile_boolean(boolean_conditions: Mapping[str, Any]) -> Predicate:
+    expected = tuple(
+        (field, normalize_boolean(value)) for field, value in boolean_conditions.items()
+    )
+
+    def check(case_context: Mapping[str, Any]) -> bool:
+        for field, expected_value in expected:
+            if normalize_boolean(case_context.get(field)) != expected_value:
+                return False
+        return True
+
+    return check
+
+
+# Evaluated in this order; every section must pass
+_SECTION_COMPILERS = (
+    ("case_types", _compile_case_types),
+    ("motion_types", _compile_motion_types),
+    ("exclusions", _compile_exclusions),
+    ("date_range", _compile_date_range),
+    ("regex", _compile_regex),
+    ("numeric", _compile_numeric),
+    ("required_fields", _compile_required_fields),
+    ("boolean", _compile_boolean),
+)
+
+
+def compile_conditions(conditions: Optional[Mapping[str, Any]]) -> Predicate:
+    """
+    Compile a rule conditions document into a predicate over a case context.
+
+    Supports:
+    - Simple value matching (case_types, motion_types)
+    - Exclusions (exclusions.field = [excluded_values])
+    - Date ranges (date_range.field = {after: date, before: date})
+    - Boolean logic ($and, $or, $not) - a wrapper key takes precedence over
+      any sibling keys
+    - Regex patterns (regex.field = pattern)
+    - Numeric comparisons (numeric.field = {gt: N, lt: N, gte: N, lte: N, eq: N})
+    - Field existence (required_fields) and boolean flags (boolean.field = value)
+
+    Args:
+        conditions: The conditions document (None/empty matches everything)
+
+    Returns:
+        Callable taking a case context dict and returning True on match
+    """
+    if not conditions:
+        return _always_true
+
+    if "$and" in conditions:
+        clauses = tuple(compile_conditions(sub) for sub in conditions["$and"])
+        return lambda case_context: all(clause(case_context) for clause in clauses)
+
+    if "$or" in conditions:
+        clauses = tuple(compile_conditions(sub) for sub in conditions["$or"])
+        return lambda case_context: any(clause(case_context) for clause in clauses)
+
+    if "$not" in conditions:
+        negated = compile_conditions(conditions["$not"])
+        return lambda case_context: not negated(case_context)
+
+    checks = tuple(
+        compiler(conditions[key])
+        for key, compiler in _SECTION_COMPILERS
+        if key in conditions
+    )
+    if not checks:
+        return _always_true
+    if len(checks) == 1:
+        return checks[0]
+
+    def match_all(case_context: Mapping[str, Any]) -> bool:
+        for check in checks:
+            if not check(case_context):
+                return False
+        return True
+
+    return match_all
+
+
+# =============================================================================
+# COMPILED CONDITION CACHE
+# =============================================================================
+
+class _CompiledRule(NamedTuple):
+    """Predicates of one rule version: rule conditions + one per deadline spec"""
+    conditions: Any  # Deep copies of what the predicates were compiled from
+    deadline_conditions: Tuple[Any, ...]
+    predicate: Predicate
+    deadline_predicates: Tuple[Predicate, ...]
+
+
+def _deadline_conditions(rule: Any) -> Tuple[Any, ...]:
+    return tuple((spec or {}).get("conditions") for spec in getattr(rule, "deadlines", None) or ())
+
+
+class CompiledConditionCache:
+    """
+    LRU cache of compiled condition predicates.
+
+    Rules are keyed by (rule id, version); anonymous conditions by content
+    fingerprint. Every hit is validated against a deep copy of the
+    conditions the predicates were compiled from (a cheap equality check),
+    so rules edited in place - by any process, without a version bump -
+    are recompiled.
+    Thread-safe.
+    """
+
+    DEFAULT_MAX_ENTRIES = 8192
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._rules: "OrderedDict[Tuple[str, Any], _CompiledRule]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "compilations": 0,
+            "evictions": 0,
+        }
+
+    def _lookup(self, key: Hashable, conditions: Optional[Mapping[str, Any]]) -> Predicate:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == conditions:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+            self._stats["misses"] += 1
+
+        snapshot = copy.deepcopy(conditions)
+        predicate = compile_conditions(snapshot)
+
+        with self._lock:
+            self._entries[key] = (snapshot, predicate)
+            self._entries.move_to_end(key)
+            self._stats["compilations"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return predicate
+
+    def _compiled_rule(self, rule: Any) -> _CompiledRule:
+        key = (str(rule.id), rule.version)
+        deadline_conditions = _deadline_conditions(rule)
+        with self._lock:
+            entry = self._rules.get(key)
+            if (
+                entry is not None
+                and entry.conditions == rule.conditions
+                and entry.deadline_conditions == deadline_conditions
+            ):
+                self._rules.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["misses"] += 1
+
+        conditions = copy.deepcopy(rule.conditions)
+        deadline_conditions = copy.deepcopy(deadline_conditions)
+        entry = _CompiledRule(
+            conditions=conditions,
+            deadline_conditions=deadline_conditions,
+            predicate=compile_conditions(conditions),
+            deadline_predicates=tuple(compile_conditions(c) for c in deadline_conditions)
+        )
+
+        with self._lock:
+            self._rules[key] = entry
+            self._rules.move_to_end(key)
+            self._stats["compilations"] += 1
+            while len(self._rules) > self._max_entries:
+                self._rules.popitem(last=False)
+                self._stats["evictions"] += 1
+        return entry
+
+    def for_rule(self, rule: Any) -> Predicate:
+        """Compiled predicate for an AuthorityRule's conditions"""
+        if rule.id is None:
+            return self.for_conditions(rule.conditions)
+        return self._compiled_rule(rule).predicate
+
+    def for_deadline(self, rule: Any, index: int) -> Predicate:
+        """Compiled predicate for the conditions of rule.deadlines[index]"""
+        if rule.id is None:
+            return self.for_conditions((rule.deadlines[index] or {}).get("conditions"))
+        return self._compiled_rule(rule).deadline_predicates[index]
+
+    def for_conditions(self, conditions: Optional[Mapping[str, Any]]) -> Predicate:
+        """Compiled predicate for a standalone conditions document"""
+        if not conditions:
+            return _always_true
+        return self._lookup(("conditions", case_context_fingerprint(conditions)), conditions)
+
+    def clear(self) -> int:
+        """Drop all compiled predicates. Returns number of entries removed."""
+        with self._lock:
+            count = len(self._entries) + len(self._rules)
+            self._entries.clear()
+            self._rules.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics including hit rate."""
+        with self._lock:
+            total_requests = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (
+                self._stats["hits"] / total_requests * 100
+                if total_requests > 0
+                else 0.0
+            )
+            return {
+                "size": len(self._entries) + len(self._rules),
+                "max_entries": self._max_entries,
+                "hit_rate": f"{hit_rate:.1f}%",
+                **self._stats,
+            }
+
+
+# Global singleton instance
+condition_cache = CompiledConditionCache()
+
+
+def get_condition_cache() -> CompiledConditionCache:
+    """Get the global compiled condition cache instance."""
+    return condition_cache
@@ -0,0 +1,256 @@
+"""
+Rule Resolution Cache - Generation-invalidated memoization of rule lookups
+
+Resolving the rule templates for a trigger (hardcoded + jurisdiction-system
+templates + Authority Core rules) is pure with respect to the rules tables.
+Every resolution is stamped with the current "rules generation" - a
+process-wide, monotonically increasing counter - and is only served while that
+generation is still current.
+
+The generation is bumped whenever rule data changes:
+- Any committed session that inserted, updated or deleted a row in
+  authority_rules, jurisdictions, rule_sets, rule_set_dependencies,
+  rule_templates or rule_template_deadlines. This covers approve_proposal,
+  rule ingestion, Watchtower updates and the admin endpoints.
+- Explicit calls to bump_rules_generation() for writes that bypass the ORM
+  unit of work (bulk UPDATE/DELETE)
+
+The counter is per process: rule edits committed by another worker, pod or
+script do not bump it. Entries therefore also expire after a TTL
+(RULE_RESOLUTION_CACHE_TTL, default 300s), which bounds how long such edits
+can go unseen. Cache keys are
+(namespace, jurisdiction, court_type, trigger_type, case-context fingerprint).
+
+Usage:
+    cache = get_rule_resolution_cache()
+    key = make_resolution_key("authority_core", jurisdiction_id, court_type, trigger_type, case_context)
+    templates = cache.get(key)
+    if templates is None:
+        generation = get_rules_generation()
+        templates = resolve(...)
+        cache.set(key, templates, generation)
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# RULES GENERATION COUNTER
+# =============================================================================
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def get_rules_generation() -> int:
+    """Current rules generation. Capture it *before* resolving rules."""
+    return _generation
+
+
+def bump_rules_generation(reason: str = "") -> int:
+    """
+    Invalidate every cached rule resolution.
+
+    Args:
+        reason: Short description for the log (e.g. "proposal approved")
+
+    Returns:
+        The new generation number
+    """
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        new_generation = _generation
+    logger.info(f"Rules generation bumped to {new_generation}" + (f" ({reason})" if reason else ""))
+    return new_generation
+
+
+def case_context_fingerprint(case_context: Optional[Any]) -> Optional[str]:
+    """
+    Stable fingerprint of a case context (or any JSON-like value).
+
+    Key order does not matter; non-JSON values are stringified.
+    """
+    if not case_context:
+        return None
+    payload = json.dumps(case_context, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def make_resolution_key(
+    namespace: str,
+    jurisdiction: Optional[str],
+    court_type: Optional[str],
+    trigger_type: Any,
+    case_context: Optional[Any] = None
+) -> Tuple[Hashable, ...]:
+    """Build a cache key for a rule resolution."""
+    trigger_value = getattr(trigger_type, "value", trigger_type)
+    return (namespace, jurisdiction, court_type, trigger_value, case_context_fingerprint(case_context))
+
+
+# =============================================================================
+# RESOLUTION CACHE
+# =============================================================================
+
+class RuleResolutionCache:
+    """
+    LRU-bounded, generation-checked and TTL-bounded cache of resolved rule templates.
+
+    Values should be immutable (tuples of dataclasses); callers copy into a
+    list before handing results out. Thread-safe.
+    """
+
+    DEFAULT_MAX_ENTRIES = 2048
+    DEFAULT_TTL_SECONDS = float(os.getenv("RULE_RESOLUTION_CACHE_TTL", "300"))
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, int, Any]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "stale": 0,
+            "sets": 0,
+            "evictions": 0,
+        }
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Cached value for key, or None if missing, expired or from an older generation."""
+        current = _generation
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            expires_at, generation, value = entry
+            if expires_at <= now or generation != current:
+                del self._entries[key]
+                self._stats["expired" if expires_at <= now else "stale"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: Tuple[Hashable, ...], value: Any, generation: int) -> None:
+        """
+        Store a resolution computed at ``generation``.
+
+        If the rules changed while the value was being computed, the value is
+        dropped instead of being cached under the new generation.
+        """
+        if generation != _generation:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, generation, value)
+            self._entries.move_to_end(key)
+            self._stats["sets"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> int:
+        """Drop all entries. Returns number of entries removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics including hit rate and current generation."""
+        with self._lock:
+            total_requests = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (
+                self._stats["hits"] / total_requests * 100
+                if total_requests > 0
+                else 0.0
+            )
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl,
+                "generation": _generation,
+                "hit_rate": f"{hit_rate:.1f}%",
+                **self._stats,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Global singleton instance
+rule_resolution_cache = RuleResolutionCache()
+
+
+def get_rule_resolution_cache() -> RuleResolutionCache:
+    """Get the global rule resolution cache instance."""
+    return rule_resolution_cache
+
+
+# =============================================================================
+# AUTOMATIC INVALIDATION ON COMMIT
+# =============================================================================
+
+# Tables whose rows feed rule resolution
+_RULE_TABLES = frozenset({
+    "authority_rules",
+    "jurisdictions",
+    "rule_sets",
+    "rule_set_dependencies",
+    "rule_templates",
+    "rule_template_deadlines",
+})
+
+_SESSION_FLAG = "rules_changed"
+
+
+@event.listens_for(Session, "before_flush")
+def _track_rule_changes(session, flush_context, instances):
+    """Remember that this transaction touched rule data."""
+    if session.info.get(_SESSION_FLAG):
+        return
+    for obj in (*session.new, *session.deleted):
+        if getattr(obj, "__tablename__", None) in _RULE_TABLES:
+            session.info[_SESSION_FLAG] = True
+            return
+    for obj in session.dirty:
+        if (
+            getattr(obj, "__tablename__", None) in _RULE_TABLES
+            and session.is_modified(obj, include_collections=False)
+        ):
+            session.info[_SESSION_FLAG] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    if session.in_nested_transaction():
+        return  # Savepoint released (e.g. the summary refresh): the outer transaction is still open
+    if session.info.pop(_SESSION_FLAG, False):
+        bump_rules_generation("rule data committed")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _reset_on_rollback(session, previous_transaction):
+    # A rolled-back savepoint leaves the outer transaction's changes pending
+    if not previous_transaction.nested:
+        session.info.pop(_SESSION_FLAG, None)
@@ -9,11 +9,13 @@ Supports both:
 1. Hardcoded rule templates (legacy, always available)
 2. Database-loaded rule templates (from jurisdiction system)
 """
-from typing import Dict, List, Optional, Any, TYPE_CHECKING, Union
+from typing import Dict, List, Mapping, Optional, Any, Tuple, TYPE_CHECKING, Union
 from datetime import date, timedelta
 from dataclasses import dataclass, field
+from types import MappingProxyType
 import logging
 import os
+import threading
 
 # Import centralized enums
 from app.models.enums import TriggerType, DeadlinePriority
@@ -21,6 +23,12 @@ from app.models.enums import TriggerType, DeadlinePriority
 # Import authoritative legal rules constants
 from app.constants.legal_rules import get_service_extension_days
 from app.constants.parsing import TRUTHY_STRINGS, FALSY_STRINGS
+from app.services.rule_resolution_cache import (
+    bump_rules_generation,
+    get_rule_resolution_cache,
+    get_rules_generation,
+    make_resolution_key
+)
 from app.utils.deadline_calculator import (
     AuthoritativeDeadlineCalculator,
     CalculationMethod,
@@ -54,7 +62,7 @@ class ClarificationQuestion:
     expected_answer_type: str = "text"
     affects_deadlines: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(frozen=True)
 class DependentDeadline:
     """A deadline that is calculated relative to a trigger event."""
     name: str
@@ -71,7 +79,7 @@ class DependentDeadline:
     condition_field: Optional[str] = None
     condition_value: Any = True
 
-@dataclass
+@dataclass(frozen=True)
 class RuleTemplate:
     """Defines a set of deadlines triggered by a specific event."""
     rule_id: str
@@ -141,36 +149,85 @@ class RulesEngine:
     _DEPRECATION_WARNING_ENABLED = True
     _deprecation_warned = False
 
-    def __init__(self):
-        self.rule_templates: Dict[str, RuleTemplate] = {}
+    # Hardcoded rule families in load order: family -> (loader, jurisdictions covered).
+    # Each family is built on first access and shared, read-only, by every
+    # RulesEngine instance in the process.
+    _RULE_FAMILIES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+        "florida_civil": ("_load_florida_civil_rules", ("florida_state",)),
+        "federal_civil": ("_load_federal_civil_rules", ("federal",)),
+        "florida_pretrial": ("_load_florida_pretrial_rules", ("florida_state",)),
+        "federal_pretrial": ("_load_federal_pretrial_rules", ("federal",)),
+        "appellate": ("_load_appellate_rules", ("florida_state", "federal")),
+    }
+    # family -> (rule_id -> template, (jurisdiction, court_type, trigger_type) -> templates)
+    _family_cache: Dict[str, Tuple[Mapping[str, RuleTemplate], Mapping[Tuple[str, str, TriggerType], Tuple[RuleTemplate, ...]]]] = {}
+    _family_lock = threading.Lock()
 
+    def __init__(self):
         # Phase 2: Hardcoded rules disabled by default
         # Legacy hardcoded rules are only loaded if explicitly enabled via LOAD_HARDCODED_RULES=true
         # This ensures Authority Core is used for 100% of deadline calculations
         if self._LOAD_HARDCODED_RULES:
-            logger.info(
-                "Loading hardcoded rules as fallback. Authority Core is primary; "
-                "hardcoded rules ensure deadlines always generate."
-            )
-            self._load_florida_civil_rules()
-            self._load_federal_civil_rules()
-            self._load_florida_pretrial_rules()
-            self._load_federal_pretrial_rules()
-            self._load_appellate_rules()
+            if not RulesEngine._deprecation_warned:
+                logger.info(
+                    "Hardcoded rules enabled as fallback (loaded per jurisdiction on first use). "
+                    "Authority Core is primary; hardcoded rules ensure deadlines always generate."
+                )
         else:
             logger.info(
                 "✅ RulesEngine initialized with hardcoded rules DISABLED. "
                 "Using Authority Core for all deadline calculations."
             )
 
-        # Log deprecation notice once per session
-        if self._DEPRECATION_WARNING_ENABLED and not RulesEngine._deprecation_warned:
-            if self.rule_templates:
-                logger.info(
-                    f"RulesEngine: {len(self.rule_templates)} hardcoded rule templates loaded as fallback."
-                )
+        if self._DEPRECATION_WARNING_ENABLED:
             RulesEngine._deprecation_warned = True
 
+    # =========================================================================
+    # LAZY RULE FAMILIES
+    # =========================================================================
+
+    def _get_family(self, family: str):
+        """Build (once per process) and return a hardcoded rule family"""
+        cached = RulesEngine._family_cache.get(family)
+        if cached is not None:
+            return cached
+
+        with RulesEngine._family_lock:
+            cached = RulesEngine._family_cache.get(family)
+            if cached is None:
+                templates: Dict[str, RuleTemplate] = {}
+                if self._LOAD_HARDCODED_RULES:
+                    loader, _ = self._RULE_FAMILIES[family]
+                    getattr(self, loader)(templates)
+
+                grouped: Dict[Tuple[str, str, TriggerType], List[RuleTemplate]] = {}
+                for rule in templates.values():
+                    grouped.setdefault((rule.jurisdiction, rule.court_type, rule.trigger_type), []).append(rule)
+
+                cached = (
+                    MappingProxyType(templates),
+                    MappingProxyType({key: tuple(rules) for key, rules in grouped.items()})
+                )
+                RulesEngine._family_cache[family] = cached
+                if templates:
+                    logger.info(f"RulesEngine: loaded {len(templates)} hardcoded '{family}' rule templates as fallback.")
+        return cached
+
+    def _families_for(self, jurisdiction: Optional[str] = None) -> List[str]:
+        """Families covering a jurisdiction (all families if None), in load order"""
+        return [
+            family for family, (_, jurisdictions) in self._RULE_FAMILIES.items()
+            if jurisdiction is None or jurisdiction in jurisdictions
+        ]
+
+    @property
+    def rule_templates(self) -> Mapping[str, RuleTemplate]:
+        """Read-only rule_id -> template view of every hardcoded family (loads all)"""
+        merged: Dict[str, RuleTemplate] = {}
+        for family in self._families_for():
+            merged.update(self._get_family(family)[0])
+        return MappingProxyType(merged)
+
     def _normalize_value(self, value: Any) -> Any:
         """
         Normalize values for soft matching in conditional deadline logic.
@@ -209,7 +266,7 @@ class RulesEngine:
         # Return as-is for all other types (bool, int, float, None, etc.)
         return value
 
-    def _load_florida_civil_rules(self):
+    def _load_florida_civil_rules(self, templates: Dict[str, RuleTemplate]):
         """Load Florida Rules of Civil Procedure templates"""
 
         # Florida Rule 1.140(a) - Answer to Complaint
@@ -236,7 +293,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[answer_rule.rule_id] = answer_rule
+        templates[answer_rule.rule_id] = answer_rule
 
         # Florida Discovery Deadlines (assuming standard 180-day discovery period)
         discovery_rule = RuleTemplate(
@@ -272,7 +329,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[discovery_rule.rule_id] = discovery_rule
+        templates[discovery_rule.rule_id] = discovery_rule
 
         # =============================================================
         # TRIAL DATE TRIGGER - COMPREHENSIVE (50+ DEADLINES)
@@ -662,7 +719,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[trial_rule.rule_id] = trial_rule
+        templates[trial_rule.rule_id] = trial_rule
 
         # Hearing Scheduled Trigger - generates dependent deadlines before hearing
         hearing_rule = RuleTemplate(
@@ -700,7 +757,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[hearing_rule.rule_id] = hearing_rule
+        templates[hearing_rule.rule_id] = hearing_rule
 
         # =============================================================
         # MOTION FILED TRIGGER - Response deadlines
@@ -740,7 +797,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[motion_rule.rule_id] = motion_rule
+        templates[motion_rule.rule_id] = motion_rule
 
         # =============================================================
         # DISCOVERY SERVED TRIGGERS - Individual Discovery Responses
@@ -770,7 +827,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[interrogatory_rule.rule_id] = interrogatory_rule
+        templates[interrogatory_rule.rule_id] = interrogatory_rule
 
         # Request for Production Served
         rfp_rule = RuleTemplate(
@@ -796,7 +853,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[rfp_rule.rule_id] = rfp_rule
+        templates[rfp_rule.rule_id] = rfp_rule
 
         # Request for Admissions Served - CRITICAL (auto-admit if not answered!)
         rfa_rule = RuleTemplate(
@@ -822,7 +879,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[rfa_rule.rule_id] = rfa_rule
+        templates[rfa_rule.rule_id] = rfa_rule
 
         # Deposition Noticed
         deposition_rule = RuleTemplate(
@@ -860,7 +917,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[deposition_rule.rule_id] = deposition_rule
+        templates[deposition_rule.rule_id] = deposition_rule
 
         # =============================================================
         # COMPLAINT SERVED - Full Defendant Response Chain
@@ -936,7 +993,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[complaint_served_rule.rule_id] = complaint_served_rule
+        templates[complaint_served_rule.rule_id] = complaint_served_rule
 
         # =============================================================
         # ORDER ENTERED - Post-Judgment Deadlines
@@ -1012,9 +1069,9 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[order_entered_rule.rule_id] = order_entered_rule
+        templates[order_entered_rule.rule_id] = order_entered_rule
 
-    def _load_federal_civil_rules(self):
+    def _load_federal_civil_rules(self, templates: Dict[str, RuleTemplate]):
         """Load Federal Rules of Civil Procedure templates"""
 
         # FRCP 12(a) - Answer to Complaint (Federal)
@@ -1041,7 +1098,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[fed_answer_rule.rule_id] = fed_answer_rule
+        templates[fed_answer_rule.rule_id] = fed_answer_rule
 
         # Federal Discovery
         fed_discovery_rule = RuleTemplate(
@@ -1067,7 +1124,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_discovery_rule.rule_id] = fed_discovery_rule
+        templates[fed_discovery_rule.rule_id] = fed_discovery_rule
 
         # Federal Hearing Scheduled Trigger
         fed_hearing_rule = RuleTemplate(
@@ -1105,7 +1162,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_hearing_rule.rule_id] = fed_hearing_rule
+        templates[fed_hearing_rule.rule_id] = fed_hearing_rule
 
         # =============================================================
         # FEDERAL TRIAL DATE - COMPREHENSIVE (40+ DEADLINES)
@@ -1401,7 +1458,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_trial_rule.rule_id] = fed_trial_rule
+        templates[fed_trial_rule.rule_id] = fed_trial_rule
 
         # =============================================================
         # FEDERAL MOTION FILED - Response Deadlines
@@ -1441,7 +1498,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_motion_rule.rule_id] = fed_motion_rule
+        templates[fed_motion_rule.rule_id] = fed_motion_rule
 
         # =============================================================
         # FEDERAL COMPLAINT SERVED - Full Response Chain
@@ -1505,7 +1562,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_complaint_served_rule.rule_id] = fed_complaint_served_rule
+        templates[fed_complaint_served_rule.rule_id] = fed_complaint_served_rule
 
         # =============================================================
         # FEDERAL DISCOVERY RESPONSES
@@ -1533,7 +1590,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_interrogatory_rule.rule_id] = fed_interrogatory_rule
+        templates[fed_interrogatory_rule.rule_id] = fed_interrogatory_rule
 
         fed_rfp_rule = RuleTemplate(
             rule_id="FED_CIV_RFP",
@@ -1558,7 +1615,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_rfp_rule.rule_id] = fed_rfp_rule
+        templates[fed_rfp_rule.rule_id] = fed_rfp_rule
 
         fed_rfa_rule = RuleTemplate(
             rule_id="FED_CIV_RFA",
@@ -1583,7 +1640,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_rfa_rule.rule_id] = fed_rfa_rule
+        templates[fed_rfa_rule.rule_id] = fed_rfa_rule
 
         # =============================================================
         # FEDERAL ORDER ENTERED - Post-Judgment Deadlines
@@ -1659,7 +1716,7 @@ class RulesEngine:
                 ),
             ]
         )
-        self.rule_templates[fed_order_entered_rule.rule_id] = fed_order_entered_rule
+        templates[fed_order_entered_rule.rule_id] = fed_order_entered_rule
 
     def get_applicable_rules(
         self,
@@ -1668,13 +1725,10 @@ class RulesEngine:
         trigger_type: TriggerType
     ) -> List[RuleTemplate]:
         """Get all applicable rule templates for a given context"""
-
+        key = (jurisdiction, court_type, trigger_type)
         applicable = []
-        for rule in self.rule_templates.values():
-            if (rule.jurisdiction == jurisdiction and
-                rule.court_type == court_type and
-                rule.trigger_type == trigger_type):
-                applicable.append(rule)
+        for family in self._families_for(jurisdiction):
+            applicable.extend(self._get_family(family)[1].get(key, ()))
 
         return applicable
 
@@ -2087,9 +2141,13 @@ class RulesEngine:
 
     def get_template_by_id(self, rule_id: str) -> Optional[RuleTemplate]:
         """Get specific rule template by ID"""
-        return self.rule_templates.get(rule_id)
+        for family in self._families_for():
+            template = self._get_family(family)[0].get(rule_id)
+            if template is not None:
+                return template
+        return None
 
-    def _load_florida_pretrial_rules(self):
+    def _load_florida_pretrial_rules(self, templates: Dict[str, RuleTemplate]):
         """Load Florida pretrial and case management templates"""
 
         # Mediation Chain ($MC trigger)
@@ -2128,7 +2186,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[mediation_rule.rule_id] = mediation_rule
+        templates[mediation_rule.rule_id] = mediation_rule
 
         # Case Management Order Chain
         cmo_rule = RuleTemplate(
@@ -2166,9 +2224,9 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[cmo_rule.rule_id] = cmo_rule
+        templates[cmo_rule.rule_id] = cmo_rule
 
-    def _load_federal_pretrial_rules(self):
+    def _load_federal_pretrial_rules(self, templates: Dict[str, RuleTemplate]):
         """Load Federal pretrial and trial preparation templates"""
 
         # Federal Pretrial Conference (Rule 16)
@@ -2207,7 +2265,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[federal_pretrial_rule.rule_id] = federal_pretrial_rule
+        templates[federal_pretrial_rule.rule_id] = federal_pretrial_rule
 
         # Federal Expert Disclosures (Rule 26)
         expert_disclosure_rule = RuleTemplate(
@@ -2257,9 +2315,9 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[expert_disclosure_rule.rule_id] = expert_disclosure_rule
+        templates[expert_disclosure_rule.rule_id] = expert_disclosure_rule
 
-    def _load_appellate_rules(self):
+    def _load_appellate_rules(self, templates: Dict[str, RuleTemplate]):
         """Load Florida and Federal appellate procedure templates"""
 
         # Florida Appellate - Notice of Appeal
@@ -2298,7 +2356,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[fl_appeal_rule.rule_id] = fl_appeal_rule
+        templates[fl_appeal_rule.rule_id] = fl_appeal_rule
 
         # Florida Appellate - Initial Brief
         fl_brief_rule = RuleTemplate(
@@ -2348,7 +2406,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[fl_brief_rule.rule_id] = fl_brief_rule
+        templates[fl_brief_rule.rule_id] = fl_brief_rule
 
         # Federal Appellate - Notice of Appeal
         fed_appeal_rule = RuleTemplate(
@@ -2374,7 +2432,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[fed_appeal_rule.rule_id] = fed_appeal_rule
+        templates[fed_appeal_rule.rule_id] = fed_appeal_rule
 
         # Federal Appellate - Briefs
         fed_brief_rule = RuleTemplate(
@@ -2424,7 +2482,7 @@ class RulesEngine:
                 )
             ]
         )
-        self.rule_templates[fed_brief_rule.rule_id] = fed_brief_rule
+        templates[fed_brief_rule.rule_id] = fed_brief_rule
 
 
     def load_templates_from_database(self, db: "Session") -> List[RuleTemplate]:
@@ -2439,7 +2497,17 @@ class RulesEngine:
 
         Returns:
             List of RuleTemplate dataclasses loaded from database
+
+        The result is memoized process-wide until the rules generation changes
+        (see app.services.rule_resolution_cache).
         """
+        cache = get_rule_resolution_cache()
+        cache_key = make_resolution_key("db_templates", None, None, None)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        generation = get_rules_generation()
+
         from app.models.jurisdiction import (
             RuleTemplate as DBRuleTemplate,
             RuleTemplateDeadline as DBDeadline,
@@ -2532,6 +2600,7 @@ class RulesEngine:
                 db_templates.append(template)
 
             logger.info(f"Loaded {len(db_templates)} rule templates from database")
+            cache.set(cache_key, tuple(db_templates), generation)
 
         except Exception as e:
             logger.error(f"Error loading templates from database: {e}")
@@ -2608,7 +2677,19 @@ class RulesEngine:
         Get applicable rules including database-loaded ones.
 
         Can optionally filter by specific rule set IDs (from jurisdiction detection).
+        Memoized per (jurisdiction, court_type, trigger_type, rule_set_ids) until
+        the rules generation changes.
         """
+        cache = get_rule_resolution_cache()
+        cache_key = make_resolution_key(
+            "with_db", jurisdiction, court_type, trigger_type,
+            sorted(rule_set_ids) if rule_set_ids else None
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        generation = get_rules_generation()
+
         # Get hardcoded templates
         applicable = self.get_applicable_rules(jurisdiction, court_type, trigger_type)
 
@@ -2631,6 +2712,7 @@ class RulesEngine:
 
                 applicable.append(template)
 
+        cache.set(cache_key, tuple(applicable), generation)
         return applicable
 
 
@@ -2649,13 +2731,10 @@ class DatabaseRulesEngine:
     def __init__(self, db: "Session"):
         self.db = db
         self._base_engine = rules_engine  # Use singleton for hardcoded templates
-        self._db_templates_cache: Optional[List[RuleTemplate]] = None
 
     def _get_db_templates(self) -> List[RuleTemplate]:
-        """Get database templates with caching"""
-        if self._db_templates_cache is None:
-            self._db_templates_cache = self._base_engine.load_templates_from_database(self.db)
-        return self._db_templates_cache
+        """Get database templates (memoized process-wide by rules generation)"""
+        return self._base_engine.load_templates_from_database(self.db)
 
     def get_all_templates(self) -> List[RuleTemplate]:
         """Get all templates including database ones"""
@@ -2700,8 +2779,8 @@ class DatabaseRulesEngine:
         return None
 
     def invalidate_cache(self):
-        """Invalidate the database templates cache"""
-        self._db_templates_cache = None
+        """Invalidate all cached rule resolutions (bumps the rules generation)"""
+        bump_rules_generation("DatabaseRulesEngine.invalidate_cache")
 
     # =========================================================================
     # AUTHORITY CORE INTEGRATION
@@ -2769,28 +2848,29 @@ class DatabaseRulesEngine:
 
         Returns:
             List of RuleTemplate dataclasses (Authority Core or hardcoded)
+
+        Results are memoized process-wide per (jurisdiction_id, court type,
+        trigger type, case_context fingerprint) until the rules generation
+        changes, so repeated triggers do not query the database again.
         """
-        import asyncio
+        cache = get_rule_resolution_cache()
+        cache_key = make_resolution_key(
+            "authority_core", jurisdiction_id, fallback_court_type, trigger_type,
+            {"case_context": case_context, "fallback_jurisdiction": fallback_jurisdiction}
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        generation = get_rules_generation()
 
-        # Try to get Authority Core rules (run async in sync context)
+        # Try to get Authority Core rules
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If already in async context, create task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        get_authority_core_rules(self.db, jurisdiction_id, trigger_type, case_context)
-                    )
-                    ac_rules = future.result(timeout=5)
-            else:
-                ac_rules = asyncio.run(
-                    get_authority_core_rules(self.db, jurisdiction_id, trigger_type, case_context)
-                )
+            ac_rules = _query_authority_core_rules(self.db, jurisdiction_id, trigger_type)
         except Exception as e:
             logger.warning(f"Authority Core query failed, using fallback: {e}")
             ac_rules = []
+            # Don't memoize a fallback caused by a failed query
+            generation = None
 
         if ac_rules:
             # Convert Authority Core rules to templates
@@ -2802,13 +2882,16 @@ class DatabaseRulesEngine:
                 templates.append(template)
 
             logger.info(f"Using {len(templates)} Authority Core templates for {trigger_type.value}")
-            return templates
+        else:
+            # Fallback to hardcoded templates
+            logger.info(f"No Authority Core rules found, using hardcoded templates for {trigger_type.value}")
+            templates = self.get_applicable_rules(
+                fallback_jurisdiction, fallback_court_type, trigger_type
+            )
 
-        # Fallback to hardcoded templates
-        logger.info(f"No Authority Core rules found, using hardcoded templates for {trigger_type.value}")
-        return self.get_applicable_rules(
-            fallback_jurisdiction, fallback_court_type, trigger_type
-        )
+        if generation is not None:
+            cache.set(cache_key, tuple(templates), generation)
+        return templates
 
     # =========================================================================
     # HIERARCHY RESOLUTION - The "Sovereign Brain" Graph Traversal
@@ -3371,67 +3454,75 @@ async def get_authority_core_rules(
     Returns:
         List of rule dictionaries with deadline specifications
     """
+    try:
+        return _query_authority_core_rules(db, jurisdiction_id, trigger_type)
+    except Exception as e:
+        logger.error(f"Error querying Authority Core: {e}")
+        return []
+
+
+def _query_authority_core_rules(
+    db: "Session",
+    jurisdiction_id: str,
+    trigger_type: TriggerType
+) -> List[Dict[str, Any]]:
+    """Query body of get_authority_core_rules; raises on database errors."""
     from app.models.authority_core import AuthorityRule
     from app.models.enums import AuthorityTier
     from sqlalchemy import or_
 
-    try:
-        # Query for matching verified rules
-        query = db.query(AuthorityRule).filter(
-            AuthorityRule.trigger_type == trigger_type.value,
-            AuthorityRule.is_active == True,
-            AuthorityRule.is_verified == True
-        )
+    # Query for matching verified rules
+    query = db.query(AuthorityRule).filter(
+        AuthorityRule.trigger_type == trigger_type.value,
+        AuthorityRule.is_active == True,
+        AuthorityRule.is_verified == True
+    )
 
-        # Include rules for this jurisdiction OR federal rules (higher precedence)
-        query = query.filter(
-            or_(
-                AuthorityRule.jurisdiction_id == jurisdiction_id,
-                AuthorityRule.authority_tier == AuthorityTier.FEDERAL
-            )
+    # Include rules for this jurisdiction OR federal rules (higher precedence)
+    query = query.filter(
+        or_(
+            AuthorityRule.jurisdiction_id == jurisdiction_id,
+            AuthorityRule.authority_tier == AuthorityTier.FEDERAL
         )
+    )
 
-        rules = query.all()
-
-        if not rules:
-            logger.debug(f"No Authority Core rules found for trigger_type={trigger_type.value}, jurisdiction={jurisdiction_id}")
-            return []
-
-        # Sort by tier precedence (federal > state > local > standing_order > firm)
-        tier_order = {
-            AuthorityTier.FEDERAL: 1,
-            AuthorityTier.STATE: 2,
-            AuthorityTier.LOCAL: 3,
-            AuthorityTier.STANDING_ORDER: 4,
-            AuthorityTier.FIRM: 5
-        }
-        rules.sort(key=lambda r: tier_order.get(r.authority_tier, 99))
-
-        # Convert to dictionaries
-        result = []
-        for rule in rules:
-            result.append({
-                'rule_id': rule.id,
-                'rule_code': rule.rule_code,
-                'rule_name': rule.rule_name,
-                'trigger_type': rule.trigger_type,
-                'authority_tier': rule.authority_tier.value if rule.authority_tier else 'state',
-                'citation': rule.citation,
-                'deadlines': rule.deadlines or [],
-                'conditions': rule.conditions,
-                'service_extensions': rule.service_extensions or {'mail': 3, 'electronic': 0, 'personal': 0},
-                'source_url': rule.source_url,
-                'is_verified': rule.is_verified,
-                'confidence_score': float(rule.confidence_score) if rule.confidence_score else 0.0
-            })
-
-        logger.info(f"Found {len(result)} Authority Core rules for trigger_type={trigger_type.value}")
-        return result
+    rules = query.all()
 
-    except Exception as e:
-        logger.error(f"Error querying Authority Core: {e}")
+    if not rules:
+        logger.debug(f"No Authority Core rules found for trigger_type={trigger_type.value}, jurisdiction={jurisdiction_id}")
         return []
 
+    # Sort by tier precedence (federal > state > local > standing_order > firm)
+    tier_order = {
+        AuthorityTier.FEDERAL: 1,
+        AuthorityTier.STATE: 2,
+        AuthorityTier.LOCAL: 3,
+        AuthorityTier.STANDING_ORDER: 4,
+        AuthorityTier.FIRM: 5
+    }
+    rules.sort(key=lambda r: tier_order.get(r.authority_tier, 99))
+
+    # Convert to dictionaries
+    result = []
+    for rule in rules:
+        result.append({
+            'rule_id': rule.id,
+            'rule_code': rule.rule_code,
+            'rule_name': rule.rule_name,
+            'trigger_type': rule.trigger_type,
+            'authority_tier': rule.authority_tier.value if rule.authority_tier else 'state',
+            'citation': rule.citation,
+            'deadlines': rule.deadlines or [],
+            'conditions': rule.conditions,
+            'service_extensions': rule.service_extensions or {'mail': 3, 'electronic': 0, 'personal': 0},
+            'source_url': rule.source_url,
+            'is_verified': rule.is_verified,
+            'confidence_score': float(rule.confidence_score) if rule.confidence_score else 0.0
+        })
+
+    logger.info(f"Found {len(result)} Authority Core rules for trigger_type={trigger_type.value}")
+    return result
+
 
 def convert_authority_rule_to_template(
     rule_dict: Dict[str, Any],
@@ -3500,5 +3591,8 @@ def get_rules_engine_for_case(db: "Session", case_id: str) -> DatabaseRulesEngin
 
     This function can be extended to auto-detect the case's jurisdiction
     and pre-filter applicable rules.
+
+    The engine itself is a thin per-session wrapper; template resolution is
+    shared across requests through the process-wide rule resolution cache.
     """
     return DatabaseRulesEngine(db)
@@ -2,12 +2,15 @@
 Workload Optimizer Service
 Analyzes calendar workload, identifies saturation risks, and suggests AI-powered rebalancing
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, NamedTuple, Optional, Tuple
+from sqlalchemy import case, func, or_
 from sqlalchemy.orm import Session
 from datetime import date, datetime, timedelta
 from collections import defaultdict
 import logging
 
+import numpy as np
+
 from app.models.deadline import Deadline
 from app.models.case import Case
 from app.services.ai_service import ai_service
@@ -24,6 +27,12 @@ class WorkloadOptimizer:
     - AI-powered deadline rebalancing suggestions
     - Burnout prevention alerts
     - Workload heatmap data generation
+    - Firm/team-wide saturation over long horizons
+
+    Scoring is columnar: only (date, priority, moveable, owner) columns are
+    fetched and daily risk scores are computed with NumPy arrays, so a
+    365-day horizon over many attorneys stays cheap. Deadline details are
+    loaded for saturated days only.
     """
 
     # Risk scoring weights
@@ -63,74 +72,62 @@ class WorkloadOptimizer:
             }
         """
 
-        end_date = date.today() + timedelta(days=days_ahead)
-
-        # Get all pending deadlines in the date range
-        deadlines = db.query(Deadline).filter(
-            Deadline.user_id == user_id,
-            Deadline.status == 'pending',
-            Deadline.deadline_date >= date.today(),
-            Deadline.deadline_date <= end_date
-        ).all()
-
-        # Group deadlines by date
-        daily_workload = defaultdict(list)
-        for deadline in deadlines:
-            if deadline.deadline_date:
-                daily_workload[deadline.deadline_date].append(deadline)
-
-        # Calculate risk scores for each day
-        risk_days = []
-        heatmap = {}
-
-        for day, items in daily_workload.items():
-            risk_score, breakdown = self._calculate_risk_score(items)
-
-            heatmap[day.isoformat()] = {
-                "risk_score": risk_score,
-                "deadline_count": len(items),
-                "intensity": self._get_intensity_level(risk_score)
+        start = date.today()
+        columns = self._load_workload_columns(db, start, days_ahead, Deadline.user_id == user_id)
+        daily = self._daily_workload_arrays(columns, days_ahead + 1)
+        risk = daily["risk"][0]
+        counts = daily["count"][0]
+
+        # Heatmap of every day with deadlines
+        days = np.flatnonzero(counts)
+        intensities = self._get_intensity_levels(risk[days])
+        heatmap = {
+            (start + timedelta(days=int(day))).isoformat(): {
+                "risk_score": float(risk[day]),
+                "deadline_count": int(counts[day]),
+                "moveable_count": int(daily["moveable"][0][day]),
+                "intensity": intensity
             }
+            for day, intensity in zip(days, intensities)
+        }
 
-            if risk_score >= self.SATURATION_THRESHOLD:
-                risk_days.append({
-                    "date": day.isoformat(),
-                    "risk_score": risk_score,
-                    "deadline_count": len(items),
-                    "fatal_count": breakdown['fatal_count'],
-                    "critical_count": breakdown['critical_count'],
-                    "important_count": breakdown['important_count'],
-                    "deadlines": [
-                        {
-                            "id": str(d.id),
-                            "title": d.title,
-                            "priority": d.priority,
-                            "case_id": d.case_id,
-                            "is_moveable": self._is_deadline_moveable(d)
-                        }
-                        for d in items
-                    ],
-                    "intensity": self._get_intensity_level(risk_score)
-                })
+        # Details are only loaded for saturated days
+        saturated_days = np.flatnonzero(risk >= self.SATURATION_THRESHOLD)
+        details = self._load_deadline_details(
+            db, [start + timedelta(days=int(day)) for day in saturated_days], Deadline.user_id == user_id
+        )
+        risk_days = []
+        for day, intensity in zip(saturated_days, self._get_intensity_levels(risk[saturated_days])):
+            day_date = start + timedelta(days=int(day))
+            risk_days.append({
+                "date": day_date.isoformat(),
+                "risk_score": float(risk[day]),
+                "deadline_count": int(counts[day]),
+                "fatal_count": int(daily["fatal"][0][day]),
+                "critical_count": int(daily["critical"][0][day]),
+                "important_count": int(daily["important"][0][day]),
+                "deadlines": details.get(day_date, []),
+                "intensity": intensity
+            })
 
         # Sort risk days by risk score (highest first)
         risk_days.sort(key=lambda x: x['risk_score'], reverse=True)
 
         # Detect burnout risk (consecutive saturated days)
-        burnout_alerts = self._detect_burnout_risk(daily_workload)
+        burnout_alerts = self._detect_burnout_risk(risk[np.newaxis, :], start)[0]
 
         # Generate AI suggestions for top 3 risk days
         suggestions = []
         for risk_day in risk_days[:3]:
             suggestion = await self._generate_rebalance_suggestion(
                 risk_day,
-                daily_workload,
+                (start, counts, risk),
                 db
             )
             suggestions.append(suggestion)
 
         # Calculate statistics
-        stats = self._calculate_workload_statistics(daily_workload, days_ahead)
+        stats = self._calculate_workload_statistics(counts, risk, start, days_ahead)
 
         return {
             "risk_days": risk_days,
@@ -140,32 +137,200 @@ class WorkloadOptimizer:
             "statistics": stats
         }
 
-    def _calculate_risk_score(self, deadlines: List[Deadline]) -> tuple[float, Dict]:
+    def analyze_team_saturation(
+        self,
+        db: Session,
+        user_ids: Optional[Iterable[str]] = None,
+        case_ids: Optional[Iterable[str]] = None,
+        days_ahead: int = 365
+    ) -> Dict[str, Any]:
+        """
+        Saturation analysis across many attorneys (firm or team horizon)
+
+        Deadlines are scoped to the given users and/or cases and scored per
+        attorney (saturation and burnout are personal). No AI suggestions.
+
+        Args:
+            db: Database session
+            user_ids: Attorneys to include
+            case_ids: Cases to include (e.g. every case the requester can access)
+            days_ahead: How many days to analyze (default 365)
+
+        Returns:
+            {
+                "team_heatmap": {date: {"risk_score", "deadline_count", "saturated_users"}},
+                "users": [{"user_id", "saturated_days", "peak_risk_score", "peak_date",
+                           "burnout_alerts", ...}],
+                "statistics": {...}
+            }
+        """
+        if user_ids is None and case_ids is None:
+            raise ValueError("Team saturation needs user_ids or case_ids")
+
+        filters = []
+        if user_ids is not None:
+            filters.append(Deadline.user_id.in_([str(u) for u in user_ids]))
+        if case_ids is not None:
+            filters.append(Deadline.case_id.in_([str(c) for c in case_ids]))
+
+        start = date.today()
+        columns = self._load_workload_columns(db, start, days_ahead, *filters)
+        daily = self._daily_workload_arrays(columns, days_ahead + 1)
+        risk, counts = daily["risk"], daily["count"]
+        saturated = risk >= self.SATURATION_THRESHOLD
+
+        team_counts = counts.sum(axis=0)
+        team_risk = risk.sum(axis=0)
+        saturated_users = saturated.sum(axis=0)
+        team_heatmap = {
+            (start + timedelta(days=int(day))).isoformat(): {
+                "risk_score": float(team_risk[day]),
+                "deadline_count": int(team_counts[day]),
+                "saturated_users": int(saturated_users[day])
+            }
+            for day in np.flatnonzero(team_counts)
+        }
+
+        burnout_alerts = self._detect_burnout_risk(risk, start)
+        peaks = risk.argmax(axis=1) if len(columns.user_ids) else np.zeros(0, dtype=np.int64)
+        users = [
+            {
+                "user_id": user_id,
+                "deadline_count": int(counts[index].sum()),
+                "saturated_days": int(saturated[index].sum()),
+                "peak_risk_score": float(risk[index, peaks[index]]),
+                "peak_date": (start + timedelta(days=int(peaks[index]))).isoformat(),
+                "burnout_alerts": burnout_alerts[index]
+            }
+            for index, user_id in enumerate(columns.user_ids)
+        ]
+        users.sort(key=lambda u: (u["saturated_days"], u["peak_risk_score"]), reverse=True)
+
+        return {
+            "team_heatmap": team_heatmap,
+            "users": users,
+            "statistics": {
+                "attorneys": len(users),
+                "total_deadlines": int(team_counts.sum()),
+                "saturated_attorney_days": int(saturated.sum()),
+                "attorneys_with_burnout_risk": sum(1 for alerts in burnout_alerts if alerts),
+                "analysis_period_days": days_ahead
+            }
+        }
+
+    def _load_workload_columns(
+        self,
+        db: Session,
+        start: date,
+        days_ahead: int,
+        *filters
+    ) -> "_WorkloadColumns":
         """
-        Calculate risk score for a day based on deadlines
+        Fetch only the columns the risk scoring needs, as arrays
 
-        Returns: (risk_score, breakdown_dict)
+        Priorities are compared case-insensitively (stored lowercase).
         """
+        rows = db.query(
+            Deadline.deadline_date,
+            func.upper(Deadline.priority),
+            self._moveable_expression(),
+            Deadline.user_id
+        ).filter(
+            *filters,
+            Deadline.status == 'pending',
+            Deadline.deadline_date >= start,
+            Deadline.deadline_date <= start + timedelta(days=days_ahead)
+        ).all()
+
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return _WorkloadColumns(empty, np.zeros(0, dtype=object), np.zeros(0, dtype=bool), empty, [])
+
+        dates, priorities, moveable, owners = zip(*rows)
+        user_ids, user_index = np.unique(np.array(owners, dtype=object).astype(str), return_inverse=True)
+        return _WorkloadColumns(
+            day=(np.array(dates, dtype='datetime64[D]') - np.datetime64(start, 'D')).astype(np.int64),
+            priority=np.array(priorities, dtype=object),
+            moveable=np.array(moveable, dtype=bool),
+            user=user_index.astype(np.int64),
+            user_ids=user_ids.tolist()
+        )
 
-        fatal_count = sum(1 for d in deadlines if d.priority == 'FATAL')
-        critical_count = sum(1 for d in deadlines if d.priority == 'CRITICAL')
-        important_count = sum(1 for d in deadlines if d.priority == 'IMPORTANT')
+    def _moveable_expression(self):
+        """
+        SQL flag: can the deadline be moved?
 
-        risk_score = (
-            len(deadlines) * self.WEIGHT_TOTAL_DEADLINES +
-            fatal_count * self.WEIGHT_FATAL +
-            critical_count * self.WEIGHT_CRITICAL +
-            important_count * self.WEIGHT_IMPORTANT
+        Cannot move:
+        - FATAL deadlines (jurisdictional)
+        - Court-ordered deadlines (heuristic: triggered by a hearing)
+        - Dependent deadlines (part of trigger chain)
+        """
+        return case(
+            (or_(
+                func.upper(Deadline.priority) == 'FATAL',
+                Deadline.is_dependent.is_(True),
+                func.lower(Deadline.trigger_event).like('%hearing%')
+            ), False),
+            else_=True
         )
 
-        breakdown = {
-            "total_deadlines": len(deadlines),
-            "fatal_count": fatal_count,
-            "critical_count": critical_count,
-            "important_count": important_count
+    def _daily_workload_arrays(self, columns: "_WorkloadColumns", n_days: int) -> Dict[str, np.ndarray]:
+        """
+        Per-attorney daily counts and risk scores, shape (attorneys, n_days)
+
+        Risk score = deadlines + weighted FATAL/CRITICAL/IMPORTANT counts.
+        """
+        n_users = max(len(columns.user_ids), 1)
+        cell = columns.user * n_days + columns.day
+
+        def per_day(mask=None):
+            weights = None if mask is None else mask.astype(np.int64)
+            totals = np.bincount(cell, weights=weights, minlength=n_users * n_days)
+            return totals.astype(np.int64).reshape(n_users, n_days)
+
+        daily = {
+            "count": per_day(),
+            "fatal": per_day(columns.priority == 'FATAL'),
+            "critical": per_day(columns.priority == 'CRITICAL'),
+            "important": per_day(columns.priority == 'IMPORTANT'),
+            "moveable": per_day(columns.moveable)
         }
+        daily["risk"] = (
+            daily["count"] * self.WEIGHT_TOTAL_DEADLINES +
+            daily["fatal"] * self.WEIGHT_FATAL +
+            daily["critical"] * self.WEIGHT_CRITICAL +
+            daily["important"] * self.WEIGHT_IMPORTANT
+        )
+        return daily
+
+    def _load_deadline_details(self, db: Session, days: List[date], *filters) -> Dict[date, List[Dict]]:
+        """Deadlines of the given days for the risk day listing"""
+        if not days:
+            return {}
+
+        rows = db.query(
+            Deadline.id,
+            Deadline.title,
+            Deadline.priority,
+            Deadline.case_id,
+            Deadline.deadline_date,
+            self._moveable_expression().label("is_moveable")
+        ).filter(
+            *filters,
+            Deadline.status == 'pending',
+            Deadline.deadline_date.in_(days)
+        ).all()
 
-        return risk_score, breakdown
+        details = defaultdict(list)
+        for row in rows:
+            details[row.deadline_date].append({
+                "id": str(row.id),
+                "title": row.title,
+                "priority": row.priority,
+                "case_id": row.case_id,
+                "is_moveable": bool(row.is_moveable)
+            })
+        return details
 
     def _get_intensity_level(self, risk_score: float) -> str:
         """Convert risk score to intensity level for visualization"""
@@ -180,68 +345,47 @@ class WorkloadOptimizer:
         else:
             return "low"
 
-    def _is_deadline_moveable(self, deadline: Deadline) -> bool:
-        """
-        Determine if a deadline can be moved
+    def _get_intensity_levels(self, risk_scores: np.ndarray) -> List[str]:
+        """Vectorized _get_intensity_level"""
+        levels = np.array(["low", "medium", "high", "very_high", "extreme"])
+        return levels[np.searchsorted([5, 10, 15, 20], risk_scores, side='right')].tolist()
 
-        Cannot move:
-        - FATAL deadlines (jurisdictional)
-        - Court-ordered deadlines
-        - Dependent deadlines (part of trigger chain)
+    def _detect_burnout_risk(self, risk: np.ndarray, start: date) -> List[List[Dict]]:
         """
+        Detect consecutive saturated days (burnout risk) for each attorney row
 
-        if deadline.priority == 'FATAL':
-            return False
-
-        if deadline.is_dependent:
-            return False
+        A day belongs to a burnout period when it is covered by a window of
+        BURNOUT_THRESHOLD_DAYS saturated days (rolling sums via cumsum).
 
-        # Check if it's a court-ordered deadline (heuristic)
-        if deadline.trigger_event and 'hearing' in deadline.trigger_event.lower():
-            return False
-
-        return True
-
-    def _detect_burnout_risk(self, daily_workload: Dict[date, List[Deadline]]) -> List[Dict]:
+        Returns: List of burnout alert periods per row of risk
         """
-        Detect consecutive saturated days (burnout risk)
 
-        Returns: List of burnout alert periods
-        """
-
-        alerts = []
-        sorted_dates = sorted(daily_workload.keys())
-
-        consecutive_saturated = []
-
-        for day in sorted_dates:
-            items = daily_workload[day]
-            risk_score, _ = self._calculate_risk_score(items)
-
-            if risk_score >= self.SATURATION_THRESHOLD:
-                consecutive_saturated.append(day)
-            else:
-                # Check if we had a streak
-                if len(consecutive_saturated) >= self.BURNOUT_THRESHOLD_DAYS:
-                    alerts.append({
-                        "type": "burnout_risk",
-                        "start_date": consecutive_saturated[0].isoformat(),
-                        "end_date": consecutive_saturated[-1].isoformat(),
-                        "consecutive_days": len(consecutive_saturated),
-                        "message": f"⚠️ {len(consecutive_saturated)} consecutive high-workload days detected. Consider redistributing deadlines to prevent burnout.",
-                        "severity": "high"
-                    })
-
-                consecutive_saturated = []
-
-        # Check final streak
-        if len(consecutive_saturated) >= self.BURNOUT_THRESHOLD_DAYS:
-            alerts.append({
+        window = self.BURNOUT_THRESHOLD_DAYS
+        n_rows, n_days = risk.shape
+        alerts = [[] for _ in range(n_rows)]
+        if n_days < window:
+            return alerts
+
+        saturated = (risk >= self.SATURATION_THRESHOLD).astype(np.int64)
+        running = np.concatenate([np.zeros((n_rows, 1), dtype=np.int64), saturated.cumsum(axis=1)], axis=1)
+        full = (running[:, window:] - running[:, :-window]) == window  # Window starting at each day
+
+        # Days covered by at least one full window
+        coverage = np.zeros((n_rows, n_days + 1), dtype=np.int64)
+        coverage[:, :n_days - window + 1] += full
+        coverage[:, window:] -= full
+        covered = coverage.cumsum(axis=1)[:, :n_days] > 0
+
+        edges = np.diff(np.pad(covered.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+        starts, ends = np.nonzero(edges == 1), np.nonzero(edges == -1)
+        for row, first, stop in zip(starts[0], starts[1], ends[1]):
+            consecutive_days = int(stop - first)
+            alerts[row].append({
                 "type": "burnout_risk",
-                "start_date": consecutive_saturated[0].isoformat(),
-                "end_date": consecutive_saturated[-1].isoformat(),
-                "consecutive_days": len(consecutive_saturated),
-                "message": f"⚠️ {len(consecutive_saturated)} consecutive high-workload days detected. Consider redistributing deadlines to prevent burnout.",
+                "start_date": (start + timedelta(days=int(first))).isoformat(),
+                "end_date": (start + timedelta(days=int(stop) - 1)).isoformat(),
+                "consecutive_days": consecutive_days,
+                "message": f"⚠️ {consecutive_days} consecutive high-workload days detected. Consider redistributing deadlines to prevent burnout.",
                 "severity": "high"
             })
 
@@ -250,7 +394,7 @@ class WorkloadOptimizer:
     async def _generate_rebalance_suggestion(
         self,
         risk_day: Dict,
-        daily_workload: Dict[date, List[Deadline]],
+        daily_workload: Tuple[date, np.ndarray, np.ndarray],
         db: Session
     ) -> Dict[str, Any]:
         """
@@ -287,12 +431,15 @@ class WorkloadOptimizer:
                 if check_date < date.today():
                     continue
 
-                items = daily_workload.get(check_date, [])
-                risk_score, _ = self._calculate_risk_score(items)
+                start, counts, risk = daily_workload
+                day = (check_date - start).days
+                if day >= len(counts):
+                    continue
+                risk_score = float(risk[day])
 
                 adjacent_days.append({
                     "date": check_date.isoformat(),
-                    "current_deadlines": len(items),
+                    "current_deadlines": int(counts[day]),
                     "risk_score": risk_score,
                     "available_capacity": max(0, self.SATURATION_THRESHOLD - risk_score)
                 })
@@ -379,12 +526,15 @@ Return JSON with:
 
     def _calculate_workload_statistics(
         self,
-        daily_workload: Dict[date, List[Deadline]],
+        counts: np.ndarray,
+        risk: np.ndarray,
+        start: date,
         days_ahead: int
     ) -> Dict[str, Any]:
         """Calculate aggregate workload statistics"""
 
-        if not daily_workload:
+        total_deadlines = int(counts.sum())
+        if not total_deadlines:
             return {
                 "average_deadlines_per_day": 0,
                 "peak_workload_day": None,
@@ -393,30 +543,31 @@ Return JSON with:
             }
 
         # Calculate averages
-        total_deadlines = sum(len(items) for items in daily_workload.values())
         avg_per_day = total_deadlines / days_ahead if days_ahead > 0 else 0
 
         # Find peak workload day
-        peak_day = max(daily_workload.items(), key=lambda x: len(x[1]))
-        peak_date, peak_deadlines = peak_day
-
-        # Count saturated days
-        saturated_count = sum(
-            1 for items in daily_workload.values()
-            if self._calculate_risk_score(items)[0] >= self.SATURATION_THRESHOLD
-        )
+        peak_day = int(counts.argmax())
 
         return {
             "average_deadlines_per_day": round(avg_per_day, 2),
             "peak_workload_day": {
-                "date": peak_date.isoformat(),
-                "deadline_count": len(peak_deadlines)
+                "date": (start + timedelta(days=peak_day)).isoformat(),
+                "deadline_count": int(counts[peak_day])
             },
-            "saturated_days_count": saturated_count,
+            "saturated_days_count": int((risk >= self.SATURATION_THRESHOLD).sum()),
             "total_deadlines": total_deadlines,
             "analysis_period_days": days_ahead
         }
 
 
+class _WorkloadColumns(NamedTuple):
+    """Pending deadlines of the analysis period, one array entry per deadline"""
+    day: np.ndarray  # Days after the period start
+    priority: np.ndarray  # Uppercased priority
+    moveable: np.ndarray  # See WorkloadOptimizer._moveable_expression
+    user: np.ndarray  # Index into user_ids
+    user_ids: List[str]
+
+
 # Singleton instance
 workload_optimizer = WorkloadOptimizer()
@@ -6,7 +6,7 @@ Used across API endpoints to implement case sharing security.
 """
 
 import logging
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.models.case import Case
@@ -218,6 +218,28 @@ def get_case_with_access_check(
     return (case, access.role)
 
 
+def get_accessible_case_ids(
+    db: Session,
+    user_id: str
+) -> List[str]:
+    """
+    Get the IDs of every case a user can read (owned or actively shared).
+
+    Args:
+        db: Database session
+        user_id: User's ID
+
+    Returns:
+        List of case IDs
+    """
+    owned = db.query(Case.id).filter(Case.user_id == user_id)
+    shared = db.query(CaseAccess.case_id).filter(
+        CaseAccess.user_id == user_id,
+        CaseAccess.is_active == True
+    )
+    return [str(case_id) for (case_id,) in owned.union(shared).all()]
+
+
 def get_shared_cases_for_user(
     db: Session,
     user_id: str
@@ -0,0 +1,289 @@
+"""
+Court Day Index - Precomputed business-day calendar for deadline math
+
+Stepping one day at a time and re-deriving the holiday list for every day is
+the dominant cost of court-day arithmetic. This module precomputes, per
+jurisdiction and per year, the sorted ordinals of every court (business) day
+plus prefix counts across years, so that:
+
+- add_court_days / subtract_court_days are a bisect plus an index offset
+- count_court_days_between is two bisects
+- is_business_day / next_business_day are a single bisect
+
+Years are built lazily the first time a date in them is touched and are kept
+for the life of the process (a year is ~250 ints).
+
+Usage:
+    index = get_court_day_index("state")
+    index.add_court_days(date(2025, 1, 15), 10)
+    index.count_court_days_between(date(2025, 1, 1), date(2025, 2, 1))
+"""
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, MINYEAR, MAXYEAR
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.utils.holiday_provider import get_holiday_provider
+
+logger = logging.getLogger(__name__)
+
+HolidayProvider = Callable[[int], Iterable[date]]
+
+
+class CourtDayIndex:
+    """
+    Sorted court-day ordinals for a contiguous range of years.
+
+    The index keeps a flat sorted list of ``date.toordinal()`` values for
+    every court day in ``[first_year, last_year]`` and a prefix-count map
+    giving the position of each year's first court day in that list. The
+    range grows (in either direction) on demand; all lookups are O(log n).
+
+    Thread-safe: readers work on an immutable snapshot, growth happens under
+    a lock and swaps the snapshot atomically.
+    """
+
+    def __init__(self, holiday_provider: HolidayProvider, name: str = "default"):
+        """
+        Args:
+            holiday_provider: Callable returning the court holidays for a year
+            name: Label used in logs/stats (usually the jurisdiction)
+        """
+        self.name = name
+        self._holiday_provider = holiday_provider
+        self._lock = threading.Lock()
+        self._holidays_by_year: Dict[int, FrozenSet[date]] = {}
+        self._days_by_year: Dict[int, List[int]] = {}
+        # Snapshot: (first_year, last_year, flat ordinals, year -> prefix count)
+        self._snapshot: Optional[Tuple[int, int, List[int], Dict[int, int]]] = None
+        # numpy view of the current snapshot's ordinals, built on demand
+        self._array: Optional[Tuple[List[int], np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    # Index construction
+    # ------------------------------------------------------------------
+
+    def _build_year(self, year: int) -> None:
+        """Compute the holidays and court-day ordinals for one year."""
+        holidays = frozenset(self._holiday_provider(year))
+        holiday_ordinals = {h.toordinal() for h in holidays}
+
+        start = date(year, 1, 1).toordinal()
+        end = date(year, 12, 31).toordinal()
+        # date.fromordinal(1) is a Monday, so (ordinal - 1) % 7 == weekday()
+        days = [
+            o for o in range(start, end + 1)
+            if (o - 1) % 7 < 5 and o not in holiday_ordinals
+        ]
+
+        self._holidays_by_year[year] = holidays
+        self._days_by_year[year] = days
+
+    def _ensure_years(self, first: int, last: int):
+        """Return a snapshot covering at least years ``first``..``last``."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] <= first and last <= snapshot[1]:
+            return snapshot
+
+        if first < MINYEAR or last > MAXYEAR:
+            raise OverflowError("date value out of range")
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                first = min(first, snapshot[0])
+                last = max(last, snapshot[1])
+                if snapshot[0] == first and snapshot[1] == last:
+                    return snapshot
+
+            for year in range(first, last + 1):
+                if year not in self._days_by_year:
+                    self._build_year(year)
+
+            ordinals: List[int] = []
+            prefix: Dict[int, int] = {}
+            for year in range(first, last + 1):
+                prefix[year] = len(ordinals)
+                ordinals.extend(self._days_by_year[year])
+
+            self._snapshot = (first, last, ordinals, prefix)
+            logger.debug(
+                f"CourtDayIndex[{self.name}] covers {first}-{last} "
+                f"({len(ordinals)} court days)"
+            )
+            return self._snapshot
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def holidays_for_year(self, year: int) -> FrozenSet[date]:
+        """Court holidays for a year (cached)."""
+        self._ensure_years(year, year)
+        return self._holidays_by_year[year]
+
+    def is_court_holiday(self, check_date: date) -> bool:
+        """True if the date is a court holiday (weekends are not holidays)."""
+        return check_date in self.holidays_for_year(check_date.year)
+
+    def is_business_day(self, check_date: date) -> bool:
+        """True if the date is neither a weekend nor a court holiday."""
+        _, _, ordinals, _ = self._ensure_years(check_date.year, check_date.year)
+        o = check_date.toordinal()
+        i = bisect_left(ordinals, o)
+        return i < len(ordinals) and ordinals[i] == o
+
+    def add_court_days(self, start_date: date, court_days: int) -> date:
+        """
+        Date that is ``court_days`` court days after ``start_date``.
+
+        The start date itself is never counted; adding 0 returns it unchanged.
+        """
+        if court_days < 0:
+            raise ValueError("court_days must be positive. Use subtract_court_days for negative.")
+        if court_days == 0:
+            return start_date
+
+        o = start_date.toordinal()
+        last = start_date.year
+        while True:
+            _, _, ordinals, _ = self._ensure_years(start_date.year, last)
+            target = bisect_right(ordinals, o) + court_days - 1
+            if target < len(ordinals):
+                return date.fromordinal(ordinals[target])
+            # ~250 court days per year - grow just far enough
+            last += (target - len(ordinals)) // 250 + 1
+
+    def subtract_court_days(self, start_date: date, court_days: int) -> date:
+        """Date that is ``court_days`` court days before ``start_date``."""
+        if court_days < 0:
+            raise ValueError("court_days must be positive")
+        if court_days == 0:
+            return start_date
+
+        o = start_date.toordinal()
+        first = start_date.year
+        while True:
+            _, _, ordinals, _ = self._ensure_years(first, start_date.year)
+            target = bisect_left(ordinals, o) - court_days
+            if target >= 0:
+                return date.fromordinal(ordinals[target])
+            first -= (-target) // 250 + 1
+
+    def next_business_day(self, start_date: date) -> date:
+        """First court day strictly after ``start_date``."""
+        return self.add_court_days(start_date, 1)
+
+    def adjust_to_business_day(self, target_date: date) -> date:
+        """``target_date`` if it is a court day, else the next court day."""
+        if self.is_business_day(target_date):
+            return target_date
+        return self.next_business_day(target_date)
+
+    def count_court_days_between(self, start_date: date, end_date: date) -> int:
+        """
+        Court days in ``(start_date, end_date]`` - exclusive of start,
+        inclusive of end. Returns 0 when start >= end.
+        """
+        if start_date >= end_date:
+            return 0
+        _, _, ordinals, _ = self._ensure_years(start_date.year, end_date.year)
+        return (
+            bisect_right(ordinals, end_date.toordinal())
+            - bisect_right(ordinals, start_date.toordinal())
+        )
+
+    def court_days_in_range(self, start_date: date, end_date: date) -> List[date]:
+        """All court days in ``[start_date, end_date]``, ascending."""
+        if start_date > end_date:
+            return []
+        _, _, ordinals, _ = self._ensure_years(start_date.year, end_date.year)
+        lo = bisect_left(ordinals, start_date.toordinal())
+        hi = bisect_right(ordinals, end_date.toordinal())
+        return [date.fromordinal(o) for o in ordinals[lo:hi]]
+
+    def ordinals_array(self, first_year: int, last_year: int) -> np.ndarray:
+        """
+        Sorted int64 array of court-day ordinals covering at least
+        ``first_year``..``last_year`` - the shared table for vectorized
+        (``numpy.searchsorted``) lookups. Do not mutate the result.
+        """
+        _, _, ordinals, _ = self._ensure_years(first_year, last_year)
+        cached = self._array
+        if cached is not None and cached[0] is ordinals:
+            return cached[1]
+        array = np.asarray(ordinals, dtype=np.int64)
+        array.setflags(write=False)
+        self._array = (ordinals, array)
+        return array
+
+    def clear(self) -> None:
+        """Drop all precomputed years (e.g. after a holiday table change)."""
+        with self._lock:
+            self._holidays_by_year.clear()
+            self._days_by_year.clear()
+            self._snapshot = None
+            self._array = None
+
+    def get_stats(self) -> Dict[str, object]:
+        """Coverage statistics for diagnostics."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"name": self.name, "years": None, "court_days": 0}
+        first, last, ordinals, _ = snapshot
+        return {"name": self.name, "years": f"{first}-{last}", "court_days": len(ordinals)}
+
+
+# ============================================================================
+# Shared per-jurisdiction indexes
+# ============================================================================
+
+_indexes: Dict[str, CourtDayIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def _normalize_jurisdiction(jurisdiction: str) -> str:
+    """Map calculator jurisdiction aliases onto index keys."""
+    normalized = (jurisdiction or "state").lower().strip()
+    if normalized in ("federal", "florida_federal"):
+        return "federal"
+    return "state"
+
+
+def _default_provider(key: str) -> HolidayProvider:
+    # Both Florida state and federal calculations currently observe the
+    # combined federal + Florida state holiday list.
+    provider = get_holiday_provider()
+    return lambda year: provider.holidays_for_year("florida_state", year)
+
+
+def get_court_day_index(jurisdiction: str = "state") -> CourtDayIndex:
+    """
+    Get the shared court-day index for a jurisdiction.
+
+    Accepts the same aliases as AuthoritativeDeadlineCalculator
+    ("state", "florida_state", "florida", "federal", "florida_federal").
+    """
+    key = _normalize_jurisdiction(jurisdiction)
+    index = _indexes.get(key)
+    if index is None:
+        with _registry_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = CourtDayIndex(_default_provider(key), name=key)
+                _indexes[key] = index
+    return index
+
+
+def reset_court_day_indexes() -> None:
+    """Clear every shared index so holidays are re-read on next use."""
+    with _registry_lock:
+        for index in _indexes.values():
+            index.clear()
+
+
+# Re-read holidays whenever the holiday table's overrides change
+get_holiday_provider().on_change(reset_court_day_indexes)
@@ -18,19 +18,15 @@ Every calculation returns:
 - Roll logic explanation if deadline adjusted
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from enum import Enum
 
-from app.utils.florida_holidays import (
-    is_business_day,
-    is_court_holiday,
-    get_all_court_holidays,
-    get_next_business_day,
-    add_court_days,
-    subtract_court_days
-)
+import numpy as np
+
+from app.utils.court_day_index import get_court_day_index
 from app.constants.legal_rules import (
     get_service_extension_days,
     get_rule_citation,
@@ -46,6 +42,10 @@ class CalculationMethod(Enum):
     BUSINESS_DAYS = "business_days"  # Alias for court_days
 
 
+# (trigger_date, base_days[, calculation_method[, service_method]])
+BatchItem = Tuple[Union[date, int, CalculationMethod, str], ...]
+
+
 @dataclass
 class RollAdjustment:
     """
@@ -297,6 +297,7 @@ class AuthoritativeDeadlineCalculator:
         """
         # Use override jurisdiction if provided
         juris = jurisdiction or self.jurisdiction
+        court_days = get_court_day_index(juris)
 
         # Normalize service method
         service_method_normalized = service_method.lower().strip()
@@ -315,11 +316,11 @@ class AuthoritativeDeadlineCalculator:
             intermediate_deadline = trigger_date + timedelta(days=total_days)
 
             # Check if roll adjustment needed
-            if is_business_day(intermediate_deadline):
+            if court_days.is_business_day(intermediate_deadline):
                 final_deadline = intermediate_deadline
                 roll_adjustment = None
             else:
-                final_deadline = get_next_business_day(intermediate_deadline)
+                final_deadline = court_days.next_business_day(intermediate_deadline)
                 roll_adjustment = self._create_roll_adjustment(
                     intermediate_deadline,
                     final_deadline,
@@ -328,11 +329,11 @@ class AuthoritativeDeadlineCalculator:
 
         else:  # COURT_DAYS / BUSINESS_DAYS
             # Court days: add business days, skipping weekends/holidays
-            intermediate_deadline = add_court_days(trigger_date, base_days)
+            intermediate_deadline = court_days.add_court_days(trigger_date, base_days)
 
             # Add service extension (also as court days)
             if service_extension > 0:
-                final_deadline = add_court_days(intermediate_deadline, service_extension)
+                final_deadline = court_days.add_court_days(intermediate_deadline, service_extension)
             else:
                 final_deadline = intermediate_deadline
 
@@ -370,7 +371,7 @@ class AuthoritativeDeadlineCalculator:
         """
         # Determine reason
         is_weekend = original_date.weekday() >= 5
-        is_holiday = is_court_holiday(original_date)
+        is_holiday = get_court_day_index(jurisdiction).is_court_holiday(original_date)
 
         if is_weekend and is_holiday:
             reason = "weekend_and_holiday"
@@ -425,7 +426,7 @@ class AuthoritativeDeadlineCalculator:
 
         # For floating holidays, we'd need more complex logic
         # For now, just return "Court Holiday"
-        if is_court_holiday(holiday_date):
+        if get_court_day_index(self.jurisdiction).is_court_holiday(holiday_date):
             return "Court Holiday"
 
         return None
@@ -434,7 +435,7 @@ class AuthoritativeDeadlineCalculator:
         self,
         trigger_date: date,
         deadline_specs: List[dict]
-    ) -> List[DeadlineCalculation]:
+    ) -> "DeadlineBatch":
         """
         Calculate multiple deadlines from a single trigger event
 
@@ -450,7 +451,8 @@ class AuthoritativeDeadlineCalculator:
                 - name: str (description)
 
         Returns:
-            List of DeadlineCalculation objects, one for each spec
+            DeadlineBatch of DeadlineCalculation objects, one for each spec
+            (each is built when first read - see calculate_deadlines_batch)
 
         Example:
             >>> specs = [
@@ -459,7 +461,7 @@ class AuthoritativeDeadlineCalculator:
             ... ]
             >>> results = calc.calculate_deadline_chain(date(2025, 1, 15), specs)
         """
-        results = []
+        items = []
 
         for spec in deadline_specs:
             # Parse calculation method
@@ -469,16 +471,238 @@ class AuthoritativeDeadlineCalculator:
             else:
                 calc_method = CalculationMethod.CALENDAR_DAYS
 
-            result = self.calculate_deadline(
-                trigger_date=trigger_date,
-                base_days=spec['base_days'],
-                service_method=spec.get('service_method', 'electronic'),
-                calculation_method=calc_method
+            items.append((
+                trigger_date,
+                spec['base_days'],
+                calc_method,
+                spec.get('service_method', 'electronic')
+            ))
+
+        return self.calculate_deadlines_batch(items)
+
+    def calculate_deadlines_batch(
+        self,
+        items: Iterable[BatchItem],
+        jurisdiction: Optional[str] = None
+    ) -> "DeadlineBatch":
+        """
+        Calculate many deadlines in one vectorized pass
+
+        Each item is a ``(trigger_date, base_days, calculation_method,
+        service_method)`` tuple - the same inputs as calculate_deadline(), so
+        mixed triggers (e.g. every case's trial date during a bulk
+        recalculation) can go through a single call. Trailing elements may be
+        omitted and default to CALENDAR_DAYS / "electronic".
+
+        All final dates are resolved with numpy.searchsorted against the
+        shared court-day table. The returned DeadlineBatch is a sequence of
+        DeadlineCalculation objects, but each object (roll adjustment,
+        holiday name, calculation_basis text) is only built when read.
+        Callers that only need dates should use ``batch.final_deadlines``.
+
+        Results are identical to calling calculate_deadline() per item.
+
+        Args:
+            items: Iterable of (trigger_date, base_days, calculation_method, service_method)
+            jurisdiction: Override default jurisdiction for the whole batch
+
+        Returns:
+            DeadlineBatch, indexable and iterable like a list
+
+        Example:
+            >>> batch = calc.calculate_deadlines_batch([
+            ...     (date(2025, 1, 15), 20, CalculationMethod.CALENDAR_DAYS, "mail"),
+            ...     (date(2025, 3, 3), 10, "court_days", "electronic"),
+            ... ])
+            >>> batch.final_deadlines
+            [datetime.date(2025, 2, 10), datetime.date(2025, 3, 17)]
+            >>> batch[0].calculation_basis
+            [Complete step-by-step breakdown]
+        """
+        juris = jurisdiction or self.jurisdiction
+
+        trigger_dates: List[date] = []
+        base_days: List[int] = []
+        methods: List[CalculationMethod] = []
+        service_methods: List[str] = []
+        extensions: List[int] = []
+        extension_cache: Dict[str, int] = {}
+
+        for item in items:
+            trigger_date = item[0]
+            days = item[1]
+            method = item[2] if len(item) > 2 and item[2] is not None else CalculationMethod.CALENDAR_DAYS
+            service_method = item[3] if len(item) > 3 and item[3] else "electronic"
+
+            if not isinstance(method, CalculationMethod):
+                method = CalculationMethod(str(method).lower().strip())
+            service_method = service_method.lower().strip()
+
+            if service_method not in extension_cache:
+                try:
+                    extension_cache[service_method] = get_service_extension_days(juris, service_method)
+                except ValueError:
+                    # Unknown service method - same fallback as calculate_deadline
+                    extension_cache[service_method] = 0
+
+            trigger_dates.append(trigger_date)
+            base_days.append(days)
+            methods.append(method)
+            service_methods.append(service_method)
+            extensions.append(extension_cache[service_method])
+
+        if not trigger_dates:
+            return DeadlineBatch(
+                self, juris, [], [], [], [], [], np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=bool)
+            )
+
+        trigger = np.fromiter((d.toordinal() for d in trigger_dates), dtype=np.int64, count=len(trigger_dates))
+        days = np.asarray(base_days, dtype=np.int64)
+        extension = np.asarray(extensions, dtype=np.int64)
+        court = np.fromiter(
+            (m is not CalculationMethod.CALENDAR_DAYS for m in methods),
+            dtype=bool,
+            count=len(methods)
+        )
+
+        if (days[court] < 0).any():
+            raise ValueError("court_days must be positive. Use subtract_court_days for negative.")
+
+        # Calendar days: trigger + base + extension, rolled forward to a court day
+        calendar_target = trigger + days + extension
+
+        index = get_court_day_index(juris)
+        first_year = date.fromordinal(int(min(trigger.min(), calendar_target.min()))).year
+        last_year = date.fromordinal(int(max(trigger.max(), calendar_target.max()))).year
+        # ~250 court days per year
+        last_year += int(np.where(court, days + extension, 0).max()) // 250 + 1
+
+        while True:
+            table = index.ordinals_array(first_year, last_year)
+            size = len(table)
+
+            calendar_pos = np.searchsorted(table, calendar_target, side="left")
+
+            # Court days: add base days, then the service extension, both as court days
+            base_pos = np.searchsorted(table, trigger, side="right") + days - 1
+            needs_base = court & (days > 0)
+            court_intermediate = np.where(needs_base, table[np.clip(base_pos, 0, size - 1)], trigger)
+            extension_pos = np.searchsorted(table, court_intermediate, side="right") + extension - 1
+            needs_extension = court & (extension > 0)
+
+            overflow = (
+                ((~court) & (calendar_pos >= size)).any()
+                or (needs_base & (base_pos >= size)).any()
+                or (needs_extension & (extension_pos >= size)).any()
             )
+            if not overflow:
+                break
+            last_year += 1
+
+        calendar_final = table[np.clip(calendar_pos, 0, size - 1)]
+        court_final = np.where(needs_extension, table[np.clip(extension_pos, 0, size - 1)], court_intermediate)
+
+        intermediate = np.where(court, court_intermediate, calendar_target)
+        final = np.where(court, court_final, calendar_final)
+
+        return DeadlineBatch(
+            self, juris, trigger_dates, base_days, methods, service_methods, extensions,
+            intermediate, final, court
+        )
 
-            results.append(result)
 
-        return results
+class DeadlineBatch(Sequence):
+    """
+    Lazily materialized results of AuthoritativeDeadlineCalculator.calculate_deadlines_batch
+
+    Final dates are computed up front as integer ordinals. The full
+    DeadlineCalculation (roll adjustment, holiday lookup and the verbose
+    calculation_basis audit trail) is only built when an item is read, and is
+    then cached.
+    """
+
+    def __init__(
+        self,
+        calculator: AuthoritativeDeadlineCalculator,
+        jurisdiction: str,
+        trigger_dates: List[date],
+        base_days: List[int],
+        methods: List[CalculationMethod],
+        service_methods: List[str],
+        extensions: List[int],
+        intermediate_ordinals: np.ndarray,
+        final_ordinals: np.ndarray,
+        court_mask: np.ndarray
+    ):
+        self._calculator = calculator
+        self.jurisdiction = jurisdiction
+        self._trigger_dates = trigger_dates
+        self._base_days = base_days
+        self._methods = methods
+        self._service_methods = service_methods
+        self._extensions = extensions
+        self._intermediate = intermediate_ordinals
+        self._final = final_ordinals
+        self._court = court_mask
+        self._final_dates: Optional[List[date]] = None
+        self._materialized: Dict[int, DeadlineCalculation] = {}
+
+    def __len__(self) -> int:
+        return len(self._trigger_dates)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("DeadlineBatch index out of range")
+
+        result = self._materialized.get(i)
+        if result is None:
+            result = self._materialize(i)
+            self._materialized[i] = result
+        return result
+
+    @property
+    def final_deadlines(self) -> List[date]:
+        """Final deadline dates in input order, without building calculations"""
+        if self._final_dates is None:
+            self._final_dates = [date.fromordinal(o) for o in self._final.tolist()]
+        return self._final_dates
+
+    @property
+    def rolled(self) -> List[bool]:
+        """True where a calendar-day deadline was rolled off a weekend/holiday"""
+        # Court-day items differ from their intermediate date by the service
+        # extension, not by a roll
+        return ((self._intermediate != self._final) & ~self._court).tolist()
+
+    def _materialize(self, i: int) -> DeadlineCalculation:
+        method = self._methods[i]
+        final_deadline = self.final_deadlines[i]
+
+        roll_adjustment = None
+        if method == CalculationMethod.CALENDAR_DAYS:
+            intermediate_ordinal = int(self._intermediate[i])
+            if intermediate_ordinal != int(self._final[i]):
+                roll_adjustment = self._calculator._create_roll_adjustment(
+                    date.fromordinal(intermediate_ordinal),
+                    final_deadline,
+                    self.jurisdiction
+                )
+
+        return DeadlineCalculation(
+            final_deadline=final_deadline,
+            trigger_date=self._trigger_dates[i],
+            base_days=self._base_days[i],
+            calculation_method=method,
+            jurisdiction=self.jurisdiction,
+            service_method=self._service_methods[i],
+            service_extension_days=self._extensions[i],
+            roll_adjustment=roll_adjustment
+        )
 
 
 # Convenience functions for common use cases
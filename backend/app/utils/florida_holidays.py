@@ -5,6 +5,9 @@ Updated calendar for accurate deadline calculations
 from datetime import date
 from typing import List
 
+from app.utils.court_day_index import get_court_day_index
+from app.utils.holiday_provider import get_holiday_provider
+
 
 def get_federal_holidays(year: int) -> List[date]:
     """
@@ -22,61 +25,12 @@ def get_federal_holidays(year: int) -> List[date]:
     - Veterans Day (November 11)
     - Thanksgiving (4th Thursday in November)
     - Christmas Day (December 25)
-    """
-
-    from datetime import datetime
-
-    holidays = []
-
-    # New Year's Day (January 1)
-    holidays.append(date(year, 1, 1))
-
-    # Martin Luther King Jr. Day (3rd Monday in January)
-    holidays.append(get_nth_weekday(year, 1, 0, 3))  # 0=Monday, 3rd occurrence
-
-    # Presidents' Day (3rd Monday in February)
-    holidays.append(get_nth_weekday(year, 2, 0, 3))
-
-    # Memorial Day (last Monday in May)
-    holidays.append(get_last_weekday(year, 5, 0))  # Last Monday in May
-
-    # Juneteenth (June 19) - Added as federal holiday in 2021
-    if year >= 2021:
-        holidays.append(date(year, 6, 19))
-
-    # Independence Day (July 4)
-    holidays.append(date(year, 7, 4))
-
-    # Labor Day (1st Monday in September)
-    holidays.append(get_nth_weekday(year, 9, 0, 1))
 
-    # Columbus Day (2nd Monday in October) - Federal courts observe
-    holidays.append(get_nth_weekday(year, 10, 0, 2))
-
-    # Veterans Day (November 11)
-    holidays.append(date(year, 11, 11))
-
-    # Thanksgiving (4th Thursday in November)
-    holidays.append(get_nth_weekday(year, 11, 3, 4))  # 3=Thursday, 4th occurrence
-
-    # Christmas Day (December 25)
-    holidays.append(date(year, 12, 25))
-
-    # If holiday falls on weekend, observe on adjacent weekday
-    # CRITICAL: Use timedelta to avoid month boundary crashes (Jan 1, Dec 31, etc.)
-    from datetime import timedelta
-    adjusted_holidays = []
-    for holiday in holidays:
-        if holiday.weekday() == 5:  # Saturday -> observe on Friday
-            adjusted = holiday - timedelta(days=1)
-            adjusted_holidays.append(adjusted)
-        elif holiday.weekday() == 6:  # Sunday -> observe on Monday
-            adjusted = holiday + timedelta(days=1)
-            adjusted_holidays.append(adjusted)
-        else:
-            adjusted_holidays.append(holiday)
-
-    return adjusted_holidays
+    Weekend holidays are observed on the adjacent weekday. Dates come from
+    the precomputed holiday table (including court_holidays overrides); an
+    observed date that falls in the neighbouring year belongs to that year.
+    """
+    return sorted(get_holiday_provider().holidays_for_year("federal", year))
 
 
 def get_florida_state_holidays(year: int) -> List[date]:
@@ -87,54 +41,31 @@ def get_florida_state_holidays(year: int) -> List[date]:
     - Good Friday (Friday before Easter)
     - Day after Thanksgiving (sometimes)
     """
-
-    holidays = []
-
-    # Good Friday (calculate Easter, then subtract 2 days)
-    easter = calculate_easter(year)
-    from datetime import timedelta
-    good_friday = easter - timedelta(days=2)
-    holidays.append(good_friday)
-
-    # Day after Thanksgiving (4th Thursday in November + 1 day)
-    thanksgiving = get_nth_weekday(year, 11, 3, 4)
-    from datetime import timedelta
-    day_after_thanksgiving = thanksgiving + timedelta(days=1)
-    holidays.append(day_after_thanksgiving)
-
-    return holidays
+    provider = get_holiday_provider()
+    return sorted(
+        provider.holidays_for_year("florida_state", year)
+        - provider.holidays_for_year("federal", year)
+    )
 
 
 def get_all_court_holidays(year: int) -> List[date]:
     """Get all holidays when Florida courts are closed (federal + state)"""
-    federal = get_federal_holidays(year)
-    state = get_florida_state_holidays(year)
-    all_holidays = list(set(federal + state))  # Remove duplicates
-    return sorted(all_holidays)
+    return sorted(get_holiday_provider().holidays_for_year("florida_state", year))
 
 
 def is_court_holiday(check_date: date) -> bool:
     """Check if a specific date is a court holiday"""
-    holidays = get_all_court_holidays(check_date.year)
-    return check_date in holidays
+    return get_court_day_index().is_court_holiday(check_date)
 
 
 def is_business_day(check_date: date) -> bool:
     """Check if a date is a business day (not weekend or holiday)"""
-    if check_date.weekday() >= 5:  # Saturday or Sunday
-        return False
-    if is_court_holiday(check_date):
-        return False
-    return True
+    return get_court_day_index().is_business_day(check_date)
 
 
 def get_next_business_day(start_date: date) -> date:
     """Get the next business day after the given date"""
-    from datetime import timedelta
-    current = start_date + timedelta(days=1)
-    while not is_business_day(current):
-        current += timedelta(days=1)
-    return current
+    return get_court_day_index().next_business_day(start_date)
 
 
 def adjust_to_business_day(target_date: date) -> date:
@@ -145,9 +76,7 @@ def adjust_to_business_day(target_date: date) -> date:
     'When a deadline falls on a weekend or legal holiday,
     it is extended to the next business day.'
     """
-    if is_business_day(target_date):
-        return target_date
-    return get_next_business_day(target_date)
+    return get_court_day_index().adjust_to_business_day(target_date)
 
 
 def add_court_days(start_date: date, court_days: int) -> date:
@@ -170,20 +99,7 @@ def add_court_days(start_date: date, court_days: int) -> date:
 
     Note: Florida Rule 2.514 - Court days exclude weekends and legal holidays
     """
-    from datetime import timedelta
-
-    if court_days < 0:
-        raise ValueError("court_days must be positive. Use subtract_court_days for negative.")
-
-    current = start_date
-    days_added = 0
-
-    while days_added < court_days:
-        current += timedelta(days=1)
-        if is_business_day(current):
-            days_added += 1
-
-    return current
+    return get_court_day_index().add_court_days(start_date, court_days)
 
 
 def subtract_court_days(start_date: date, court_days: int) -> date:
@@ -203,20 +119,7 @@ def subtract_court_days(start_date: date, court_days: int) -> date:
     Returns:
         Date that is court_days business days before start_date
     """
-    from datetime import timedelta
-
-    if court_days < 0:
-        raise ValueError("court_days must be positive")
-
-    current = start_date
-    days_subtracted = 0
-
-    while days_subtracted < court_days:
-        current -= timedelta(days=1)
-        if is_business_day(current):
-            days_subtracted += 1
-
-    return current
+    return get_court_day_index().subtract_court_days(start_date, court_days)
 
 
 def count_court_days_between(start_date: date, end_date: date) -> int:
@@ -232,20 +135,7 @@ def count_court_days_between(start_date: date, end_date: date) -> int:
     Returns:
         Number of business days between the dates (exclusive of start, inclusive of end)
     """
-    from datetime import timedelta
-
-    if start_date >= end_date:
-        return 0
-
-    current = start_date
-    court_days = 0
-
-    while current < end_date:
-        current += timedelta(days=1)
-        if is_business_day(current):
-            court_days += 1
-
-    return court_days
+    return get_court_day_index().count_court_days_between(start_date, end_date)
 
 
 def add_calendar_days_with_service_extension(
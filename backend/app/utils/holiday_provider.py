@@ -0,0 +1,467 @@
+"""
+Holiday Provider - Single source of truth for court holidays
+
+Every court holiday from 1990 through 2100 is generated in one vectorized
+(numpy) pass for each built-in calendar:
+
+- "federal":        federal court holidays (weekend-observed)
+- "florida_state":  federal holidays + Florida state closures (Good Friday,
+                    day after Thanksgiving)
+
+Each calendar is a bitmap over day ordinals (1 bit per day, ~5 KB per
+calendar). The packed bitmaps are written to a small binary cache file and
+memory-loaded on later starts, which takes microseconds instead of
+regenerating the tables.
+
+Rows in the court_holidays table are layered on top as overrides:
+court_closed=True adds a closure, court_closed=False re-opens a computed
+holiday. Florida state and federal jurisdiction ids resolve to the matching
+built-in calendar, so their overrides apply there; any other jurisdiction
+gets its own calendar (federal holidays + its overrides) keyed by
+jurisdiction id.
+
+Usage:
+    provider = get_holiday_provider()
+    provider.is_holiday("florida_state", date(2025, 11, 28))
+    provider.holidays_for_year("federal", 2026)
+    provider.load_overrides(db)   # at startup / after court_holidays changes
+"""
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from datetime import date
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FIRST_YEAR = 1990
+LAST_YEAR = 2100
+
+# Bump when the holiday rules below change so stale cache files are rebuilt
+RULES_VERSION = 1
+
+BUILTIN_CALENDARS = ("federal", "florida_state")
+
+_CALENDAR_ALIASES = {
+    "federal": "federal",
+    "florida_federal": "federal",
+    "florida_state": "florida_state",
+    "florida": "florida_state",
+    "state": "florida_state",
+}
+
+_CACHE_MAGIC = b"LDHOLBIN"
+_EPOCH_ORDINAL = date(FIRST_YEAR, 1, 1).toordinal()
+_N_DAYS = date(LAST_YEAR, 12, 31).toordinal() - _EPOCH_ORDINAL + 1
+
+# numpy datetime64[D] counts days from 1970-01-01
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def default_cache_path() -> str:
+    """Cache file location (HOLIDAY_CACHE_PATH overrides the temp-dir default)."""
+    return os.getenv(
+        "HOLIDAY_CACHE_PATH",
+        os.path.join(tempfile.gettempdir(), f"litdocket_court_holidays_v{RULES_VERSION}.bin")
+    )
+
+
+# =============================================================================
+# VECTORIZED GENERATION
+# =============================================================================
+
+def _ymd(years: np.ndarray, month: int, day: int) -> np.ndarray:
+    """datetime64[D] array of (year, month, day) for every year"""
+    months = (years - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)
+    return months.astype("datetime64[D]") + (day - 1)
+
+
+def _weekday(days: np.ndarray) -> np.ndarray:
+    """Monday=0 ... Sunday=6 (1970-01-01 was a Thursday)"""
+    return (days.astype(np.int64) + 3) % 7
+
+
+def _nth_weekday(years: np.ndarray, month: int, weekday: int, n: int) -> np.ndarray:
+    first = _ymd(years, month, 1)
+    return first + (weekday - _weekday(first)) % 7 + 7 * (n - 1)
+
+
+def _last_weekday(years: np.ndarray, month: int, weekday: int) -> np.ndarray:
+    last = _ymd(years, month + 1, 1) - 1 if month < 12 else _ymd(years + 1, 1, 1) - 1
+    return last - (_weekday(last) - weekday) % 7
+
+
+def _easter(years: np.ndarray) -> np.ndarray:
+    """Easter Sunday (Gregorian computus), vectorized"""
+    a = years % 19
+    b = years // 100
+    c = years % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    months = (years - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)
+    return months.astype("datetime64[D]") + (day - 1)
+
+
+def _observed(days: np.ndarray) -> np.ndarray:
+    """Saturday holidays are observed Friday, Sunday holidays Monday"""
+    weekday = _weekday(days)
+    return days + np.where(weekday == 5, -1, np.where(weekday == 6, 1, 0))
+
+
+def generate_calendars(first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR) -> Dict[str, np.ndarray]:
+    """
+    Generate the holiday dates of every built-in calendar.
+
+    Returns:
+        Calendar name -> sorted unique int64 array of date ordinals
+    """
+    years = np.arange(first_year, last_year + 1, dtype=np.int64)
+
+    federal = [
+        _ymd(years, 1, 1),                    # New Year's Day
+        _nth_weekday(years, 1, 0, 3),         # Martin Luther King Jr. Day
+        _nth_weekday(years, 2, 0, 3),         # Presidents' Day
+        _last_weekday(years, 5, 0),           # Memorial Day
+        _ymd(years[years >= 2021], 6, 19),    # Juneteenth (since 2021)
+        _ymd(years, 7, 4),                    # Independence Day
+        _nth_weekday(years, 9, 0, 1),         # Labor Day
+        _nth_weekday(years, 10, 0, 2),        # Columbus Day
+        _ymd(years, 11, 11),                  # Veterans Day
+        _nth_weekday(years, 11, 3, 4),        # Thanksgiving
+        _ymd(years, 12, 25),                  # Christmas Day
+    ]
+    federal_days = _observed(np.concatenate(federal))
+
+    florida_extra = np.concatenate([
+        _easter(years) - 2,                   # Good Friday
+        _nth_weekday(years, 11, 3, 4) + 1,    # Day after Thanksgiving
+    ])
+
+    def to_ordinals(days: np.ndarray) -> np.ndarray:
+        return np.unique(days.astype(np.int64) + _UNIX_EPOCH_ORDINAL)
+
+    return {
+        "federal": to_ordinals(federal_days),
+        "florida_state": to_ordinals(np.concatenate([federal_days, florida_extra])),
+    }
+
+
+def _to_bitmap(ordinals: np.ndarray) -> np.ndarray:
+    bitmap = np.zeros(_N_DAYS, dtype=bool)
+    offsets = ordinals - _EPOCH_ORDINAL
+    bitmap[offsets[(offsets >= 0) & (offsets < _N_DAYS)]] = True
+    return bitmap
+
+
+# =============================================================================
+# BINARY CACHE
+# =============================================================================
+
+def write_cache(path: str, bitmaps: Dict[str, np.ndarray]) -> None:
+    """Write packed bitmaps: magic, header length, JSON header, packed bits."""
+    keys = list(bitmaps)
+    packed = [np.packbits(bitmaps[key]) for key in keys]
+    header = json.dumps({
+        "version": RULES_VERSION,
+        "first_year": FIRST_YEAR,
+        "last_year": LAST_YEAR,
+        "n_days": _N_DAYS,
+        "keys": keys,
+        "n_bytes": int(packed[0].size),
+    }).encode("utf-8")
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_CACHE_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for bits in packed:
+            f.write(bits.tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_cache(path: str) -> Optional[Dict[str, np.ndarray]]:
+    """Load packed bitmaps; None if missing, corrupt or from other rules."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        if data[:8] != _CACHE_MAGIC:
+            return None
+        (header_len,) = struct.unpack_from("<I", data, 8)
+        header = json.loads(data[12:12 + header_len])
+        if (
+            header["version"] != RULES_VERSION
+            or header["first_year"] != FIRST_YEAR
+            or header["last_year"] != LAST_YEAR
+            or header["n_days"] != _N_DAYS
+        ):
+            return None
+        n_bytes = header["n_bytes"]
+        packed = np.frombuffer(data, dtype=np.uint8, offset=12 + header_len)
+        packed = packed.reshape(len(header["keys"]), n_bytes)
+        return {
+            key: np.unpackbits(packed[i], count=_N_DAYS).astype(bool)
+            for i, key in enumerate(header["keys"])
+        }
+    except (ValueError, KeyError, struct.error):
+        return None
+
+
+# =============================================================================
+# PROVIDER
+# =============================================================================
+
+class HolidayProvider:
+    """
+    Precomputed court holiday calendars with database overrides.
+
+    Thread-safe: calendars are immutable bitmaps swapped atomically.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self._cache_path = cache_path or default_cache_path()
+        self._lock = threading.Lock()
+        self._base: Optional[Dict[str, np.ndarray]] = None
+        self._calendars: Dict[str, np.ndarray] = {}
+        # calendar -> {date: court_closed}
+        self._overrides: Dict[str, Dict[date, bool]] = {}
+        # jurisdiction id -> built-in calendar it maps onto
+        self._jurisdiction_calendars: Dict[str, str] = {}
+        self._by_year: Dict[Tuple[str, int], FrozenSet[date]] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self._stats = {"source": None, "load_ms": 0.0, "override_rows": 0}
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _ensure_base(self) -> Dict[str, np.ndarray]:
+        base = self._base
+        if base is not None:
+            return base
+
+        with self._lock:
+            if self._base is not None:
+                return self._base
+
+            started = time.perf_counter()
+            base = read_cache(self._cache_path)
+            source = "cache"
+            if base is None or set(base) != set(BUILTIN_CALENDARS):
+                base = {key: _to_bitmap(ordinals) for key, ordinals in generate_calendars().items()}
+                source = "generated"
+                try:
+                    write_cache(self._cache_path, base)
+                except OSError as e:
+                    logger.debug(f"Could not write holiday cache {self._cache_path}: {e}")
+
+            for bitmap in base.values():
+                bitmap.setflags(write=False)
+            self._base = base
+            self._calendars = self._apply_overrides(base, self._overrides)
+            self._stats["source"] = source
+            self._stats["load_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            logger.info(
+                f"Court holidays {FIRST_YEAR}-{LAST_YEAR} {source} in {self._stats['load_ms']}ms"
+            )
+            return base
+
+    @staticmethod
+    def _apply_overrides(
+        base: Dict[str, np.ndarray],
+        overrides: Dict[str, Dict[date, bool]]
+    ) -> Dict[str, np.ndarray]:
+        calendars = dict(base)
+        for key, dates in overrides.items():
+            bitmap = base.get(key, base["federal"]).copy()
+            for day, closed in dates.items():
+                offset = day.toordinal() - _EPOCH_ORDINAL
+                if 0 <= offset < _N_DAYS:
+                    bitmap[offset] = closed
+            bitmap.setflags(write=False)
+            calendars[key] = bitmap
+        return calendars
+
+    def load_overrides(self, db) -> int:
+        """
+        (Re)load court_holidays rows and apply them to the calendars.
+
+        Call at startup and after court_holidays changes.
+
+        Returns:
+            Number of override rows applied
+        """
+        from app.models.court_holiday import CourtHoliday
+        from app.models.jurisdiction import Jurisdiction
+
+        rows = db.query(
+            CourtHoliday.jurisdiction_id,
+            CourtHoliday.holiday_date,
+            CourtHoliday.court_closed,
+            Jurisdiction.code,
+            Jurisdiction.jurisdiction_type,
+        ).outerjoin(Jurisdiction, Jurisdiction.id == CourtHoliday.jurisdiction_id).all()
+
+        jurisdiction_calendars: Dict[str, str] = {}
+        for jurisdiction_id, code, jurisdiction_type in db.query(
+            Jurisdiction.id, Jurisdiction.code, Jurisdiction.jurisdiction_type
+        ).all():
+            builtin = _builtin_for_jurisdiction(code, jurisdiction_type)
+            if builtin:
+                jurisdiction_calendars[str(jurisdiction_id)] = builtin
+
+        overrides: Dict[str, Dict[date, bool]] = {}
+        for jurisdiction_id, holiday_date, court_closed, code, jurisdiction_type in rows:
+            closed = court_closed is not False
+            key = jurisdiction_calendars.get(str(jurisdiction_id), str(jurisdiction_id))
+            overrides.setdefault(key, {})[holiday_date] = closed
+
+        self.set_overrides(overrides, jurisdiction_calendars)
+        self._stats["override_rows"] = len(rows)
+        return len(rows)
+
+    def set_overrides(
+        self,
+        overrides: Dict[str, Dict[date, bool]],
+        jurisdiction_calendars: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Replace all overrides (calendar -> {date: court_closed}).
+
+        ``jurisdiction_calendars`` (jurisdiction id -> built-in calendar), when
+        given, replaces the jurisdiction ids resolved onto built-in calendars.
+        """
+        base = self._ensure_base()
+        with self._lock:
+            self._overrides = {key: dict(dates) for key, dates in overrides.items()}
+            if jurisdiction_calendars is not None:
+                self._jurisdiction_calendars = dict(jurisdiction_calendars)
+            self._calendars = self._apply_overrides(base, self._overrides)
+            self._by_year = {}
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    def on_change(self, listener: Callable[[], None]) -> None:
+        """Register a callback run whenever the calendars change."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def resolve(self, calendar: Optional[str]) -> Optional[str]:
+        """Canonical calendar key for a name, alias or jurisdiction id (None if unknown)."""
+        self._ensure_base()
+        if not calendar:
+            return None
+        key = _CALENDAR_ALIASES.get(calendar.lower().strip(), calendar)
+        key = self._jurisdiction_calendars.get(key, key)
+        return key if key in self._calendars else None
+
+    def jurisdiction_calendar(self, jurisdiction_id: Optional[str]) -> Optional[str]:
+        """Calendar key for a jurisdiction id (None if it has no holiday calendar)."""
+        self._ensure_base()
+        if not jurisdiction_id:
+            return None
+        key = self._jurisdiction_calendars.get(jurisdiction_id)
+        if key is None and jurisdiction_id in self._overrides and jurisdiction_id not in BUILTIN_CALENDARS:
+            key = jurisdiction_id
+        return key
+
+    def _bitmap(self, calendar: str) -> np.ndarray:
+        key = self.resolve(calendar)
+        if key is None:
+            raise KeyError(f"Unknown holiday calendar: {calendar}")
+        return self._calendars[key]
+
+    def is_holiday(self, calendar: str, check_date: date) -> bool:
+        """True if the court is closed for a holiday on ``check_date``."""
+        offset = check_date.toordinal() - _EPOCH_ORDINAL
+        if 0 <= offset < _N_DAYS:
+            return bool(self._bitmap(calendar)[offset])
+        return check_date in self.holidays_for_year(calendar, check_date.year)
+
+    def holidays_for_year(self, calendar: str, year: int) -> FrozenSet[date]:
+        """All holidays of a calendar in a year (computed on the fly outside 1990-2100)."""
+        key = self.resolve(calendar)
+        if key is None:
+            raise KeyError(f"Unknown holiday calendar: {calendar}")
+
+        cached = self._by_year.get((key, year))
+        if cached is not None:
+            return cached
+
+        if FIRST_YEAR <= year <= LAST_YEAR:
+            start = date(year, 1, 1).toordinal() - _EPOCH_ORDINAL
+            end = date(year, 12, 31).toordinal() - _EPOCH_ORDINAL + 1
+            offsets = np.flatnonzero(self._calendars[key][start:end]) + start + _EPOCH_ORDINAL
+            holidays = frozenset(date.fromordinal(int(o)) for o in offsets)
+        else:
+            base_key = key if key in BUILTIN_CALENDARS else "federal"
+            # Neighbouring years too: their observed dates can fall in this one
+            ordinals = generate_calendars(year - 1, year + 1)[base_key]
+            days = {date.fromordinal(int(o)) for o in ordinals}
+            for day, closed in self._overrides.get(key, {}).items():
+                if day.year == year:
+                    (days.add if closed else days.discard)(day)
+            holidays = frozenset(d for d in days if d.year == year)
+
+        self._by_year[(key, year)] = holidays
+        return holidays
+
+    def holidays_in_range(self, calendar: str, start_date: date, end_date: date) -> List[date]:
+        """Sorted holidays in ``[start_date, end_date]``."""
+        holidays: List[date] = []
+        for year in range(start_date.year, end_date.year + 1):
+            holidays.extend(h for h in self.holidays_for_year(calendar, year) if start_date <= h <= end_date)
+        return sorted(holidays)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Provider statistics for diagnostics."""
+        self._ensure_base()
+        return {
+            "years": f"{FIRST_YEAR}-{LAST_YEAR}",
+            "calendars": sorted(self._calendars),
+            "cache_path": self._cache_path,
+            **self._stats,
+        }
+
+
+def _builtin_for_jurisdiction(code: Optional[str], jurisdiction_type) -> Optional[str]:
+    """Built-in calendar a Jurisdiction row maps onto, if any."""
+    type_value = getattr(jurisdiction_type, "value", jurisdiction_type)
+    if type_value == "federal":
+        return "federal"
+    if (code or "").upper() == "FL":
+        return "florida_state"
+    return None
+
+
+# Global singleton instance
+holiday_provider = HolidayProvider()
+
+
+def get_holiday_provider() -> HolidayProvider:
+    """Get the global holiday provider instance."""
+    return holiday_provider
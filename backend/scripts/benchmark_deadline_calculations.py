@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Benchmark Deadline Calculation Hot Paths
+
+Times the code paths every trigger request runs through and compares them
+against a stored baseline so slowdowns are caught before deploy:
+
+- add_court_days:           florida_holidays.add_court_days (20 and 250 court days)
+- service_extension:        add_calendar_days_with_service_extension (mail, 20 days)
+- calculate_deadline:       AuthoritativeDeadlineCalculator.calculate_deadline
+- dependent_deadlines:      RulesEngine.calculate_dependent_deadlines (trial date template)
+- simulate_round_trip:      POST /api/v1/triggers/simulate through FastAPI against
+                            an in-memory SQLite database (no Authority Core rules,
+                            so the hardcoded fallback runs end to end)
+
+Usage:
+    python scripts/benchmark_deadline_calculations.py                  # print results
+    python scripts/benchmark_deadline_calculations.py --save-baseline  # write baseline JSON
+    python scripts/benchmark_deadline_calculations.py --check          # fail on regression
+
+--check exits 1 if any benchmark's median is more than --tolerance (default
+50%) slower than the baseline. Baselines are machine-specific: regenerate
+them on the machine that runs the check.
+
+Requires the same environment as the app (SECRET_KEY etc. via .env).
+"""
+
+import sys
+import os
+import argparse
+import json
+import platform
+import statistics
+import time
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, "scripts", "deadline_benchmark_baseline.json")
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+def time_callable(fn: Callable[[], object], repeat: int, min_time: float = 0.05) -> Dict[str, float]:
+    """
+    Median / min per-call time of ``fn`` in microseconds.
+
+    Each of ``repeat`` samples loops ``fn`` enough times to run for about
+    ``min_time`` seconds (calibrated once after a warm-up call).
+    """
+    fn()  # warm-up: first-use caches and indexes are not what we measure
+
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - started) / loops * 1_000_000)
+
+    return {
+        "median_us": round(statistics.median(samples), 3),
+        "min_us": round(min(samples), 3),
+        "loops": loops,
+    }
+
+
+# =============================================================================
+# BENCHMARK CASES
+# =============================================================================
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    """Name -> zero-argument callable for every benchmark."""
+    from app.utils.florida_holidays import add_court_days, add_calendar_days_with_service_extension
+    from app.utils.deadline_calculator import AuthoritativeDeadlineCalculator, CalculationMethod
+    from app.services.rules_engine import RulesEngine, TriggerType
+
+    calculator = AuthoritativeDeadlineCalculator(jurisdiction="state")
+    engine = RulesEngine()
+    trial_templates = engine.get_applicable_rules("florida_state", "civil", TriggerType.TRIAL_DATE)
+    if not trial_templates:
+        raise RuntimeError("No florida_state/civil trial_date template to benchmark")
+    trial_template = trial_templates[0]
+    case_context = {"case_number": "2025-CA-000123", "plaintiffs": ["Smith"], "defendants": ["Jones"]}
+
+    return {
+        "add_court_days_20": lambda: add_court_days(date(2025, 12, 15), 20),
+        "add_court_days_250": lambda: add_court_days(date(2025, 3, 3), 250),
+        "service_extension_mail": lambda: add_calendar_days_with_service_extension(
+            date(2025, 11, 20), 20, "mail", "state"
+        ),
+        "calculate_deadline_calendar": lambda: calculator.calculate_deadline(
+            date(2025, 12, 5), 20, "mail", CalculationMethod.CALENDAR_DAYS
+        ),
+        "calculate_deadline_court": lambda: calculator.calculate_deadline(
+            date(2025, 12, 5), 10, "electronic", CalculationMethod.COURT_DAYS
+        ),
+        "dependent_deadlines_trial": lambda: engine.calculate_dependent_deadlines(
+            date(2026, 6, 15), trial_template, "email", case_context
+        ),
+        "simulate_round_trip": _build_simulate_case(),
+    }
+
+
+def _build_simulate_case() -> Callable[[], object]:
+    """POST /triggers/simulate through the real router against in-memory SQLite."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.database import Base, get_db
+    from app.api.v1 import triggers
+    from app.models.case import Case
+    from app.models.user import User
+    from app.utils.auth import get_current_user
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    # Only the tables the simulate path reads (the full schema uses
+    # PostgreSQL-only column types)
+    for table in ("users", "jurisdictions", "cases", "authority_rules"):
+        Base.metadata.tables[table].create(engine)
+    Session = sessionmaker(bind=engine)
+
+    db = Session()
+    user = User(id="bench-user", email="bench@example.com", name="Benchmark")
+    case = Case(
+        id="bench-case",
+        user_id=user.id,
+        case_number="2025-CA-000123",
+        title="Smith v. Jones",
+        case_type="civil",
+        jurisdiction="florida_state",
+        parties=[
+            {"name": "Smith", "role": "Plaintiff"},
+            {"name": "Jones", "role": "Defendant"},
+        ],
+    )
+    db.add_all([user, case])
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def override_current_user():
+        session = Session()
+        try:
+            return session.get(User, "bench-user")
+        finally:
+            session.close()
+
+    app = FastAPI()
+    app.include_router(triggers.router, prefix="/api/v1/triggers")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_current_user
+    client = TestClient(app)
+
+    payload = {
+        "trigger_type": "trial_date",
+        "trigger_date": "2026-06-15",
+        "case_id": "bench-case",
+        "service_method": "email",
+    }
+
+    def simulate():
+        response = client.post("/api/v1/triggers/simulate", json=payload)
+        if response.status_code != 200 or not response.json().get("deadlines_count"):
+            raise RuntimeError(f"simulate failed: {response.status_code} {response.text[:200]}")
+        return response
+
+    return simulate
+
+
+# =============================================================================
+# BASELINE
+# =============================================================================
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict, tolerance: float) -> List[str]:
+    """Names (with detail) of benchmarks slower than baseline * (1 + tolerance)."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if not reference:
+            continue
+        limit = reference["median_us"] * (1 + tolerance)
+        if result["median_us"] > limit:
+            regressions.append(
+                f"{name}: {result['median_us']:.1f}us vs baseline {reference['median_us']:.1f}us "
+                f"(+{(result['median_us'] / reference['median_us'] - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark deadline calculation hot paths")
+    parser.add_argument("--repeat", type=int, default=7, help="Samples per benchmark")
+    parser.add_argument("--only", nargs="*", help="Run only these benchmarks")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline file")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown for --check (0.5 = 50%%)")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.WARNING)  # simulate logs every request
+
+    cases = build_cases()
+    if args.only:
+        cases = {name: fn for name, fn in cases.items() if name in args.only}
+
+    results = {name: time_callable(fn, args.repeat) for name, fn in cases.items()}
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "benchmarks": results,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Deadline calculation benchmarks ({args.repeat} samples each)")
+        print("-" * 72)
+        for name, result in results.items():
+            print(f"{name:<30} median {result['median_us']:>11.1f} us   min {result['min_us']:>11.1f} us")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+
+    if args.check:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline} (run with --save-baseline)", file=sys.stderr)
+            sys.exit(2)
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Performance regressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark RulesEngine Cold-Start Cost
+
+Measures what a freshly started worker pays before it can answer its first
+trigger request. Each sample runs in a new interpreter so nothing is warm:
+
+- import:           `import app.services.rules_engine` (dependencies preloaded,
+                    so this is the module itself plus the singleton)
+- instantiate:      one additional `RulesEngine()`
+- first_request:    first `get_applicable_rules("florida_state", "civil", COMPLAINT_SERVED)`
+- all_templates:    `get_all_templates()` (forces every hardcoded rule family)
+
+Usage:
+    python scripts/benchmark_rules_engine_startup.py [--runs N] [--json]
+
+Requires the same environment as the app (SECRET_KEY etc. via .env).
+"""
+
+import sys
+import os
+import argparse
+import json
+import statistics
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executed in a fresh interpreter per sample; prints one JSON line of timings (ms)
+_SAMPLE_CODE = r"""
+import json, time
+import app.services, app.models.enums, app.utils.deadline_calculator  # noqa: F401
+import app.constants.legal_rules, app.constants.parsing, app.services.rule_resolution_cache  # noqa: F401
+
+t0 = time.perf_counter()
+import app.services.rules_engine as rules_module
+t1 = time.perf_counter()
+engine = rules_module.RulesEngine()
+t2 = time.perf_counter()
+engine.get_applicable_rules("florida_state", "civil", rules_module.TriggerType.COMPLAINT_SERVED)
+t3 = time.perf_counter()
+count = len(engine.get_all_templates())
+t4 = time.perf_counter()
+
+print(json.dumps({
+    "import": (t1 - t0) * 1000,
+    "instantiate": (t2 - t1) * 1000,
+    "first_request": (t3 - t2) * 1000,
+    "all_templates": (t4 - t3) * 1000,
+    "template_count": count,
+}))
+"""
+
+
+def run_sample() -> dict:
+    """Run one cold-start sample in a subprocess."""
+    output = subprocess.run(
+        [sys.executable, "-c", _SAMPLE_CODE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RulesEngine cold-start cost")
+    parser.add_argument("--runs", type=int, default=15, help="Number of fresh-interpreter samples")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args()
+
+    samples = [run_sample() for _ in range(args.runs)]
+    metrics = ["import", "instantiate", "first_request", "all_templates"]
+    summary = {
+        metric: {
+            "median_ms": round(statistics.median(s[metric] for s in samples), 3),
+            "min_ms": round(min(s[metric] for s in samples), 3),
+        }
+        for metric in metrics
+    }
+    summary["template_count"] = samples[0]["template_count"]
+    summary["runs"] = args.runs
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"RulesEngine cold start ({args.runs} runs, {summary['template_count']} hardcoded templates)")
+    print("-" * 60)
+    for metric in metrics:
+        print(f"{metric:<16} median {summary[metric]['median_ms']:>9.3f} ms   min {summary[metric]['min_ms']:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
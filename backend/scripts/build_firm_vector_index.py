@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Build the Firm-Wide Vector Index
+
+(Re)builds the memory-mapped IVF index used by POST /rag/semantic/firm on
+deployments without pgvector (see app/services/firm_vector_index.py) and
+folds the delta segment the embedding pipeline has appended since the last
+build. Run after bulk imports, and periodically (e.g. nightly).
+
+Usage:
+    python scripts/build_firm_vector_index.py
+    python scripts/build_firm_vector_index.py --lists 1024
+    python scripts/build_firm_vector_index.py --path /var/lib/litdocket/firm_index
+
+The index is written next to the live one and swapped in when complete.
+"""
+
+import sys
+import os
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.firm_vector_index import DEFAULT_INDEX_DIR, FirmVectorIndex
+from app.services.rag_service import rag_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the firm-wide ANN index over chunk embeddings")
+    parser.add_argument("--path", default=DEFAULT_INDEX_DIR, help="Index directory")
+    parser.add_argument("--lists", type=int, default=None, help="IVF lists (default ~4*sqrt(rows))")
+    parser.add_argument("--dimensions", type=int, default=rag_service.embedding_dimensions,
+                        help="Embedding dimension to index (default: active embedding model)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = FirmVectorIndex(path=args.path).build(db, args.dimensions, nlist=args.lists)
+        print(f"✅ Indexed {count} embeddings ({args.dimensions} dimensions) in {args.path}")
+    except Exception as e:
+        print(f"❌ Error building firm vector index: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
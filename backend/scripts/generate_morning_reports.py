@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Generate Morning Report Snapshots
+
+Generates today's Morning Report snapshot of every user whose snapshot is
+missing or stale (see app.services.morning_report_snapshot). Safe to re-run:
+users whose data did not change since generation are skipped.
+
+Usage:
+    python scripts/generate_morning_reports.py
+    python scripts/generate_morning_reports.py --workers 8
+    python scripts/generate_morning_reports.py --user <user_id>
+"""
+
+import sys
+import os
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.morning_report_snapshot import MORNING_REPORT_WORKERS, refresh_morning_report_snapshots
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate today's Morning Report snapshots")
+    parser.add_argument("--workers", type=int, default=MORNING_REPORT_WORKERS, help="Reports generated concurrently")
+    parser.add_argument("--user", default=None, help="Only generate this user's report")
+    args = parser.parse_args()
+
+    try:
+        counts = refresh_morning_report_snapshots(max_workers=args.workers, user_id=args.user)
+        print(f"✅ Morning reports: {counts}")
+    except Exception as e:
+        print(f"❌ Error generating morning reports: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
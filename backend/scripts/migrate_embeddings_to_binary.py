@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Migrate JSON Embeddings to Binary Storage
+
+Converts document_embeddings rows that still hold a JSON float array into
+the packed embedding_bytes column (see app/services/embedding_storage.py).
+Apply supabase/migrations/022_embedding_binary_storage.sql first.
+
+Usage:
+    python scripts/migrate_embeddings_to_binary.py                 # float32
+    python scripts/migrate_embeddings_to_binary.py --format int8   # 4x smaller again
+    python scripts/migrate_embeddings_to_binary.py --keep-json     # don't clear JSON yet
+
+Safe to interrupt and re-run: converted rows are skipped.
+"""
+
+import sys
+import os
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.embedding_storage import FORMAT_FLOAT32, FORMAT_INT8, migrate_json_embeddings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert JSON embeddings to packed binary storage")
+    parser.add_argument("--format", choices=[FORMAT_FLOAT32, FORMAT_INT8], default=FORMAT_FLOAT32)
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per transaction")
+    parser.add_argument("--keep-json", action="store_true", help="Leave the JSON column populated")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        converted = migrate_json_embeddings(
+            db, fmt=args.format, batch_size=args.batch_size, keep_json=args.keep_json
+        )
+        print(f"✅ Converted {converted} embeddings to {args.format}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error migrating embeddings: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Process Deadline Reminders
+
+Creates today's approaching/overdue/fatal deadline notifications (see
+NotificationService.process_deadline_reminders). Safe to re-run: deadlines
+already reminded today are skipped.
+
+The nightly run can be split across workers by user id range; every
+(shard, shards) pair covers a fixed slice of the user id space.
+
+Usage:
+    python scripts/process_deadline_reminders.py
+    python scripts/process_deadline_reminders.py --shard 0 --shards 4
+    python scripts/process_deadline_reminders.py --user <user_id>
+"""
+
+import sys
+import os
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.notification_service import NotificationService, reminder_shard_range
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create today's deadline reminder notifications")
+    parser.add_argument("--shard", type=int, default=0, help="Shard index (0-based)")
+    parser.add_argument("--shards", type=int, default=1, help="Total number of shards")
+    parser.add_argument("--user", default=None, help="Only process this user")
+    args = parser.parse_args()
+
+    user_range = reminder_shard_range(args.shard, args.shards) if args.shards > 1 else None
+
+    db = SessionLocal()
+    try:
+        counts = NotificationService(db).process_deadline_reminders(user_id=args.user, user_range=user_range)
+        print(f"✅ Shard {args.shard + 1}/{args.shards}: {counts}")
+    except Exception as e:
+        print(f"❌ Error processing deadline reminders: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Rebuild War Room Dashboard Summaries
+
+Recomputes the materialized per-case dashboard aggregates
+(dashboard_case_summaries, see app/services/dashboard_summary.py). Run once
+after applying migration 025, and after any bulk import that wrote cases,
+deadlines or documents with raw SQL.
+
+Usage:
+    python scripts/rebuild_dashboard_summaries.py
+    python scripts/rebuild_dashboard_summaries.py --user <user_id>
+"""
+
+import sys
+import os
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.dashboard_summary import rebuild_user_summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild materialized dashboard aggregates")
+    parser.add_argument("--user", default=None, help="Only rebuild this user's cases")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = rebuild_user_summaries(db, args.user)
+        db.commit()
+        scope = f"user {args.user}" if args.user else "all users"
+        print(f"✅ Rebuilt {count} case summaries for {scope}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error rebuilding dashboard summaries: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+-- Migration: Binary embedding storage (deployments without pgvector)
+-- Embeddings are written as packed float32 (or int8 + scale) bytes instead of
+-- JSON float arrays: ~5x smaller, decoded with numpy.frombuffer.
+--
+-- Existing JSON rows keep working; convert them with:
+--   python scripts/migrate_embeddings_to_binary.py [--format int8]
+
+ALTER TABLE document_embeddings
+ADD COLUMN IF NOT EXISTS embedding_bytes BYTEA;
@@ -0,0 +1,12 @@
+-- Migration: Content-addressed embedding cache
+-- Identical chunk text (boilerplate captions, certificates of service,
+-- signature blocks) reuses a stored vector instead of re-embedding.
+-- Key: (embedding model, sha256 of whitespace-normalized chunk text)
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model VARCHAR(100) NOT NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    embedding_bytes BYTEA NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (model, content_hash)
+);
@@ -0,0 +1,10 @@
+-- Migration: Per-chunk content hash for incremental re-embedding
+-- Re-embedding a document (OCR re-run, /rag/embed) re-chunks the new text
+-- and only embeds chunks whose hash is not already stored for the document.
+-- sha256 of whitespace-normalized chunk text (app.services.embedding_cache).
+--
+-- Existing rows are hashed on the fly the first time their document is
+-- re-embedded; no backfill needed.
+
+ALTER TABLE document_embeddings
+ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
@@ -0,0 +1,34 @@
+-- Migration: Materialized War Room dashboard aggregates
+-- One row per case, refreshed in the same transaction as any committed
+-- change to the case, its deadlines or its documents
+-- (app.services.dashboard_summary). GET /dashboard reads a user's rows
+-- with a single indexed query.
+--
+-- Backfill after applying: python scripts/rebuild_dashboard_summaries.py
+-- (a user without rows is also backfilled on their first dashboard load).
+
+CREATE TABLE IF NOT EXISTS dashboard_case_summaries (
+    case_id VARCHAR(36) PRIMARY KEY REFERENCES cases(id) ON DELETE CASCADE,
+    user_id VARCHAR(36) NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    case_number VARCHAR(100),
+    title VARCHAR(500),
+    court VARCHAR(255),
+    judge VARCHAR(255),
+    status VARCHAR(50),
+    case_type VARCHAR(100),
+    jurisdiction VARCHAR(100),
+    filing_date DATE,
+    total_deadlines INTEGER NOT NULL DEFAULT 0,
+    completed_deadlines INTEGER NOT NULL DEFAULT 0,
+    pending_deadlines INTEGER NOT NULL DEFAULT 0,
+    last_deadline_date DATE,
+    pending_dated JSON,
+    activity_by_day JSON,
+    document_count INTEGER NOT NULL DEFAULT 0,
+    last_document_at TIMESTAMPTZ,
+    recent_documents JSON,
+    refreshed_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_dashboard_case_summaries_user
+ON dashboard_case_summaries(user_id);
@@ -0,0 +1,7 @@
+-- Migration: Index for the set-based deadline reminder engine
+-- NotificationService.process_deadline_reminders anti-joins candidate
+-- deadlines against notifications already created today for the same
+-- deadline; this keeps that NOT EXISTS probe an index lookup.
+
+CREATE INDEX IF NOT EXISTS idx_notifications_deadline_created
+ON notifications(deadline_id, created_at);
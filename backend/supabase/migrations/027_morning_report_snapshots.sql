@@ -0,0 +1,20 @@
+-- Migration: Precomputed Morning Report snapshots
+-- One row per user holding the day's Intelligence Briefing, generated
+-- early in the morning by the scheduler (app.services.morning_report_snapshot)
+-- and regenerated only for users whose deadlines, documents or cases
+-- changed since (row count, latest updated_at and sum of updated_at epochs).
+-- GET /dashboard/morning-report reads the row with a single query and
+-- generates live only when it is missing or stale.
+--
+-- Populate after applying: python scripts/generate_morning_reports.py
+
+CREATE TABLE IF NOT EXISTS morning_report_snapshots (
+    user_id VARCHAR(36) PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    report_date DATE NOT NULL,
+    report JSON NOT NULL,
+    source_rows INTEGER NOT NULL DEFAULT 0,
+    source_updated_at TIMESTAMPTZ,
+    source_updated_sum NUMERIC(28, 6),
+    last_login TIMESTAMPTZ,
+    generated_at TIMESTAMPTZ DEFAULT NOW()
+);
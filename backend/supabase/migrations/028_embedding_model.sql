@@ -0,0 +1,11 @@
+-- Migration: Record which embedding model produced each stored chunk vector
+-- Incremental re-embedding (app.services.embedding_pipeline) only keeps a
+-- stored row whose text is unchanged when it was embedded by the current
+-- model. Vectors written by the hash-based fallback during an OpenAI outage
+-- (NULL model, 768 dimensions) or by a previous model are re-embedded.
+--
+-- Existing rows keep NULL; the first re-embed of their document adopts them
+-- when their vector dimension matches the current model.
+
+ALTER TABLE document_embeddings
+ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(100);
@@ -0,0 +1,141 @@
+"""
+Tests for the in-memory Authority Core rule index
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text, update
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - configure all mappers
+from app.database import Base
+from app.models.authority_core import AuthorityRule
+from app.models.enums import AuthorityTier
+from app.services.authority_rule_index import AuthorityRuleIndex, get_authority_rule_index, indexed_rule_from
+
+
+def _rule(rule_id, jurisdiction_id="fl", trigger_type="complaint_served",
+          tier=AuthorityTier.STATE, verified=True, conditions=None):
+    return SimpleNamespace(
+        id=rule_id,
+        jurisdiction_id=jurisdiction_id,
+        trigger_type=trigger_type,
+        authority_tier=tier,
+        is_verified=verified,
+        conditions=conditions or {},
+    )
+
+
+def _index(*rules):
+    index = AuthorityRuleIndex()
+    index.build(indexed_rule_from(rule) for rule in rules)
+    return index
+
+
+class TestAuthorityRuleIndex:
+    """Candidate lookup is a set intersection over postings lists"""
+
+    def test_trigger_and_jurisdiction_with_federal(self):
+        index = _index(
+            _rule("fl-1"),
+            _rule("fl-2", trigger_type="trial_date"),
+            _rule("us-1", jurisdiction_id="us", tier=AuthorityTier.FEDERAL),
+            _rule("ga-1", jurisdiction_id="ga"),
+        )
+
+        assert index.candidate_ids(None, "complaint_served", ["fl"]) == {"fl-1"}
+        assert index.candidate_ids(None, "complaint_served", ["fl"], include_federal=True) == {"fl-1", "us-1"}
+        assert index.candidate_ids(None, "complaint_served", ["fl", "ga"]) == {"fl-1", "ga-1"}
+
+    def test_verified_only(self):
+        index = _index(_rule("a"), _rule("b", verified=False))
+        assert index.candidate_ids(None, "complaint_served", ["fl"]) == {"a"}
+        assert index.candidate_ids(None, "complaint_served", ["fl"], verified_only=False) == {"a", "b"}
+
+    def test_condition_postings_narrow_candidates(self):
+        index = _index(
+            _rule("civil", conditions={"case_types": ["Civil"]}),
+            _rule("family", conditions={"case_types": ["family"]}),
+            _rule("pattern", conditions={"case_types": ["regex:^civ"]}),
+            _rule("wrapped", conditions={"$or": [{"case_types": ["probate"]}]}),
+            _rule("msj", conditions={"motion_types": ["msj"]}),
+            _rule("any"),
+        )
+
+        assert index.candidate_ids(None, "complaint_served", ["fl"], case_type="civil") == {
+            "civil", "pattern", "wrapped", "msj", "any"
+        }
+        assert index.candidate_ids(None, "complaint_served", ["fl"], motion_type="mtd") == {
+            "civil", "family", "pattern", "wrapped", "any"
+        }
+
+    def test_incremental_update_and_removal(self):
+        index = _index(_rule("a"), _rule("b"))
+
+        index.apply({
+            "a": None,
+            "b": indexed_rule_from(_rule("b", jurisdiction_id="ga")),
+            "c": indexed_rule_from(_rule("c")),
+        })
+
+        assert index.candidate_ids(None, "complaint_served", ["fl"]) == {"c"}
+        assert index.candidate_ids(None, "complaint_served", ["ga"]) == {"b"}
+        assert index.get_stats()["rules"] == 2
+
+    def test_changes_before_first_build_are_ignored(self):
+        index = AuthorityRuleIndex()
+        index.apply({"a": indexed_rule_from(_rule("a"))})
+        assert index.get_stats()["rules"] == 0
+
+    def test_load_rules_rechecks_active_and_verified(self):
+        engine = create_engine("sqlite://")
+        for table in ("users", "jurisdictions", "authority_rules"):
+            Base.metadata.tables[table].create(engine)
+        db = sessionmaker(bind=engine)()
+        for rule_id, verified in (("live", True), ("retired", True), ("draft", False)):
+            db.add(AuthorityRule(id=rule_id, rule_code=rule_id, rule_name=rule_id, trigger_type="complaint_served",
+                                 authority_tier=AuthorityTier.STATE, deadlines=[], is_verified=verified))
+        db.commit()
+
+        # Deactivated behind the index's back (raw SQL, another process)
+        db.execute(text("UPDATE authority_rules SET is_active = 0 WHERE id = 'retired'"))
+        index = AuthorityRuleIndex()
+        assert [r.id for r in index.load_rules(db, ["live", "retired", "draft"])] == ["live"]
+        assert {r.id for r in index.load_rules(db, ["live", "retired", "draft"], verified_only=False)} == {"live", "draft"}
+        db.close()
+
+    def test_out_of_process_writes_are_picked_up(self):
+        engine = create_engine("sqlite://")
+        for table in ("users", "jurisdictions", "authority_rules"):
+            Base.metadata.tables[table].create(engine)
+        db = sessionmaker(bind=engine)()
+        earlier = datetime.now() - timedelta(hours=1)
+        db.add(AuthorityRule(id="live", rule_code="live", rule_name="live", trigger_type="complaint_served",
+                             authority_tier=AuthorityTier.STATE, deadlines=[], is_verified=True,
+                             updated_at=earlier))
+        db.commit()
+        index = get_authority_rule_index()  # The instance maintained on commit
+        index.invalidate()
+        builds = index.get_stats()["full_builds"]
+        assert index.candidate_ids(db, trigger_type="complaint_served") == {"live"}
+
+        # Committed through the ORM here: applied incrementally, no rebuild
+        db.add(AuthorityRule(id="local", rule_code="local", rule_name="local", trigger_type="complaint_served",
+                             authority_tier=AuthorityTier.STATE, deadlines=[], is_verified=True))
+        db.commit()
+        assert index.candidate_ids(db, trigger_type="complaint_served") == {"live", "local"}
+        assert index.get_stats()["full_builds"] == builds + 1
+
+        # Core statements skip the ORM events, like another process's writes
+        rules = AuthorityRule.__table__
+        db.execute(rules.insert().values(id="harvested", rule_code="h", rule_name="h", trigger_type="complaint_served",
+                                         authority_tier="state", deadlines=[], is_verified=True))
+        assert index.candidate_ids(db, trigger_type="complaint_served") == {"live", "local", "harvested"}
+
+        db.execute(update(rules).where(rules.c.id == "live").values(trigger_type="order_entered",
+                                                                    updated_at=datetime.now() + timedelta(hours=1)))
+        assert index.candidate_ids(db, trigger_type="complaint_served") == {"local", "harvested"}
+        assert index.get_stats()["full_builds"] == builds + 3
+        db.close()
+        index.invalidate()
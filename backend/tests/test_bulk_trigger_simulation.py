@@ -0,0 +1,149 @@
+"""
+Tests for bulk trigger simulation
+
+Every line of /triggers/simulate/bulk must match what /triggers/simulate
+returns for the same item, for both Authority Core rules and the hardcoded
+rules_engine fallback.
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import triggers
+from app.database import Base, get_db
+from app.models.authority_core import AuthorityRule
+from app.models.case import Case
+from app.models.enums import AuthorityTier, JurisdictionType
+from app.models.jurisdiction import Jurisdiction
+from app.models.user import User
+from app.services.authority_rule_index import get_authority_rule_index
+from app.utils.auth import get_current_user
+
+
+@pytest.fixture
+def client():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    for table in ("users", "jurisdictions", "cases", "authority_rules"):
+        Base.metadata.tables[table].create(engine)
+    Session = sessionmaker(bind=engine)
+
+    db = Session()
+    db.add_all([
+        User(id="u1", email="u1@example.com", name="Owner"),
+        User(id="u2", email="u2@example.com", name="Other"),
+        Jurisdiction(id="fed", code="FED", name="federal", jurisdiction_type=JurisdictionType.FEDERAL),
+        Case(id="fl-case", user_id="u1", case_number="2025-CA-1", title="Smith v. Jones",
+             case_type="civil", jurisdiction="florida_state",
+             parties=[{"name": "Smith", "role": "Plaintiff"}, {"name": "Jones", "role": "Defendant"}]),
+        Case(id="fed-case", user_id="u1", case_number="1:25-cv-1", title="Doe v. Roe",
+             case_type="civil", jurisdiction="federal"),
+        Case(id="foreign-case", user_id="u2", case_number="2025-CA-2", title="Not yours",
+             case_type="civil", jurisdiction="florida_state"),
+        AuthorityRule(
+            id="fed-answer", jurisdiction_id="fed", authority_tier=AuthorityTier.FEDERAL,
+            rule_code="FRCP 12(a)", rule_name="Answer", trigger_type="complaint_served",
+            citation="Fed. R. Civ. P. 12(a)", is_verified=True, is_active=True,
+            deadlines=[
+                {"title": "Answer Due", "days_from_trigger": 21, "calculation_method": "calendar_days"},
+                {"title": "Reply Due", "days_from_trigger": 14, "calculation_method": "court_days",
+                 "conditions": {"case_types": ["admiralty"]}},
+            ],
+            service_extensions={"mail": 3, "electronic": 0, "personal": 0},
+        ),
+    ])
+    db.commit()
+    db.close()
+    get_authority_rule_index().invalidate()
+
+    def override_get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def override_current_user():
+        session = Session()
+        try:
+            return session.get(User, "u1")
+        finally:
+            session.close()
+
+    app = FastAPI()
+    app.include_router(triggers.router, prefix="/triggers")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_current_user
+
+    yield TestClient(app)
+
+    get_authority_rule_index().invalidate()
+    engine.dispose()
+
+
+def _bulk(client, items):
+    response = client.post("/triggers/simulate/bulk", json={"items": items})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+ITEMS = [
+    {"case_id": "fl-case", "trigger_type": "trial_date", "trigger_date": "2026-06-15", "ref": "a"},
+    {"case_id": "fed-case", "trigger_type": "complaint_served", "trigger_date": "2026-01-09",
+     "service_method": "mail"},
+    {"case_id": "fl-case", "trigger_type": "complaint_served", "trigger_date": "2025-12-19"},
+    {"case_id": "fl-case", "trigger_type": "trial_date", "trigger_date": "2027-03-01"},
+]
+
+
+class TestBulkSimulation:
+    """Bulk lines equal single /simulate responses"""
+
+    def test_matches_single_simulation(self, client):
+        lines = _bulk(client, ITEMS)
+        assert len(lines) == len(ITEMS) + 1
+
+        for index, (item, line) in enumerate(zip(ITEMS, lines)):
+            single = client.post("/triggers/simulate", json=item).json()
+            assert line["index"] == index
+            assert line["ref"] == item.get("ref")
+            assert line["success"] is True
+            assert line["source"] == single["source"]
+            assert line["deadlines"] == single["deadlines"]
+            assert line["deadlines_count"] > 0
+
+        # Federal case used the Authority Core rule (conditional deadline excluded)
+        assert lines[1]["source"] == "authority_core"
+        assert [d["title"] for d in lines[1]["deadlines"]] == ["Answer Due"]
+
+        summary = lines[-1]
+        assert summary["done"] is True
+        assert summary["succeeded"] == len(ITEMS)
+        assert summary["failed"] == 0
+        assert summary["deadlines"] == sum(line["deadlines_count"] for line in lines[:-1])
+
+    def test_invalid_items_fail_individually(self, client):
+        lines = _bulk(client, [
+            {"case_id": "foreign-case", "trigger_type": "trial_date", "trigger_date": "2026-06-15"},
+            {"case_id": "fl-case", "trigger_type": "not_a_trigger", "trigger_date": "2026-06-15"},
+            {"case_id": "fl-case", "trigger_type": "trial_date", "trigger_date": "06/15/2026"},
+            ITEMS[0],
+        ])
+
+        assert [line.get("success") for line in lines[:4]] == [False, False, False, True]
+        assert lines[0]["error"] == "Case not found"
+        assert "trigger_type" in lines[1]["error"]
+        assert lines[-1]["failed"] == 3
+
+    def test_request_limits(self, client):
+        assert client.post("/triggers/simulate/bulk", json={"items": []}).status_code == 400
@@ -0,0 +1,164 @@
+"""
+Tests for the per-case in-memory vector index
+
+Rankings must match the brute-force cosine similarity the fallback search
+used to compute row by row.
+"""
+
+import asyncio
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.document_embedding import DocumentEmbedding
+from app.services.case_vector_index import CaseVectorIndex, CaseVectorIndexCache, get_case_vector_index_cache
+from app.services.rag_service import rag_service
+
+
+def _brute_force(query, rows, top_k):
+    scored = [(row_id, rag_service.cosine_similarity(query, vector or [])) for row_id, vector in rows]
+    scored.sort(key=lambda r: r[1], reverse=True)
+    return scored[:top_k]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.tables["document_embeddings"].create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+    get_case_vector_index_cache().clear()
+
+
+def _add_rows(db, case_id, vectors, document_id="doc-1"):
+    rows = []
+    for i, vector in enumerate(vectors):
+        row = DocumentEmbedding(
+            id=str(uuid.uuid4()), case_id=case_id, document_id=document_id,
+            chunk_text=f"chunk {i}", chunk_index=i, embedding=vector, chunk_metadata={"i": i},
+        )
+        db.add(row)
+        rows.append((row.id, vector))
+    db.commit()
+    return rows
+
+
+class TestCaseVectorIndex:
+    """Matrix search ranks like per-row cosine similarity"""
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        rows = [(f"r{i}", rng.normal(size=64).tolist()) for i in range(500)]
+        index = CaseVectorIndex("case")
+        index.add(rows)
+
+        for _ in range(10):
+            query = rng.normal(size=64).tolist()
+            hits = index.search(query, 10)
+            expected = _brute_force(query, rows, 10)
+            assert [row_id for row_id, _ in hits] == [row_id for row_id, _ in expected]
+            assert np.allclose([s for _, s in hits], [s for _, s in expected], atol=1e-5)
+
+    def test_mixed_dimensions_and_empty_rows(self):
+        rows = [
+            ("a", [1.0, 0.0, 0.0]),
+            ("b", [-1.0, 0.0, 0.0]),
+            ("c", [1.0, 1.0]),  # Other dimension: similarity 0.0
+            ("d", None),
+            ("e", [0.0, 0.0, 0.0]),
+        ]
+        index = CaseVectorIndex("case")
+        index.add(rows)
+
+        hits = index.search([1.0, 0.0, 0.0], 5)
+        assert hits[0] == ("a", pytest.approx(1.0))
+        assert hits[-1] == ("b", pytest.approx(-1.0))
+        assert {row_id for row_id, _ in hits} == {"a", "b", "c", "d", "e"}
+        assert index.size == 5
+
+    def test_incremental_add_grows_matrix(self):
+        index = CaseVectorIndex("case")
+        for i in range(200):
+            index.add([(f"r{i}", [float(i), 1.0])])
+        assert index.size == 200
+        assert index.search([1.0, 0.0], 1)[0][0] == "r199"
+
+
+class TestCaseVectorIndexCache:
+    """Per-case indexes are cached, kept current and bounded"""
+
+    def test_build_hit_and_incremental_add(self, db):
+        cache = CaseVectorIndexCache()
+        _add_rows(db, "case-1", [[1.0, 0.0], [0.0, 1.0]])
+
+        index = cache.get(db, "case-1")
+        assert index.size == 2
+        assert cache.get(db, "case-1") is index
+
+        new_rows = _add_rows(db, "case-1", [[0.6, 0.8]], document_id="doc-2")
+        assert cache.add_chunks("case-1", new_rows)
+        assert cache.get(db, "case-1") is index
+        assert index.size == 3
+
+        stats = cache.get_stats()
+        assert stats["builds"] == 1
+        assert stats["hits"] == 2
+
+    def test_rebuilds_when_rows_change_elsewhere(self, db):
+        cache = CaseVectorIndexCache()
+        _add_rows(db, "case-1", [[1.0, 0.0]])
+        first = cache.get(db, "case-1")
+
+        _add_rows(db, "case-1", [[0.0, 1.0]], document_id="doc-2")  # Not reported to the cache
+        second = cache.get(db, "case-1")
+        assert second is not first
+        assert second.size == 2
+
+    def test_rebuilds_when_rows_are_replaced_elsewhere(self, db):
+        cache = CaseVectorIndexCache()
+        _add_rows(db, "case-1", [[1.0, 0.0], [0.0, 1.0]])
+        first = cache.get(db, "case-1")
+
+        # Re-embedded by another worker: same row count, new ids
+        db.query(DocumentEmbedding).filter(DocumentEmbedding.case_id == "case-1").delete()
+        new_rows = _add_rows(db, "case-1", [[1.0, 0.0], [0.0, 1.0]])
+        second = cache.get(db, "case-1")
+        assert second is not first
+        assert {row_id for row_id, _ in second.search([1.0, 0.0], 2)} == {row_id for row_id, _ in new_rows}
+
+    def test_memory_bound_evicts_least_recent(self, db):
+        for case_id in ("a", "b", "c"):
+            _add_rows(db, case_id, [[1.0] * 64] * 10)
+        cache = CaseVectorIndexCache(max_bytes=2 * 64 * 64 * 4)  # Two cases' matrices
+
+        cache.get(db, "a")
+        cache.get(db, "b")
+        cache.get(db, "a")
+        cache.get(db, "c")
+
+        assert cache.get_stats()["cases"] == 2
+        assert cache.get_stats()["evictions"] == 1
+        assert not cache.add_chunks("b", [])  # "b" was least recently used
+
+
+class TestFallbackSemanticSearch:
+    """RAGService fallback search returns the brute-force top-k"""
+
+    def test_matches_previous_results(self, db):
+        rng = np.random.default_rng(11)
+        vectors = [rng.normal(size=32).tolist() for _ in range(300)]
+        rows = _add_rows(db, "case-9", vectors)
+        query = rng.normal(size=32).tolist()
+
+        results = asyncio.run(rag_service._fallback_semantic_search(query, "case-9", db, 5))
+
+        expected = _brute_force(query, rows, 5)
+        chunk_by_id = {row_id: f"chunk {i}" for i, (row_id, _) in enumerate(rows)}
+        assert [r["chunk_text"] for r in results] == [chunk_by_id[row_id] for row_id, _ in expected]
+        assert all("metadata" in r and r["document_id"] == "doc-1" for r in results)
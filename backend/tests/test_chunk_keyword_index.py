@@ -0,0 +1,140 @@
+"""
+Tests for the SQLite FTS5 chunk keyword index
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import rag_search
+from app.database import Base, get_db
+from app.models.case import Case
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.models.user import User
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.chunk_keyword_index import ChunkKeywordIndex, fts_query, get_chunk_keyword_index
+from app.services.rag_service import rag_service
+from app.utils.auth import get_current_user
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    for table in ("users", "cases", "documents", "document_embeddings"):
+        Base.metadata.tables[table].create(engine)
+    yield engine
+    engine.dispose()
+    get_case_vector_index_cache().clear()
+
+
+def _add_chunk(db, row_id, case_id, chunk_text, document_id="doc-1", chunk_index=0):
+    db.add(DocumentEmbedding(id=row_id, case_id=case_id, document_id=document_id,
+                             chunk_text=chunk_text, chunk_index=chunk_index))
+    db.commit()
+
+
+class TestFtsQuery:
+    """User text never reaches FTS5 syntax"""
+
+    def test_terms_are_quoted(self):
+        match = fts_query('motion AND "compel" NEAR(x) -discovery*', "case-1")
+        assert match == (
+            'case_id : "case 1" AND chunk_text : '
+            '("motion" OR "and" OR "compel" OR "near" OR "x" OR "discovery")'
+        )
+        assert fts_query("?!", "case-1") == ""
+
+
+class TestChunkKeywordIndex:
+    """Trigger-maintained FTS5 index with BM25 ranking"""
+
+    def test_backfill_triggers_and_case_isolation(self, engine):
+        db = sessionmaker(bind=engine)()
+        _add_chunk(db, "old", "case-1", "Order granting motion to compel discovery")
+        index = ChunkKeywordIndex()
+        assert index.available(db)  # Creates the index and backfills "old"
+
+        _add_chunk(db, "new", "case-1", "Motion to compel production; motion to compel answers", chunk_index=1)
+        _add_chunk(db, "other", "case-2", "Motion to compel discovery in another case")
+        _add_chunk(db, "unrelated", "case-1", "Notice of deposition", chunk_index=2)
+
+        hits = index.search(db, "case-1", "compelled motions", top_k=5)
+        assert [row_id for row_id, _ in hits] == ["new", "old"]  # Stemming; more matches rank higher
+        assert hits[0][1] > hits[1][1] > 0
+
+        db.execute(text("DELETE FROM document_embeddings WHERE id = 'new'"))
+        db.commit()
+        assert [row_id for row_id, _ in index.search(db, "case-1", "compel", top_k=5)] == ["old"]
+
+        db.execute(text("UPDATE document_embeddings SET chunk_text = 'Deposition transcript' WHERE id = 'old'"))
+        db.commit()
+        assert {row_id for row_id, _ in index.search(db, "case-1", "deposition", top_k=5)} == {"unrelated", "old"}
+        assert index.search(db, "case-1", "compel", top_k=5) == []
+        db.close()
+
+    def test_not_available_without_sqlite_table(self):
+        engine = create_engine("sqlite:///:memory:")
+        db = sessionmaker(bind=engine)()
+        assert not ChunkKeywordIndex().available(db)
+        db.close()
+        engine.dispose()
+
+
+class TestSqliteSearch:
+    """hybrid_search and /rag/semantic use the FTS5 index on SQLite"""
+
+    @pytest.fixture
+    def db(self, engine):
+        session = sessionmaker(bind=engine)()
+        session.add_all([
+            User(id="u1", email="u1@example.com", name="Owner"),
+            Case(id="case-1", user_id="u1", case_number="2025-CA-1", title="Smith v. Jones"),
+            Document(id="doc-a", case_id="case-1", user_id="u1", file_name="order.pdf", storage_path="x",
+                     document_type="order",
+                     extracted_text="The court grants the motion for a protective order regarding Zimmerman."),
+            Document(id="doc-b", case_id="case-1", user_id="u1", file_name="notice.pdf", storage_path="y",
+                     document_type="notice",
+                     extracted_text="Notice of hearing on the motion for summary judgment set for March."),
+        ])
+        session.commit()
+        documents = session.query(Document).all()
+        asyncio.run(rag_service.embed_documents([(d, "case-1") for d in documents], session))
+        yield session
+        session.close()
+
+    def test_hybrid_search_uses_keyword_ranking(self, db):
+        results = asyncio.run(rag_service.hybrid_search("Zimmerman", "case-1", db, top_k=2, alpha=0.0))
+        assert results[0]['document_id'] == "doc-a"
+        assert results[0]['bm25_score'] == 1.0
+
+    def test_semantic_endpoint(self, engine, db):
+        Session = sessionmaker(bind=engine)
+
+        def override_get_db():
+            session = Session()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app = FastAPI()
+        app.include_router(rag_search.router, prefix="/rag")
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = lambda: db.get(User, "u1")
+
+        response = TestClient(app).post("/rag/semantic", json={"query": "Zimmerman protective", "case_id": "case-1"})
+
+        assert response.status_code == 200
+        sources = response.json()["sources"]
+        assert sources[0]["document_name"] == "order.pdf"
+        assert get_chunk_keyword_index().available(db)
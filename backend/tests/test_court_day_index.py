@@ -0,0 +1,86 @@
+"""
+Tests for the precomputed court-day index
+
+The index must agree exactly with naive day-by-day stepping over the same
+holiday list - deadline math is not allowed to drift for the sake of speed.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+from app.utils.court_day_index import CourtDayIndex, get_court_day_index
+from app.utils.florida_holidays import get_all_court_holidays
+
+
+def _naive_is_business_day(d: date) -> bool:
+    return d.weekday() < 5 and d not in get_all_court_holidays(d.year)
+
+
+def _naive_add(start: date, n: int) -> date:
+    current = start
+    added = 0
+    while added < n:
+        current += timedelta(days=1)
+        if _naive_is_business_day(current):
+            added += 1
+    return current
+
+
+def _naive_subtract(start: date, n: int) -> date:
+    current = start
+    removed = 0
+    while removed < n:
+        current -= timedelta(days=1)
+        if _naive_is_business_day(current):
+            removed += 1
+    return current
+
+
+class TestCourtDayIndex:
+    """Index lookups match day-by-day stepping"""
+
+    @pytest.mark.parametrize("start", [
+        date(2024, 12, 20),  # Crosses Christmas and New Year
+        date(2025, 3, 28),   # Crosses Good Friday
+        date(2025, 11, 21),  # Crosses Thanksgiving + day after
+        date(2026, 7, 2),    # Independence Day (observed Friday)
+    ])
+    @pytest.mark.parametrize("days", [0, 1, 5, 30, 90, 400])
+    def test_add_and_subtract_match_naive(self, start, days):
+        index = get_court_day_index("state")
+        assert index.add_court_days(start, days) == _naive_add(start, days)
+        assert index.subtract_court_days(start, days) == _naive_subtract(start, days)
+
+    def test_count_between_is_exclusive_start_inclusive_end(self):
+        index = get_court_day_index("state")
+        # Fri Jan 3 2025 -> Fri Jan 10 2025: Mon-Fri of the following week
+        assert index.count_court_days_between(date(2025, 1, 3), date(2025, 1, 10)) == 5
+        assert index.count_court_days_between(date(2025, 1, 10), date(2025, 1, 3)) == 0
+
+    def test_count_round_trips_with_add(self):
+        index = get_court_day_index("state")
+        start = date(2025, 1, 15)
+        end = index.add_court_days(start, 137)
+        assert index.count_court_days_between(start, end) == 137
+
+    def test_holiday_and_weekend_lookup(self):
+        index = get_court_day_index("florida_state")
+        assert index.is_court_holiday(date(2025, 12, 25))
+        assert not index.is_business_day(date(2025, 12, 25))
+        assert not index.is_business_day(date(2025, 12, 27))  # Saturday
+        assert index.is_business_day(date(2025, 12, 26))
+        assert index.next_business_day(date(2025, 12, 24)) == date(2025, 12, 26)
+
+    def test_negative_days_rejected(self):
+        with pytest.raises(ValueError):
+            get_court_day_index().add_court_days(date(2025, 1, 1), -1)
+        with pytest.raises(ValueError):
+            get_court_day_index().subtract_court_days(date(2025, 1, 1), -1)
+
+    def test_custom_holiday_provider(self):
+        index = CourtDayIndex(lambda year: [date(year, 1, 6)], name="test")
+        # Mon Jan 6 2025 is a holiday for this index only
+        assert index.add_court_days(date(2025, 1, 3), 1) == date(2025, 1, 7)
+        assert index.court_days_in_range(date(2025, 1, 4), date(2025, 1, 8)) == [
+            date(2025, 1, 7), date(2025, 1, 8)
+        ]
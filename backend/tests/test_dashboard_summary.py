@@ -0,0 +1,242 @@
+"""
+Tests for the materialized War Room dashboard aggregates
+"""
+
+import asyncio
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - configure all mappers
+from app.api.v1.dashboard import get_dashboard_health
+from app.database import Base
+from app.models.case import Case
+from app.models.dashboard_summary import DashboardCaseSummary
+from app.models.deadline import Deadline
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.models.user import User
+from app.services import dashboard_service as dashboard_module
+from app.services.dashboard_service import dashboard_service
+from app.services import dashboard_summary as summary_module
+from app.services import retrieval_cache as retrieval_module
+from app.services.dashboard_summary import get_dashboard_section_cache, mark_dashboard_cases_changed
+from app.services.retrieval_cache import get_case_embedding_generation
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    for table in ("users", "cases", "documents", "deadlines", "dashboard_case_summaries"):
+        Base.metadata.tables[table].create(engine)
+    yield engine
+    engine.dispose()
+    get_dashboard_section_cache().clear()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        User(id="u1", email="partner@example.com", name="Partner"),
+        Case(id="busy", user_id="u1", case_number="2025-CA-1", title="Busy matter", judge="Judge Rivera",
+             court="Eleventh Circuit", status="active", case_type="civil", jurisdiction="state"),
+        Case(id="zombie", user_id="u1", case_number="2025-CA-2", title="Quiet matter", judge="Judge Rivera",
+             status="active", case_type="civil", jurisdiction="state"),
+        Case(id="gone", user_id="u1", case_number="2025-CA-3", title="Deleted matter", status="deleted"),
+    ])
+    session.flush()
+    session.add_all([
+        _deadline("overdue", "busy", -2),
+        _deadline("tomorrow", "busy", 1, priority="fatal"),
+        _deadline("week", "busy", 5),
+        _deadline("month", "busy", 20),
+        _deadline("later", "busy", 45),
+        _deadline("undated", "busy", None),
+        _deadline("done", "busy", -10, status="completed"),
+        _deadline("old", "zombie", -30, status="completed"),
+        Document(id="motion", case_id="busy", user_id="u1", file_name="motion.pdf", storage_path="x",
+                 document_type="motion"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def _deadline(deadline_id, case_id, days, status="pending", priority="standard"):
+    return Deadline(
+        id=deadline_id, case_id=case_id, user_id="u1", title=f"Deadline {deadline_id}",
+        deadline_date=TODAY + timedelta(days=days) if days is not None else None,
+        status=status, priority=priority
+    )
+
+
+def _dashboard(db, sections=None):
+    return asyncio.run(dashboard_service.get_dashboard_data("u1", db, sections=sections))
+
+
+class TestDashboardFromSummaries:
+    """Sections are bucketed against today from the per-case rows"""
+
+    def test_sections(self, db):
+        data = _dashboard(db)
+
+        alerts = data["deadline_alerts"]
+        assert [alerts[b]["count"] for b in ("overdue", "urgent", "upcoming_week", "upcoming_month")] == [1, 1, 1, 1]
+        assert alerts["urgent"]["deadlines"][0]["days_until"] == 1
+        assert [d["id"] for d in data["upcoming_deadlines"]] == ["tomorrow", "week", "month"]
+        assert data["total_cases"] == 2
+
+        assert data["case_statistics"]["total_pending_deadlines"] == 6
+        assert data["case_statistics"]["total_documents"] == 1
+        assert [z["case_id"] for z in data["zombie_cases"]] == ["zombie"]
+        assert data["zombie_cases"][0]["last_activity"] == (TODAY - timedelta(days=30)).isoformat()
+        assert data["critical_cases"][0]["total_pending_deadlines"] == 6
+        assert data["calendar_hotspots"]["summary"]["total_next_7_days"] == 2
+        assert data["velocity_metrics"]["this_week"]["added"] == 8
+        assert data["recent_activity"][0]["case_number"] == "2025-CA-1"
+
+        [judge] = data["judge_analytics"]
+        assert (judge["judge"], judge["active_cases"], judge["urgent_deadlines"]) == ("Judge Rivera", 2, 1)
+        card = data["matter_health_cards"][0]
+        assert card["case_id"] == "busy" and card["health_status"] == "critical"
+        assert card["progress"] == {"completed": 1, "pending": 6, "total": 7, "percentage": 14}
+        assert card["judge_stats"]["total_cases_with_judge"] == 2
+
+    def test_single_read_then_cached(self, db, engine):
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        first = _dashboard(db)
+        assert len(statements) == 1 and "dashboard_case_summaries" in statements[0]
+
+        statements.clear()
+        again = _dashboard(db)
+        assert statements == []
+        assert {k: v for k, v in again.items() if k != "generated_at"} == \
+            {k: v for k, v in first.items() if k != "generated_at"}
+
+
+class TestDashboardSections:
+    """Partial responses, per-section isolation and invalidation"""
+
+    def test_partial_response_and_invalidation(self, db):
+        data = _dashboard(db, ["deadline_alerts", "critical_cases"])
+        assert set(data) == {"deadline_alerts", "critical_cases", "generated_at"}
+        assert data["deadline_alerts"]["urgent"]["count"] == 1
+
+        # A committed write makes the next request recompute
+        db.get(Deadline, "tomorrow").deadline_date = TODAY + timedelta(days=10)
+        db.commit()
+        data = _dashboard(db, ["deadline_alerts"])
+        assert data["deadline_alerts"]["urgent"]["count"] == 0
+
+        with pytest.raises(ValueError):
+            _dashboard(db, ["deadline_alerts", "bogus"])
+
+    def test_slow_or_failing_section_is_isolated(self, db, monkeypatch):
+        build = dashboard_service._build_section
+
+        def flaky_build(name, context):
+            if name == "judge_analytics":
+                time.sleep(0.5)
+            if name == "heat_map_flat":
+                raise RuntimeError("boom")
+            return build(name, context)
+
+        monkeypatch.setattr(dashboard_module, "SECTION_TIMEOUT_SECONDS", 0.1)
+        monkeypatch.setattr(dashboard_service, "_build_section", flaky_build)
+        data = _dashboard(db, ["judge_analytics", "heat_map_flat", "zombie_cases"])
+
+        assert data["section_errors"] == {"judge_analytics": "timeout", "heat_map_flat": "error"}
+        assert data["judge_analytics"] is None and data["heat_map_flat"] is None
+        assert [z["case_id"] for z in data["zombie_cases"]] == ["zombie"]
+        assert get_dashboard_section_cache().get("u1", "heat_map_flat", TODAY) is None
+
+    def test_health_endpoint_reports_failed_section(self, db, monkeypatch):
+        build = dashboard_service._build_section
+
+        def failing_build(name, context):
+            if name == "critical_cases":
+                raise RuntimeError("boom")
+            return build(name, context)
+
+        monkeypatch.setattr(dashboard_service, "_build_section", failing_build)
+        data = asyncio.run(get_dashboard_health(current_user=db.get(User, "u1"), db=db))
+
+        assert data["critical_cases"] == [] and data["section_errors"] == {"critical_cases": "error"}
+        assert len(data["health_cards"]) == 2
+
+
+class TestIncrementalMaintenance:
+    """Committed writes refresh only the touched cases' rows"""
+
+    def test_deadline_and_document_changes(self, db):
+        db.get(Deadline, "tomorrow").status = "completed"
+        db.get(Deadline, "week").case_id = "zombie"
+        db.commit()
+
+        busy, zombie = db.get(DashboardCaseSummary, "busy"), db.get(DashboardCaseSummary, "zombie")
+        assert (busy.completed_deadlines, busy.pending_deadlines) == (2, 4)
+        assert [d["id"] for d in zombie.pending_dated] == ["week"]
+        assert sum(busy.activity_by_day["completed"].values()) == 2  # "done" was completed today as well
+
+        # Rolled back writes leave the summary alone
+        db.get(Deadline, "month").status = "cancelled"
+        db.flush()
+        db.rollback()
+        assert len(db.get(DashboardCaseSummary, "busy").pending_dated) == 3
+
+        # Raw SQL writes are marked explicitly
+        db.execute(text("DELETE FROM documents WHERE id = 'motion'"))
+        db.execute(text("DELETE FROM cases WHERE id = 'gone'"))
+        mark_dashboard_cases_changed(db, ["busy", "gone"])
+        db.commit()
+        assert db.get(DashboardCaseSummary, "busy").document_count == 0
+        assert db.get(DashboardCaseSummary, "gone") is None
+
+    def test_failed_refresh_keeps_other_invalidations(self, db, engine, monkeypatch):
+        def fail(session, case_ids):
+            session.execute(text("SELECT * FROM no_such_table"))
+
+        Base.metadata.tables["document_embeddings"].create(engine)
+        monkeypatch.setattr(summary_module, "refresh_case_summaries", fail)
+        before = get_case_embedding_generation("busy")
+        db.get(Deadline, "month").status = "completed"
+        db.add(DocumentEmbedding(id="chunk", case_id="busy", document_id="motion", chunk_text="Motion",
+                                 chunk_index=0))
+        db.commit()  # The refresh savepoint rolls back; the write still commits
+
+        assert db.get(Deadline, "month").status == "completed"
+        assert get_case_embedding_generation("busy") == before + 1  # Search caches still invalidated
+
+    def test_generations_bumped_after_the_outer_commit(self, db, engine, monkeypatch):
+        Base.metadata.tables["document_embeddings"].create(engine)
+        committed, bumps = [], []
+        event.listen(engine, "commit", lambda conn: committed.append(True))
+        monkeypatch.setattr(summary_module, "bump_user_dashboard_generation",
+                            lambda user_id: bumps.append(("dashboard", bool(committed))))
+        monkeypatch.setattr(retrieval_module, "bump_case_embedding_generation",
+                            lambda case_id, reason="": bumps.append(("search", bool(committed))))
+
+        db.get(Deadline, "month").status = "completed"
+        db.add(DocumentEmbedding(id="chunk", case_id="busy", document_id="motion", chunk_text="Motion",
+                                 chunk_index=0))
+        db.commit()
+
+        assert sorted(bumps) == [("dashboard", True), ("search", True)]
+
+    def test_backfill_on_first_load(self, db):
+        db.execute(text("DELETE FROM dashboard_case_summaries"))
+        db.commit()
+        assert _dashboard(db)["total_cases"] == 2
+        assert db.query(DashboardCaseSummary).count() == 3
@@ -500,6 +500,64 @@ class TestRuleTemplateIntegration:
         assert results[0].final_deadline < results[1].final_deadline < results[2].final_deadline
 
 
+class TestBatchCalculation:
+    """Test the vectorized batch API against the single-deadline path"""
+
+    ITEMS = [
+        (date(2024, 1, 1), 20, CalculationMethod.CALENDAR_DAYS, "mail"),
+        (date(2024, 12, 20), 5, CalculationMethod.CALENDAR_DAYS, "electronic"),  # Rolls past Christmas
+        (date(2024, 11, 25), 3, CalculationMethod.COURT_DAYS, "mail"),           # Spans Thanksgiving
+        (date(2024, 3, 1), 0, CalculationMethod.COURT_DAYS, "electronic"),
+        (date(2024, 6, 1), 400, "court_days", "personal"),                       # Spans a year boundary
+        (date(2024, 9, 1), -30, CalculationMethod.CALENDAR_DAYS, "electronic"),  # "X days before"
+        (date(2024, 10, 7), 20),                                                 # Defaults
+    ]
+
+    @pytest.mark.parametrize("jurisdiction", ["state", "federal"])
+    def test_batch_matches_single_calculations(self, jurisdiction):
+        calc = AuthoritativeDeadlineCalculator(jurisdiction=jurisdiction)
+
+        batch = calc.calculate_deadlines_batch(self.ITEMS)
+
+        assert len(batch) == len(self.ITEMS)
+        for item, result in zip(self.ITEMS, batch):
+            method = CalculationMethod(item[2]) if len(item) > 2 else CalculationMethod.CALENDAR_DAYS
+            expected = calc.calculate_deadline(
+                trigger_date=item[0],
+                base_days=item[1],
+                service_method=item[3] if len(item) > 3 else "electronic",
+                calculation_method=method
+            )
+            assert result == expected
+
+    def test_final_deadlines_without_materializing(self):
+        calc = AuthoritativeDeadlineCalculator(jurisdiction="state")
+
+        batch = calc.calculate_deadlines_batch(self.ITEMS)
+
+        assert batch.final_deadlines[1] == date(2024, 12, 26)
+        assert batch.rolled[1] is True
+        assert batch._materialized == {}
+        assert batch[1].roll_adjustment.original_date == date(2024, 12, 25)
+
+    def test_court_day_extension_is_not_a_roll(self):
+        calc = AuthoritativeDeadlineCalculator(jurisdiction="state")
+
+        batch = calc.calculate_deadlines_batch([(date(2024, 3, 4), 5, "court_days", "mail")])
+
+        assert batch.rolled == [False]
+        assert batch[0].roll_adjustment is None
+
+    def test_empty_batch(self):
+        calc = AuthoritativeDeadlineCalculator(jurisdiction="state")
+        assert len(calc.calculate_deadlines_batch([])) == 0
+
+    def test_negative_court_days_rejected(self):
+        calc = AuthoritativeDeadlineCalculator(jurisdiction="state")
+        with pytest.raises(ValueError):
+            calc.calculate_deadlines_batch([(date(2024, 1, 1), -5, CalculationMethod.COURT_DAYS, "mail")])
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+Tests for the incremental deadline cascade engine
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - register mapped classes
+from app.api.v1.triggers import _legacy_trigger_dependents
+from app.models.deadline import Deadline
+from app.services.deadline_cascade import DeadlineCascadeEngine
+from app.services.dependency_listener import DependencyListener
+
+
+@pytest.fixture
+def db():
+    """Session on an in-memory database holding only the deadlines table"""
+    engine = create_engine("sqlite:///:memory:")
+    Deadline.__table__.create(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session = sessionmaker(bind=engine)()
+    session.info["statements"] = statements
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _deadline(db, deadline_id, deadline_date, parent=None, **kwargs):
+    deadline = Deadline(
+        id=deadline_id,
+        case_id="case-1",
+        user_id="user-1",
+        title=deadline_id,
+        deadline_date=deadline_date,
+        parent_deadline_id=parent,
+        trigger_date=kwargs.pop("trigger_date", None),
+        status=kwargs.pop("status", "pending"),
+        **kwargs
+    )
+    db.add(deadline)
+    return deadline
+
+
+def _dates(db):
+    db.expire_all()
+    return {d.id: d.deadline_date for d in db.query(Deadline).all()}
+
+
+class TestDeadlineCascadeEngine:
+    """Multi-level cascade, override protection, single bulk write"""
+
+    @pytest.fixture
+    def chain(self, db):
+        # trial (Mon 2025-03-03) -> pretrial -> exhibits, pretrial -> witness list (overridden) -> jury
+        _deadline(db, "trial", date(2025, 3, 3))
+        _deadline(db, "pretrial", date(2025, 2, 24), parent="trial", trigger_date=date(2025, 3, 3))
+        _deadline(db, "exhibits", date(2025, 2, 17), parent="pretrial")
+        _deadline(db, "witnesses", date(2025, 2, 20), parent="pretrial", is_manually_overridden=True)
+        _deadline(db, "jury", date(2025, 2, 13), parent="witnesses")
+        _deadline(db, "filed", date(2025, 2, 10), parent="trial", status="completed")
+        db.commit()
+        return db
+
+    def test_shifts_every_level_and_protects_overrides(self, chain):
+        engine = DeadlineCascadeEngine(chain, adjust=lambda d: d)
+        plan = engine.plan("trial", date(2025, 3, 3), date(2025, 3, 10))
+
+        order = [change.node.id for change in plan.changes]
+        assert sorted(order) == ["exhibits", "filed", "pretrial"]
+        assert order.index("pretrial") < order.index("exhibits")
+        assert [node.id for node in plan.skipped] == ["witnesses"]
+        # Nothing below the overridden node is loaded
+        assert "jury" not in plan.nodes
+
+        assert engine.apply(plan, modified_by="user-1") == 3
+        chain.commit()
+
+        dates = _dates(chain)
+        assert dates["pretrial"] == date(2025, 3, 3)
+        assert dates["exhibits"] == date(2025, 2, 24)
+        assert dates["witnesses"] == date(2025, 2, 20)
+        assert dates["jury"] == date(2025, 2, 13)
+
+    def test_children_inherit_adjusted_shift(self, db):
+        # Saturday parent rolls to Monday, so its child moves 2 more days
+        _deadline(db, "root", date(2025, 1, 1))
+        _deadline(db, "a", date(2025, 1, 4), parent="root")
+        _deadline(db, "b", date(2025, 1, 10), parent="a")
+        db.commit()
+
+        roll_weekend = lambda d: d.fromordinal(d.toordinal() + (7 - d.weekday()) % 7) if d.weekday() >= 5 else d
+        plan = DeadlineCascadeEngine(db, adjust=roll_weekend).plan("root", date(2025, 1, 1), date(2025, 1, 1))
+        assert plan.changes == []
+
+        plan = DeadlineCascadeEngine(db, adjust=roll_weekend).plan("root", date(2025, 1, 1), date(2025, 1, 8))
+        new_dates = {change.node.id: change.new_date for change in plan.changes}
+        assert new_dates["a"] == date(2025, 1, 13)
+        # a: Sat 1/11 -> Mon 1/13 (shift 9), b: Sun 1/19 -> Mon 1/20
+        assert new_dates["b"] == date(2025, 1, 20)
+
+    def test_pending_only_stops_at_completed_nodes(self, chain):
+        plan = DeadlineCascadeEngine(chain, adjust=lambda d: d, pending_only=True).plan(
+            "trial", date(2025, 3, 3), date(2025, 3, 10)
+        )
+        assert "filed" not in [change.node.id for change in plan.changes]
+
+    def test_apply_is_a_single_update(self, chain):
+        engine = DeadlineCascadeEngine(chain, adjust=lambda d: d)
+        plan = engine.plan("trial", date(2025, 3, 3), date(2025, 3, 10))
+
+        chain.info["statements"].clear()
+        engine.apply(plan, modified_by="user-1", reason=lambda change: "moved")
+        updates = [s for s in chain.info["statements"] if s.lstrip().upper().startswith("UPDATE")]
+        assert len(updates) == 1
+
+    def test_legacy_rows_matched_by_trigger_event(self, db):
+        trigger = _deadline(db, "trigger", date(2025, 3, 3), trigger_event="trial")
+        _deadline(db, "flagged", date(2025, 2, 24), trigger_event="trial", is_dependent=True)
+        _deadline(db, "unflagged", date(2025, 2, 17), trigger_event="trial", is_dependent=False)
+        _deadline(db, "other", date(2025, 2, 10), trigger_event="mediation")
+        db.commit()
+
+        plan = DeadlineCascadeEngine(db, adjust=lambda d: d).plan(
+            "trigger", date(2025, 3, 3), date(2025, 3, 10), extra_children=_legacy_trigger_dependents(trigger)
+        )
+        assert {change.node.id for change in plan.changes} == {"flagged", "unflagged"}
+
+
+class TestDependencyListenerCascade:
+    """DependencyListener now cascades through grandchildren"""
+
+    def test_apply_cascade_update(self, db):
+        _deadline(db, "trigger", date(2025, 6, 2))
+        _deadline(db, "child", date(2025, 6, 9), parent="trigger", trigger_date=date(2025, 6, 2))
+        _deadline(db, "grandchild", date(2025, 6, 16), parent="child")
+        db.commit()
+
+        result = DependencyListener(db).apply_cascade_update("trigger", date(2025, 6, 9), user_id="user-1")
+
+        assert result["success"]
+        assert result["updated_count"] == 2
+        dates = _dates(db)
+        assert dates["trigger"] == date(2025, 6, 9)
+        assert dates["child"] == date(2025, 6, 16)
+        assert dates["grandchild"] == date(2025, 6, 23)
+        assert db.get(Deadline, "child").trigger_date == date(2025, 6, 9)
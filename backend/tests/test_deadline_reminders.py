@@ -0,0 +1,144 @@
+"""
+Tests for the set-based deadline reminder engine
+"""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - configure all mappers
+from app.database import Base
+from app.models.case import Case
+from app.models.deadline import Deadline
+from app.models.notification import Notification, NotificationPreferences, NotificationType
+from app.models.user import User
+from app.services.notification_service import NotificationService, reminder_shard_range
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    for table in ("users", "cases", "deadlines", "notifications", "notification_preferences"):
+        Base.metadata.tables[table].create(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_user(db, prefs=None):
+    user_id = str(uuid.uuid4())
+    db.add(User(id=user_id, email=f"{user_id}@example.com", name="Attorney"))
+    db.add(Case(id=user_id, user_id=user_id, case_number=user_id[:8], title="Matter", status="active"))
+    if prefs is not None:
+        db.add(NotificationPreferences(user_id=user_id, email_enabled=False, **prefs))
+    db.flush()
+    return user_id
+
+
+def _add_deadline(db, user_id, days, priority="standard", status="pending", case_id=None):
+    deadline = Deadline(user_id=user_id, case_id=case_id or user_id, title=f"Due in {days}",
+                        deadline_date=TODAY + timedelta(days=days), priority=priority, status=status)
+    db.add(deadline)
+    db.flush()
+    return deadline.id
+
+
+def _reminded(db):
+    return {(n.deadline_id, n.type) for n in db.query(Notification)}
+
+
+class TestReminderEngine:
+    """Candidates, preferences and idempotence"""
+
+    def test_reminders_follow_preferences(self, db):
+        user = _add_user(db, {})
+        fatal = _add_deadline(db, user, 3, priority="fatal")
+        _add_deadline(db, user, 2)  # Not a default reminder day
+        tomorrow = _add_deadline(db, user, 1)
+        overdue = _add_deadline(db, user, -4)
+        _add_deadline(db, user, 1, status="completed")
+
+        closed = _add_user(db, {})
+        db.get(Case, closed).status = "closed"
+        _add_deadline(db, closed, 1)
+
+        custom = _add_user(db, {"remind_days_before_standard": [2]})
+        custom_two_days = _add_deadline(db, custom, 2)
+        _add_deadline(db, custom, 1)
+
+        quiet = _add_user(db, {"in_app_deadline_reminders": False})
+        quiet_fatal = _add_deadline(db, quiet, 0, priority="fatal")
+        _add_deadline(db, quiet, -1)
+        db.commit()
+
+        counts = NotificationService(db).process_deadline_reminders()
+
+        assert counts == {"fatal": 2, "overdue": 1, "approaching": 2}
+        assert _reminded(db) == {
+            (fatal, NotificationType.DEADLINE_FATAL),
+            (tomorrow, NotificationType.DEADLINE_APPROACHING),
+            (overdue, NotificationType.DEADLINE_OVERDUE),
+            (custom_two_days, NotificationType.DEADLINE_APPROACHING),
+            (quiet_fatal, NotificationType.DEADLINE_FATAL),
+        }
+        notification = db.query(Notification).filter(Notification.deadline_id == overdue).one()
+        assert notification.title == "Overdue: Due in -4"
+        assert notification.extra_data["days_until"] == -4
+
+        # Already reminded today
+        assert NotificationService(db).process_deadline_reminders() == {"fatal": 0, "overdue": 0, "approaching": 0}
+
+    def test_round_trips_do_not_grow_with_deadlines(self, db, engine):
+        def statements_for(count):
+            user = _add_user(db, {})
+            for _ in range(count):
+                _add_deadline(db, user, 1)
+            db.commit()
+            statements = []
+            listener = lambda *args: statements.append(args[2])  # noqa: E731
+            event.listen(engine, "before_cursor_execute", listener)
+            NotificationService(db).process_deadline_reminders(user_id=user)
+            event.remove(engine, "before_cursor_execute", listener)
+            return len(statements)
+
+        assert statements_for(3) == statements_for(60)
+
+
+class TestSharding:
+    """Shards split users without gaps or overlap"""
+
+    def test_shard_ranges(self):
+        assert reminder_shard_range(0, 1) == (None, None)
+        assert reminder_shard_range(0, 4) == (None, "40000000")
+        assert reminder_shard_range(3, 4) == ("c0000000", None)
+        with pytest.raises(ValueError):
+            reminder_shard_range(4, 4)
+
+    def test_shards_cover_every_user_once(self, db):
+        users = [_add_user(db, {}) for _ in range(20)]
+        for user in users:
+            _add_deadline(db, user, -1)
+        db.commit()
+
+        total = sum(
+            NotificationService(db).process_deadline_reminders(user_range=reminder_shard_range(shard, 3))["overdue"]
+            for shard in range(3)
+        )
+        assert total == 20
+        assert {n.user_id for n in db.query(Notification)} == set(users)
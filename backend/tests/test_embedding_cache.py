@@ -0,0 +1,127 @@
+"""
+Tests for the content-hash embedding cache
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.document import Document
+from app.services.embedding_cache import EmbeddingCache, content_hash
+from app.services.embedding_pipeline import EmbeddingPipeline
+from app.services.rag_service import rag_service
+
+
+class CountingEmbedder:
+    """Deterministic stub embedder that records every text it embeds"""
+
+    def __init__(self, dimensions=4):
+        self.dimensions = dimensions
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.extend(texts)
+        return [[float(len(text) % 7 + 1)] + [0.5] * (self.dimensions - 1) for text in texts]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    for table in ("document_embeddings", "embedding_cache"):
+        Base.metadata.tables[table].create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestContentHash:
+    """Only whitespace differences map to the same key"""
+
+    def test_normalization(self):
+        assert content_hash("Certificate of\n  Service ") == content_hash("Certificate of Service")
+        assert content_hash("Certificate of Service") != content_hash("certificate of service")
+
+
+class TestEmbeddingCache:
+    """Memory LRU in front of the embedding_cache table"""
+
+    def test_reuses_vectors_across_calls_and_restarts(self, db):
+        cache = EmbeddingCache()
+        embedder = CountingEmbedder()
+        texts = ["caption", "signature block", "caption", "unique text"]
+
+        first = cache.embed(db, "model-a", texts, embedder)
+        assert embedder.calls == ["caption", "signature block", "unique text"]
+        assert first[0] is first[2]
+
+        assert cache.embed(db, "model-a", ["caption"], embedder)[0].tolist() == list(first[0])
+        assert len(embedder.calls) == 3
+
+        # New process: memory is empty, the table still answers
+        restarted = EmbeddingCache()
+        assert restarted.embed(db, "model-a", ["signature block"], embedder)[0].tolist() == list(first[1])
+        assert len(embedder.calls) == 3
+        assert restarted.get_stats()["db_hits"] == 1
+
+        # Another model never shares vectors
+        cache.embed(db, "model-b", ["caption"], embedder)
+        assert len(embedder.calls) == 4
+
+        stats = cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["request_duplicates"] == 1
+        assert stats["misses"] == 4
+        assert stats["hit_rate"] == "33.3%"
+
+    def test_memory_level_is_bounded(self, db):
+        cache = EmbeddingCache(max_entries=2)
+        cache.embed(db, "m", ["a", "b", "c"], CountingEmbedder())
+        assert cache.get_stats()["memory_entries"] == 2
+
+    def test_duplicate_store_is_ignored(self, db):
+        cache = EmbeddingCache()
+        digest = content_hash("x")
+        assert cache.store(db, "m", {digest: [1.0, 0.0]}) == 1
+        assert EmbeddingCache().store(db, "m", {digest: [1.0, 0.0]}) == 0
+        assert cache.lookup(db, "m", [digest])[digest].tolist() == [1.0, 0.0]
+
+
+class TestPipelineCache:
+    """Bulk ingestion skips boilerplate it has already embedded"""
+
+    BOILERPLATE = "\n\nCERTIFICATE OF SERVICE\n\n" + "I HEREBY CERTIFY that a true copy was served on all counsel of record. " * 12
+
+    def _documents(self, prefix):
+        return [
+            (Document(id=f"{prefix}-{i}", extracted_text=f"Motion {prefix} {i}. " * 20 + self.BOILERPLATE),
+             "case-1")
+            for i in range(3)
+        ]
+
+    def test_second_ingestion_embeds_nothing_new(self, db):
+        embedder = CountingEmbedder()
+        pipeline = EmbeddingPipeline(embed_fn=embedder, chunker=rag_service.chunk_document,
+                                     cache=EmbeddingCache(), model="stub", dimensions=4)
+
+        first = asyncio.run(pipeline.embed_documents(self._documents("a"), db))
+        assert first.reused > 0  # Identical boilerplate chunks were embedded once
+        assert first.embedded == len(set(embedder.calls)) == len(embedder.calls)
+        assert first.embedded + first.reused == first.total_chunks
+
+        again = asyncio.run(pipeline.embed_documents(self._documents("a"), db))
+        assert again.embedded == 0
+        assert again.total_chunks == first.total_chunks
+
+    def test_unexpected_dimensions_are_not_cached(self, db):
+        cache = EmbeddingCache()
+        pipeline = EmbeddingPipeline(embed_fn=CountingEmbedder(dimensions=3), chunker=rag_service.chunk_document,
+                                     cache=cache, model="stub", dimensions=4)
+
+        result = asyncio.run(pipeline.embed_documents(self._documents("b"), db))
+
+        assert result.total_chunks > 0
+        assert cache.get_stats()["stored"] == 0
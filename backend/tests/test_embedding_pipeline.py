@@ -0,0 +1,259 @@
+"""
+Tests for the batched, concurrent embedding pipeline
+
+Uses a local stub embedder: deterministic vectors, records batch sizes and
+peak concurrency, and blocks like a real HTTP client would.
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.embedding_pipeline import EmbeddingPipeline, _PendingChunk
+from app.services.embedding_storage import row_vector
+from app.services.rag_service import rag_service
+
+
+class StubEmbedder:
+    """Blocking embedder returning one-hot-ish vectors derived from the text"""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.batch_sizes = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.batch_sizes.append(len(texts))
+        try:
+            time.sleep(self.delay)  # Blocking, like the sync OpenAI client
+            if self.fail_on and any(self.fail_on in text for text in texts):
+                raise RuntimeError("embedding API unavailable")
+            return [self.vector(text) for text in texts]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    @staticmethod
+    def vector(text):
+        vector = [0.0] * 8
+        vector[sum(map(ord, text)) % 8] = 1.0
+        return vector
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.tables["document_embeddings"].create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+    get_case_vector_index_cache().clear()
+
+
+def _document(doc_id, paragraphs):
+    text = " ".join(f"Paragraph {i} of {doc_id}." * 30 for i in range(paragraphs))
+    return Document(id=doc_id, extracted_text=text, document_type="motion")
+
+
+class TestBatching:
+    """Chunks are packed under the token and item limits"""
+
+    def test_token_and_item_limits(self):
+        pipeline = EmbeddingPipeline(embed_fn=StubEmbedder(), chunker=rag_service.chunk_document,
+                                     max_batch_tokens=100, max_batch_items=3)
+        pending = [_PendingChunk("d", "c", {}, tokens) for tokens in (40, 40, 40, 10, 10, 10, 10, 500)]
+
+        batches = pipeline.build_batches(pending)
+
+        assert [[item.tokens for item in batch] for batch in batches] == [
+            [40, 40], [40, 10, 10], [10, 10], [500]
+        ]
+
+
+class TestEmbedDocuments:
+    """Many documents are embedded concurrently and stored in one insert"""
+
+    def test_embeds_and_stores_all_chunks(self, db):
+        embedder = StubEmbedder(delay=0.02)
+        pipeline = EmbeddingPipeline(embed_fn=embedder, chunker=rag_service.chunk_document,
+                                     max_batch_tokens=600, max_concurrency=3)
+        documents = [(_document(f"doc-{i}", 4), f"case-{i % 2}") for i in range(10)]
+        documents.append((Document(id="empty", extracted_text=None), "case-0"))
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            result = await pipeline.embed_documents(documents, db)
+            task.cancel()
+            return result, ticks
+
+        result, ticks = asyncio.run(run())
+
+        expected = {str(doc.id): len(rag_service.chunk_document(doc.extracted_text, str(doc.id)))
+                    for doc, _ in documents[:-1]}
+        assert result.chunks == {**expected, "empty": 0}
+        assert result.failed == {}
+        assert result.batches == len(embedder.batch_sizes) > 1
+        assert 1 < embedder.peak <= 3
+        assert ticks > result.batches  # The event loop kept running while embedding
+
+        rows = db.query(DocumentEmbedding).order_by(DocumentEmbedding.document_id, DocumentEmbedding.chunk_index).all()
+        assert len(rows) == result.total_chunks
+        for row in rows:
+            vector = row_vector(row.embedding_bytes, row.embedding)
+            assert np.array_equal(vector, StubEmbedder.vector(row.chunk_text))
+            assert row.case_id == f"case-{int(row.document_id.split('-')[1]) % 2}"
+
+    def test_failed_batch_only_fails_its_documents(self, db):
+        pipeline = EmbeddingPipeline(embed_fn=StubEmbedder(fail_on="doc-bad"), chunker=rag_service.chunk_document,
+                                     max_batch_tokens=600)
+        documents = [(_document("doc-ok", 3), "case"), (_document("doc-bad", 3), "case")]
+
+        result = asyncio.run(pipeline.embed_documents(documents, db))
+
+        assert result.chunks["doc-bad"] == 0
+        assert "unavailable" in result.failed["doc-bad"]
+        assert result.chunks["doc-ok"] > 0
+        assert {row.document_id for row in db.query(DocumentEmbedding.document_id)} == {"doc-ok"}
+
+    def test_embed_document_uses_pipeline(self, db):
+        document = _document("single", 2)
+        created = asyncio.run(rag_service.embed_document(document, "case-s", db))
+
+        assert created == len(rag_service.chunk_document(document.extracted_text, "single")) > 0
+        assert db.query(DocumentEmbedding).count() == created
+
+
+class TestWaves:
+    """Chunks are pulled from the chunker and stored in bounded waves"""
+
+    def test_late_failure_removes_earlier_waves(self, db):
+        pulled = []
+
+        def chunker(text, document_id, document_type):
+            for chunk in rag_service.iter_chunks(text, document_id, document_type):
+                pulled.append(chunk)
+                yield chunk
+
+        embedder = StubEmbedder(fail_on="Paragraph 5 of doc-bad")
+        pipeline = EmbeddingPipeline(embed_fn=embedder, chunker=chunker,
+                                     max_batch_tokens=600, max_wave_chunks=2)
+        documents = [(_document("doc-ok", 3), "case"), (_document("doc-bad", 6), "case")]
+
+        result = asyncio.run(pipeline.embed_documents(documents, db))
+
+        assert len(pulled) == result.chunks["doc-ok"] + len(rag_service.chunk_document(
+            documents[1][0].extracted_text, "doc-bad"))
+        assert result.chunks["doc-bad"] == 0
+        assert "doc-bad" in result.failed
+        assert {row.document_id for row in db.query(DocumentEmbedding.document_id)} == {"doc-ok"}
+
+
+class TestIncrementalReembed:
+    """Re-embedding a changed document only embeds the chunks that changed"""
+
+    @staticmethod
+    def _exhibit(changed_page=None):
+        pages = []
+        for page in range(12):
+            detail = "was revised after the OCR re-run" if page == changed_page else f"is unchanged on page {page}"
+            pages.append(f"{page + 1}. The witness testimony {detail}. " + f"Exhibit page {page} record. " * 25)
+        return Document(id="exhibit", extracted_text="\n\n".join(pages), document_type="exhibit")
+
+    def _rows(self, db):
+        return db.query(DocumentEmbedding).filter(
+            DocumentEmbedding.document_id == "exhibit"
+        ).order_by(DocumentEmbedding.chunk_index).all()
+
+    def test_only_changed_chunks_are_embedded(self, db):
+        embedder = StubEmbedder()
+        pipeline = EmbeddingPipeline(embed_fn=embedder, chunker=rag_service.iter_chunks)
+        first = asyncio.run(pipeline.embed_documents([(self._exhibit(), "case")], db))
+        original_ids = {row.id for row in self._rows(db)}
+        embedder.batch_sizes.clear()
+
+        again = asyncio.run(pipeline.embed_documents([(self._exhibit(changed_page=4), "case")], db))
+
+        expected = rag_service.chunk_document(self._exhibit(changed_page=4).extracted_text, "exhibit", "exhibit")
+        rows = self._rows(db)
+        assert [row.chunk_text for row in rows] == [chunk["chunk_text"] for chunk in expected]
+        assert [row.chunk_index for row in rows] == list(range(len(expected)))
+        assert sum(embedder.batch_sizes) == again.embedded == 1
+        assert again.unchanged == first.total_chunks - 1 and again.removed == 1
+        assert again.chunks["exhibit"] == len(rows)
+        assert len(original_ids & {row.id for row in rows}) == again.unchanged
+
+    def test_legacy_rows_are_matched_and_hashed(self, db):
+        pipeline = EmbeddingPipeline(embed_fn=StubEmbedder(), chunker=rag_service.iter_chunks)
+        asyncio.run(pipeline.embed_documents([(self._exhibit(), "case")], db))
+        db.query(DocumentEmbedding).update({"content_hash": None})
+        db.commit()
+
+        again = asyncio.run(pipeline.embed_documents([(self._exhibit(), "case")], db))
+
+        assert again.embedded == 0 and again.removed == 0
+        assert all(row.content_hash for row in self._rows(db))
+
+    def test_rows_of_another_model_are_reembedded(self, db):
+        # Fallback run: unstamped 8-dimension vectors
+        first = asyncio.run(EmbeddingPipeline(embed_fn=StubEmbedder(), chunker=rag_service.iter_chunks)
+                            .embed_documents([(self._exhibit(), "case")], db))
+        assert {row.embedding_model for row in self._rows(db)} == {None}
+
+        # The model's dimension differs: every row is replaced and stamped
+        wide = EmbeddingPipeline(embed_fn=lambda texts: [[1.0] * 16 for _ in texts],
+                                 chunker=rag_service.iter_chunks, model="model-a", dimensions=16)
+        again = asyncio.run(wide.embed_documents([(self._exhibit(), "case")], db))
+        assert again.embedded == first.total_chunks and again.unchanged == 0
+        assert {row.embedding_model for row in self._rows(db)} == {"model-a"}
+        assert asyncio.run(wide.embed_documents([(self._exhibit(), "case")], db)).embedded == 0
+
+        # Another model of the same dimension is not reused either
+        other = EmbeddingPipeline(embed_fn=lambda texts: [[0.5] * 16 for _ in texts],
+                                  chunker=rag_service.iter_chunks, model="model-b", dimensions=16)
+        assert asyncio.run(other.embed_documents([(self._exhibit(), "case")], db)).unchanged == 0
+
+    def test_unstamped_rows_of_the_model_dimension_are_adopted(self, db):
+        asyncio.run(EmbeddingPipeline(embed_fn=StubEmbedder(), chunker=rag_service.iter_chunks)
+                    .embed_documents([(self._exhibit(), "case")], db))
+
+        pipeline = EmbeddingPipeline(embed_fn=StubEmbedder(), chunker=rag_service.iter_chunks,
+                                     model="model-a", dimensions=8)
+        again = asyncio.run(pipeline.embed_documents([(self._exhibit(), "case")], db))
+
+        assert again.embedded == 0 and again.removed == 0
+        assert {row.embedding_model for row in self._rows(db)} == {"model-a"}
+
+    def test_failed_reembed_keeps_stored_rows(self, db):
+        asyncio.run(EmbeddingPipeline(embed_fn=StubEmbedder(), chunker=rag_service.iter_chunks)
+                    .embed_documents([(self._exhibit(), "case")], db))
+        before = [(row.id, row.chunk_text) for row in self._rows(db)]
+
+        pipeline = EmbeddingPipeline(embed_fn=StubEmbedder(fail_on="revised"), chunker=rag_service.iter_chunks)
+        result = asyncio.run(pipeline.embed_documents([(self._exhibit(changed_page=4), "case")], db))
+
+        assert "exhibit" in result.failed
+        assert [(row.id, row.chunk_text) for row in self._rows(db)] == before
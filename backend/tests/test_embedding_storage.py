@@ -0,0 +1,115 @@
+"""
+Tests for packed binary embedding storage and the JSON -> binary migration
+"""
+
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.document_embedding import DocumentEmbedding
+from app.services.case_vector_index import CaseVectorIndexCache
+from app.services.embedding_storage import (
+    FORMAT_FLOAT32,
+    FORMAT_INT8,
+    decode_embedding,
+    embedding_columns,
+    encode_embedding,
+    migrate_json_embeddings,
+    stored_dimension,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.tables["document_embeddings"].create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestCodec:
+    """encode_embedding / decode_embedding round trips"""
+
+    def test_float32_round_trip_is_exact_and_zero_copy(self):
+        vector = np.random.default_rng(1).normal(size=1536).astype(np.float32)
+        blob = encode_embedding(vector.tolist(), FORMAT_FLOAT32)
+
+        assert len(blob) == 4 + 1536 * 4
+        decoded = decode_embedding(blob)
+        assert decoded.dtype == np.float32
+        assert np.array_equal(decoded, vector)
+        assert not decoded.flags.owndata  # View over the bytes
+
+    def test_int8_round_trip_preserves_direction(self):
+        vector = np.random.default_rng(2).normal(size=1536)
+        blob = encode_embedding(vector, FORMAT_INT8)
+
+        assert len(blob) == 8 + 1536
+        decoded = decode_embedding(blob)
+        cosine = decoded @ vector / (np.linalg.norm(decoded) * np.linalg.norm(vector))
+        assert cosine > 0.999
+        assert np.max(np.abs(decoded - vector)) <= np.max(np.abs(vector)) / 127
+
+    def test_zero_vector_and_memoryview(self):
+        decoded = decode_embedding(memoryview(encode_embedding([0.0, 0.0], FORMAT_INT8)))
+        assert decoded.tolist() == [0.0, 0.0]
+
+    def test_stored_dimension_without_decoding(self):
+        assert stored_dimension(encode_embedding([1.0] * 768, FORMAT_FLOAT32), None) == 768
+        assert stored_dimension(encode_embedding([1.0] * 768, FORMAT_INT8), None) == 768
+        assert stored_dimension(None, [1.0] * 1536) == 1536
+        assert stored_dimension(None, None) is None
+
+    def test_unknown_format_rejected(self):
+        with pytest.raises(ValueError):
+            decode_embedding(b"\x09\x00\x00\x00")
+
+
+class TestMigration:
+    """Legacy JSON rows are converted in place and stay searchable"""
+
+    def test_migrates_json_rows(self, db):
+        rng = np.random.default_rng(3)
+        vectors = [rng.normal(size=16).tolist() for _ in range(25)]
+        for i, vector in enumerate(vectors):
+            db.add(DocumentEmbedding(
+                id=str(uuid.uuid4()), case_id="case-1", document_id="doc-1",
+                chunk_text=f"chunk {i}", chunk_index=i, embedding=vector,
+            ))
+        # Already-binary row is left alone
+        db.add(DocumentEmbedding(
+            id=str(uuid.uuid4()), case_id="case-1", document_id="doc-2", chunk_text="new",
+            chunk_index=0, **embedding_columns([1.0] * 16, FORMAT_FLOAT32),
+        ))
+        db.commit()
+
+        query = rng.normal(size=16).tolist()
+        before = CaseVectorIndexCache().get(db, "case-1").search(query, 5)
+
+        assert migrate_json_embeddings(db, FORMAT_FLOAT32, batch_size=7) == 25
+        assert migrate_json_embeddings(db, FORMAT_FLOAT32) == 0
+
+        rows = db.query(DocumentEmbedding.embedding, DocumentEmbedding.embedding_bytes).all()
+        assert all(row.embedding is None and row.embedding_bytes for row in rows)
+
+        after = CaseVectorIndexCache().get(db, "case-1").search(query, 5)
+        assert [row_id for row_id, _ in after] == [row_id for row_id, _ in before]
+        assert np.allclose([s for _, s in after], [s for _, s in before], atol=1e-6)
+
+    def test_keep_json(self, db):
+        db.add(DocumentEmbedding(
+            id="e1", case_id="case-1", document_id="doc-1", chunk_text="x",
+            chunk_index=0, embedding=[0.5, -0.25],
+        ))
+        db.commit()
+
+        assert migrate_json_embeddings(db, FORMAT_INT8, keep_json=True) == 1
+        row = db.get(DocumentEmbedding, "e1")
+        assert row.embedding == [0.5, -0.25]
+        assert np.allclose(decode_embedding(row.embedding_bytes), [0.5, -0.25], atol=0.01)
@@ -0,0 +1,196 @@
+"""
+Tests for the firm-wide IVF vector index and /rag/semantic/firm
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import rag_search
+from app.database import Base, get_db
+from app.models.case import Case
+from app.models.case_access import CaseAccess
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.models.user import User
+from app.services import firm_vector_index as firm_module
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.embedding_storage import embedding_columns
+from app.services.firm_vector_index import FirmVectorIndex
+from app.services.rag_service import rag_service
+from app.services.retrieval_cache import get_query_embedding_cache, get_search_result_cache
+from app.utils.auth import get_current_user
+
+DIMENSION = 16
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    for table in ("users", "cases", "case_access", "documents", "document_embeddings"):
+        Base.metadata.tables[table].create(engine)
+    yield engine
+    engine.dispose()
+    get_case_vector_index_cache().clear()
+    get_query_embedding_cache().clear()
+    get_search_result_cache().clear()
+
+
+def _clustered_rows(count, cases, seed=0):
+    """Vectors around a few directions, spread over cases"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(100, DIMENSION))
+    vectors = centers[rng.integers(0, 100, count)] + 0.3 * rng.normal(size=(count, DIMENSION))
+    return [(f"row-{i:05d}", f"case-{i % cases}", vectors[i].astype(np.float32)) for i in range(count)]
+
+
+def _store(db, rows):
+    db.bulk_insert_mappings(DocumentEmbedding, [
+        {"id": row_id, "case_id": case_id, "document_id": "doc", "chunk_text": row_id, "chunk_index": 0,
+         **embedding_columns(vector.tolist())}
+        for row_id, case_id, vector in rows
+    ])
+    db.commit()
+
+
+def _exact(rows, query, case_ids, top_k):
+    query = query / np.linalg.norm(query)
+    scored = [(row_id, float(vector @ query / np.linalg.norm(vector)))
+              for row_id, case_id, vector in rows if case_id in case_ids]
+    return [row_id for row_id, _ in sorted(scored, key=lambda r: r[1], reverse=True)[:top_k]]
+
+
+class TestFirmVectorIndex:
+    """IVF search, case filtering, persistence and incremental updates"""
+
+    def test_ivf_recall_and_case_filter(self, engine, tmp_path):
+        rows = _clustered_rows(3000, cases=30)
+        db = sessionmaker(bind=engine)()
+        _store(db, rows)
+
+        index = FirmVectorIndex(path=str(tmp_path / "index"), nprobe=16, exact_max_rows=0)
+        assert index.build(db, DIMENSION) == 3000
+
+        allowed = {f"case-{i}" for i in range(0, 30, 2)}
+        recalls = []
+        for _, _, query in rows[:20]:
+            hits = index.search(query, allowed, top_k=10)
+            assert all(case_id in allowed for _, case_id, _ in hits)
+            expected = _exact(rows, query, allowed, 10)
+            recalls.append(len({row_id for row_id, _, _ in hits} & set(expected)) / 10)
+        assert np.mean(recalls) >= 0.9
+
+        # Few visible rows: exact scan of those cases
+        exact = FirmVectorIndex(path=str(tmp_path / "index"))
+        assert exact.load()
+        query = rows[7][2]
+        assert [row_id for row_id, _, _ in exact.search(query, {"case-7"}, top_k=5)] == \
+            _exact(rows, query, {"case-7"}, 5)
+        assert exact.get_stats()["exact_searches"] == 1
+        db.close()
+
+    def test_persisted_memory_mapped_and_delta(self, engine, tmp_path):
+        rows = _clustered_rows(500, cases=5)
+        db = sessionmaker(bind=engine)()
+        _store(db, rows)
+        path = str(tmp_path / "index")
+        FirmVectorIndex(path=path).build(db, DIMENSION)
+
+        index = FirmVectorIndex(path=path)
+        new_vector = np.ones(DIMENSION, dtype=np.float32)
+        assert index.add_rows([("new-row", "case-new", new_vector), ("bad", "case-new", [1.0])]) == 1
+
+        reloaded = FirmVectorIndex(path=path)
+        assert reloaded.load()
+        assert isinstance(reloaded._vectors, np.memmap)
+        hits = reloaded.search(new_vector, {"case-new", "case-1"}, top_k=3)
+        assert hits[0][:2] == ("new-row", "case-new")
+        assert hits[0][2] == pytest.approx(1.0)
+
+        # Rebuild folds the table back in and resets the delta
+        reloaded.build(db, DIMENSION)
+        assert reloaded.get_stats()["delta_rows"] == 1  # new-row is not in the table: kept as delta
+        db.close()
+
+    def test_without_persisted_index_add_is_noop(self, tmp_path):
+        index = FirmVectorIndex(path=str(tmp_path / "missing"))
+        assert index.add_rows([("r", "c", np.ones(DIMENSION))]) == 0
+        assert not (tmp_path / "missing").exists()
+
+
+class TestFirmSearchEndpoint:
+    """/rag/semantic/firm only returns chunks of accessible cases"""
+
+    def test_access_grants(self, engine, tmp_path, monkeypatch):
+        monkeypatch.setattr(firm_module, "firm_vector_index", FirmVectorIndex(path=str(tmp_path / "index")))
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        db.add_all([
+            User(id="u1", email="u1@example.com", name="Associate"),
+            User(id="u2", email="u2@example.com", name="Partner"),
+            Case(id="own", user_id="u1", case_number="2025-CA-1", title="Own case"),
+            Case(id="shared", user_id="u2", case_number="2025-CA-2", title="Shared case"),
+            Case(id="private", user_id="u2", case_number="2025-CA-3", title="Private case"),
+            Case(id="revoked", user_id="u2", case_number="2025-CA-4", title="Revoked case"),
+            CaseAccess(case_id="shared", user_id="u1", role="viewer", is_active=True),
+            CaseAccess(case_id="revoked", user_id="u1", role="viewer", is_active=False),
+        ])
+        text = "Opposing counsel argued lack of personal jurisdiction over the defendant."
+        documents = [
+            Document(id=f"doc-{case_id}", case_id=case_id, user_id="u2", file_name=f"{case_id}.pdf",
+                     storage_path="x", document_type="motion", extracted_text=text)
+            for case_id in ("own", "shared", "private", "revoked")
+        ]
+        db.add_all(documents)
+        db.commit()
+        asyncio.run(rag_service.embed_documents([(d, d.case_id) for d in documents], db))
+
+        def override_get_db():
+            session = Session()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app = FastAPI()
+        app.include_router(rag_search.router, prefix="/rag")
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = lambda: db.get(User, "u1")
+        client = TestClient(app)
+
+        # No index yet: the request does not build it, a background thread does
+        response = client.post("/rag/semantic/firm", json={"query": "personal jurisdiction argument"})
+        assert response.status_code == 503
+        index = firm_module.get_firm_vector_index()
+        index._builder.join(timeout=30)
+        assert index.get_stats()["builds"] == 1
+
+        response = client.post("/rag/semantic/firm", json={"query": "personal jurisdiction argument"})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["cases_searched"] == 2
+        assert {source["case_id"] for source in body["sources"]} == {"own", "shared"}
+        assert {source["case_number"] for source in body["sources"]} == {"2025-CA-1", "2025-CA-2"}
+
+        # A document embedded after the build is visible immediately (delta)
+        late = Document(id="doc-late", case_id="own", user_id="u1", file_name="late.pdf", storage_path="y",
+                        document_type="order", extracted_text="Order on personal jurisdiction.")
+        db.add(late)
+        db.commit()
+        asyncio.run(rag_service.embed_documents([(late, "own")], db))
+
+        response = client.post("/rag/semantic/firm", json={"query": "personal jurisdiction argument",
+                                                          "case_ids": ["own", "private"]})
+        assert response.json()["cases_searched"] == 1
+        assert {source["document_id"] for source in response.json()["sources"]} == {"doc-own", "doc-late"}
+        db.close()
@@ -0,0 +1,211 @@
+"""
+Tests for the precomputed holiday table
+
+The vectorized generator must reproduce the scalar holiday rules exactly,
+the binary cache must round-trip, and court_holidays overrides must reach
+every calendar consumer.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - configure all mappers
+from app.database import Base
+from app.utils.court_day_index import CourtDayIndex
+from app.utils.florida_holidays import calculate_easter, get_last_weekday, get_nth_weekday
+from app.utils.holiday_provider import (
+    FIRST_YEAR,
+    LAST_YEAR,
+    HolidayProvider,
+    generate_calendars,
+    read_cache,
+)
+
+
+def _observed(d: date) -> date:
+    if d.weekday() == 5:
+        return d - timedelta(days=1)
+    if d.weekday() == 6:
+        return d + timedelta(days=1)
+    return d
+
+
+def _scalar_federal(year: int) -> set:
+    holidays = [
+        date(year, 1, 1),
+        get_nth_weekday(year, 1, 0, 3),
+        get_nth_weekday(year, 2, 0, 3),
+        get_last_weekday(year, 5, 0),
+        date(year, 7, 4),
+        get_nth_weekday(year, 9, 0, 1),
+        get_nth_weekday(year, 10, 0, 2),
+        date(year, 11, 11),
+        get_nth_weekday(year, 11, 3, 4),
+        date(year, 12, 25),
+    ]
+    if year >= 2021:
+        holidays.append(date(year, 6, 19))
+    return {_observed(h) for h in holidays}
+
+
+def _scalar_florida_state(year: int) -> set:
+    return _scalar_federal(year) | {
+        calculate_easter(year) - timedelta(days=2),
+        get_nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+    }
+
+
+@pytest.fixture
+def provider(tmp_path):
+    return HolidayProvider(str(tmp_path / "holidays.bin"))
+
+
+class TestGeneration:
+    """Vectorized generation matches the scalar holiday rules"""
+
+    def test_matches_scalar_rules_for_every_year(self):
+        calendars = generate_calendars()
+        lo, hi = date(FIRST_YEAR, 1, 1), date(LAST_YEAR, 12, 31)
+
+        expected_federal = set()
+        expected_state = set()
+        for year in range(FIRST_YEAR, LAST_YEAR + 1):
+            expected_federal |= _scalar_federal(year)
+            expected_state |= _scalar_florida_state(year)
+
+        federal = {date.fromordinal(int(o)) for o in calendars["federal"]}
+        state = {date.fromordinal(int(o)) for o in calendars["florida_state"]}
+        assert federal == {d for d in expected_federal if lo <= d <= hi}
+        assert state == {d for d in expected_state if lo <= d <= hi}
+
+    def test_observed_date_in_previous_year(self, provider):
+        """New Year's Day 2022 (Saturday) is observed Friday 2021-12-31"""
+        assert provider.is_holiday("federal", date(2021, 12, 31))
+        assert date(2021, 12, 31) in provider.holidays_for_year("federal", 2021)
+
+    def test_outside_precomputed_range(self, provider):
+        assert provider.holidays_for_year("state", 2150) == {
+            d for d in _scalar_florida_state(2150) | _scalar_florida_state(2151) if d.year == 2150
+        }
+        assert provider.is_holiday("federal", date(1985, 12, 25))
+
+
+class TestBinaryCache:
+    """The packed bitmap file round-trips and is reused"""
+
+    def test_written_then_loaded(self, tmp_path):
+        path = str(tmp_path / "holidays.bin")
+        first = HolidayProvider(path)
+        assert first.get_stats()["source"] == "generated"
+
+        second = HolidayProvider(path)
+        assert second.get_stats()["source"] == "cache"
+        for year in (FIRST_YEAR, 2026, LAST_YEAR):
+            assert second.holidays_for_year("florida_state", year) == first.holidays_for_year("florida_state", year)
+
+    def test_corrupt_cache_is_regenerated(self, tmp_path):
+        path = tmp_path / "holidays.bin"
+        path.write_bytes(b"not a holiday table")
+        assert read_cache(str(path)) is None
+
+        provider = HolidayProvider(str(path))
+        assert provider.get_stats()["source"] == "generated"
+        assert read_cache(str(path)) is not None
+
+
+class TestOverrides:
+    """court_holidays rows are layered over the computed calendars"""
+
+    def test_add_and_remove_closures(self, provider):
+        closure = date(2026, 3, 9)       # e.g. hurricane closure (Monday)
+        reopened = date(2026, 11, 27)    # day after Thanksgiving, court open
+        provider.set_overrides({"florida_state": {closure: True, reopened: False}})
+
+        assert provider.is_holiday("florida_state", closure)
+        assert not provider.is_holiday("florida_state", reopened)
+        assert closure in provider.holidays_for_year("florida_state", 2026)
+        assert not provider.is_holiday("federal", closure)
+
+    def test_jurisdiction_calendar_extends_federal(self, provider):
+        provider.set_overrides({"jurisdiction-1": {date(2026, 8, 3): True}})
+
+        assert provider.resolve("jurisdiction-1") == "jurisdiction-1"
+        assert provider.is_holiday("jurisdiction-1", date(2026, 8, 3))
+        assert provider.is_holiday("jurisdiction-1", date(2026, 12, 25))
+        assert provider.resolve("unknown") is None
+
+    def test_listeners_refresh_court_day_index(self, provider):
+        index = CourtDayIndex(lambda year: provider.holidays_for_year("federal", year), name="federal")
+        provider.on_change(index.clear)
+        closure = date(2026, 3, 9)
+        assert index.is_business_day(closure)
+
+        provider.set_overrides({"federal": {closure: True}})
+        assert not index.is_business_day(closure)
+        assert index.add_court_days(date(2026, 3, 6), 1) == date(2026, 3, 10)
+
+
+class TestJurisdictionCalendars:
+    """court_holidays rows keyed by jurisdiction id reach the calendar service"""
+
+    @pytest.fixture
+    def db_session(self):
+        engine = create_engine("sqlite://")
+        for table in ("users", "jurisdictions", "court_holidays"):
+            Base.metadata.tables[table].create(engine)
+        db = sessionmaker(bind=engine)()
+        yield db
+        db.close()
+
+    @pytest.fixture
+    def jurisdictions(self, db_session):
+        from app.models.court_holiday import CourtHoliday
+        from app.models.enums import JurisdictionType
+        from app.models.jurisdiction import Jurisdiction
+
+        florida = Jurisdiction(code="FL", name="Florida State Courts", jurisdiction_type=JurisdictionType.STATE)
+        georgia = Jurisdiction(code="GA", name="Georgia State Courts", jurisdiction_type=JurisdictionType.STATE)
+        db_session.add_all([florida, georgia])
+        db_session.flush()
+        db_session.add_all([
+            CourtHoliday(jurisdiction_id=florida.id, name="Hurricane closure",
+                         holiday_date=date(2026, 3, 9), year=2026),
+            CourtHoliday(jurisdiction_id=georgia.id, name="Confederate Memorial Day",
+                         holiday_date=date(2026, 4, 27), year=2026),
+        ])
+        db_session.flush()
+        return florida.id, georgia.id
+
+    @pytest.fixture
+    def calendar(self, provider, monkeypatch):
+        import app.services.calendar_service as calendar_module
+
+        monkeypatch.setattr(calendar_module, "get_holiday_provider", lambda: provider)
+        return calendar_module.CalendarService()
+
+    def test_builtin_jurisdiction_ids_resolve_to_builtin_calendars(self, provider, db_session, jurisdictions):
+        florida_id, georgia_id = jurisdictions
+        provider.load_overrides(db_session)
+
+        assert provider.resolve(florida_id) == "florida_state"
+        assert provider.is_holiday("florida_state", date(2026, 3, 9))
+        assert provider.is_holiday(florida_id, date(2026, 4, 3))      # Good Friday
+        assert provider.resolve(georgia_id) == georgia_id
+        assert not provider.is_holiday("florida_state", date(2026, 4, 27))
+
+    def test_calendar_service_consults_jurisdiction_overrides(self, provider, calendar, db_session, jurisdictions):
+        florida_id, georgia_id = jurisdictions
+        closure = date(2026, 4, 27)  # Monday
+        assert calendar.is_court_day(closure, jurisdiction=georgia_id)
+
+        provider.load_overrides(db_session)
+
+        assert calendar.is_holiday(closure, jurisdiction=georgia_id)
+        assert not calendar.is_court_day(closure, jurisdiction=georgia_id)
+        assert calendar.adjust_for_holidays_and_weekends(date(2026, 4, 25), jurisdiction=georgia_id) == date(2026, 4, 28)
+        assert calendar.is_court_day(closure, jurisdiction="florida_state")
+        assert not calendar.is_court_day(date(2026, 3, 9), jurisdiction=florida_id)
+        assert calendar.is_court_day(closure, jurisdiction="unknown")
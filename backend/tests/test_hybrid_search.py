@@ -0,0 +1,86 @@
+"""
+Tests for reciprocal rank fusion hybrid search (non-pgvector path)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.rag_service import RAGService, reciprocal_rank_fusion, rag_service
+
+
+class TestReciprocalRankFusion:
+    """score = sum(weight / (k + rank))"""
+
+    def test_items_in_both_rankings_win(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+        assert [item for item, _ in fused] == ["c", "a", "b", "d"]
+        assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+
+    def test_weights(self):
+        fused = reciprocal_rank_fusion([["a"], ["b"]], weights=[0.2, 0.8])
+        assert [item for item, _ in fused] == ["b", "a"]
+
+    def test_single_ranking_keeps_order(self):
+        assert [item for item, _ in reciprocal_rank_fusion([["x", "y", "z"]])] == ["x", "y", "z"]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.tables["document_embeddings"].create(engine)
+    session = sessionmaker(bind=engine)()
+
+    documents = [
+        Document(id="order", document_type="order",
+                 extracted_text="The court grants the motion to compel discovery responses within ten days."),
+        Document(id="notice", document_type="notice",
+                 extracted_text="Notice of hearing on the motion for summary judgment set for March."),
+        Document(id="certificate", document_type="certificate",
+                 extracted_text="I certify a copy was furnished by email to all counsel of record."),
+    ]
+    asyncio.run(rag_service.embed_documents([(d, "case-1") for d in documents], session))
+
+    yield session
+    session.close()
+    engine.dispose()
+    get_case_vector_index_cache().clear()
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestFallbackHybridSearch:
+    """Vector index + keyword ranking fused in-process"""
+
+    def test_semantic_weight_only_matches_semantic_order(self, db):
+        semantic = _run(rag_service.semantic_search("motion to compel discovery", "case-1", db, top_k=3))
+        hybrid = _run(rag_service.hybrid_search("motion to compel discovery", "case-1", db, top_k=3, alpha=1.0))
+
+        assert [r['document_id'] for r in hybrid] == [r['document_id'] for r in semantic]
+        assert [r['semantic_score'] for r in hybrid] == pytest.approx([r['similarity'] for r in semantic])
+
+    def test_keyword_ranking_is_fused(self, db, monkeypatch):
+        certificate_id = db.query(DocumentEmbedding.id).filter(
+            DocumentEmbedding.document_id == "certificate"
+        ).scalar()
+
+        async def keyword_search(self, query, case_id, db, top_k):
+            return [(certificate_id, 4.0)]
+
+        monkeypatch.setattr(RAGService, "_keyword_search", keyword_search)
+
+        semantic_only = _run(rag_service.hybrid_search("counsel", "case-1", db, top_k=3, alpha=1.0))
+        keyword_only = _run(rag_service.hybrid_search("counsel", "case-1", db, top_k=3, alpha=0.0))
+
+        assert keyword_only[0]['document_id'] == "certificate"
+        assert keyword_only[0]['bm25_score'] == 1.0
+        assert len(semantic_only) == 3
+        assert {r['document_id'] for r in semantic_only} == {"order", "notice", "certificate"}
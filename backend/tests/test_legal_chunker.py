@@ -0,0 +1,100 @@
+"""
+Tests for the structure-aware streaming legal chunker
+"""
+
+import types
+
+from app.services.legal_chunker import HEADING, NUMBERED, WHEREFORE, LegalChunker, iter_blocks, iter_sentences
+
+
+MOTION = """IN THE CIRCUIT COURT OF THE ELEVENTH JUDICIAL CIRCUIT
+IN AND FOR MIAMI-DADE COUNTY, FLORIDA
+
+CASE NO.: 2024-CA-001234
+
+JOHN SMITH,
+    Plaintiff,
+v.
+ACME CORP.,
+    Defendant.
+
+DEFENDANT'S MOTION TO DISMISS
+
+Defendant moves to dismiss pursuant to Fla. R. Civ. P. 1.140(b)(6), and states:
+
+1. Plaintiff filed the complaint on January 5, 2024.
+2. The complaint fails to state a cause of action. """ + "The allegations are conclusory. " * 40 + """
+3. Service was made under section 48.031, Fla. Stat.
+
+WHEREFORE, Defendant requests that the Court dismiss the complaint.
+
+CERTIFICATE OF SERVICE
+
+I HEREBY CERTIFY that a true copy was served on all counsel of record.
+"""
+
+
+def _chunks(text, **kwargs):
+    return list(LegalChunker(**kwargs).iter_chunks(text, "doc-1", "motion"))
+
+
+class TestBlocks:
+    """Lines are grouped into structural blocks"""
+
+    def test_block_kinds(self):
+        kinds = [kind for _, _, kind in iter_blocks(MOTION)]
+        assert kinds[:3] == [HEADING, HEADING, HEADING]
+        assert kinds.count(NUMBERED) == 3
+        assert WHEREFORE in kinds
+
+    def test_citations_do_not_end_sentences(self):
+        text = "See Smith v. Jones, 123 So. 3d 456 (Fla. 3d DCA 2019). Rule 1.140 applies. Next."
+        assert [text[a:b] for a, b in iter_sentences(text, 0, len(text))] == [
+            "See Smith v. Jones, 123 So. 3d 456 (Fla. 3d DCA 2019). ",
+            "Rule 1.140 applies. ",
+            "Next.",
+        ]
+
+
+class TestLegalChunker:
+    """Chunks follow structure and stay within the token budget"""
+
+    def test_structure_is_kept(self):
+        chunks = _chunks(MOTION, max_tokens=120, overlap_tokens=20)
+        texts = [chunk["chunk_text"] for chunk in chunks]
+
+        assert [chunk["chunk_index"] for chunk in chunks] == list(range(len(chunks)))
+        assert all(chunk["chunk_metadata"]["tokens"] <= 120 for chunk in chunks)
+        # The caption stays in one chunk; the motion title starts the next
+        assert texts[0].startswith("IN THE CIRCUIT COURT") and texts[0].endswith("Defendant.")
+        assert texts[1].startswith("DEFENDANT'S MOTION TO DISMISS")
+        assert "Fla. R. Civ. P. 1.140(b)(6)" in texts[1]
+        # WHEREFORE clause and certificate get their own chunks
+        assert texts[-2] == "WHEREFORE, Defendant requests that the Court dismiss the complaint."
+        assert texts[-1].startswith("CERTIFICATE OF SERVICE\n\nI HEREBY CERTIFY")
+        assert chunks[-1]["chunk_metadata"]["section"] == "CERTIFICATE OF SERVICE"
+        assert chunks[2]["chunk_metadata"]["section"] == "DEFENDANT'S MOTION TO DISMISS"
+
+    def test_oversized_paragraph_splits_on_sentences_with_overlap(self):
+        chunks = _chunks(MOTION, max_tokens=120, overlap_tokens=20)
+        paragraph = [c for c in chunks if "conclusory" in c["chunk_text"]]
+
+        assert len(paragraph) > 1
+        assert all(c["chunk_text"].endswith(".") for c in paragraph)
+        for previous, current in zip(paragraph, paragraph[1:]):
+            assert current["chunk_metadata"]["start_char"] < previous["chunk_metadata"]["end_char"]
+
+    def test_streams_lazily(self):
+        text = "\n\n".join(f"{i}. Paragraph {i} of the record." for i in range(1, 100000))
+        chunks = LegalChunker(max_tokens=200).iter_chunks(text, "record")
+
+        assert isinstance(chunks, types.GeneratorType)
+        first = next(chunks)
+        assert first["chunk_text"].startswith("1. Paragraph 1 ")
+        assert first["chunk_metadata"]["end_char"] < 1000
+
+    def test_text_without_structure(self):
+        text = "word " * 5000
+        chunks = _chunks(text, max_tokens=100, overlap_tokens=0)
+        assert "".join(c["chunk_text"] + " " for c in chunks).split() == text.split()
+        assert all(c["chunk_metadata"]["tokens"] <= 100 for c in chunks)
@@ -0,0 +1,158 @@
+"""
+Tests for pre-generated Morning Report snapshots
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - configure all mappers
+from app.database import Base
+from app.models.case import Case
+from app.models.deadline import Deadline
+from app.models.morning_report import MorningReportSnapshot
+from app.models.user import User
+from app.services.morning_report_snapshot import (
+    _with_current_greeting,
+    get_morning_report,
+    refresh_morning_report_snapshots,
+)
+
+TODAY = date.today()
+USERS = ("u1", "u2", "u3")
+EARLIER = datetime.now() - timedelta(hours=1)  # SQLite's now() has one-second resolution
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # File database: every worker thread gets its own connection
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    for table in ("users", "cases", "documents", "deadlines", "morning_report_snapshots"):
+        Base.metadata.tables[table].create(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    for user_id in USERS:
+        session.add(User(id=user_id, email=f"{user_id}@example.com", name=f"Attorney {user_id}"))
+        session.add(Case(id=f"case-{user_id}", user_id=user_id, case_number=user_id, title="Matter",
+                         status="active", updated_at=EARLIER))
+    session.flush()
+    for user_id in USERS:
+        session.add(Deadline(id=f"due-{user_id}", case_id=f"case-{user_id}", user_id=user_id,
+                             title="Answer", deadline_date=TODAY + timedelta(days=2),
+                             status="pending", priority="fatal", updated_at=EARLIER))
+    session.commit()
+    session.close()
+    return factory
+
+
+class TestSnapshotJob:
+    """The job generates everyone once, then only users whose data changed"""
+
+    def test_regenerates_only_changed_users(self, session_factory):
+        assert refresh_morning_report_snapshots(session_factory, max_workers=3) == \
+            {"users": 3, "generated": 3, "skipped": 0, "failed": 0}
+        assert refresh_morning_report_snapshots(session_factory, max_workers=3)["generated"] == 0
+
+        db = session_factory()
+        db.get(Deadline, "due-u2").status = "completed"
+        db.commit()
+        assert refresh_morning_report_snapshots(session_factory, max_workers=3) == \
+            {"users": 3, "generated": 1, "skipped": 2, "failed": 0}
+        assert db.get(MorningReportSnapshot, "u2").report["upcoming_deadlines"] == []
+        assert len(db.get(MorningReportSnapshot, "u1").report["upcoming_deadlines"]) == 1
+
+        # Yesterday's snapshots are stale whatever the data
+        db.get(MorningReportSnapshot, "u3").report_date = TODAY - timedelta(days=1)
+        db.commit()
+        assert refresh_morning_report_snapshots(session_factory)["generated"] == 1
+        db.close()
+
+    def test_write_stamped_before_the_latest_change(self, session_factory):
+        db = session_factory()
+        db.add(Deadline(id="latest", case_id="case-u1", user_id="u1", title="Brief", status="completed",
+                        deadline_date=TODAY + timedelta(days=2), updated_at=EARLIER + timedelta(minutes=30)))
+        db.commit()
+        refresh_morning_report_snapshots(session_factory)
+
+        # Committed by a transaction that started before "latest" was written:
+        # row count and max(updated_at) are unchanged
+        deadline = db.get(Deadline, "due-u1")
+        deadline.status, deadline.updated_at = "completed", EARLIER + timedelta(minutes=10)
+        db.commit()
+        assert refresh_morning_report_snapshots(session_factory)["generated"] == 1
+        assert db.get(MorningReportSnapshot, "u1").report["upcoming_deadlines"] == []
+        db.close()
+
+    @pytest.fixture
+    def shared(self, session_factory):
+        # u1 works a deadline on u2's case
+        db = session_factory()
+        db.add(Deadline(id="shared", case_id="case-u2", user_id="u1", title="Reply",
+                        deadline_date=TODAY + timedelta(days=3), status="pending", updated_at=EARLIER))
+        db.commit()
+        refresh_morning_report_snapshots(session_factory)
+        yield db
+        db.close()
+
+    # SQLite timestamps have one-second resolution: one change per test
+
+    def test_deadline_change_on_shared_case(self, session_factory, shared):
+        shared.get(Deadline, "shared").status = "completed"
+        shared.commit()
+        assert refresh_morning_report_snapshots(session_factory) == \
+            {"users": 3, "generated": 1, "skipped": 2, "failed": 0}
+        assert len(shared.get(MorningReportSnapshot, "u1").report["upcoming_deadlines"]) == 1
+
+    def test_shared_case_closed(self, session_factory, shared):
+        assert len(shared.get(MorningReportSnapshot, "u1").report["upcoming_deadlines"]) == 2
+        shared.get(Case, "case-u2").status = "closed"
+        shared.commit()
+        assert refresh_morning_report_snapshots(session_factory)["generated"] == 2  # Owner and u1
+        assert [d["deadline_id"] for d in shared.get(MorningReportSnapshot, "u1").report["upcoming_deadlines"]] == \
+            ["due-u1"]
+
+
+class TestMorningReportEndpoint:
+    """Current snapshots are served with one read"""
+
+    def test_single_read_when_current(self, session_factory, engine):
+        refresh_morning_report_snapshots(session_factory)
+        db = session_factory()
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        report = get_morning_report(db, "u1")
+        assert len(statements) == 1
+        assert report["upcoming_deadlines"][0]["deadline_id"] == "due-u1"
+
+        # A change since generation falls back to live generation and stores it
+        db.add(Deadline(id="new", case_id="case-u1", user_id="u1", title="Reply",
+                        deadline_date=TODAY + timedelta(days=1), status="pending"))
+        db.commit()
+        statements.clear()
+        assert len(get_morning_report(db, "u1")["upcoming_deadlines"]) == 2
+        assert len(statements) > 1
+
+        statements.clear()
+        assert len(get_morning_report(db, "u1")["upcoming_deadlines"]) == 2
+        assert len(statements) == 1
+
+        # So does a different last login
+        login = datetime(2026, 1, 5, 8, 0)
+        get_morning_report(db, "u1", last_login=login)
+        assert db.get(MorningReportSnapshot, "u1").last_login == login
+        db.close()
+
+    def test_greeting_follows_time_of_day(self):
+        report = {"greeting": "Good morning, Pat. Busy day ahead.", "generated_at": "2026-01-05T05:30:00"}
+        assert _with_current_greeting(report, datetime(2026, 1, 5, 9, 0)) is report
+        assert _with_current_greeting(report, datetime(2026, 1, 5, 14, 0))["greeting"] == \
+            "Good afternoon, Pat. Busy day ahead."
@@ -0,0 +1,123 @@
+"""
+Tests for the query-embedding and search-result caches
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.document import Document
+from app.models.document_embedding import DocumentEmbedding
+from app.services.case_vector_index import get_case_vector_index_cache
+from app.services.rag_service import rag_service
+from app.services.retrieval_cache import (
+    QueryEmbeddingCache,
+    SearchResultCache,
+    bump_case_embedding_generation,
+    get_case_embedding_generation,
+    get_query_embedding_cache,
+    get_search_result_cache,
+    make_search_key,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.tables["document_embeddings"].create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+    get_case_vector_index_cache().clear()
+    get_query_embedding_cache().clear()
+    get_search_result_cache().clear()
+
+
+class TestQueryEmbeddingCache:
+    """LRU + TTL keyed by model and normalized text"""
+
+    def test_normalized_key_and_model(self):
+        cache = QueryEmbeddingCache()
+        cache.set("m", "motion  to\ncompel", [1.0, 2.0])
+        assert cache.get("m", "motion to compel") == [1.0, 2.0]
+        assert cache.get("other", "motion to compel") is None
+
+    def test_ttl_and_size(self):
+        expired = QueryEmbeddingCache(ttl_seconds=0)
+        expired.set("m", "q", [1.0])
+        assert expired.get("m", "q") is None
+        assert expired.get_stats()["expired"] == 1
+
+        small = QueryEmbeddingCache(max_entries=2)
+        for query in ("a", "b", "c"):
+            small.set("m", query, [0.0])
+        assert len(small) == 2 and small.get("m", "a") is None
+
+
+class TestSearchResultCache:
+    """Results are served only while the case's embedding generation holds"""
+
+    def test_generation_invalidates(self):
+        cache = SearchResultCache()
+        key = make_search_key("case-gen", "semantic", "Notice of hearing", 5)
+        cache.set(key, [{"document_id": "d"}], get_case_embedding_generation("case-gen"))
+
+        hit = cache.get(key)
+        assert hit == [{"document_id": "d"}]
+        hit[0]["document_id"] = "mutated"
+        assert cache.get(key) == [{"document_id": "d"}]
+
+        bump_case_embedding_generation("case-gen")
+        assert cache.get(key) is None
+        assert cache.get_stats()["stale"] == 1
+
+    def test_result_computed_across_a_bump_is_dropped(self):
+        cache = SearchResultCache()
+        key = make_search_key("case-race", "semantic", "q", 5)
+        generation = get_case_embedding_generation("case-race")
+        bump_case_embedding_generation("case-race")
+        cache.set(key, [], generation)
+        assert len(cache) == 0
+
+
+class TestRagServiceCaching:
+    """Repeated chat lookups reuse the query embedding and results"""
+
+    def test_repeated_search_and_invalidation(self, db, monkeypatch):
+        calls = []
+        generate = rag_service.generate_embeddings
+
+        def counting_generate(texts):
+            calls.append(list(texts))
+            return generate(texts)
+
+        monkeypatch.setattr(rag_service, "generate_embeddings", counting_generate)
+        monkeypatch.setattr(rag_service.embedding_pipeline, "embed_fn", counting_generate)
+
+        first = Document(id="order", document_type="order", extracted_text="Order granting motion to compel.")
+        asyncio.run(rag_service.embed_documents([(first, "case-cache")], db))
+        calls.clear()
+
+        results = asyncio.run(rag_service.semantic_search("motion to compel", "case-cache", db, top_k=5))
+        again = asyncio.run(rag_service.semantic_search("motion  to compel", "case-cache", db, top_k=5))
+        hybrid = asyncio.run(rag_service.hybrid_search("motion to compel", "case-cache", db, top_k=5))
+        asyncio.run(rag_service.hybrid_search("motion to compel", "case-cache", db, top_k=5))
+
+        assert again == results and len(hybrid) == 1
+        assert calls == [["motion to compel"]]  # One query embedding for all four searches
+
+        # Embedding a new document makes it visible on the next search
+        second = Document(id="notice", document_type="notice", extracted_text="Notice of motion to compel.")
+        asyncio.run(rag_service.embed_documents([(second, "case-cache")], db))
+        refreshed = asyncio.run(rag_service.semantic_search("motion to compel", "case-cache", db, top_k=5))
+        assert {r["document_id"] for r in refreshed} == {"order", "notice"}
+
+        # ORM deletes bump the generation on commit
+        generation = get_case_embedding_generation("case-cache")
+        db.delete(db.query(DocumentEmbedding).filter(DocumentEmbedding.document_id == "notice").one())
+        db.commit()
+        assert get_case_embedding_generation("case-cache") == generation + 1
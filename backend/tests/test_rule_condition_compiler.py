@@ -0,0 +1,111 @@
+"""
+Tests for compiled Authority Core rule conditions
+"""
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from app.services.rule_condition_compiler import CompiledConditionCache, compile_conditions
+
+
+class TestCompileConditions:
+    """Compiled predicates follow the conditions document semantics"""
+
+    def test_empty_conditions_match_everything(self):
+        assert compile_conditions(None)({"case_type": "civil"})
+        assert compile_conditions({})({})
+
+    def test_case_type_patterns(self):
+        match = compile_conditions({"case_types": ["Civil", "regex:^crim", "small_*"]})
+        assert match({"case_type": "civil"})
+        assert match({"case_type": "Criminal Felony"})
+        assert match({"case_type": "small_claims"})
+        assert not match({"case_type": "family"})
+        # Missing case type is not a reason to exclude the rule
+        assert match({})
+
+    def test_invalid_regex_never_matches(self):
+        assert not compile_conditions({"case_types": ["regex:(unclosed"]})({"case_type": "civil"})
+        # Invalid regex condition is skipped rather than failing the rule
+        assert compile_conditions({"regex": {"court": "(unclosed"}})({"court": "circuit"})
+
+    def test_date_range_bounds(self):
+        match = compile_conditions({"date_range": {"filing_date": {"on_or_after": "2024-01-01", "before": "2025-01-01"}}})
+        assert match({"filing_date": "2024-01-01"})
+        assert match({"filing_date": date(2024, 6, 1)})
+        assert not match({"filing_date": "2025-01-01T10:00:00Z"})
+        assert not match({"filing_date": "2023-12-31"})
+
+    def test_today_is_evaluated_at_match_time(self):
+        match = compile_conditions({"date_range": {"hearing_date": {"after": "today"}}})
+        assert match({"hearing_date": date.today() + timedelta(days=1)})
+        assert not match({"hearing_date": date.today()})
+
+    def test_numeric_boolean_and_required_fields(self):
+        match = compile_conditions({
+            "numeric": {"amount": {"gt": 100, "lte": 5000}},
+            "boolean": {"jury_demanded": "yes"},
+            "required_fields": ["county"],
+        })
+        assert match({"amount": "250", "jury_demanded": True, "county": "leon"})
+        assert not match({"amount": 50, "jury_demanded": True, "county": "leon"})
+        assert not match({"amount": 250, "jury_demanded": "off", "county": "leon"})
+        assert not match({"amount": 250, "jury_demanded": True, "county": None})
+
+    def test_boolean_logic(self):
+        match = compile_conditions({
+            "$or": [
+                {"case_types": ["family"]},
+                {"$and": [{"motion_types": ["msj"]}, {"$not": {"exclusions": {"county": ["dade"]}}}]},
+            ]
+        })
+        assert match({"case_type": "family"})
+        assert match({"case_type": "civil", "motion_type": "msj", "county": "dade"})
+        assert not match({"case_type": "civil", "motion_type": "msj", "county": "leon"})
+
+
+class TestCompiledConditionCache:
+    """Predicates are reused per rule version and recompiled on change"""
+
+    def test_reuses_predicate_for_same_rule_version(self):
+        cache = CompiledConditionCache()
+        rule = SimpleNamespace(id="r1", version=1, conditions={"case_types": ["civil"]})
+
+        assert cache.for_rule(rule) is cache.for_rule(rule)
+        assert cache.get_stats()["compilations"] == 1
+
+    def test_recompiles_when_rules_change(self):
+        cache = CompiledConditionCache()
+        rule = SimpleNamespace(id="r1", version=1, conditions={"case_types": ["civil"]})
+        assert cache.for_rule(rule)({"case_type": "civil"})
+
+        # New version
+        rule.version, rule.conditions = 2, {"case_types": ["family"]}
+        assert not cache.for_rule(rule)({"case_type": "civil"})
+
+        # Edited in place without a version bump (e.g. by another process)
+        rule.conditions = {"case_types": ["civil"]}
+        assert cache.for_rule(rule)({"case_type": "civil"})
+        assert cache.get_stats()["compilations"] == 3
+
+    def test_deadline_predicates_compiled_with_the_rule(self):
+        cache = CompiledConditionCache()
+        rule = SimpleNamespace(id="r2", version=1, conditions=None, deadlines=[
+            {"title": "Always"},
+            {"title": "MSJ only", "conditions": {"motion_types": ["msj"]}},
+        ])
+
+        assert cache.for_deadline(rule, 0)({"motion_type": "mtd"})
+        assert not cache.for_deadline(rule, 1)({"motion_type": "mtd"})
+        assert cache.for_deadline(rule, 1) is cache.for_deadline(rule, 1)
+        assert cache.get_stats()["compilations"] == 1
+
+        rule.deadlines[0]["conditions"] = {"motion_types": ["mtd"]}
+        assert not cache.for_deadline(rule, 0)({"motion_type": "msj"})
+        assert cache.get_stats()["compilations"] == 2
+
+    def test_anonymous_conditions_keyed_by_content(self):
+        cache = CompiledConditionCache()
+        first = cache.for_conditions({"motion_types": ["msj"], "case_types": ["civil"]})
+        second = cache.for_conditions({"case_types": ["civil"], "motion_types": ["msj"]})
+        assert first is second
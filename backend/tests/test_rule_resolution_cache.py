@@ -0,0 +1,119 @@
+"""
+Tests for generation-based rule resolution caching
+"""
+
+import time
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from app.services.rule_resolution_cache import (
+    RuleResolutionCache,
+    bump_rules_generation,
+    case_context_fingerprint,
+    get_rules_generation,
+    make_resolution_key,
+)
+from app.services.rules_engine import RulesEngine, rules_engine, TriggerType
+
+
+class TestRuleResolutionCache:
+    """Entries are served only while their generation is current"""
+
+    def test_hit_then_stale_after_bump(self):
+        cache = RuleResolutionCache()
+        key = make_resolution_key("test", "florida_state", "civil", TriggerType.COMPLAINT_SERVED)
+
+        cache.set(key, ("a", "b"), get_rules_generation())
+        assert cache.get(key) == ("a", "b")
+
+        bump_rules_generation("test")
+        assert cache.get(key) is None
+        assert cache.get_stats()["stale"] == 1
+
+    def test_value_computed_across_a_bump_is_not_cached(self):
+        cache = RuleResolutionCache()
+        key = make_resolution_key("test", "federal", "civil", TriggerType.TRIAL_DATE)
+
+        generation = get_rules_generation()
+        bump_rules_generation("rules changed mid-resolution")
+        cache.set(key, ("old",), generation)
+
+        assert cache.get(key) is None
+
+    def test_entries_expire_for_edits_made_elsewhere(self, monkeypatch):
+        cache = RuleResolutionCache(ttl_seconds=60)
+        key = make_resolution_key("test", "florida_state", "civil", TriggerType.TRIAL_DATE)
+        cache.set(key, ("a",), get_rules_generation())
+
+        # No bump: the edit was committed by another process
+        clock = time.monotonic() + 61
+        monkeypatch.setattr("app.services.rule_resolution_cache.time.monotonic", lambda: clock)
+        assert cache.get(key) is None
+        assert cache.get_stats()["expired"] == 1
+
+    def test_lru_bound(self):
+        cache = RuleResolutionCache(max_entries=2)
+        generation = get_rules_generation()
+        for i in range(3):
+            cache.set(("k", i), i, generation)
+
+        assert len(cache) == 2
+        assert cache.get(("k", 0)) is None
+        assert cache.get(("k", 2)) == 2
+
+    def test_context_fingerprint_ignores_key_order(self):
+        a = case_context_fingerprint({"case_type": "civil", "service_method": "mail"})
+        b = case_context_fingerprint({"service_method": "mail", "case_type": "civil"})
+        assert a == b
+        assert case_context_fingerprint(None) is None
+        assert a != case_context_fingerprint({"case_type": "family", "service_method": "mail"})
+
+
+class TestRulesEngineLookup:
+    """Hardcoded template lookup uses a prebuilt index but returns fresh lists"""
+
+    def test_applicable_rules_match_linear_scan(self):
+        for template in rules_engine.get_all_templates():
+            expected = [
+                t for t in rules_engine.get_all_templates()
+                if (t.jurisdiction, t.court_type, t.trigger_type)
+                == (template.jurisdiction, template.court_type, template.trigger_type)
+            ]
+            assert rules_engine.get_applicable_rules(
+                template.jurisdiction, template.court_type, template.trigger_type
+            ) == expected
+
+    def test_returned_list_is_a_copy(self):
+        first = rules_engine.get_applicable_rules("florida_state", "civil", TriggerType.TRIAL_DATE)
+        first.append("sentinel")
+        second = rules_engine.get_applicable_rules("florida_state", "civil", TriggerType.TRIAL_DATE)
+        assert "sentinel" not in second
+
+
+class TestLazyRuleFamilies:
+    """Hardcoded rule families load on first use, per jurisdiction"""
+
+    @pytest.fixture
+    def cold_families(self, monkeypatch):
+        monkeypatch.setattr(RulesEngine, "_family_cache", {})
+        return RulesEngine._family_cache
+
+    def test_construction_loads_nothing(self, cold_families):
+        RulesEngine()
+        assert cold_families == {}
+
+    def test_lookup_loads_only_matching_jurisdiction(self, cold_families):
+        engine = RulesEngine()
+        rules = engine.get_applicable_rules("florida_state", "civil", TriggerType.COMPLAINT_SERVED)
+
+        assert rules
+        assert set(cold_families) == {"florida_civil", "florida_pretrial", "appellate"}
+
+    def test_templates_are_immutable(self, cold_families):
+        engine = RulesEngine()
+        template = engine.get_all_templates()[0]
+        with pytest.raises(FrozenInstanceError):
+            template.name = "changed"
+        with pytest.raises(TypeError):
+            engine.rule_templates["x"] = template
@@ -0,0 +1,139 @@
+"""
+Tests for the columnar workload saturation analysis
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - configure all mappers
+from app.database import Base
+from app.models.case import Case
+from app.models.deadline import Deadline
+from app.models.user import User
+from app.services.workload_optimizer import WorkloadOptimizer
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    for table in ("users", "cases", "deadlines"):
+        Base.metadata.tables[table].create(engine)
+    session = sessionmaker(bind=engine)()
+    for user_id in ("u1", "u2"):
+        session.add(User(id=user_id, email=f"{user_id}@example.com"))
+        session.add(Case(id=f"case-{user_id}", user_id=user_id, case_number=user_id, title="Matter"))
+    session.flush()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _add(db, user_id, days, count=1, priority="standard", status="pending", **fields):
+    for _ in range(count):
+        db.add(Deadline(user_id=user_id, case_id=f"case-{user_id}", title=f"Due in {days}",
+                        deadline_date=TODAY + timedelta(days=days), priority=priority,
+                        status=status, **fields))
+    db.flush()
+
+
+@pytest.fixture
+def optimizer(monkeypatch):
+    optimizer = WorkloadOptimizer()
+
+    async def no_ai(risk_day, daily_workload, db):
+        return {"date": risk_day["date"]}
+
+    monkeypatch.setattr(optimizer, "_generate_rebalance_suggestion", no_ai)
+    return optimizer
+
+
+class TestCalendarSaturation:
+    """Single-attorney analysis keeps its response shape"""
+
+    def test_scores_and_risk_days(self, db, optimizer):
+        _add(db, "u1", 1, priority="fatal")  # 1 + 10
+        _add(db, "u1", 1, priority="important", trigger_event="Pretrial Hearing")  # 1 + 3
+        _add(db, "u1", 1, is_dependent=False)
+        _add(db, "u1", 2, count=4)
+        _add(db, "u1", 3, count=9, status="completed")
+        _add(db, "u2", 1, count=12)
+
+        data = asyncio.run(optimizer.analyze_calendar_saturation("u1", db, days_ahead=30))
+
+        tomorrow = (TODAY + timedelta(days=1)).isoformat()
+        assert data["workload_heatmap"] == {
+            tomorrow: {"risk_score": 16.0, "deadline_count": 3, "moveable_count": 1, "intensity": "very_high"},
+            (TODAY + timedelta(days=2)).isoformat():
+                {"risk_score": 4.0, "deadline_count": 4, "moveable_count": 4, "intensity": "low"},
+        }
+        [risk_day] = data["risk_days"]
+        assert (risk_day["date"], risk_day["fatal_count"], risk_day["important_count"]) == (tomorrow, 1, 1)
+        assert sorted(d["is_moveable"] for d in risk_day["deadlines"]) == [False, False, True]
+        assert data["ai_suggestions"] == [{"date": tomorrow}]
+        assert data["statistics"]["peak_workload_day"]["deadline_count"] == 4
+        assert data["statistics"]["saturated_days_count"] == 1
+        assert data["burnout_alerts"] == []
+
+    def test_burnout_needs_consecutive_calendar_days(self, db, optimizer):
+        for days in (0, 1, 2, 3, 4, 6, 7, 8, 9):  # Day 5 is free
+            _add(db, "u1", days, count=10)
+        _add(db, "u1", 20, count=3)
+
+        data = asyncio.run(optimizer.analyze_calendar_saturation("u1", db, days_ahead=30))
+
+        [alert] = data["burnout_alerts"]
+        assert (alert["start_date"], alert["consecutive_days"]) == (TODAY.isoformat(), 5)
+        assert alert["end_date"] == (TODAY + timedelta(days=4)).isoformat()
+
+    def test_burnout_windows_match_streak_scan(self, optimizer):
+        rng = np.random.default_rng(7)
+        risk = np.where(rng.random((50, 90)) < 0.7, 12.0, 0.0)
+        alerts = optimizer._detect_burnout_risk(risk, TODAY)
+
+        for row, row_alerts in zip(risk, alerts):
+            expected, streak = [], 0
+            for score in list(row) + [0.0]:
+                if score >= optimizer.SATURATION_THRESHOLD:
+                    streak += 1
+                    continue
+                if streak >= optimizer.BURNOUT_THRESHOLD_DAYS:
+                    expected.append(streak)
+                streak = 0
+            assert [a["consecutive_days"] for a in row_alerts] == expected
+
+
+class TestTeamSaturation:
+    """Firm/team horizon scores each attorney separately"""
+
+    def test_per_attorney_scores(self, db, optimizer):
+        for days in range(100, 106):
+            _add(db, "u2", days, count=10)
+        _add(db, "u1", 100, count=3)
+        _add(db, "u1", 400, count=10)  # Beyond the horizon
+
+        data = optimizer.analyze_team_saturation(db, case_ids=["case-u1", "case-u2"], days_ahead=365)
+
+        day = (TODAY + timedelta(days=100)).isoformat()
+        assert data["team_heatmap"][day] == {"risk_score": 13.0, "deadline_count": 13, "saturated_users": 1}
+        busy, light = data["users"]
+        assert (busy["user_id"], busy["saturated_days"], busy["peak_date"]) == ("u2", 6, day)
+        assert busy["burnout_alerts"][0]["consecutive_days"] == 6
+        assert (light["user_id"], light["deadline_count"], light["burnout_alerts"]) == ("u1", 3, [])
+        assert data["statistics"]["attorneys_with_burnout_risk"] == 1
+
+        only_u1 = optimizer.analyze_team_saturation(db, user_ids=["u1"])
+        assert [u["user_id"] for u in only_u1["users"]] == ["u1"]
+        with pytest.raises(ValueError):
+            optimizer.analyze_team_saturation(db)